@@ -0,0 +1,113 @@
+"""
+Benchmark: the throughput and p99 latency of a fixed size pool and an
+autoscaling pool under a bursty load.
+
+The synthetic load is some bursts of I/O-bound tasks (sleeping), and the
+pool idles for a while between two bursts. For both 'ThreadPoolStrategy'
+and 'GreenThreadPoolStrategy', it runs the same load by:
+
+    * fixed_min: a fixed pool with the min size.
+    * fixed_max: a fixed pool with the max size.
+    * autoscale: an autoscaling pool between the min size and the max size.
+
+The latency of a task is from its burst is submitted to it's done, and the
+throughput is the amount of tasks per second of the busy time (the idle time
+between bursts is excluded). It also reports the average size of the
+autoscaling pool when each burst starts, and the amount of scaling events.
+
+Usage:
+    python -m benchmarks.autoscale_pool
+"""
+
+from typing import List, Dict, Callable, Optional
+import statistics
+import json
+import time
+
+import gevent
+
+from multirunnable.framework.runnable.autoscale import ScalingPolicy
+from multirunnable.concurrent.strategy import ThreadPoolStrategy
+from multirunnable.coroutine.strategy import GreenThreadPoolStrategy
+
+
+_Min_Size: int = 2
+_Max_Size: int = 32
+_Bursts: int = 10
+_Burst_Size: int = 200
+_Task_Time: float = 0.005
+_Idle_Time: float = 0.3
+
+
+def _policy() -> ScalingPolicy:
+    return ScalingPolicy(min_size=_Min_Size, max_size=_Max_Size, scale_up_backlog=1,
+                         scale_down_idle_time=0.05, step=4, interval=0.01)
+
+
+def _io_task(sleep: Callable[[float], None]) -> Callable[[int], float]:
+
+    def _task(index: int) -> float:
+        sleep(_Task_Time)
+        return time.perf_counter()
+
+    return _task
+
+
+def _run_load(strategy, task: Callable[[int], float], idle: Callable[[float], None]) -> Dict[str, float]:
+    __latencies: List[float] = []
+    __busy_time = 0.0
+    __sizes = []
+    strategy.initialization()
+    for _ in range(_Bursts):
+        if strategy.auto_scaler is not None:
+            __sizes.append(strategy.auto_scaler.size)
+        _start = time.perf_counter()
+        strategy.map(function=task, args_iter=range(_Burst_Size))
+        __busy_time += time.perf_counter() - _start
+        __latencies.extend(__result.data - _start for __result in strategy.get_result())
+        idle(_Idle_Time)
+
+    __events = len(strategy.auto_scaler.events) if strategy.auto_scaler is not None else 0
+    strategy.close()
+
+    __latencies.sort()
+    __record = {
+        "throughput": len(__latencies) / __busy_time,
+        "p99_ms": __latencies[int(len(__latencies) * 0.99) - 1] * 1000,
+        "median_ms": statistics.median(__latencies) * 1000,
+    }
+    if __sizes:
+        __record["average_size"] = statistics.mean(__sizes)
+        __record["scaling_events"] = __events
+    return __record
+
+
+def _run_mode(mode: str, strategy_cls, sleep: Callable[[float], None]) -> Dict[str, float]:
+    __record = {}
+    __task = _io_task(sleep)
+    __strategies: Dict[str, Callable[[], object]] = {
+        "fixed_min": lambda: strategy_cls(pool_size=_Min_Size),
+        "fixed_max": lambda: strategy_cls(pool_size=_Max_Size),
+        "autoscale": lambda: strategy_cls(pool_size=_Min_Size, autoscale=_policy()),
+    }
+    for __name, __strategy_factory in __strategies.items():
+        for __key, __value in _run_load(__strategy_factory(), __task, sleep).items():
+            __record[f"{mode}_{__name}_{__key}"] = __value
+    return __record
+
+
+def run(modes: Optional[List[str]] = None) -> Dict[str, float]:
+    __modes = {
+        "Concurrent": (ThreadPoolStrategy, time.sleep),
+        "GreenThread": (GreenThreadPoolStrategy, gevent.sleep),
+    }
+    __record = {}
+    for __mode in (modes or list(__modes.keys())):
+        __strategy_cls, __sleep = __modes[__mode]
+        __record.update(_run_mode(__mode, __strategy_cls, __sleep))
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,113 @@
+"""
+Benchmark: the per-statement overhead of getting the connection of current worker from BaseConnectionPool.
+
+For each RunningMode, a worker (thread, green thread, asyncio task or the
+main process) of the mode gets its connection and commits for each
+statement. It compares:
+
+    * legacy: look up the connection by the key of worker name, which is
+      resolved by the context adapter every time (the way before the
+      worker-local binding).
+    * worker_local: the worker-local binding of BaseConnectionPool.
+
+It reports the cost of the lookup alone and of a whole statement (a
+'SELECT 1' and a commit with sqlite3 in memory) in microseconds.
+
+Usage:
+    python -m benchmarks.connection_affinity
+"""
+
+from threading import Thread
+from typing import List, Dict, Optional, Any
+import sqlite3
+import asyncio
+import timeit
+import json
+
+import gevent
+
+from multirunnable import set_mode, RunningMode
+from multirunnable.adapter.context import context
+from multirunnable.persistence.database.strategy import BaseManagedConnectionPool, database_connection_pools
+from multirunnable._singletons import NamedSingletonABCMeta
+
+
+_Statements: int = 20000
+_Pool_Name: str = "benchmark_connection_affinity"
+
+
+class _SQLiteConnectionPool(BaseManagedConnectionPool):
+
+    def _connect_database(self, **kwargs) -> sqlite3.Connection:
+        return sqlite3.connect(":memory:", check_same_thread=False)
+
+
+
+def _legacy_connection(strategy: _SQLiteConnectionPool, connections: Dict[str, Any]) -> Any:
+    return connections[f"{strategy.__class__.__name__}_{context.get_current_worker_name()}"]
+
+
+def _measure(strategy: _SQLiteConnectionPool, statements: int) -> Dict[str, float]:
+    _connection = strategy.get_one_connection(pool_name=_Pool_Name)
+    _connections = {f"{strategy.__class__.__name__}_{context.get_current_worker_name()}": _connection}
+
+    def _legacy_statement():
+        _legacy_connection(strategy, _connections).execute("SELECT 1")
+        _legacy_connection(strategy, _connections).commit()
+
+    def _statement():
+        strategy.current_connection.execute("SELECT 1")
+        strategy.commit()
+
+    __record = {
+        "legacy_lookup_us": timeit.timeit(lambda: _legacy_connection(strategy, _connections), number=statements) / statements * 10 ** 6,
+        "worker_local_lookup_us": timeit.timeit(lambda: strategy.current_connection, number=statements) / statements * 10 ** 6,
+        "legacy_statement_us": timeit.timeit(_legacy_statement, number=statements) / statements * 10 ** 6,
+        "worker_local_statement_us": timeit.timeit(_statement, number=statements) / statements * 10 ** 6,
+    }
+    strategy.close_connection()
+    return __record
+
+
+def _run_mode(mode: RunningMode, strategy: _SQLiteConnectionPool, statements: int) -> Dict[str, float]:
+    _result = []
+    if mode is RunningMode.Concurrent:
+        _thread = Thread(target=lambda: _result.append(_measure(strategy, statements)))
+        _thread.start()
+        _thread.join()
+    elif mode is RunningMode.GreenThread:
+        _result.append(gevent.spawn(_measure, strategy, statements).get())
+    elif mode is RunningMode.Asynchronous:
+        async def _in_task():
+            return await asyncio.get_running_loop().create_task(_async_measure())
+
+        async def _async_measure():
+            return _measure(strategy, statements)
+
+        _result.append(asyncio.run(_in_task()))
+    else:
+        _result.append(_measure(strategy, statements))
+    return _result[0]
+
+
+def run(modes: Optional[List[str]] = None, statements: int = _Statements) -> Dict[str, float]:
+    __record = {}
+    for __mode in (modes or ["Parallel", "Concurrent", "GreenThread", "Asynchronous"]):
+        set_mode(RunningMode[__mode])
+        NamedSingletonABCMeta._NamedInstances.pop(_SQLiteConnectionPool.__name__, None)
+        database_connection_pools().pop(_Pool_Name, None)
+        _strategy = _SQLiteConnectionPool(pool_name=_Pool_Name, pool_size=1)
+        try:
+            for __key, __value in _run_mode(RunningMode[__mode], _strategy, statements).items():
+                __record[f"{__mode}_{__key}"] = __value
+        finally:
+            _strategy.close_pool(pool_name=_Pool_Name)
+            set_mode(None)
+        __record[f"{__mode}_lookup_speedup"] = __record[f"{__mode}_legacy_lookup_us"] / __record[f"{__mode}_worker_local_lookup_us"]
+        __record[f"{__mode}_statement_speedup"] = __record[f"{__mode}_legacy_statement_us"] / __record[f"{__mode}_worker_local_statement_us"]
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
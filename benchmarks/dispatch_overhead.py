@@ -0,0 +1,148 @@
+"""
+Benchmark: the framework overhead of each worker in each RunningMode.
+
+For each RunningMode, it maps a trivial function by the strategy and by the
+native workers (Process, Thread, Greenlet and asyncio Task) directly, then
+reports the cost of each worker in microseconds and the difference of them.
+
+It also measures the dispatching alone: activating one finished green thread
+and a list of 100 finished green threads by GreenThreadStrategy with the cached
+'method_dispatch', compares with the same methods which be dispatched by
+*multipledispatch*.
+
+Usage:
+    python -m benchmarks.dispatch_overhead
+"""
+
+from multiprocessing import Process
+from threading import Thread
+from typing import Dict, Callable
+from collections.abc import Iterable
+from multipledispatch import dispatch
+import asyncio
+import timeit
+import json
+import time
+
+from gevent import Greenlet
+import gevent
+
+from multirunnable.parallel.strategy import ProcessStrategy
+from multirunnable.concurrent.strategy import ThreadStrategy
+from multirunnable.coroutine.strategy import GreenThreadStrategy, AsynchronousStrategy
+
+
+_Workers: Dict[str, int] = {
+    "Parallel": 200,
+    "Concurrent": 5000,
+    "GreenThread": 50000,
+    "Asynchronous": 50000,
+}
+_Dispatch_Calls: int = 100000
+
+
+def _target(index: int) -> int:
+    return index
+
+
+async def _async_target(index: int) -> int:
+    return index
+
+
+def _run_processes(workers: int) -> None:
+    __processes = [Process(target=_target, args=(_i,)) for _i in range(workers)]
+    for __process in __processes:
+        __process.start()
+    for __process in __processes:
+        __process.join()
+
+
+def _run_threads(workers: int) -> None:
+    __threads = [Thread(target=_target, args=(_i,)) for _i in range(workers)]
+    for __thread in __threads:
+        __thread.start()
+    for __thread in __threads:
+        __thread.join()
+
+
+def _run_green_threads(workers: int) -> None:
+    gevent.joinall([gevent.spawn(_target, _i) for _i in range(workers)])
+
+
+def _run_tasks(workers: int) -> None:
+
+    async def __gather():
+        await asyncio.gather(*[asyncio.create_task(_async_target(_i)) for _i in range(workers)])
+
+    asyncio.run(__gather())
+
+
+def _run_by_strategy(strategy, function: Callable, workers: int) -> None:
+    strategy.map(function=function, args_iter=[(_i,) for _i in range(workers)])
+    strategy.get_result()
+
+
+_Modes = {
+    "Parallel": (lambda: ProcessStrategy(executors=1), _target, _run_processes),
+    "Concurrent": (lambda: ThreadStrategy(executors=1), _target, _run_threads),
+    "GreenThread": (lambda: GreenThreadStrategy(executors=1), _target, _run_green_threads),
+    "Asynchronous": (lambda: AsynchronousStrategy(executors=1), _async_target, _run_tasks),
+}
+
+
+def _measure_per_worker(function: Callable, workers: int) -> float:
+    _start = time.perf_counter()
+    function()
+    return (time.perf_counter() - _start) / workers * 1000000
+
+
+class _MultipleDispatchGreenThreadStrategy(GreenThreadStrategy):
+    """
+    Description:
+        The same strategy but its methods are dispatched by *multipledispatch*.
+    """
+
+    @dispatch(Greenlet)
+    def activate_workers(self, workers: Greenlet) -> None:
+        workers.start()
+
+
+    @dispatch(Iterable)
+    def activate_workers(self, workers) -> None:
+        for worker in workers:
+            self.activate_workers(worker)
+
+
+def _measure_dispatch(strategy: GreenThreadStrategy, calls: int) -> float:
+    # A finished green thread, so activating it again does nothing but dispatching.
+    __worker = Greenlet(_target, 0)
+    __worker.start()
+    __worker.join()
+    __workers = [__worker] * 100
+
+    def __dispatch():
+        strategy.activate_workers(__worker)
+        strategy.activate_workers(__workers)
+
+    return min(timeit.repeat(__dispatch, number=calls // 100, repeat=5)) / (calls // 100) * 1000000
+
+
+def run(workers: Dict[str, int] = _Workers, dispatch_calls: int = _Dispatch_Calls) -> Dict[str, float]:
+    __record = {}
+    for __mode, (__strategy_factory, __function, __run_natively) in _Modes.items():
+        __workers = workers[__mode]
+        __strategy = __strategy_factory()
+        __framework_us = _measure_per_worker(lambda: _run_by_strategy(__strategy, __function, __workers), __workers)
+        __native_us = _measure_per_worker(lambda: __run_natively(__workers), __workers)
+        __record[f"{__mode}_framework_us"] = __framework_us
+        __record[f"{__mode}_native_us"] = __native_us
+        __record[f"{__mode}_overhead_us"] = __framework_us - __native_us
+
+    __record["method_dispatch_us"] = _measure_dispatch(GreenThreadStrategy(executors=1), dispatch_calls)
+    __record["multipledispatch_us"] = _measure_dispatch(_MultipleDispatchGreenThreadStrategy(executors=1), dispatch_calls)
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
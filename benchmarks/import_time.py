@@ -0,0 +1,57 @@
+"""
+Benchmark: the cost of 'import multirunnable'.
+
+It imports the package in a brand-new interpreter (so nothing be cached)
+and records how long it takes and how many children processes are alive
+after importing. Importing the package should never fork any process,
+e.g., the server process of 'multiprocessing.Manager'.
+
+Usage:
+    python -m benchmarks.import_time
+"""
+
+from typing import Dict, List
+import subprocess
+import statistics
+import json
+import sys
+
+
+_Import_Modules: List[str] = [
+    "multirunnable",
+    "multirunnable.parallel.strategy",
+    "multirunnable.persistence.file.saver",
+]
+
+_Import_Script: str = """
+import time, json
+_start = time.perf_counter()
+{imports}
+_end = time.perf_counter()
+import multiprocessing
+print(json.dumps({{"seconds": _end - _start, "children": len(multiprocessing.active_children())}}))
+"""
+
+
+def _import_once(modules: List[str]) -> Dict:
+    __script = _Import_Script.format(imports="\n".join([f"import {_m}" for _m in modules]))
+    __output = subprocess.check_output([sys.executable, "-c", __script])
+    return json.loads(__output.decode("utf-8").strip().splitlines()[-1])
+
+
+def run(repeat: int = 10) -> Dict[str, float]:
+    __records = [_import_once(_Import_Modules) for _ in range(repeat)]
+    __seconds = [_r["seconds"] for _r in __records]
+    return {
+        "import_mean_ms": statistics.mean(__seconds) * 1000,
+        "import_min_ms": min(__seconds) * 1000,
+        "children_after_import": max([_r["children"] for _r in __records]),
+    }
+
+
+if __name__ == '__main__':
+
+    _result = run()
+    print(json.dumps(_result, indent=4))
+    if _result["children_after_import"] != 0:
+        raise SystemExit("Importing 'multirunnable' forks children processes.")
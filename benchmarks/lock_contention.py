@@ -0,0 +1,121 @@
+"""
+Benchmark: the throughput of a read-heavy shared cache with Lock, ReadWriteLock and ShardedLock.
+
+For each RunningMode, some workers (processes, threads, green threads or
+coroutines) operate a shared cache with the keys chosen at random. Most of
+the operations are reads and each one holds the lock for a while (as
+loading the value). It compares the throughput (operations per second) of
+protecting the cache by:
+
+    * lock: one global Lock, so every operation runs one by one.
+    * read_write_lock: ReadWriteLock, the reads run at the same time.
+    * sharded_lock: ShardedLock by the key, the operations of the different
+      keys run at the same time.
+
+Usage:
+    python -m benchmarks.lock_contention
+"""
+
+from multiprocessing import Process
+from threading import Thread
+from typing import List, Dict, Callable, Optional
+import asyncio
+import random
+import json
+import time
+
+import gevent
+
+from multirunnable.mode import FeatureMode
+from multirunnable.adapter.lock import Lock, ReadWriteLock, ShardedLock, AsyncLock, AsyncReadWriteLock, AsyncShardedLock
+from multirunnable.api.operator import (
+    LockOperator, ReadWriteLockOperator, ShardedLockOperator,
+    LockAsyncOperator, ReadWriteLockAsyncOperator, ShardedLockAsyncOperator
+)
+
+
+_Workers: int = 8
+_Operations: int = 50
+_Read_Ratio: float = 0.9
+_Keys: int = 64
+_Shards: int = 16
+_Hold_Time: float = 0.001
+
+
+def _operations(seed: int, operations: int) -> List[tuple]:
+    __random = random.Random(seed)
+    return [(__random.random() < _Read_Ratio, __random.randrange(_Keys)) for _ in range(operations)]
+
+
+def _operate(kind: str, seed: int, operations: int, sleep: Callable[[float], None]) -> None:
+    __lock, __rwlock, __sharded_lock = LockOperator(), ReadWriteLockOperator(), ShardedLockOperator()
+    for __read, __key in _operations(seed, operations):
+        if kind == "lock":
+            __context = __lock
+        elif kind == "read_write_lock":
+            __context = __rwlock.reading() if __read else __rwlock.writing()
+        else:
+            __context = __sharded_lock.locking(__key)
+        with __context:
+            sleep(_Hold_Time)
+
+
+def _run_mode(mode: FeatureMode, kind: str, operations: int) -> float:
+    Lock(mode=mode, init=True)
+    ReadWriteLock(mode=mode, init=True)
+    ShardedLock(shards=_Shards, mode=mode, init=True)
+
+    _start = time.perf_counter()
+    if mode is FeatureMode.GreenThread:
+        gevent.joinall([gevent.spawn(_operate, kind, _seed, operations, gevent.sleep) for _seed in range(_Workers)])
+    else:
+        __worker_cls = Process if mode is FeatureMode.Parallel else Thread
+        __workers = [__worker_cls(target=_operate, args=(kind, _seed, operations, time.sleep)) for _seed in range(_Workers)]
+        for __worker in __workers:
+            __worker.start()
+        for __worker in __workers:
+            __worker.join()
+    return _Workers * operations / (time.perf_counter() - _start)
+
+
+async def _async_operate(kind: str, seed: int, operations: int) -> None:
+    __lock, __rwlock, __sharded_lock = LockAsyncOperator(), ReadWriteLockAsyncOperator(), ShardedLockAsyncOperator()
+    for __read, __key in _operations(seed, operations):
+        if kind == "lock":
+            __context = __lock
+        elif kind == "read_write_lock":
+            __context = __rwlock.reading() if __read else __rwlock.writing()
+        else:
+            __context = __sharded_lock.locking(__key)
+        async with __context:
+            await asyncio.sleep(_Hold_Time)
+
+
+async def _run_async(kind: str, operations: int) -> float:
+    __event_loop = asyncio.get_running_loop()
+    AsyncLock(mode=FeatureMode.Asynchronous, init=True, event_loop=__event_loop)
+    AsyncReadWriteLock(mode=FeatureMode.Asynchronous, init=True, event_loop=__event_loop)
+    AsyncShardedLock(shards=_Shards, mode=FeatureMode.Asynchronous, init=True, event_loop=__event_loop)
+
+    _start = time.perf_counter()
+    await asyncio.gather(*[_async_operate(kind, _seed, operations) for _seed in range(_Workers)])
+    return _Workers * operations / (time.perf_counter() - _start)
+
+
+def run(modes: Optional[List[str]] = None, operations: int = _Operations) -> Dict[str, float]:
+    __record = {}
+    for __mode in (modes or ["Parallel", "Concurrent", "GreenThread", "Asynchronous"]):
+        for __kind in ("lock", "read_write_lock", "sharded_lock"):
+            if __mode == "Asynchronous":
+                __throughput = asyncio.run(_run_async(__kind, operations))
+            else:
+                __throughput = _run_mode(FeatureMode[__mode], __kind, operations)
+            __record[f"{__mode}_{__kind}_throughput"] = __throughput
+        __record[f"{__mode}_read_write_lock_speedup"] = __record[f"{__mode}_read_write_lock_throughput"] / __record[f"{__mode}_lock_throughput"]
+        __record[f"{__mode}_sharded_lock_speedup"] = __record[f"{__mode}_sharded_lock_throughput"] / __record[f"{__mode}_lock_throughput"]
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
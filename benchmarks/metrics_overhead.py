@@ -0,0 +1,66 @@
+"""
+Benchmark: the overhead of the metrics of pools.
+
+It maps a lot of trivial tasks by 'ThreadPoolStrategy', 'GreenThreadPoolStrategy'
+and 'ProcessPoolStrategy', with the metrics disabled and enabled, and reports
+the cost per task (microseconds) of each one. The tasks do nothing so that
+the difference is the cost of measuring the timing and aggregating it.
+
+Usage:
+    python -m benchmarks.metrics_overhead
+"""
+
+from typing import List, Dict, Optional
+import json
+import time
+
+from multirunnable.concurrent.strategy import ThreadPoolStrategy
+from multirunnable.coroutine.strategy import GreenThreadPoolStrategy
+from multirunnable.parallel.strategy import ProcessPoolStrategy
+
+
+_Pool_Size: int = 4
+_Tasks: int = 20000
+_Rounds: int = 3
+
+
+def _noop(value: int) -> int:
+    return value
+
+
+def _cost_per_task(strategy_cls, metrics: bool) -> float:
+    __strategy = strategy_cls(pool_size=_Pool_Size)
+    if metrics is True:
+        __strategy.enable_metrics()
+    __strategy.initialization()
+    __costs = []
+    try:
+        for _ in range(_Rounds):
+            _start = time.perf_counter()
+            __strategy.map(function=_noop, args_iter=range(_Tasks), chunksize=100)
+            __strategy.get_result()
+            __costs.append((time.perf_counter() - _start) / _Tasks)
+    finally:
+        __strategy.close()
+    return min(__costs) * 1000000
+
+
+def run(modes: Optional[List[str]] = None) -> Dict[str, float]:
+    __modes = {
+        "Concurrent": ThreadPoolStrategy,
+        "GreenThread": GreenThreadPoolStrategy,
+        "Parallel": ProcessPoolStrategy,
+    }
+    __record = {}
+    for __mode in (modes or list(__modes.keys())):
+        __off = _cost_per_task(__modes[__mode], metrics=False)
+        __on = _cost_per_task(__modes[__mode], metrics=True)
+        __record[f"{__mode}_metrics_off_us_per_task"] = __off
+        __record[f"{__mode}_metrics_on_us_per_task"] = __on
+        __record[f"{__mode}_overhead_us_per_task"] = __on - __off
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,64 @@
+"""
+Benchmark: the startup latency of a cold pool and a warm (named) pool.
+
+For each RunningMode of pool, it opens a 'SimplePool' by *with* block and
+runs one trivial task again and again:
+
+    * cold: a pool without name, so it builds (and closes) its workers every time.
+    * warm: a pool with option *name*, so it attaches to the pool which keeps
+            running in 'Pool_Registry' after the first time.
+
+It reports the median latency of each round (initialing, running one task and
+closing the pool) in milliseconds.
+
+Usage:
+    python -m benchmarks.pool_startup
+"""
+
+from typing import Dict, Optional
+import statistics
+import json
+import time
+
+from multirunnable import SimplePool, RunningMode, Pool_Registry
+
+
+_Pool_Size: int = 4
+_Rounds: Dict[RunningMode, int] = {
+    RunningMode.Parallel: 30,
+    RunningMode.Concurrent: 200,
+    RunningMode.GreenThread: 200,
+}
+
+
+def _target(index: int) -> int:
+    return index
+
+
+def _measure(mode: RunningMode, rounds: int, name: Optional[str]) -> float:
+    __latencies = []
+    for _ in range(rounds):
+        _start = time.perf_counter()
+        with SimplePool(mode=mode, pool_size=_Pool_Size, name=name) as __pool:
+            __pool.apply(tasks_size=1, function=_target, args=(1,))
+        __latencies.append((time.perf_counter() - _start) * 1000)
+        __pool.get_result()
+    return statistics.median(__latencies)
+
+
+def run(rounds: Dict[RunningMode, int] = _Rounds) -> Dict[str, float]:
+    __record = {}
+    for __mode, __rounds in rounds.items():
+        __name = f"benchmark-{__mode.name}"
+        __cold_ms = _measure(__mode, __rounds, name=None)
+        __warm_ms = _measure(__mode, __rounds, name=__name)
+        Pool_Registry.close(name=__name)
+        __record[f"{__mode.name}_cold_ms"] = __cold_ms
+        __record[f"{__mode.name}_warm_ms"] = __warm_ms
+        __record[f"{__mode.name}_speedup"] = __cold_ms / __warm_ms
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,117 @@
+"""
+Benchmark: the throughput of 'map' and 'imap' in each RunningMode.
+
+For the pools of Parallel, Concurrent and GreenThread, it maps a lot of
+trivial tasks by 'map', 'imap' and 'imap' in streaming mode. For Asynchronous,
+it maps the coroutines by 'map' with bounded workers and 'map_as_completed'.
+The tasks do nothing, so the throughput (tasks per second) is bounded by the
+per-task overhead of the framework, which is reported in microseconds.
+
+Usage:
+    python -m benchmarks.pool_throughput
+"""
+
+from typing import List, Dict, Callable, Optional
+import json
+import time
+
+from multirunnable.parallel.strategy import ProcessPoolStrategy
+from multirunnable.concurrent.strategy import ThreadPoolStrategy
+from multirunnable.coroutine.strategy import GreenThreadPoolStrategy, AsynchronousStrategy
+
+
+_Pool_Size: int = 4
+_Tasks: Dict[str, int] = {
+    "Parallel": 20000,
+    "Concurrent": 20000,
+    "GreenThread": 20000,
+    "Asynchronous": 20000,
+}
+_Chunk_Size: int = 100
+_Rounds: int = 3
+
+
+def _target(value: int) -> int:
+    return value
+
+
+async def _async_target(value: int) -> int:
+    return value
+
+
+def _best_seconds(function: Callable[[], None], rounds: int) -> float:
+    __seconds = []
+    for _ in range(rounds):
+        _start = time.perf_counter()
+        function()
+        __seconds.append(time.perf_counter() - _start)
+    return min(__seconds)
+
+
+def _pool_apis(strategy, tasks: int) -> Dict[str, Callable[[], None]]:
+
+    def __map():
+        strategy.map(function=_target, args_iter=range(tasks), chunksize=_Chunk_Size)
+        strategy.get_result()
+
+    def __imap():
+        strategy.imap(function=_target, args_iter=range(tasks), chunksize=_Chunk_Size)
+        strategy.get_result()
+
+    def __imap_stream():
+        for _ in strategy.imap(function=_target, args_iter=range(tasks), stream=True, window=_Pool_Size * 4):
+            pass
+
+    return {"map": __map, "imap": __imap, "imap_stream": __imap_stream}
+
+
+def _async_apis(strategy: AsynchronousStrategy, tasks: int) -> Dict[str, Callable[[], None]]:
+
+    def __map():
+        strategy.map(function=_async_target, args_iter=[(_i,) for _i in range(tasks)], max_workers=_Pool_Size * 4)
+        strategy.get_result()
+
+    def __map_as_completed():
+        for _ in strategy.map_as_completed(function=_async_target, args_iter=range(tasks), limit=_Pool_Size * 4):
+            pass
+
+    return {"map": __map, "map_as_completed": __map_as_completed}
+
+
+def _record(mode: str, apis: Dict[str, Callable[[], None]], tasks: int, rounds: int) -> Dict[str, float]:
+    __record = {}
+    for __api, __function in apis.items():
+        __seconds = _best_seconds(__function, rounds)
+        __record[f"{mode}_{__api}_throughput"] = tasks / __seconds
+        __record[f"{mode}_{__api}_us_per_task"] = __seconds / tasks * 1000000
+    return __record
+
+
+def run(modes: Optional[List[str]] = None, tasks: Dict[str, int] = _Tasks, rounds: int = _Rounds) -> Dict[str, float]:
+    __pools = {
+        "Parallel": ProcessPoolStrategy,
+        "Concurrent": ThreadPoolStrategy,
+        "GreenThread": GreenThreadPoolStrategy,
+    }
+    __record = {}
+    for __mode in (modes or list(tasks.keys())):
+        if __mode == "Asynchronous":
+            __strategy = AsynchronousStrategy(executors=_Pool_Size)
+            try:
+                __record.update(_record(__mode, _async_apis(__strategy, tasks[__mode]), tasks[__mode], rounds))
+            finally:
+                __strategy.shutdown()
+            continue
+
+        __strategy = __pools[__mode](pool_size=_Pool_Size)
+        __strategy.initialization()
+        try:
+            __record.update(_record(__mode, _pool_apis(__strategy, tasks[__mode]), tasks[__mode], rounds))
+        finally:
+            __strategy.close()
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,158 @@
+"""
+Benchmark: the throughput of the queues in each RunningMode.
+
+For each RunningMode, it measures 2 things of the queue which the RunningMode
+uses (multiprocessing Queue, Thread Queue, gevent Queue and asyncio Queue):
+
+    * seed: put the values of 'QueueTask' into the queue by 'init_queue_with_values',
+      as same as 'Executor' and 'Pool' do before running.
+    * transfer: a producer worker (a process, thread, green thread or coroutine)
+      puts the values and the main one gets them.
+
+    * seed_batch / transfer_batch: the same, but the values are put by chunks
+      ('QueueTask.chunk_size' and 'QueueOperator.put_many') and got by
+      'QueueOperator.get_many'.
+
+All are reported in items per second.
+
+Usage:
+    python -m benchmarks.queue_throughput
+"""
+
+from multiprocessing import Process, Queue
+from threading import Thread
+from typing import List, Dict, Optional
+import asyncio
+import json
+import time
+
+import gevent
+
+from multirunnable.concurrent.queue import Thread_Queue
+from multirunnable.coroutine.queue import Greenlet_Queue, Async_Queue
+from multirunnable.api.operator import QueueOperator, QueueAsyncOperator
+from multirunnable.tasks import QueueTask
+
+
+_Items: Dict[str, int] = {
+    "Parallel": 20000,
+    "Concurrent": 100000,
+    "GreenThread": 100000,
+    "Asynchronous": 100000,
+}
+_Rounds: int = 3
+_Chunk_Size: int = 500
+
+
+def _put_values(queue, items: int, batch: bool = False) -> None:
+    if batch:
+        QueueOperator.put_many(queue, range(items), chunk_size=_Chunk_Size)
+        return
+    for __value in range(items):
+        queue.put(__value)
+
+
+def _get_values(queue, items: int, batch: bool = False) -> None:
+    if batch:
+        __amount = 0
+        while __amount < items:
+            __amount += len(QueueOperator.get_many(queue, max_items=_Chunk_Size))
+        return
+    for _ in range(items):
+        queue.get()
+
+
+def _seed_seconds(queue_instance, items: int, chunk_size: Optional[int] = None) -> float:
+    __task = QueueTask()
+    __task.name = "benchmark_queue"
+    __task.queue_instance = queue_instance
+    __task.value = range(items)
+    __task.chunk_size = chunk_size
+
+    _start = time.perf_counter()
+    __task.init_queue_with_values()
+    __seconds = time.perf_counter() - _start
+    # Drain the queue, or the feeder thread of multiprocessing Queue blocks the exit.
+    _get_values(queue_instance, items, batch=chunk_size is not None)
+    return __seconds
+
+
+def _transfer_seconds(mode: str, queue, items: int, batch: bool = False) -> float:
+    _start = time.perf_counter()
+    if mode == "Parallel":
+        __producer = Process(target=_put_values, args=(queue, items, batch))
+    elif mode == "Concurrent":
+        __producer = Thread(target=_put_values, args=(queue, items, batch))
+    else:
+        __producer = gevent.spawn(_put_values, queue, items, batch)
+        _get_values(queue, items, batch)
+        __producer.join()
+        return time.perf_counter() - _start
+
+    __producer.start()
+    _get_values(queue, items, batch)
+    __producer.join()
+    return time.perf_counter() - _start
+
+
+async def _async_seconds(items: int, batch: bool = False) -> Dict[str, float]:
+    __task = QueueTask()
+    __task.name = "benchmark_queue"
+    __task.queue_instance = Async_Queue()
+    __task.value = range(items)
+    __task.chunk_size = _Chunk_Size if batch else None
+
+    _start = time.perf_counter()
+    await __task.async_init_queue_with_values()
+    __seed = time.perf_counter() - _start
+
+    async def __produce(queue: Async_Queue):
+        if batch:
+            await QueueAsyncOperator.put_many(queue, range(items), chunk_size=_Chunk_Size)
+            return
+        for __value in range(items):
+            await queue.put(__value)
+
+    async def __consume(queue: Async_Queue):
+        __amount = 0
+        while __amount < items:
+            if batch:
+                __amount += len(await QueueAsyncOperator.get_many(queue, max_items=_Chunk_Size))
+            else:
+                await queue.get()
+                __amount += 1
+
+    __queue = Async_Queue()
+    _start = time.perf_counter()
+    __producer = asyncio.create_task(__produce(__queue))
+    await __consume(__queue)
+    await __producer
+    return {"seed": __seed, "transfer": time.perf_counter() - _start}
+
+
+def run(modes: Optional[List[str]] = None, items: Dict[str, int] = _Items, rounds: int = _Rounds) -> Dict[str, float]:
+    __queues = {
+        "Parallel": Queue,
+        "Concurrent": Thread_Queue,
+        "GreenThread": Greenlet_Queue,
+    }
+    __record = {}
+    for __mode in (modes or list(items.keys())):
+        __items = items[__mode]
+        for __batch, __suffix in ((False, ""), (True, "_batch")):
+            if __mode == "Asynchronous":
+                __seconds = [asyncio.run(_async_seconds(__items, batch=__batch)) for _ in range(rounds)]
+                __seed = min(__s["seed"] for __s in __seconds)
+                __transfer = min(__s["transfer"] for __s in __seconds)
+            else:
+                __chunk_size = _Chunk_Size if __batch else None
+                __seed = min(_seed_seconds(__queues[__mode](), __items, __chunk_size) for _ in range(rounds))
+                __transfer = min(_transfer_seconds(__mode, __queues[__mode](), __items, __batch) for _ in range(rounds))
+            __record[f"{__mode}_seed{__suffix}_throughput"] = __items / __seed
+            __record[f"{__mode}_transfer{__suffix}_throughput"] = __items / __transfer
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,90 @@
+"""
+Benchmark: the throughput of collecting running results from children processes.
+
+It compares 2 ways to ship the running results from children processes to
+the main process:
+
+    * manager: append each result to a list proxy of 'multiprocessing.Manager'
+               and iterate the proxy element by element in the main process
+               (one round trip to the manager server per result).
+    * channel: send each result through the result channel of the process
+               which is used by 'ProcessStrategy'.
+
+Both of them are measured with many small results and a few large results.
+
+Usage:
+    python -m benchmarks.result_collection
+"""
+
+from multiprocessing import Process
+from typing import Dict, List, Callable
+import time
+import json
+
+from multirunnable.parallel.strategy import ParallelStrategy, _ResultChannelProcess
+from multirunnable.parallel.share import Global_Manager
+
+
+_Workers: int = 4
+_Scenarios: Dict[str, Dict[str, int]] = {
+    "small": {"results": 10000, "size": 64},
+    "large": {"results": 100, "size": 1024 * 1024},
+}
+
+
+def _produce_by_manager(results: List, amount: int, size: int) -> None:
+    _payload = b"x" * size
+    for _ in range(amount):
+        results.append({"result": _payload, "successful": True})
+
+
+def _produce_by_channel(amount: int, size: int) -> None:
+    _payload = b"x" * size
+    _function = ParallelStrategy.save_return_value(lambda: _payload)
+    for _ in range(amount):
+        _function()
+
+
+def _collect_by_manager(amount: int, size: int) -> int:
+    __results = Global_Manager.list()
+    __processes = [Process(target=_produce_by_manager, args=(__results, amount // _Workers, size)) for _ in range(_Workers)]
+    for _p in __processes:
+        _p.start()
+    for _p in __processes:
+        _p.join()
+    return len([_r for _r in __results])
+
+
+def _collect_by_channel(amount: int, size: int) -> int:
+    __results = []
+    __processes = [
+        _ResultChannelProcess(results=__results, target=_produce_by_channel, args=(amount // _Workers, size))
+        for _ in range(_Workers)]
+    for _p in __processes:
+        _p.start()
+    for _p in __processes:
+        _p.join()
+    return len(__results)
+
+
+def _measure(collect: Callable[[int, int], int], amount: int, size: int) -> float:
+    _start = time.perf_counter()
+    _collected = collect(amount, size)
+    _end = time.perf_counter()
+    assert _collected == amount, f"It should collect {amount} results but it got {_collected}."
+    return _end - _start
+
+
+def run(repeat: int = 3) -> Dict[str, float]:
+    __record = {}
+    for _name, _scenario in _Scenarios.items():
+        for _transport, _collect in (("manager", _collect_by_manager), ("channel", _collect_by_channel)):
+            __seconds = min([_measure(_collect, _scenario["results"], _scenario["size"]) for _ in range(repeat)])
+            __record[f"{_name}_{_transport}_ms"] = __seconds * 1000
+            __record[f"{_name}_{_transport}_results_per_second"] = _scenario["results"] / __seconds
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
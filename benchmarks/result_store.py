@@ -0,0 +1,77 @@
+"""
+Benchmark: the memory which is kept by the running results of green threads.
+
+It runs 1,000,000 green threads by 'GreenThreadStrategy' in batches and
+never calls 'get_result' until the end, then measures the Python memory
+which is still kept by the strategy after each batch:
+
+    * unbounded: keep all the running results (the default option).
+    * keep_last: only keep the last *_Max_Size* running results
+                 (option *result_max_size*).
+    * drop: don't keep any running result (*result_max_size* is 0).
+
+Usage:
+    python -m benchmarks.result_store
+"""
+
+from typing import Dict, Optional
+import tracemalloc
+import time
+import json
+import gc
+
+from multirunnable.coroutine.strategy import GreenThreadStrategy
+
+
+_Green_Threads: int = 1000000
+_Batch_Size: int = 10000
+_Max_Size: int = 1000
+
+
+def _target(index: int) -> int:
+    return index
+
+
+def _measure(max_size: Optional[int], green_threads: int) -> Dict[str, float]:
+    __strategy = GreenThreadStrategy(executors=_Batch_Size)
+    __strategy.result_max_size = max_size
+    __strategy.initialization()
+
+    gc.collect()
+    tracemalloc.start()
+    _start = time.perf_counter()
+    __first_batch_kb = None
+    for __offset in range(0, green_threads, _Batch_Size):
+        __workers = [__strategy.generate_worker(_target, _i) for _i in range(__offset, __offset + _Batch_Size)]
+        __strategy.activate_workers(__workers)
+        for __worker in __workers:
+            __strategy.close(__worker)
+        del __workers
+        if __first_batch_kb is None:
+            __first_batch_kb = tracemalloc.get_traced_memory()[0] / 1024
+    _end = time.perf_counter()
+    __kept_kb = tracemalloc.get_traced_memory()[0] / 1024
+    __peak_kb = tracemalloc.get_traced_memory()[1] / 1024
+    tracemalloc.stop()
+
+    __records = len(__strategy.get_result())
+    return {
+        "seconds": _end - _start,
+        "records": __records,
+        "kept_kb_after_first_batch": __first_batch_kb,
+        "kept_kb_at_end": __kept_kb,
+        "peak_kb": __peak_kb,
+    }
+
+
+def run(green_threads: int = _Green_Threads) -> Dict[str, float]:
+    __record = {}
+    for _name, _max_size in (("unbounded", None), ("keep_last", _Max_Size), ("drop", 0)):
+        for _key, _value in _measure(_max_size, green_threads).items():
+            __record[f"{_name}_{_key}"] = _value
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
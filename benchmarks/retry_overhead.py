@@ -0,0 +1,83 @@
+"""
+Benchmark: the overhead of calling a function which be decorated by the retry API.
+
+It calls a trivial function directly and through 'retry.function',
+'retry.bounded_function' and 'async_retry.function', then reports the
+extra cost of each call in microseconds.
+
+Usage:
+    python -m benchmarks.retry_overhead
+"""
+
+from typing import Dict, Callable
+import asyncio
+import timeit
+import json
+
+from multirunnable.api.decorator import retry, async_retry
+
+
+_Calls: int = 100000
+
+
+def _plain() -> int:
+    return 1
+
+
+@retry.function
+def _retry_plain() -> int:
+    return 1
+
+
+class _Target:
+
+    def plain(self) -> int:
+        return 1
+
+
+    @retry.bounded_function
+    def retry_plain(self) -> int:
+        return 1
+
+
+async def _async_plain() -> int:
+    return 1
+
+
+@async_retry.function
+async def _async_retry_plain() -> int:
+    return 1
+
+
+def _measure(function: Callable, calls: int, repeat: int) -> float:
+    return min(timeit.repeat(function, number=calls, repeat=repeat)) / calls * 1000000
+
+
+def _measure_async(function: Callable, calls: int, repeat: int) -> float:
+
+    async def __call_many():
+        for _ in range(calls):
+            await function()
+
+    return min(timeit.repeat(lambda: asyncio.run(__call_many()), number=1, repeat=repeat)) / calls * 1000000
+
+
+def run(calls: int = _Calls, repeat: int = 5) -> Dict[str, float]:
+    __target = _Target()
+    __record = {
+        "function_us": _measure(_plain, calls, repeat),
+        "retry_function_us": _measure(_retry_plain, calls, repeat),
+        "bounded_function_us": _measure(__target.plain, calls, repeat),
+        "retry_bounded_function_us": _measure(__target.retry_plain, calls, repeat),
+        "async_function_us": _measure_async(_async_plain, calls, repeat),
+        "async_retry_function_us": _measure_async(_async_retry_plain, calls, repeat),
+    }
+    __record["retry_function_overhead_us"] = __record["retry_function_us"] - __record["function_us"]
+    __record["retry_bounded_function_overhead_us"] = __record["retry_bounded_function_us"] - __record["bounded_function_us"]
+    __record["async_retry_function_overhead_us"] = __record["async_retry_function_us"] - __record["async_function_us"]
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,157 @@
+"""
+Run the benchmarks and compare the results with a baseline.
+
+It runs the benchmark modules, saves their results with the environment
+information as JSON and, if a baseline (the JSON saved before) is given,
+compares each measurement with it. The measurement is a regression if it's
+worse than the baseline over the tolerance (a ratio):
+
+    * the throughput, tasks per second or speedup: higher is better.
+    * the latency or cost (microseconds, milliseconds, seconds or KB): lower
+      is better.
+    * the others are information only, they're not compared.
+
+It exits with code 1 if there is any regression, so that it could be a check
+in CI.
+
+Usage:
+    python -m benchmarks.run
+    python -m benchmarks.run --only spawn_cost pool_throughput --output baseline.json
+    python -m benchmarks.run --baseline baseline.json --tolerance 0.2
+"""
+
+from typing import List, Dict, Optional, Any
+import importlib
+import argparse
+import platform
+import json
+import time
+import sys
+
+from multirunnable import __version__
+
+
+Benchmarks: List[str] = [
+    "spawn_cost",
+    "dispatch_overhead",
+    "pool_startup",
+    "pool_throughput",
+    "result_collection",
+    "result_store",
+    "synchronization_latency",
+    "lock_contention",
+    "queue_throughput",
+    "shared_memory_queue",
+    "connection_affinity",
+    "statement_cache",
+    "retry_overhead",
+    "metrics_overhead",
+    "autoscale_pool",
+    "shared_memory",
+    "import_time",
+]
+
+_Higher_Is_Better: List[str] = ["throughput", "per_second", "speedup"]
+_Lower_Is_Better: List[str] = ["_us", "_ms", "us_per_task", "_seconds", "_kb"]
+_Tolerance: float = 0.2
+
+
+def direction(key: str) -> int:
+    """
+    Description:
+        Which direction is better of the measurement.
+    :param key: The key of the measurement.
+    :return: 1 if higher is better, -1 if lower is better and 0 if it's information only.
+    """
+
+    __key = key.lower()
+    if any(__word in __key for __word in _Higher_Is_Better):
+        return 1
+    if any(__key.endswith(__suffix) for __suffix in _Lower_Is_Better):
+        return -1
+    return 0
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float = _Tolerance) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Description:
+        Compare the results with the baseline. It only compares the measurements
+        which are in both of them and have a direction.
+    :param results: The results of benchmarks, by the name of benchmark.
+    :param baseline: The results of benchmarks which are saved before.
+    :param tolerance: The ratio of changing which is acceptable.
+    :return: The regressions and improvements.
+    """
+
+    __report = {"regressions": [], "improvements": []}
+    for __benchmark, __measurements in results.items():
+        for __key, __value in __measurements.items():
+            __baseline = baseline.get(__benchmark, {}).get(__key)
+            __direction = direction(__key)
+            if __direction == 0 or not isinstance(__baseline, (int, float)) or __baseline <= 0:
+                continue
+
+            __change = (__value - __baseline) / __baseline * __direction
+            __record = {"benchmark": __benchmark, "key": __key, "baseline": __baseline, "value": __value, "change": __change}
+            if __change < -tolerance:
+                __report["regressions"].append(__record)
+            elif __change > tolerance:
+                __report["improvements"].append(__record)
+    return __report
+
+
+def run(benchmarks: Optional[List[str]] = None) -> Dict[str, Any]:
+    __results = {}
+    for __benchmark in (benchmarks or Benchmarks):
+        print(f"Running benchmark '{__benchmark}' ...", file=sys.stderr)
+        __module = importlib.import_module(f"benchmarks.{__benchmark}")
+        __results[__benchmark] = __module.run()
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "multirunnable": __version__,
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        },
+        "results": __results,
+    }
+
+
+def _print_report(report: Dict[str, List[Dict[str, Any]]]) -> None:
+    for __kind in ("regressions", "improvements"):
+        print(f"{__kind.capitalize()}: {len(report[__kind])}", file=sys.stderr)
+        for __record in report[__kind]:
+            print(f"    {__record['benchmark']}.{__record['key']}: {__record['baseline']:.4g} -> "
+                  f"{__record['value']:.4g} ({__record['change']:+.1%})", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    __parser = argparse.ArgumentParser(description="Run the benchmarks of multirunnable.")
+    __parser.add_argument("--only", nargs="+", choices=Benchmarks, help="The benchmarks to run. It runs all of them by default.")
+    __parser.add_argument("--output", help="The file to save the results as JSON.")
+    __parser.add_argument("--baseline", help="The file of the results to compare with.")
+    __parser.add_argument("--tolerance", type=float, default=_Tolerance, help="The ratio of changing which is acceptable.")
+    __args = __parser.parse_args(argv)
+
+    __record = run(__args.only)
+    if __args.output:
+        with open(__args.output, "w") as __file:
+            json.dump(__record, __file, indent=4)
+    else:
+        print(json.dumps(__record, indent=4))
+
+    if __args.baseline:
+        with open(__args.baseline) as __file:
+            __baseline = json.load(__file)
+        __report = compare(__record["results"], __baseline.get("results", {}), tolerance=__args.tolerance)
+        _print_report(__report)
+        if __report["regressions"]:
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+
+    sys.exit(main())
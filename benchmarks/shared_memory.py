@@ -0,0 +1,59 @@
+"""
+Benchmark: passing large buffer objects to and from the processes pool.
+
+It compares the default transport (pickle the buffers) with the shared
+memory transport (option *shared_memory_threshold*) of 'ProcessPoolStrategy'.
+Each task receives a large bytes object and returns it back.
+
+Usage:
+    python -m benchmarks.shared_memory
+"""
+
+from typing import Dict, Optional
+import time
+import json
+
+from multirunnable.parallel.strategy import ProcessPoolStrategy
+
+
+_Pool_Size: int = 4
+_Tasks: int = 16
+_Buffer_Size: int = 32 * 1024 * 1024
+
+
+def _echo(buffer: bytes) -> bytes:
+    return buffer
+
+
+def _checksum(buffer: bytes) -> int:
+    return buffer[0] + buffer[-1]
+
+
+def _measure(function, threshold: Optional[int]) -> float:
+    __buffers = [bytes([_i % 256]) * _Buffer_Size for _i in range(_Tasks)]
+    __strategy = ProcessPoolStrategy(pool_size=_Pool_Size, shared_memory_threshold=threshold)
+    __strategy.initialization()
+    try:
+        _start = time.perf_counter()
+        __strategy.map(function=function, args_iter=__buffers, chunksize=1)
+        __results = __strategy.get_result()
+        _end = time.perf_counter()
+    finally:
+        __strategy.close()
+    assert len(__results) == _Tasks and all([_r.is_successful for _r in __results]), "All the tasks should be successful."
+    return _end - _start
+
+
+def run(repeat: int = 3) -> Dict[str, float]:
+    __record = {}
+    for _name, _function in (("arguments", _checksum), ("arguments_and_results", _echo)):
+        for _transport, _threshold in (("pickle", None), ("shared_memory", 1024 * 1024)):
+            __seconds = min([_measure(_function, _threshold) for _ in range(repeat)])
+            __record[f"{_name}_{_transport}_ms"] = __seconds * 1000
+            __record[f"{_name}_{_transport}_mb_per_second"] = _Tasks * _Buffer_Size / (1024 * 1024) / __seconds
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,89 @@
+"""
+Benchmark: the throughput of SharedMemoryQueue against multiprocessing.Queue.
+
+A producer process puts the integers and the consumer processes get them
+(one consumer, or many consumers as SPMC). It measures:
+
+    * queue: multiprocessing.Queue with 'put' and 'get'.
+    * shared_memory_queue: SharedMemoryQueue with 'put' and 'get'.
+    * shared_memory_queue_batch: SharedMemoryQueue with 'put_many' and 'get_many'.
+
+All are reported in items per second, and the speedup is against multiprocessing.Queue.
+
+Usage:
+    python -m benchmarks.shared_memory_queue
+"""
+
+from multiprocessing import Process, Queue
+from typing import List, Dict, Optional
+import json
+import time
+
+from multirunnable.parallel.queue import SharedMemoryQueue
+
+
+_Items: int = 100000
+_Consumers: List[int] = [1, 4]
+_Maxsize: int = 4096
+_Batch_Size: int = 256
+_Rounds: int = 3
+# The value which tells the consumer to stop.
+_Stop: int = -1
+
+
+def _produce(queue, items: int, consumers: int, batch: bool) -> None:
+    if batch:
+        queue.put_many(range(items))
+    else:
+        for __value in range(items):
+            queue.put(__value)
+    for _ in range(consumers):
+        queue.put(_Stop)
+
+
+def _consume(queue, batch: bool) -> None:
+    while True:
+        if batch:
+            __values = queue.get_many(max_items=_Batch_Size)
+            if _Stop in __values:
+                # Other consumers' stop values may be in the batch, so hand them back.
+                for _ in range(__values.count(_Stop) - 1):
+                    queue.put(_Stop)
+                return
+        elif queue.get() == _Stop:
+            return
+
+
+def _transfer_seconds(kind: str, items: int, consumers: int) -> float:
+    __batch = kind == "shared_memory_queue_batch"
+    __queue = Queue() if kind == "queue" else SharedMemoryQueue(maxsize=_Maxsize)
+    __workers = [Process(target=_produce, args=(__queue, items, consumers, __batch))]
+    __workers += [Process(target=_consume, args=(__queue, __batch)) for _ in range(consumers)]
+
+    _start = time.perf_counter()
+    for __worker in __workers:
+        __worker.start()
+    for __worker in __workers:
+        __worker.join()
+    __seconds = time.perf_counter() - _start
+
+    if isinstance(__queue, SharedMemoryQueue):
+        __queue.unlink()
+    return __seconds
+
+
+def run(items: int = _Items, consumers: Optional[List[int]] = None, rounds: int = _Rounds) -> Dict[str, float]:
+    __record = {}
+    for __consumers in (consumers or _Consumers):
+        for __kind in ("queue", "shared_memory_queue", "shared_memory_queue_batch"):
+            __seconds = min(_transfer_seconds(__kind, items, __consumers) for _ in range(rounds))
+            __record[f"{__kind}_{__consumers}_consumers_throughput"] = items / __seconds
+        for __kind in ("shared_memory_queue", "shared_memory_queue_batch"):
+            __record[f"{__kind}_{__consumers}_consumers_speedup"] = \
+                __record[f"{__kind}_{__consumers}_consumers_throughput"] / __record[f"queue_{__consumers}_consumers_throughput"]
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,111 @@
+"""
+Benchmark: the cost of spawning one worker in each RunningMode.
+
+For each RunningMode, it runs a trivial function by one worker at a time with
+the strategy ('run' with one executor) and with the native worker (Process,
+Thread, Greenlet and asyncio Task), and reports the latency (microseconds)
+from spawning the worker to it's joined. It's the cost which every 'Executor'
+call pays before its tasks run.
+
+Usage:
+    python -m benchmarks.spawn_cost
+"""
+
+from multiprocessing import Process
+from threading import Thread
+from typing import Dict, Callable
+import statistics
+import asyncio
+import json
+import time
+
+import gevent
+
+from multirunnable.parallel.strategy import ProcessStrategy
+from multirunnable.concurrent.strategy import ThreadStrategy
+from multirunnable.coroutine.strategy import GreenThreadStrategy, AsynchronousStrategy
+
+
+_Spawns: Dict[str, int] = {
+    "Parallel": 50,
+    "Concurrent": 1000,
+    "GreenThread": 5000,
+    "Asynchronous": 2000,
+}
+
+
+def _target() -> int:
+    return 1
+
+
+async def _async_target() -> int:
+    return 1
+
+
+def _spawn_process() -> None:
+    __process = Process(target=_target)
+    __process.start()
+    __process.join()
+
+
+def _spawn_thread() -> None:
+    __thread = Thread(target=_target)
+    __thread.start()
+    __thread.join()
+
+
+def _spawn_green_thread() -> None:
+    gevent.spawn(_target).join()
+
+
+def _spawn_task(loop: asyncio.AbstractEventLoop) -> Callable[[], None]:
+    return lambda: loop.run_until_complete(loop.create_task(_async_target()))
+
+
+def _spawn_by_strategy(strategy, function: Callable) -> Callable[[], None]:
+
+    def __spawn():
+        strategy.run(function=function)
+        strategy.get_result()
+
+    return __spawn
+
+
+def _measure(function: Callable[[], None], spawns: int) -> float:
+    # Warm up the imports and caches at first.
+    function()
+    __latencies = []
+    for _ in range(spawns):
+        _start = time.perf_counter()
+        function()
+        __latencies.append(time.perf_counter() - _start)
+    return statistics.median(__latencies) * 1000000
+
+
+def run(spawns: Dict[str, int] = _Spawns) -> Dict[str, float]:
+    __loop = asyncio.new_event_loop()
+    __async_strategy = AsynchronousStrategy(executors=1)
+    __modes = {
+        "Parallel": (ProcessStrategy(executors=1), _target, _spawn_process),
+        "Concurrent": (ThreadStrategy(executors=1), _target, _spawn_thread),
+        "GreenThread": (GreenThreadStrategy(executors=1), _target, _spawn_green_thread),
+        "Asynchronous": (__async_strategy, _async_target, _spawn_task(__loop)),
+    }
+
+    __record = {}
+    try:
+        for __mode, (__strategy, __target, __native_spawn) in __modes.items():
+            if __mode not in spawns:
+                continue
+            __record[f"{__mode}_spawn_us"] = _measure(_spawn_by_strategy(__strategy, __target), spawns[__mode])
+            __record[f"{__mode}_native_spawn_us"] = _measure(__native_spawn, spawns[__mode])
+            __record[f"{__mode}_overhead_us"] = __record[f"{__mode}_spawn_us"] - __record[f"{__mode}_native_spawn_us"]
+    finally:
+        __async_strategy.shutdown()
+        __loop.close()
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
@@ -0,0 +1,148 @@
+"""
+Benchmark: the prepared statement cache of DatabaseOperator.
+
+A worker runs the same INSERT and SELECT statements again and again with
+sqlite3 in memory through a DatabaseOperator. It compares:
+
+    * shared_cursor: all the statements run with the one cursor of operator
+      (the way before the statement cache).
+    * cursor_per_statement: a new cursor for each statement.
+    * statement_cache: the operator keeps a cursor for each SQL by the
+      prepared statement cache.
+
+sqlite3 has its own cache of compiled statements for each connection
+(*cached_statements*), so each variant runs with it (driver_cache) and
+without it (no_driver_cache) to show the cost of preparing the statement
+for each time which the prepared statements of the database server save.
+It reports the cost of a pair of INSERT and SELECT in microseconds and
+the hit ratio of statement cache.
+
+Usage:
+    python -m benchmarks.statement_cache
+"""
+
+from typing import Tuple, Dict, Any
+import sqlite3
+import timeit
+import json
+
+from multirunnable.persistence.database.strategy import BaseSingleConnection
+from multirunnable.persistence.database.operator import DatabaseOperator
+from multirunnable._singletons import NamedSingletonABCMeta
+
+
+_Statements: int = 20000
+_Insert_SQL: str = "INSERT INTO crawled_data (task, page, content) VALUES (?, ?, ?)"
+_Select_SQL: str = "SELECT page, content FROM crawled_data WHERE task = ? AND page = ?"
+
+
+class _SQLiteConnection(BaseSingleConnection):
+
+    def _connect_database(self, **kwargs) -> sqlite3.Connection:
+        _connection = sqlite3.connect(":memory:", cached_statements=kwargs["cached_statements"])
+        _connection.execute("CREATE TABLE crawled_data (task INTEGER, page INTEGER, content TEXT)")
+        _connection.execute("CREATE INDEX crawled_data_index ON crawled_data (task, page)")
+        return _connection
+
+
+    def commit(self) -> None:
+        self.current_connection.commit()
+
+
+    def _close_connection(self) -> None:
+        if self.current_connection is not None:
+            self.current_connection.close()
+
+
+
+class _SharedCursorOperator(DatabaseOperator):
+
+    _Statement_Cache_Size = 0
+
+    def initial_cursor(self, connection: sqlite3.Connection) -> sqlite3.Cursor:
+        return connection.cursor()
+
+
+    def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> sqlite3.Cursor:
+        return self._cursor.execute(operator, params)
+
+
+    def fetch_many(self, size: int = None) -> list:
+        return self._cursor.fetchmany(size or 1)
+
+
+    def fetch_one(self) -> list:
+        return self._cursor.fetchone()
+
+
+    def close_cursor(self) -> None:
+        self._cursor.close()
+
+
+
+class _CursorPerStatementOperator(_SharedCursorOperator):
+
+    def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> sqlite3.Cursor:
+        self._db_cursor = self.initial_cursor(connection=self._connection)
+        return self._db_cursor.execute(operator, params)
+
+
+
+class _StatementCacheOperator(_SharedCursorOperator):
+
+    _Statement_Cache_Size = 128
+
+    def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> sqlite3.Cursor:
+        return self._statement(operator).execute(operator, params)
+
+
+    def fetch_one(self) -> list:
+        return self._result_cursor.fetchone()
+
+
+
+_Operators = {
+    "shared_cursor": _SharedCursorOperator,
+    "cursor_per_statement": _CursorPerStatementOperator,
+    "statement_cache": _StatementCacheOperator,
+}
+
+
+def _measure(operator_cls, cached_statements: int, statements: int) -> Tuple[float, Dict[str, Any]]:
+    NamedSingletonABCMeta._NamedInstances.pop(_SQLiteConnection.__name__, None)
+    _strategy = _SQLiteConnection(cached_statements=cached_statements, initial=False)
+    _operator = operator_cls(conn_strategy=_strategy, db_config={"cached_statements": cached_statements})
+    _page = iter(range(statements))
+
+    def _statement():
+        __page = next(_page)
+        _operator.execute(_Insert_SQL, (0, __page, "content"))
+        _operator.execute(_Select_SQL, (0, __page))
+        assert _operator.fetch_one() is not None
+
+    try:
+        return timeit.timeit(_statement, number=statements) / statements * 10 ** 6, _operator.statement_cache_stats()
+    finally:
+        _operator.close_connection()
+        NamedSingletonABCMeta._NamedInstances.pop(_SQLiteConnection.__name__, None)
+
+
+def run(statements: int = _Statements) -> Dict[str, float]:
+    __record = {}
+    for __driver_cache, __cached_statements in (("driver_cache", 128), ("no_driver_cache", 0)):
+        for __name, __operator_cls in _Operators.items():
+            __cost, __stats = _measure(__operator_cls, __cached_statements, statements)
+            __record[f"{__driver_cache}_{__name}_us"] = __cost
+            if __stats:
+                __record[f"{__driver_cache}_hit_ratio"] = __stats["hit_ratio"]
+        __record[f"{__driver_cache}_speedup_vs_shared_cursor"] = \
+            __record[f"{__driver_cache}_shared_cursor_us"] / __record[f"{__driver_cache}_statement_cache_us"]
+        __record[f"{__driver_cache}_speedup_vs_cursor_per_statement"] = \
+            __record[f"{__driver_cache}_cursor_per_statement_us"] / __record[f"{__driver_cache}_statement_cache_us"]
+    __record["prepare_saving_speedup"] = __record["no_driver_cache_statement_cache_us"] / __record["driver_cache_statement_cache_us"]
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
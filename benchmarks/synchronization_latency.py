@@ -0,0 +1,177 @@
+"""
+Benchmark: the latency of Lock, Semaphore and Event in each RunningMode.
+
+For each RunningMode, it initializes the features by the adapters (as same
+as 'features' of Executor and Pool) and measures the latency (microseconds)
+of the operators which workers use:
+
+    * lock: acquire and release by 'LockOperator' without contention.
+    * run_with_lock: call a trivial function decorated by 'RunWith.Lock'.
+    * semaphore: acquire and release by 'SemaphoreOperator' (as a context manager,
+      as same as 'RunWith.Semaphore').
+    * event: set, wait and clear by 'EventOperator'.
+    * contended_lock: the average latency of each 'RunWith.Lock' call when
+      some workers (threads, processes, green threads or coroutines) call
+      it at the same time.
+
+Usage:
+    python -m benchmarks.synchronization_latency
+"""
+
+from multiprocessing import Process
+from threading import Thread
+from typing import List, Dict, Callable, Optional
+import asyncio
+import timeit
+import json
+import time
+
+import gevent
+
+from multirunnable.mode import FeatureMode
+from multirunnable.adapter.lock import Lock, Semaphore, AsyncLock, AsyncSemaphore
+from multirunnable.adapter.communication import Event, AsyncEvent
+from multirunnable.api.operator import (
+    LockOperator, SemaphoreOperator, EventOperator,
+    LockAsyncOperator, SemaphoreAsyncOperator, EventAsyncOperator
+)
+from multirunnable.api.decorator import RunWith, AsyncRunWith
+
+
+_Calls: int = 100000
+_Contended_Workers: int = 4
+_Contended_Calls: Dict[str, int] = {
+    "Parallel": 2000,
+    "Concurrent": 20000,
+    "GreenThread": 20000,
+    "Asynchronous": 20000,
+}
+
+
+@RunWith.Lock
+def _locked_target() -> int:
+    return 1
+
+
+@AsyncRunWith.Lock
+async def _async_locked_target() -> int:
+    return 1
+
+
+def _measure(function: Callable[[], None], calls: int, repeat: int = 5) -> float:
+    return min(timeit.repeat(function, number=calls, repeat=repeat)) / calls * 1000000
+
+
+def _call_locked_target(calls: int) -> None:
+    for _ in range(calls):
+        _locked_target()
+
+
+def _contend(mode: FeatureMode, calls: int) -> float:
+    __calls_per_worker = calls // _Contended_Workers
+    _start = time.perf_counter()
+    if mode is FeatureMode.Parallel:
+        __workers = [Process(target=_call_locked_target, args=(__calls_per_worker,)) for _ in range(_Contended_Workers)]
+    elif mode is FeatureMode.Concurrent:
+        __workers = [Thread(target=_call_locked_target, args=(__calls_per_worker,)) for _ in range(_Contended_Workers)]
+    else:
+        __workers = None
+        gevent.joinall([gevent.spawn(_call_locked_target, __calls_per_worker) for _ in range(_Contended_Workers)])
+
+    for __worker in (__workers or []):
+        __worker.start()
+    for __worker in (__workers or []):
+        __worker.join()
+    return (time.perf_counter() - _start) / (__calls_per_worker * _Contended_Workers) * 1000000
+
+
+def _run_mode(mode: FeatureMode, calls: int, contended_calls: int) -> Dict[str, float]:
+    Lock(mode=mode, init=True)
+    Semaphore(mode=mode, init=True, value=1)
+    Event(mode=mode, init=True)
+    __lock, __semaphore, __event = LockOperator(), SemaphoreOperator(), EventOperator()
+
+    def __lock_round():
+        __lock.acquire()
+        __lock.release()
+
+    def __semaphore_round():
+        with __semaphore:
+            pass
+
+    def __event_round():
+        __event.set()
+        __event.wait()
+        __event.clear()
+
+    return {
+        "lock_us": _measure(__lock_round, calls),
+        "run_with_lock_us": _measure(_locked_target, calls),
+        "semaphore_us": _measure(__semaphore_round, calls),
+        "event_us": _measure(__event_round, calls),
+        "contended_lock_us": _contend(mode, contended_calls),
+    }
+
+
+async def _run_async(calls: int, contended_calls: int) -> Dict[str, float]:
+    __event_loop = asyncio.get_running_loop()
+    AsyncLock(mode=FeatureMode.Asynchronous, init=True, event_loop=__event_loop)
+    AsyncSemaphore(mode=FeatureMode.Asynchronous, init=True, value=1, event_loop=__event_loop)
+    AsyncEvent(mode=FeatureMode.Asynchronous, init=True, event_loop=__event_loop)
+    __lock, __semaphore, __event = LockAsyncOperator(), SemaphoreAsyncOperator(), EventAsyncOperator()
+
+    async def __measure(function: Callable, repeat: int = 5) -> float:
+        __seconds = []
+        for _ in range(repeat):
+            _start = time.perf_counter()
+            for _ in range(calls):
+                await function()
+            __seconds.append(time.perf_counter() - _start)
+        return min(__seconds) / calls * 1000000
+
+    async def __lock_round():
+        await __lock.acquire()
+        __lock.release()
+
+    async def __semaphore_round():
+        async with __semaphore:
+            pass
+
+    async def __event_round():
+        __event.set()
+        await __event.wait()
+        __event.clear()
+
+    async def __call_locked_target(worker_calls: int):
+        for _ in range(worker_calls):
+            await _async_locked_target()
+            # Yield to the other coroutines, or there isn't any contention.
+            await asyncio.sleep(0)
+
+    __record = {
+        "lock_us": await __measure(__lock_round),
+        "run_with_lock_us": await __measure(_async_locked_target),
+        "semaphore_us": await __measure(__semaphore_round),
+        "event_us": await __measure(__event_round),
+    }
+    __calls_per_worker = contended_calls // _Contended_Workers
+    _start = time.perf_counter()
+    await asyncio.gather(*[__call_locked_target(__calls_per_worker) for _ in range(_Contended_Workers)])
+    __record["contended_lock_us"] = (time.perf_counter() - _start) / (__calls_per_worker * _Contended_Workers) * 1000000
+    return __record
+
+
+def run(modes: Optional[List[str]] = None, calls: int = _Calls, contended_calls: Dict[str, int] = _Contended_Calls) -> Dict[str, float]:
+    __record = {}
+    for __mode in (modes or list(contended_calls.keys())):
+        if __mode == "Asynchronous":
+            __mode_record = asyncio.run(_run_async(calls, contended_calls[__mode]))
+        else:
+            __mode_record = _run_mode(FeatureMode[__mode], calls, contended_calls[__mode])
+        __record.update({f"{__mode}_{__key}": __value for __key, __value in __mode_record.items()})
+    return __record
+
+
+if __name__ == '__main__':
+
+    print(json.dumps(run(), indent=4))
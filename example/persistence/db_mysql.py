@@ -9,7 +9,7 @@ from typing import Tuple, Dict, Any, cast, Generic, Union
 from mysql.connector.connection import MySQLConnection
 from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection
 from mysql.connector.errors import PoolError
-from mysql.connector.cursor import MySQLCursor
+from mysql.connector.cursor import MySQLCursor, MySQLCursorPrepared
 import mysql.connector
 import logging
 import time
@@ -114,24 +114,33 @@ class MySQLOperator(DatabaseOperator):
         return connection.cursor(buffered=True)
 
 
+    def _prepare_statement(self, operator: str) -> MySQLCursorPrepared:
+        # Prepare the statement in MySQL server once, and the cache reuses it by the SQL.
+        return self._connection.cursor(prepared=True)
+
+
     def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> MySQLCursor:
-        return self._cursor.execute(operation=operator, params=params, multi=multi)
+        if multi is True:
+            # The prepared statement doesn't support multiple statements.
+            self._last_statement = self._cursor
+            return self._cursor.execute(operation=operator, params=params, multi=multi)
+        return self._statement(operator).execute(operation=operator, params=params or ())
 
 
     def execute_many(self, operator: Any, seq_params=None) -> MySQLCursor:
-        return self._cursor.executemany(operation=operator, seq_params=seq_params)
+        return self._statement(operator).executemany(operation=operator, seq_params=seq_params)
 
 
     def fetch_one(self) -> list:
-        return self._cursor.fetchone()
+        return self._result_cursor.fetchone()
 
 
     def fetch_many(self, size: int = None) -> list:
-        return self._cursor.fetchmany(size=size)
+        return self._result_cursor.fetchmany(size=size)
 
 
     def fetch_all(self) -> list:
-        return self._cursor.fetchall()
+        return self._result_cursor.fetchall()
 
 
     def close_cursor(self) -> None:
@@ -30,6 +30,9 @@ from multirunnable.mode import RunningMode, FeatureMode
 from multirunnable.tasks import QueueTask
 from multirunnable.executor import SimpleExecutor
 from multirunnable.pool import SimplePool
+from multirunnable.framework.runnable.pool_registry import PoolLifecycle, Pool_Registry
+from multirunnable.framework.runnable.autoscale import ScalingPolicy, ScalingEvent
+from multirunnable.framework.runnable.metrics import Metrics, MetricsExporter, LoggingExporter, InMemoryExporter
 from multirunnable._import_utils import ImportMultiRunnable as _ImportMultiRunnable
 from multirunnable._config import set_mode, get_current_mode
 
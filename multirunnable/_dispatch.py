@@ -0,0 +1,133 @@
+from typing import List, Tuple, Dict, Callable, Optional, Any
+from types import MethodType
+import sys
+
+
+
+class MethodDispatcher:
+    """
+    Description:
+        A method which has multiple implementations for different types of its
+        positional arguments, like *multipledispatch.dispatch* does.
+
+        The difference is the resolving. It only resolves the implementation
+        once for each combination of argument types, and saves it in a table.
+        So the calling in hot path (generating, activating and closing workers)
+        is only a dictionary lookup instead of resolving by MRO every time.
+    """
+
+    def __init__(self, name: str):
+        self.__name__ = name
+        self.__doc__ = None
+        self._Signatures: List[Tuple[Tuple[tuple, ...], Callable]] = []
+        self._Dispatch_Table: Dict[Tuple[type, ...], Callable] = {}
+
+
+    def __repr__(self):
+        return f"<MethodDispatcher: {self.__name__}>"
+
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return MethodType(self, instance)
+
+
+    def __call__(self, instance, *args, **kwargs) -> Any:
+        __types = tuple(map(type, args))
+        try:
+            __function = self._Dispatch_Table[__types]
+        except KeyError:
+            __function = self.resolve(__types)
+        return __function(instance, *args, **kwargs)
+
+
+    def add(self, types: Tuple[tuple, ...], function: Callable) -> None:
+        """
+        Description:
+            Register an implementation. Each element of *types* is a tuple of the
+            acceptable classes of the positional argument in the same index.
+        :param types:
+        :param function:
+        :return:
+        """
+
+        if self.__doc__ is None:
+            self.__doc__ = function.__doc__
+        self._Signatures.append((types, function))
+        self._Dispatch_Table.clear()
+
+
+    def resolve(self, types: Tuple[type, ...]) -> Callable:
+        """
+        Description:
+            Find the most specific implementation for the types of arguments and
+            save it into the dispatch table. The distance of a class is its index
+            in the MRO of the argument type, and the distance of a virtual subclass
+            (for example, *list* of *collections.abc.Iterable*) is the longest one.
+            It chooses the first registered one if there are more than one.
+        :param types:
+        :return:
+        """
+
+        __function: Optional[Callable] = None
+        __min_distance: Optional[int] = None
+        for __signature, __implementation in self._Signatures:
+            __distance = MethodDispatcher._distance(types, __signature)
+            if __distance is not None and (__min_distance is None or __distance < __min_distance):
+                __function, __min_distance = __implementation, __distance
+
+        if __function is None:
+            __types_str = ", ".join(__type.__name__ for __type in types)
+            raise NotImplementedError(f"Could not find signature for {self.__name__}: <{__types_str}>")
+
+        self._Dispatch_Table[types] = __function
+        return __function
+
+
+    @staticmethod
+    def _distance(types: Tuple[type, ...], signature: Tuple[tuple, ...]) -> Optional[int]:
+        if len(types) != len(signature):
+            return None
+
+        __distance = 0
+        for __type, __accepted_types in zip(types, signature):
+            __mro = __type.__mro__
+            __indexes = [__mro.index(__accepted) for __accepted in __accepted_types if __accepted in __mro]
+            if __indexes:
+                __distance += min(__indexes)
+            elif issubclass(__type, __accepted_types):
+                __distance += len(__mro)
+            else:
+                return None
+        return __distance
+
+
+
+def method_dispatch(*types, **kwargs) -> Callable[[Callable], MethodDispatcher]:
+    """
+    Description:
+        Decorate on methods which have the same name in class to let them be
+        one method which dispatches by the types of positional arguments.
+        Each type could be a class or a tuple of classes. The keyword arguments
+        (for example, *args=tuple*) are only for describing and never be checked.
+
+        It works like *multipledispatch.dispatch* on methods, but the resolving
+        result is saved for each combination of argument types.
+    :param types:
+    :return:
+    """
+
+    __signature = tuple(__type if isinstance(__type, tuple) else (__type,) for __type in types)
+    # The namespace of the class body which is defining the method. It only be
+    # used at the time of defining class, never at the time of calling method.
+    __namespace = sys._getframe(1).f_locals
+
+    def _register(function: Callable) -> MethodDispatcher:
+        __dispatcher = __namespace.get(function.__name__)
+        if not isinstance(__dispatcher, MethodDispatcher):
+            __dispatcher = MethodDispatcher(name=function.__name__)
+        __dispatcher.add(__signature, function)
+        return __dispatcher
+
+    return _register
@@ -1,2 +1,2 @@
-from .lock import Lock, RLock, Semaphore, BoundedSemaphore
+from .lock import Lock, RLock, Semaphore, BoundedSemaphore, ReadWriteLock, ShardedLock
 from .communication import Event, Condition
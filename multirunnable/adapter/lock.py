@@ -1,10 +1,17 @@
-__all__ = ["Lock", "RLock", "Semaphore", "BoundedSemaphore"]
+__all__ = ["Lock", "RLock", "Semaphore", "BoundedSemaphore", "ReadWriteLock", "ShardedLock"]
+
+from typing import Hashable
 
 from ..framework.adapter import BaseLockAdapter, BaseAsyncLockAdapter
-from ..factory import LockFactory, RLockFactory, SemaphoreFactory, BoundedSemaphoreFactory
+from ..factory import (
+    LockFactory, RLockFactory, SemaphoreFactory, BoundedSemaphoreFactory,
+    ReadWriteLockFactory, ShardedLockFactory
+)
 from ..api import (
     LockOperator, RLockOperator, SemaphoreOperator, BoundedSemaphoreOperator,
-    LockAsyncOperator, SemaphoreAsyncOperator, BoundedSemaphoreAsyncOperator
+    ReadWriteLockOperator, ShardedLockOperator,
+    LockAsyncOperator, SemaphoreAsyncOperator, BoundedSemaphoreAsyncOperator,
+    ReadWriteLockAsyncOperator, ShardedLockAsyncOperator
 )
 
 
@@ -89,6 +96,86 @@ class BoundedSemaphore(Semaphore):
 
 
 
+class ReadWriteLock(BaseLockAdapter):
+
+    def _instantiate_factory(self) -> ReadWriteLockFactory:
+        return ReadWriteLockFactory()
+
+
+    def _instantiate_operator(self) -> ReadWriteLockOperator:
+        return ReadWriteLockOperator()
+
+
+    def acquire(self) -> None:
+        """
+        Description:
+            Acquire as a writer. It's exclusive as *Lock*.
+        :return:
+        """
+        self._feature_operator.acquire_write()
+
+
+    def release(self) -> None:
+        self._feature_operator.release_write()
+
+
+    def acquire_read(self) -> None:
+        self._feature_operator.acquire_read()
+
+
+    def release_read(self) -> None:
+        self._feature_operator.release_read()
+
+
+    def acquire_write(self) -> None:
+        self._feature_operator.acquire_write()
+
+
+    def release_write(self) -> None:
+        self._feature_operator.release_write()
+
+
+    def reading(self):
+        return self._feature_operator.reading()
+
+
+    def writing(self):
+        return self._feature_operator.writing()
+
+
+
+class ShardedLock(BaseLockAdapter):
+
+    def __init__(self, shards: int = 16, **kwargs):
+        self._shards = shards
+        super().__init__(**kwargs)
+
+
+    def __enter__(self):
+        raise TypeError("It needs a key to choose the lock. Please use method 'locking' with the key.")
+
+
+    def _instantiate_factory(self) -> ShardedLockFactory:
+        return ShardedLockFactory(shards=self._shards)
+
+
+    def _instantiate_operator(self) -> ShardedLockOperator:
+        return ShardedLockOperator()
+
+
+    def acquire(self, key: Hashable) -> None:
+        self._feature_operator.acquire(key)
+
+
+    def release(self, key: Hashable) -> None:
+        self._feature_operator.release(key)
+
+
+    def locking(self, key: Hashable):
+        return self._feature_operator.locking(key)
+
+
+
 class AsyncLock(BaseAsyncLockAdapter):
 
     def _instantiate_factory(self) -> LockFactory:
@@ -145,3 +232,78 @@ class AsyncBoundedSemaphore(AsyncSemaphore):
     def release(self, *args, **kwargs) -> None:
         self._feature_operator.release()
 
+
+
+
+class AsyncReadWriteLock(BaseAsyncLockAdapter):
+
+    def _instantiate_factory(self) -> ReadWriteLockFactory:
+        return ReadWriteLockFactory()
+
+
+    def _instantiate_operator(self) -> ReadWriteLockAsyncOperator:
+        return ReadWriteLockAsyncOperator()
+
+
+    async def acquire(self, *args, **kwargs) -> None:
+        await self._feature_operator.acquire_write()
+
+
+    def release(self, *args, **kwargs) -> None:
+        self._feature_operator.release_write()
+
+
+    async def acquire_read(self) -> None:
+        await self._feature_operator.acquire_read()
+
+
+    async def release_read(self) -> None:
+        await self._feature_operator.release_read()
+
+
+    async def acquire_write(self) -> None:
+        await self._feature_operator.acquire_write()
+
+
+    def release_write(self) -> None:
+        self._feature_operator.release_write()
+
+
+    def reading(self):
+        return self._feature_operator.reading()
+
+
+    def writing(self):
+        return self._feature_operator.writing()
+
+
+
+class AsyncShardedLock(BaseAsyncLockAdapter):
+
+    def __init__(self, shards: int = 16, **kwargs):
+        self._shards = shards
+        super().__init__(**kwargs)
+
+
+    async def __aenter__(self):
+        raise TypeError("It needs a key to choose the lock. Please use method 'locking' with the key.")
+
+
+    def _instantiate_factory(self) -> ShardedLockFactory:
+        return ShardedLockFactory(shards=self._shards)
+
+
+    def _instantiate_operator(self) -> ShardedLockAsyncOperator:
+        return ShardedLockAsyncOperator()
+
+
+    async def acquire(self, key: Hashable) -> None:
+        await self._feature_operator.acquire(key)
+
+
+    def release(self, key: Hashable) -> None:
+        self._feature_operator.release(key)
+
+
+    def locking(self, key: Hashable):
+        return self._feature_operator.locking(key)
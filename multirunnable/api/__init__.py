@@ -4,14 +4,26 @@ from .operator import (
     RLockOperator,
     SemaphoreOperator,
     BoundedSemaphoreOperator,
+    ReadWriteLockOperator,
+    ShardedLockOperator,
     EventOperator,
     ConditionOperator,
     LockAsyncOperator,
     SemaphoreAsyncOperator,
     BoundedSemaphoreAsyncOperator,
+    ReadWriteLockAsyncOperator,
+    ShardedLockAsyncOperator,
     EventAsyncOperator,
     ConditionAsyncOperator,
-    QueueOperator)
+    QueueOperator,
+    QueueAsyncOperator)
+from .contention import ContentionMonitor, LockContention
+from .retry_policy import (
+    RetryPolicy,
+    RetryBudget,
+    ConstantBackoff,
+    ExponentialBackoff,
+    DecorrelatedJitterBackoff)
 from .decorator import (
     retry as _retry,
     async_retry as _async_retry,
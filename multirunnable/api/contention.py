@@ -0,0 +1,281 @@
+from typing import List, Dict, Optional, Any
+from threading import Lock, current_thread
+from os import getpid
+import asyncio
+import logging
+import random
+import time
+
+from gevent import getcurrent as _get_current_greenlet, Greenlet as _Greenlet
+
+from ..framework.runnable.metrics import Histogram as _Histogram, MetricsExporter as _MetricsExporter
+from .. import PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION
+
+
+
+def _holder_name() -> str:
+    """
+    Description:
+        The identity of the current worker: the asyncio task, the green thread
+        or the thread (with the process ID).
+    :return:
+    """
+
+    try:
+        if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
+            __task = asyncio.current_task()
+        else:
+            __task = asyncio.Task.current_task()
+    except RuntimeError:
+        __task = None
+    if __task is not None:
+        if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) >= (3, 8):
+            return f"{getpid()}:{__task.get_name()}"
+        else:
+            return f"{getpid()}:AsyncTask-{id(__task)}"
+
+    __greenlet = _get_current_greenlet()
+    if isinstance(__greenlet, _Greenlet):
+        return f"{getpid()}:{__greenlet.name}"
+    return f"{getpid()}:{current_thread().name}"
+
+
+
+class LockContention:
+    """
+    Description:
+        The contention of one lock (or semaphore). It counts all the acquisitions,
+        but only measures the sampled ones:
+
+            * wait: from the worker starts to acquire to it gets the lock.
+            * hold: from the worker gets the lock to it releases the lock.
+
+        The workers which hold the lock are recorded by the sampled acquisitions.
+    """
+
+    _Max_Holders: int = 1000
+
+    def __init__(self, name: str, max_samples: int = 10000):
+        self.name = name
+        self.acquisitions = 0
+        self.__lock = Lock()
+        self.__wait = _Histogram(max_samples=max_samples)
+        self.__hold = _Histogram(max_samples=max_samples)
+        # The sampled workers which are holding the lock now: {holder: the time it gets the lock}
+        self.holding: Dict[str, float] = {}
+        # {holder: [sampled acquisitions, hold time]}
+        self.__holders: Dict[str, List[float]] = {}
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name}, acquisitions={self.acquisitions}, sampled={len(self.__wait)})"
+
+
+    def record_acquisition(self, start_time: Optional[float] = None) -> None:
+        """
+        Description:
+            Count an acquisition, and record its wait time if it's sampled.
+        :param start_time: The time it starts to acquire, None if it isn't sampled.
+        :return:
+        """
+
+        if start_time is None:
+            with self.__lock:
+                self.acquisitions += 1
+            return
+
+        __acquired_time = time.perf_counter()
+        __holder = _holder_name()
+        with self.__lock:
+            self.acquisitions += 1
+            self.__wait.add(__acquired_time - start_time)
+            self.holding[__holder] = __acquired_time
+
+
+    def record_wait(self, start_time: float) -> None:
+        __acquired_time = time.perf_counter()
+        __holder = _holder_name()
+        with self.__lock:
+            self.__wait.add(__acquired_time - start_time)
+            self.holding[__holder] = __acquired_time
+
+
+    def record_hold(self) -> None:
+        __holder = _holder_name()
+        with self.__lock:
+            __acquired_time = self.holding.pop(__holder, None)
+            if __acquired_time is None:
+                # It's released by the worker which isn't sampled, or by the other worker.
+                return
+            __hold_time = time.perf_counter() - __acquired_time
+            self.__hold.add(__hold_time)
+            if __holder in self.__holders:
+                self.__holders[__holder][0] += 1
+                self.__holders[__holder][1] += __hold_time
+            elif len(self.__holders) < self._Max_Holders:
+                self.__holders[__holder] = [1, __hold_time]
+
+
+    def snapshot(self, top_holders: int = 3) -> Dict[str, Any]:
+        """
+        Description:
+            The current contention. The estimated wait time is the mean of sampled
+            wait times multiplies all the acquisitions.
+        :param top_holders: The amount of workers which hold the lock the longest.
+        :return:
+        """
+
+        with self.__lock:
+            __wait, __hold = self.__wait.summary(), self.__hold.summary()
+            __holders = sorted(self.__holders.items(), key=lambda _holder: _holder[1][1], reverse=True)[:top_holders]
+            return {
+                "name": self.name,
+                "acquisitions": self.acquisitions,
+                "sampled": __wait["count"],
+                "estimated_wait_time": (__wait["mean"] or 0.0) * self.acquisitions,
+                "wait": __wait,
+                "hold": __hold,
+                "holding": list(self.holding.keys()),
+                "top_holders": [{"holder": _holder, "acquisitions": int(_acquisitions), "hold_time": _hold_time}
+                                for _holder, (_acquisitions, _hold_time) in __holders],
+            }
+
+
+
+class ContentionMonitor:
+    """
+    Description:
+        The instrumentation of the contention of Lock and Semaphore. It's disabled by default.
+        If it's enabled, the operators ('LockOperator', 'SemaphoreOperator', their asynchronous
+        versions and the decorators in 'RunWith' and 'AsyncRunWith') count every acquisition and
+        measure the sampled ones, so that it's cheap enough to be always on.
+
+        The contention is kept in the memory of each process. In Parallel mode, the
+        report of the main process doesn't include the contention of the child processes.
+    """
+
+    _Enabled: bool = False
+    _Sample_Rate: float = 0.01
+    _Max_Samples: int = 10000
+    _Contentions: Dict[str, LockContention] = {}
+    _Contentions_Lock: Lock = Lock()
+
+    def __init__(self):
+        raise RuntimeError("It shouldn't instantiate ContentionMonitor object.")
+
+
+    @classmethod
+    def enable(cls, sample_rate: float = 0.01, max_samples: int = 10000) -> None:
+        """
+        Description:
+            Start to record the contention.
+        :param sample_rate: The ratio (0 - 1) of acquisitions which are measured.
+        :param max_samples: The amount of latest sampled times which are kept for the percentiles of each lock.
+        :return:
+        """
+
+        if not 0 < sample_rate <= 1:
+            raise ValueError("The option *sample_rate* should be bigger than 0 and smaller than or equal to 1.")
+        cls._Sample_Rate = sample_rate
+        cls._Max_Samples = max_samples
+        cls._Enabled = True
+
+
+    @classmethod
+    def disable(cls) -> None:
+        cls._Enabled = False
+
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        return cls._Enabled
+
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._Contentions_Lock:
+            cls._Contentions = {}
+
+
+    @classmethod
+    def start(cls) -> Optional[float]:
+        """
+        Description:
+            Called before acquiring the lock.
+        :return: The time it starts to acquire if this acquisition is sampled, or None.
+        """
+
+        if cls._Enabled is False or random.random() >= cls._Sample_Rate:
+            return None
+        return time.perf_counter()
+
+
+    @classmethod
+    def acquired(cls, name: str, start_time: Optional[float]) -> None:
+        """
+        Description:
+            Called after the lock is acquired.
+        :param name: The name of lock.
+        :param start_time: The return value of 'start'.
+        :return:
+        """
+
+        if cls._Enabled is False:
+            return
+        __contention = cls._Contentions.get(name, None) or cls.get_contention(name)
+        __contention.record_acquisition(start_time)
+
+
+    @classmethod
+    def releasing(cls, name: str) -> None:
+        """
+        Description:
+            Called before the lock is released.
+        :param name: The name of lock.
+        :return:
+        """
+
+        if cls._Enabled is False:
+            return
+        __contention = cls._Contentions.get(name, None)
+        if __contention is not None and __contention.holding:
+            __contention.record_hold()
+
+
+    @classmethod
+    def get_contention(cls, name: str) -> LockContention:
+        with cls._Contentions_Lock:
+            if name not in cls._Contentions:
+                cls._Contentions[name] = LockContention(name=name, max_samples=cls._Max_Samples)
+            return cls._Contentions[name]
+
+
+    @classmethod
+    def report(cls, top: int = 10) -> List[Dict[str, Any]]:
+        """
+        Description:
+            The most contended locks, sorted by the estimated wait time.
+        :param top: The amount of locks in the report.
+        :return:
+        """
+
+        __snapshots = [_contention.snapshot() for _contention in list(cls._Contentions.values())]
+        return sorted(__snapshots, key=lambda _snapshot: _snapshot["estimated_wait_time"], reverse=True)[:top]
+
+
+    @classmethod
+    def export(cls, exporter: _MetricsExporter, top: int = 10) -> List[Dict[str, Any]]:
+        """
+        Description:
+            Export the report by the exporter of metrics.
+        :param exporter:
+        :param top: The amount of locks in the report.
+        :return: The report.
+        """
+
+        __report = cls.report(top=top)
+        try:
+            exporter.export("contention", {"locks": __report})
+        except Exception as e:
+            logging.warning(f"Fail to export the contention of locks: {e}")
+        return __report
@@ -1,6 +1,6 @@
 from functools import wraps
 from inspect import isclass as inspect_isclass
-from typing import List, Callable, Type, Any, Union, Optional
+from typing import List, Callable, Hashable, Type, Any, Union, Optional
 from types import MethodType, FunctionType
 from abc import ABCMeta, abstractmethod
 
@@ -10,9 +10,13 @@ from ..api.operator import (
     RLockOperator as _RLockOperator,
     SemaphoreOperator as _SemaphoreOperator,
     BoundedSemaphoreOperator as _BoundedSemaphoreOperator,
+    ReadWriteLockOperator as _ReadWriteLockOperator,
+    ShardedLockOperator as _ShardedLockOperator,
     LockAsyncOperator as _LockAsyncOperator,
     SemaphoreAsyncOperator as _SemaphoreAsyncOperator,
-    BoundedSemaphoreAsyncOperator as _BoundedSemaphoreAsyncOperator
+    BoundedSemaphoreAsyncOperator as _BoundedSemaphoreAsyncOperator,
+    ReadWriteLockAsyncOperator as _ReadWriteLockAsyncOperator,
+    ShardedLockAsyncOperator as _ShardedLockAsyncOperator
 )
 from ._retry import (
     _BaseRetry,
@@ -20,6 +24,7 @@ from ._retry import (
     _BaseAsyncRetry,
     _AsyncRetryFunction, _AsyncRetryBoundedFunction
 )
+from .retry_policy import RetryPolicy as _RetryPolicy
 
 
 class InstantiateError(RuntimeError):
@@ -40,27 +45,28 @@ class _BaseRetryDecorator(metaclass=ABCMeta):
 
     @staticmethod
     @abstractmethod
-    def function(function=None, timeout: int = 1):
+    def function(function=None, timeout: int = 1, policy: Optional[_RetryPolicy] = None):
         pass
 
 
     @staticmethod
     @abstractmethod
-    def bounded_function(function: Optional[FunctionType] = None, timeout: int = 1):
+    def bounded_function(function: Optional[FunctionType] = None, timeout: int = 1, policy: Optional[_RetryPolicy] = None):
         pass
 
 
     @classmethod
-    def _retry_process(cls, retry_mechanism: Type[Union[_BaseRetry, _BaseAsyncRetry]], function: Optional[FunctionType] = None, timeout: int = 1):
+    def _retry_process(cls, retry_mechanism: Type[Union[_BaseRetry, _BaseAsyncRetry]], function: Optional[FunctionType] = None,
+                       timeout: int = 1, policy: Optional[_RetryPolicy] = None):
         if inspect_isclass(function) is True:
             raise ValueError("The target object be decorated should be a 'function' type object.")
 
         if function:
-            return retry_mechanism(function=function, timeout=timeout)
+            return retry_mechanism(function=function, timeout=timeout, policy=policy)
         else:
             @wraps(function)
             def __retry(function: Callable):
-                return retry_mechanism(function=function, timeout=timeout)
+                return retry_mechanism(function=function, timeout=timeout, policy=policy)
 
             return __retry
 
@@ -69,43 +75,43 @@ class _BaseRetryDecorator(metaclass=ABCMeta):
 class retry(_BaseRetryDecorator):
 
     @staticmethod
-    def function(function: Optional[FunctionType] = None, timeout: int = 1):
-        return retry._retry_process(retry_mechanism=_RetryFunction, function=function, timeout=timeout)
+    def function(function: Optional[FunctionType] = None, timeout: int = 1, policy: Optional[_RetryPolicy] = None):
+        return retry._retry_process(retry_mechanism=_RetryFunction, function=function, timeout=timeout, policy=policy)
 
 
     @staticmethod
-    def bounded_function(function: Optional[FunctionType] = None, timeout: int = 1):
-        return retry._retry_process(retry_mechanism=_RetryBoundedFunction, function=function, timeout=timeout)
+    def bounded_function(function: Optional[FunctionType] = None, timeout: int = 1, policy: Optional[_RetryPolicy] = None):
+        return retry._retry_process(retry_mechanism=_RetryBoundedFunction, function=function, timeout=timeout, policy=policy)
 
 
 
 class async_retry(_BaseRetryDecorator):
 
     @staticmethod
-    def function(function: Optional[FunctionType] = None, timeout: int = 1):
-        return async_retry._retry_process(retry_mechanism=_AsyncRetryFunction, function=function, timeout=timeout)
+    def function(function: Optional[FunctionType] = None, timeout: int = 1, policy: Optional[_RetryPolicy] = None):
+        return async_retry._retry_process(retry_mechanism=_AsyncRetryFunction, function=function, timeout=timeout, policy=policy)
 
 
     @staticmethod
-    def bounded_function(function: Optional[FunctionType] = None, timeout: int = 1):
-        return async_retry._retry_process(retry_mechanism=_AsyncRetryBoundedFunction, function=function, timeout=timeout)
+    def bounded_function(function: Optional[FunctionType] = None, timeout: int = 1, policy: Optional[_RetryPolicy] = None):
+        return async_retry._retry_process(retry_mechanism=_AsyncRetryBoundedFunction, function=function, timeout=timeout, policy=policy)
 
 
 
-def retry_function(function: Optional[Union[FunctionType, MethodType]] = None, timeout: int = 1):
-    return retry.function(function=function, timeout=timeout)
+def retry_function(function: Optional[Union[FunctionType, MethodType]] = None, timeout: int = 1, policy: Optional[_RetryPolicy] = None):
+    return retry.function(function=function, timeout=timeout, policy=policy)
 
 
-def retry_bounded_function(function: Optional[Union[FunctionType, MethodType]] = None, timeout: int = 1):
-    return retry.bounded_function(function=function, timeout=timeout)
+def retry_bounded_function(function: Optional[Union[FunctionType, MethodType]] = None, timeout: int = 1, policy: Optional[_RetryPolicy] = None):
+    return retry.bounded_function(function=function, timeout=timeout, policy=policy)
 
 
-def async_retry_function(function: Callable = None, timeout: int = 1):
-    return async_retry.function(function=function, timeout=timeout)
+def async_retry_function(function: Callable = None, timeout: int = 1, policy: Optional[_RetryPolicy] = None):
+    return async_retry.function(function=function, timeout=timeout, policy=policy)
 
 
-def async_retry_bounded_function(function: Callable = None, timeout: int = 1):
-    return async_retry.bounded_function(function=function, timeout=timeout)
+def async_retry_bounded_function(function: Callable = None, timeout: int = 1, policy: Optional[_RetryPolicy] = None):
+    return async_retry.bounded_function(function=function, timeout=timeout, policy=policy)
 
 
 
@@ -126,7 +132,7 @@ class RunWith:
 
         @wraps(function)
         def __lock_process(*args, **kwargs) -> List[Type[_MRResult]]:
-            __lock = _LockOperator()
+            __lock = _LockOperator(name=function.__qualname__)
 
             with __lock:
                 result = function(*args, **kwargs)
@@ -166,7 +172,7 @@ class RunWith:
 
         @wraps(function)
         def __semaphore_process(*args, **kwargs) -> List[Type[_MRResult]]:
-            __semaphore = _SemaphoreOperator()
+            __semaphore = _SemaphoreOperator(name=function.__qualname__)
 
             with __semaphore:
                 result = function(*args, **kwargs)
@@ -186,7 +192,7 @@ class RunWith:
 
         @wraps(function)
         def __bounded_semaphore_process(*args, **kwargs) -> List[Type[_MRResult]]:
-            __bounded_semaphore = _BoundedSemaphoreOperator()
+            __bounded_semaphore = _BoundedSemaphoreOperator(name=function.__qualname__)
 
             with __bounded_semaphore:
                 result = function(*args, **kwargs)
@@ -195,6 +201,73 @@ class RunWith:
         return __bounded_semaphore_process
 
 
+    @staticmethod
+    def Read_Lock(function: Callable[[Any, Any], List[Type[_MRResult]]]):
+        """
+        Description:
+            A decorator which would hold the read-write lock as a reader
+            around the target function. Many readers could run at the
+            same time, but not with any writer.
+        :return:
+        """
+
+        @wraps(function)
+        def __read_lock_process(*args, **kwargs) -> List[Type[_MRResult]]:
+            __rwlock = _ReadWriteLockOperator(name=function.__qualname__)
+
+            with __rwlock.reading():
+                result = function(*args, **kwargs)
+            return result
+
+        return __read_lock_process
+
+
+    @staticmethod
+    def Write_Lock(function: Callable[[Any, Any], List[Type[_MRResult]]]):
+        """
+        Description:
+            A decorator which would hold the read-write lock as a writer
+            around the target function. It runs exclusively.
+        :return:
+        """
+
+        @wraps(function)
+        def __write_lock_process(*args, **kwargs) -> List[Type[_MRResult]]:
+            __rwlock = _ReadWriteLockOperator(name=function.__qualname__)
+
+            with __rwlock.writing():
+                result = function(*args, **kwargs)
+            return result
+
+        return __write_lock_process
+
+
+    @staticmethod
+    def Sharded_Lock(key: Callable[..., Hashable]):
+        """
+        Description:
+            A decorator which would hold the lock of the sharded lock which
+            is chosen by the key around the target function. The calls with
+            the different keys could run at the same time.
+        :param key: A function which gets the key from the arguments of target function.
+        :return:
+        """
+
+        def __decorator(function: Callable[[Any, Any], List[Type[_MRResult]]]):
+
+            @wraps(function)
+            def __sharded_lock_process(*args, **kwargs) -> List[Type[_MRResult]]:
+                __sharded_lock = _ShardedLockOperator(name=function.__qualname__)
+
+                with __sharded_lock.locking(key(*args, **kwargs)):
+                    result = function(*args, **kwargs)
+                return result
+
+            return __sharded_lock_process
+
+        return __decorator
+
+
 
 class AsyncRunWith:
 
@@ -212,7 +285,7 @@ class AsyncRunWith:
 
         @wraps(function)
         async def __lock_process(*args, **kwargs) -> List[Type[_MRResult]]:
-            __lock = _LockAsyncOperator()
+            __lock = _LockAsyncOperator(name=function.__qualname__)
 
             async with __lock:
                 result = await function(*args, **kwargs)
@@ -231,7 +304,7 @@ class AsyncRunWith:
 
         @wraps(function)
         async def __semaphore_process(*args, **kwargs) -> List[Type[_MRResult]]:
-            __semaphore = _SemaphoreAsyncOperator()
+            __semaphore = _SemaphoreAsyncOperator(name=function.__qualname__)
 
             async with __semaphore:
                 result = await function(*args, **kwargs)
@@ -250,7 +323,7 @@ class AsyncRunWith:
 
         @wraps(function)
         async def __bounded_semaphore_process(*args, **kwargs) -> List[Type[_MRResult]]:
-            __bounded_semaphore = _BoundedSemaphoreAsyncOperator()
+            __bounded_semaphore = _BoundedSemaphoreAsyncOperator(name=function.__qualname__)
 
             async with __bounded_semaphore:
                 result = await function(*args, **kwargs)
@@ -258,3 +331,65 @@ class AsyncRunWith:
 
         return __bounded_semaphore_process
 
+
+    @staticmethod
+    def Read_Lock(function: Callable):
+        """
+        Description:
+            Asynchronous version of run_with_read_lock.
+        :return:
+        """
+
+        @wraps(function)
+        async def __read_lock_process(*args, **kwargs) -> List[Type[_MRResult]]:
+            __rwlock = _ReadWriteLockAsyncOperator(name=function.__qualname__)
+
+            async with __rwlock.reading():
+                result = await function(*args, **kwargs)
+            return result
+
+        return __read_lock_process
+
+
+    @staticmethod
+    def Write_Lock(function: Callable):
+        """
+        Description:
+            Asynchronous version of run_with_write_lock.
+        :return:
+        """
+
+        @wraps(function)
+        async def __write_lock_process(*args, **kwargs) -> List[Type[_MRResult]]:
+            __rwlock = _ReadWriteLockAsyncOperator(name=function.__qualname__)
+
+            async with __rwlock.writing():
+                result = await function(*args, **kwargs)
+            return result
+
+        return __write_lock_process
+
+
+    @staticmethod
+    def Sharded_Lock(key: Callable[..., Hashable]):
+        """
+        Description:
+            Asynchronous version of run_with_sharded_lock.
+        :param key: A function which gets the key from the arguments of target function.
+        :return:
+        """
+
+        def __decorator(function: Callable):
+
+            @wraps(function)
+            async def __sharded_lock_process(*args, **kwargs) -> List[Type[_MRResult]]:
+                __sharded_lock = _ShardedLockAsyncOperator(name=function.__qualname__)
+
+                async with __sharded_lock.locking(key(*args, **kwargs)):
+                    result = await function(*args, **kwargs)
+                return result
+
+            return __sharded_lock_process
+
+        return __decorator
+
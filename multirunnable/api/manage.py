@@ -1,6 +1,7 @@
 from typing import Dict, Optional
 
 from ..framework.factory.base import BaseGlobalizeAPI as _BaseGlobalizeAPI
+from ..framework.runnable.synchronization import ReadWriteLock as _ReadWriteLock, ShardedLock as _ShardedLock
 from ..exceptions import GlobalizeObjectError as _GlobalizeObjectError
 from ..types import (
     MRQueue as _MRQueue,
@@ -17,6 +18,8 @@ Running_Lock: Optional[_MRLock] = None
 Running_RLock: Optional[_MRRLock] = None
 Running_Semaphore: Optional[_MRSemaphore] = None
 Running_Bounded_Semaphore: Optional[_MRBoundedSemaphore] = None
+Running_Read_Write_Lock: Optional[_ReadWriteLock] = None
+Running_Sharded_Lock: Optional[_ShardedLock] = None
 Running_Event: Optional[_MREvent] = None
 Running_Condition: Optional[_MRCondition] = None
 
@@ -96,6 +99,38 @@ class Globalize(_BaseGlobalizeAPI):
             raise _GlobalizeObjectError
 
 
+    @staticmethod
+    def read_write_lock(rwlock: _ReadWriteLock) -> None:
+        """
+        Description:
+            Globalize Read-Write Lock so that it could run between each different threads or processes.
+        :param rwlock:
+        :return:
+        """
+
+        if rwlock is not None:
+            global Running_Read_Write_Lock
+            Running_Read_Write_Lock = rwlock
+        else:
+            raise _GlobalizeObjectError
+
+
+    @staticmethod
+    def sharded_lock(slock: _ShardedLock) -> None:
+        """
+        Description:
+            Globalize Sharded Lock so that it could run between each different threads or processes.
+        :param slock:
+        :return:
+        """
+
+        if slock is not None:
+            global Running_Sharded_Lock
+            Running_Sharded_Lock = slock
+        else:
+            raise _GlobalizeObjectError
+
+
     @staticmethod
     def event(event: _MREvent) -> None:
         if event is not None:
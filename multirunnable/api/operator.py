@@ -1,4 +1,10 @@
-from typing import Dict, Optional
+from typing import List, Dict, Iterable, Hashable, Optional, Union, Any
+from contextlib import contextmanager
+from multiprocessing.queues import SimpleQueue as _ProcessSimpleQueue
+from queue import Queue as _ThreadQueue, Empty as _Empty, Full as _Full
+from collections import deque
+from itertools import islice
+import asyncio
 
 from ..framework.api.operator import (
     AdapterOperator as _AdapterOperator,
@@ -6,7 +12,8 @@ from ..framework.api.operator import (
     AsyncAdapterOperator as _AsyncAdapterOperator,
     BaseAsyncLockAdapterOperator as _BaseAsyncLockOperator)
 from ..api.exceptions import QueueNotExistWithName as _QueueNotExistWithName
-from ..exceptions import GlobalObjectIsNoneError as _GlobalObjectIsNoneError
+from ..api.contention import ContentionMonitor as _ContentionMonitor
+from ..exceptions import GlobalObjectIsNoneError as _GlobalObjectIsNoneError, QueuePutTimeoutError as _QueuePutTimeoutError
 from .._config import get_current_mode
 from ..types import (
     MRLock as _MRLock,
@@ -16,11 +23,82 @@ from ..types import (
     MREvent as _MREvent,
     MRCondition as _MRCondition,
     MRQueue as _MRQueue)
+from ..framework.runnable.queue import QueueBatch as _QueueBatch
+from ..framework.runnable.synchronization import (
+    ReadWriteLock as _ReadWriteLock,
+    AsyncReadWriteLock as _AsyncReadWriteLock,
+    AsyncLockContext as _AsyncLockContext,
+    ShardedLock as _ShardedLock)
 from ..mode import RunningMode
 
 
+# The amount of values 'put_many' takes from the iterable at a time if it doesn't put them as chunks.
+_Queue_Put_Chunk: int = 1000
+
+
+
+class _ContentionTracked:
+    """
+    Description:
+        The operators which record the contention by 'ContentionMonitor'. The
+        contention is recorded by the name of feature and the option *name*
+        (e.g., the function which 'RunWith' decorates), so that the report
+        could tell where the workers wait for the lock.
+    """
+
+    _Contention_Feature: str = None
+
+    def __init__(self, *args, name: Optional[str] = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._contention_name = _ContentionTracked._naming(self._Contention_Feature, name)
+
+
+    @staticmethod
+    def _naming(feature: str, name: Optional[str]) -> str:
+        return feature if name is None else f"{feature}:{name}"
+
+
+
+class _LockInstanceOperator:
+    """
+    Description:
+        The operators of the features which are not the native lock objects,
+        e.g., ReadWriteLock, so they don't support Python keyword 'with' directly.
+    """
+
+    _Feature_Instance = None
+
+    def __repr__(self):
+        return f"<Operator object for {repr(self._feature_instance)}>"
+
+
+    @property
+    def _feature_instance(self):
+        if self._Feature_Instance is None:
+            self._Feature_Instance = self._get_feature_instance()
+            if self._Feature_Instance is None:
+                __feature = self.__class__.__name__.replace("AsyncOperator", "").replace("Operator", "")
+                raise ValueError(f"The {__feature} object not be initialed yet.")
+        return self._Feature_Instance
+
+
+    @_feature_instance.setter
+    def _feature_instance(self, feature) -> None:
+        self._Feature_Instance = feature
+
+
+
+class LockOperator(_ContentionTracked, _BaseLockAdapterOperator):
+
+    _Contention_Feature: str = "Lock"
+
+    def __enter__(self):
+        self.acquire()
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
 
-class LockOperator(_BaseLockAdapterOperator):
 
     def _get_feature_instance(self) -> _MRLock:
         from .manage import Running_Lock
@@ -28,10 +106,13 @@ class LockOperator(_BaseLockAdapterOperator):
 
 
     def acquire(self) -> None:
+        __start_time = _ContentionMonitor.start()
         self._feature_instance.acquire()
+        _ContentionMonitor.acquired(self._contention_name, __start_time)
 
 
     def release(self) -> None:
+        _ContentionMonitor.releasing(self._contention_name)
         self._feature_instance.release()
 
 
@@ -65,50 +146,175 @@ class RLockOperator(_BaseLockAdapterOperator):
 
 
 
-class SemaphoreOperator(_BaseLockAdapterOperator):
+class SemaphoreOperator(_ContentionTracked, _BaseLockAdapterOperator):
+
+    _Contention_Feature: str = "Semaphore"
+
+    def __enter__(self):
+        self.acquire()
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
 
     def _get_feature_instance(self) -> _MRSemaphore:
         from .manage import Running_Semaphore
         return Running_Semaphore
 
 
-    def acquire(self, blocking: bool = True, timeout: int = None) -> None:
+    def acquire(self, blocking: bool = True, timeout: int = None) -> bool:
         """
         Note:
-            Parallel -  multiprocessing doesn't have parameter 'blocking'
+            Parallel -  multiprocessing names parameter 'blocking' as 'block'
             Concurrent - threading has parameter 'blocking'
             Coroutine - gevent (greenlet framework) has parameter 'blocking'
             Async - asyncio doesn't have any parameter
 
+            So it passes them by position.
+
         :param blocking:
         :param timeout:
         :return:
         """
 
-        _kwargs = {"blocking": blocking, "timeout": timeout}
-        return self._feature_instance.acquire(**_kwargs)
+        __start_time = _ContentionMonitor.start()
+        __acquired = self._feature_instance.acquire(blocking, timeout)
+        if __acquired is not False:
+            _ContentionMonitor.acquired(self._contention_name, __start_time)
+        return __acquired
 
-    # __enter__ = acquire
 
     def release(self, n: int = 1) -> None:
-        # Needs to double check
-        return self._feature_instance.release(n=n)
+        """
+        Note:
+            Only threading supports parameter 'n', so it releases one by one.
+
+        :param n:
+        :return:
+        """
+
+        for _ in range(n):
+            _ContentionMonitor.releasing(self._contention_name)
+            self._feature_instance.release()
 
 
 
 class BoundedSemaphoreOperator(SemaphoreOperator):
 
+    _Contention_Feature: str = "BoundedSemaphore"
+
     def _get_feature_instance(self) -> _MRBoundedSemaphore:
         from .manage import Running_Bounded_Semaphore
         return Running_Bounded_Semaphore
 
-    # __enter__ = acquire
 
     def release(self, n=1) -> None:
+        _ContentionMonitor.releasing(self._contention_name)
         self._feature_instance.release()
 
 
 
+class ReadWriteLockOperator(_LockInstanceOperator, _AdapterOperator):
+
+    def __init__(self, name: Optional[str] = None):
+        self._read_contention_name = _ContentionTracked._naming("ReadLock", name)
+        self._write_contention_name = _ContentionTracked._naming("WriteLock", name)
+
+
+    def __enter__(self):
+        self.acquire_write()
+
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release_write()
+
+
+    def _get_feature_instance(self) -> _ReadWriteLock:
+        from .manage import Running_Read_Write_Lock
+        return Running_Read_Write_Lock
+
+
+    def acquire_read(self) -> None:
+        __start_time = _ContentionMonitor.start()
+        self._feature_instance.acquire_read()
+        _ContentionMonitor.acquired(self._read_contention_name, __start_time)
+
+
+    def release_read(self) -> None:
+        _ContentionMonitor.releasing(self._read_contention_name)
+        self._feature_instance.release_read()
+
+
+    def acquire_write(self) -> None:
+        __start_time = _ContentionMonitor.start()
+        self._feature_instance.acquire_write()
+        _ContentionMonitor.acquired(self._write_contention_name, __start_time)
+
+
+    def release_write(self) -> None:
+        _ContentionMonitor.releasing(self._write_contention_name)
+        self._feature_instance.release_write()
+
+
+    @contextmanager
+    def reading(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+
+    @contextmanager
+    def writing(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+
+class ShardedLockOperator(_LockInstanceOperator, _AdapterOperator):
+
+    def __init__(self, name: Optional[str] = None):
+        self._contention_name = _ContentionTracked._naming("ShardedLock", name)
+
+
+    def _get_feature_instance(self) -> _ShardedLock:
+        from .manage import Running_Sharded_Lock
+        return Running_Sharded_Lock
+
+
+    def _shard_contention_name(self, key: Hashable) -> str:
+        # Each shard is recorded as a lock, so the report tells which shards are hot.
+        return f"{self._contention_name}[{self._feature_instance.index(key)}]"
+
+
+    def acquire(self, key: Hashable) -> None:
+        __start_time = _ContentionMonitor.start()
+        self._feature_instance.acquire(key)
+        if _ContentionMonitor.is_enabled():
+            _ContentionMonitor.acquired(self._shard_contention_name(key), __start_time)
+
+
+    def release(self, key: Hashable) -> None:
+        if _ContentionMonitor.is_enabled():
+            _ContentionMonitor.releasing(self._shard_contention_name(key))
+        self._feature_instance.release(key)
+
+
+    @contextmanager
+    def locking(self, key: Hashable):
+        self.acquire(key)
+        try:
+            yield
+        finally:
+            self.release(key)
+
+
+
 class EventOperator(_AdapterOperator):
 
     _Event_Instance: _MREvent = None
@@ -216,7 +422,18 @@ class ConditionOperator(_BaseLockAdapterOperator):
 
 
 
-class LockAsyncOperator(_BaseAsyncLockOperator):
+class LockAsyncOperator(_ContentionTracked, _BaseAsyncLockOperator):
+
+    _Contention_Feature: str = "Lock"
+
+    async def __aenter__(self):
+        await self.acquire()
+        return None
+
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
 
     def _get_feature_instance(self) -> _MRLock:
         from .manage import Running_Lock
@@ -224,15 +441,29 @@ class LockAsyncOperator(_BaseAsyncLockOperator):
 
 
     async def acquire(self):
+        __start_time = _ContentionMonitor.start()
         await self._feature_instance.acquire()
+        _ContentionMonitor.acquired(self._contention_name, __start_time)
 
 
     def release(self):
+        _ContentionMonitor.releasing(self._contention_name)
         self._feature_instance.release()
 
 
 
-class SemaphoreAsyncOperator(_BaseAsyncLockOperator):
+class SemaphoreAsyncOperator(_ContentionTracked, _BaseAsyncLockOperator):
+
+    _Contention_Feature: str = "Semaphore"
+
+    async def __aenter__(self):
+        await self.acquire()
+        return None
+
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
 
     def _get_feature_instance(self) -> _MRSemaphore:
         from .manage import Running_Semaphore
@@ -240,23 +471,90 @@ class SemaphoreAsyncOperator(_BaseAsyncLockOperator):
 
 
     async def acquire(self):
+        __start_time = _ContentionMonitor.start()
         await self._feature_instance.acquire()
+        _ContentionMonitor.acquired(self._contention_name, __start_time)
 
 
     def release(self):
+        _ContentionMonitor.releasing(self._contention_name)
         self._feature_instance.release()
 
 
 
 class BoundedSemaphoreAsyncOperator(SemaphoreAsyncOperator):
 
+    _Contention_Feature: str = "BoundedSemaphore"
+
     def _get_feature_instance(self) -> _MRBoundedSemaphore:
         from .manage import Running_Bounded_Semaphore
         return Running_Bounded_Semaphore
 
 
-    def release(self):
-        self._feature_instance.release()
+
+class ReadWriteLockAsyncOperator(_LockInstanceOperator, _AsyncAdapterOperator):
+
+    def __init__(self, name: Optional[str] = None):
+        self._read_contention_name = _ContentionTracked._naming("ReadLock", name)
+        self._write_contention_name = _ContentionTracked._naming("WriteLock", name)
+
+
+    async def __aenter__(self):
+        await self.acquire_write()
+        return None
+
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.release_write()
+
+
+    def _get_feature_instance(self) -> _AsyncReadWriteLock:
+        from .manage import Running_Read_Write_Lock
+        return Running_Read_Write_Lock
+
+
+    async def acquire_read(self) -> None:
+        __start_time = _ContentionMonitor.start()
+        await self._feature_instance.acquire_read()
+        _ContentionMonitor.acquired(self._read_contention_name, __start_time)
+
+
+    async def release_read(self) -> None:
+        _ContentionMonitor.releasing(self._read_contention_name)
+        await self._feature_instance.release_read()
+
+
+    async def acquire_write(self) -> None:
+        __start_time = _ContentionMonitor.start()
+        await self._feature_instance.acquire_write()
+        _ContentionMonitor.acquired(self._write_contention_name, __start_time)
+
+
+    def release_write(self) -> None:
+        _ContentionMonitor.releasing(self._write_contention_name)
+        self._feature_instance.release_write()
+
+
+    def reading(self) -> _AsyncLockContext:
+        return _AsyncLockContext(acquire=self.acquire_read, release=self.release_read)
+
+
+    def writing(self) -> _AsyncLockContext:
+        return _AsyncLockContext(acquire=self.acquire_write, release=self.release_write)
+
+
+
+class ShardedLockAsyncOperator(ShardedLockOperator):
+
+    async def acquire(self, key: Hashable) -> None:
+        __start_time = _ContentionMonitor.start()
+        await self._feature_instance.acquire(key)
+        if _ContentionMonitor.is_enabled():
+            _ContentionMonitor.acquired(self._shard_contention_name(key), __start_time)
+
+
+    def locking(self, key: Hashable) -> _AsyncLockContext:
+        return _AsyncLockContext(acquire=lambda: self.acquire(key), release=lambda: self.release(key))
 
 
 
@@ -342,6 +640,112 @@ class ConditionAsyncOperator(_BaseAsyncLockOperator):
 
 
 
+def _put_into_thread_queue(queue: _ThreadQueue, values: list) -> bool:
+    """
+    Description:
+        Put the values into the queue of threads (queue.Queue, LifoQueue and PriorityQueue)
+        with acquiring its lock once. It doesn't if the queue doesn't have enough space.
+    :return: True if the values are put.
+    """
+
+    if not isinstance(queue, _ThreadQueue):
+        return False
+    with queue.mutex:
+        if 0 < queue.maxsize < queue._qsize() + len(values):
+            return False
+        for __value in values:
+            queue._put(__value)
+        queue.unfinished_tasks += len(values)
+        queue.not_empty.notify(len(values))
+    return True
+
+
+def _put_into_queue(queue: _MRQueue, value: Any, timeout: Optional[float], amount: int) -> None:
+    """
+    Description:
+        Put one item into the queue and wait for a free slot at most *timeout* seconds.
+    :param amount: The amount of values which have been put before, it's saved by the error if it's timeout.
+    :return:
+    """
+
+    if isinstance(queue, _ProcessSimpleQueue):
+        queue.put(value)
+        return
+    try:
+        queue.put(value, block=True, timeout=timeout)
+    except _Full:
+        raise _QueuePutTimeoutError(amount=amount, timeout=timeout)
+
+
+def _get_from_thread_queue(queue: _ThreadQueue, max_items: int) -> list:
+    # Stop getting once it has *max_items* values, so only the last chunk could be split.
+    with queue.mutex:
+        __items, __amount = [], 0
+        while __amount < max_items and queue._qsize() > 0:
+            __item = queue._get()
+            __items.append(__item)
+            __amount += len(__item) if isinstance(__item, _QueueBatch) else 1
+        if __items:
+            queue.not_full.notify(len(__items))
+    return __items
+
+
+def _collect_values(values: list, item: Any, max_items: int) -> Optional[_QueueBatch]:
+    """
+    Description:
+        Collect the item into *values*, the chunk from 'put_many' is unpacked.
+    :return: The chunk of values over *max_items*, it's None if all the values are collected.
+    """
+
+    if not isinstance(item, _QueueBatch):
+        values.append(item)
+        return None
+    __space = max_items - len(values)
+    values.extend(item[:__space])
+    if len(item) > __space:
+        return _QueueBatch(item[__space:])
+    return None
+
+
+def _put_back(queue: Union[_MRQueue, asyncio.Queue], batch: _QueueBatch) -> bool:
+    """
+    Description:
+        Put the rest values of a chunk back to the queue without blocking. It's put to
+        the front of queue of threads, so the order of values doesn't change. The other
+        queues put it to the end of queue.
+    :return: True if it's put back, it's False if the queue is full.
+    """
+
+    if isinstance(queue, _ThreadQueue):
+        with queue.mutex:
+            if 0 < queue.maxsize <= queue._qsize():
+                return False
+            if isinstance(queue.queue, deque):
+                queue.queue.appendleft(batch)
+            else:
+                # LifoQueue and PriorityQueue get the next value by their own order.
+                queue._put(batch)
+            queue.unfinished_tasks += 1
+            queue.not_empty.notify()
+        return True
+    if isinstance(queue, _ProcessSimpleQueue):
+        queue.put(batch)
+        return True
+    try:
+        queue.put_nowait(batch)
+    except (_Full, asyncio.QueueFull):
+        return False
+    return True
+
+
+def _keep_rest_values(queue: Union[_MRQueue, asyncio.Queue], values: list, rest: Optional[_QueueBatch]) -> list:
+    # The rest values are returned too if the queue is full, it never blocks or loses them.
+    if rest is not None and _put_back(queue, rest) is False:
+        values.extend(rest)
+    return values
+
+
+
 class QueueOperator(_AdapterOperator):
 
     @classmethod
@@ -380,3 +784,185 @@ class QueueOperator(_AdapterOperator):
             raise _QueueNotExistWithName
 
 
+    @classmethod
+    def _queue_instance(cls, queue: Union[str, _MRQueue]) -> _MRQueue:
+        if isinstance(queue, str):
+            return cls.get_queue_with_name(name=queue)
+        return queue
+
+
+    @classmethod
+    def put_many(cls, queue: Union[str, _MRQueue], values: Iterable, chunk_size: Optional[int] = None, timeout: Optional[float] = None) -> int:
+        """
+        Description:
+            Put all the values into the queue. It raises 'QueuePutTimeoutError' (a sub-class
+            of 'queue.Full') if it's timeout to wait for a free slot of queue, its *amount*
+            is the amount of values which have been put.
+
+            If *chunk_size* is None, each value is one item of the queue, so the workers
+            could still get them by 'get'. The queue of threads puts them with acquiring
+            its lock once for each 1000 values.
+
+            If *chunk_size* is set, each chunk of values is one item ('QueueBatch'). It's
+            much faster with the queue of processes because the values are pickled and
+            transferred once by each chunk. But the workers should get them by 'get_many'.
+
+            'SharedMemoryQueue' only saves the fixed-size records, so it always puts them
+            one by one (with moving its tail once for each group of free slots), and it
+            doesn't support *chunk_size*.
+
+            SimpleQueue of multiprocessing doesn't support timeout, so it ignores *timeout*.
+        :param queue: The name of globalized queue, or the queue object.
+        :param values: The values. It could be a generator, it takes them chunk by chunk.
+        :param chunk_size: The amount of values in each item of the queue.
+        :param timeout: The most seconds it waits for each free slot of queue. It waits forever if it's None.
+        :return: The amount of values.
+        """
+
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("The option *chunk_size* should be bigger than 0.")
+
+        __queue = cls._queue_instance(queue)
+        if callable(getattr(__queue, "put_many", None)):
+            # The queue has its own batch operations, e.g., SharedMemoryQueue.
+            if chunk_size is not None:
+                raise ValueError(f"The option *chunk_size* isn't supported by {__queue.__class__.__name__}.")
+            return __queue.put_many(values, timeout=timeout)
+
+        __values = iter(values)
+        __amount = 0
+        while True:
+            __chunk = list(islice(__values, chunk_size or _Queue_Put_Chunk))
+            if not __chunk:
+                return __amount
+            if chunk_size is not None:
+                _put_into_queue(__queue, _QueueBatch(__chunk), timeout=timeout, amount=__amount)
+            elif not _put_into_thread_queue(__queue, __chunk):
+                for __index, __value in enumerate(__chunk):
+                    _put_into_queue(__queue, __value, timeout=timeout, amount=__amount + __index)
+            __amount += len(__chunk)
+
+
+    @classmethod
+    def get_many(cls, queue: Union[str, _MRQueue], max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Description:
+            Get at most *max_items* values from the queue. It blocks until there is a
+            value (or the timeout), then takes the other values which are already in the
+            queue without blocking. The chunks from 'put_many' are unpacked, and the
+            values over *max_items* are put back to the queue as a chunk without blocking.
+            They're put back to the front of queue of threads (queue.Queue), and to the end
+            of the other queues, so the order of values could change if the chunk is split.
+            They're returned too if the queue has been full, so it could return more than
+            *max_items* values in that case.
+
+            SimpleQueue of multiprocessing doesn't support timeout, so it doesn't wait
+            if the queue is empty and *timeout* is set.
+        :param queue: The name of globalized queue, or the queue object.
+        :param max_items: The most amount of values it gets.
+        :param timeout: The most seconds it waits for the first value. It waits forever if it's None.
+        :return: The values. It's an empty list if it's timeout.
+        """
+
+        if max_items < 1:
+            raise ValueError("The option *max_items* should be bigger than 0.")
+
+        __queue = cls._queue_instance(queue)
+        if callable(getattr(__queue, "get_many", None)):
+            return __queue.get_many(max_items, timeout=timeout)
+
+        __values = []
+        try:
+            if isinstance(__queue, _ProcessSimpleQueue):
+                if timeout is not None and __queue.empty():
+                    return __values
+                __item = __queue.get()
+            else:
+                __item = __queue.get(block=True, timeout=timeout)
+        except _Empty:
+            return __values
+        __rest = _collect_values(__values, __item, max_items)
+
+        while len(__values) < max_items:
+            if isinstance(__queue, _ThreadQueue):
+                __items = _get_from_thread_queue(__queue, max_items - len(__values))
+            elif isinstance(__queue, _ProcessSimpleQueue):
+                __items = [] if __queue.empty() else [__queue.get()]
+            else:
+                try:
+                    __items = [__queue.get_nowait()]
+                except _Empty:
+                    __items = []
+            if not __items:
+                break
+            for __item in __items:
+                __rest = _collect_values(__values, __item, max_items)
+        return _keep_rest_values(__queue, __values, __rest)
+
+
+
+class QueueAsyncOperator(QueueOperator):
+
+    @classmethod
+    async def put_many(cls, queue: Union[str, asyncio.Queue], values: Iterable, chunk_size: Optional[int] = None, timeout: Optional[float] = None) -> int:
+        """
+        Description:
+            Asynchronous version of 'QueueOperator.put_many'. It only awaits if the
+            queue is full.
+        :param queue: The name of globalized queue, or the queue object.
+        :param values: The values. It could be a generator, it takes them chunk by chunk.
+        :param chunk_size: The amount of values in each item of the queue.
+        :param timeout: The most seconds it waits for each free slot of queue. It waits forever if it's None.
+        :return: The amount of values.
+        """
+
+        if chunk_size is not None and chunk_size < 1:
+            raise ValueError("The option *chunk_size* should be bigger than 0.")
+
+        __queue = cls._queue_instance(queue)
+        __values = iter(values)
+        __amount = 0
+        while True:
+            __chunk = list(islice(__values, chunk_size or _Queue_Put_Chunk))
+            if not __chunk:
+                return __amount
+            for __index, __item in enumerate([_QueueBatch(__chunk)] if chunk_size is not None else __chunk):
+                try:
+                    __queue.put_nowait(__item)
+                except asyncio.QueueFull:
+                    try:
+                        await asyncio.wait_for(__queue.put(__item), timeout=timeout)
+                    except asyncio.TimeoutError:
+                        raise _QueuePutTimeoutError(amount=__amount + __index, timeout=timeout)
+            __amount += len(__chunk)
+
+
+    @classmethod
+    async def get_many(cls, queue: Union[str, asyncio.Queue], max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Description:
+            Asynchronous version of 'QueueOperator.get_many'.
+        :param queue: The name of globalized queue, or the queue object.
+        :param max_items: The most amount of values it gets.
+        :param timeout: The most seconds it waits for the first value. It waits forever if it's None.
+        :return: The values. It's an empty list if it's timeout.
+        """
+
+        if max_items < 1:
+            raise ValueError("The option *max_items* should be bigger than 0.")
+
+        __queue = cls._queue_instance(queue)
+        __values = []
+        try:
+            __item = await asyncio.wait_for(__queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return __values
+        __rest = _collect_values(__values, __item, max_items)
+
+        while len(__values) < max_items:
+            try:
+                __item = __queue.get_nowait()
+            except asyncio.QueueEmpty:
+                break
+            __rest = _collect_values(__values, __item, max_items)
+        return _keep_rest_values(__queue, __values, __rest)
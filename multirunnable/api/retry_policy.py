@@ -0,0 +1,251 @@
+from typing import Tuple, Type, Iterator, Optional, Union
+from threading import Lock
+import multiprocessing
+import random
+import time
+
+from gevent import getcurrent as _get_current_greenlet, Greenlet as _Greenlet, sleep as _gevent_sleep
+
+from .. import _config
+from ..mode import FeatureMode as _FeatureMode
+
+
+
+class BaseBackoff:
+    """
+    Description:
+        The delays between retries. Each call of the retry target iterates
+        a new iterator from method 'delays', so the backoff state is never
+        shared between calls.
+    """
+
+    def __init__(self, base_delay: float = 0.1, max_delay: Optional[float] = None):
+        if base_delay < 0:
+            raise ValueError("The option *base_delay* should be bigger than or equal to 0.")
+        if max_delay is not None and max_delay < base_delay:
+            raise ValueError("The option *max_delay* should be bigger than or equal to *base_delay*.")
+
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+
+
+    @property
+    def base_delay(self) -> float:
+        return self._base_delay
+
+
+    @property
+    def max_delay(self) -> Optional[float]:
+        return self._max_delay
+
+
+    def delays(self) -> Iterator[float]:
+        """
+        Description:
+            Generate the delays (seconds) before each retry.
+        :return:
+        """
+        raise NotImplementedError
+
+
+    def _cap(self, delay: float) -> float:
+        if self._max_delay is not None:
+            return min(delay, self._max_delay)
+        return delay
+
+
+
+class ConstantBackoff(BaseBackoff):
+
+    def delays(self) -> Iterator[float]:
+        while True:
+            yield self._base_delay
+
+
+
+class ExponentialBackoff(BaseBackoff):
+    """
+    Description:
+        The delay is *base_delay* * *multiplier* ** N before the N-th retry.
+        It waits a random delay between 0 and it if *jitter* is True (full jitter).
+    """
+
+    def __init__(self, base_delay: float = 0.1, max_delay: Optional[float] = None, multiplier: float = 2.0, jitter: bool = True):
+        super().__init__(base_delay=base_delay, max_delay=max_delay)
+        if multiplier < 1:
+            raise ValueError("The option *multiplier* should be bigger than or equal to 1.")
+        self._multiplier = multiplier
+        self._jitter = jitter
+
+
+    def delays(self) -> Iterator[float]:
+        __delay = self._base_delay
+        while True:
+            __capped_delay = self._cap(__delay)
+            yield random.uniform(0, __capped_delay) if self._jitter is True else __capped_delay
+            # Stop growing after it reaches the max delay, so it never overflows.
+            if __capped_delay == __delay:
+                __delay *= self._multiplier
+
+
+
+class DecorrelatedJitterBackoff(BaseBackoff):
+    """
+    Description:
+        Each delay is a random value between *base_delay* and 3 times of
+        the previous delay, so the retries of workers spread out over time.
+    """
+
+    def delays(self) -> Iterator[float]:
+        __delay = self._base_delay
+        while True:
+            __delay = self._cap(random.uniform(self._base_delay, __delay * 3))
+            yield __delay
+
+
+
+class RetryBudget:
+    """
+    Description:
+        A budget of retries which be shared by all the workers (threads, green
+        threads or coroutines). Each retry takes one token, and it gives up
+        retrying if there is no token. The tokens are refilled by
+        *refill_per_second* up to *max_retries* again.
+
+        It's per-process by default. If *shared* is True, the tokens are kept in
+        shared memory with a process lock, so the worker processes share the budget.
+        It should be instantiated before the processes start (e.g., in module level),
+        because the shared memory is inherited by the child processes.
+
+    :param max_retries: The max amount of tokens.
+    :param refill_per_second: The amount of tokens which are refilled per second.
+    :param shared: Share the budget between processes. It's True if it's None and
+                   the features of current RunningMode work between processes
+                   (Parallel and the hybrid modes).
+    """
+
+    def __init__(self, max_retries: int, refill_per_second: float = 0.0, shared: Optional[bool] = None):
+        if max_retries < 0:
+            raise ValueError("The option *max_retries* should be bigger than or equal to 0.")
+        if refill_per_second < 0:
+            raise ValueError("The option *refill_per_second* should be bigger than or equal to 0.")
+
+        if shared is None:
+            shared = _config.RUNNING_MODE is not None and _config.RUNNING_MODE.value["feature"] is _FeatureMode.Parallel
+
+        self._max_retries = max_retries
+        self._refill_per_second = refill_per_second
+        self._shared = shared
+        if shared is True:
+            # The tokens and the updated time, time.monotonic is system-wide so it works between processes.
+            self._state = multiprocessing.Array("d", [float(max_retries), time.monotonic()], lock=True)
+            self._lock = self._state.get_lock()
+        else:
+            self._state = [float(max_retries), time.monotonic()]
+            self._lock = Lock()
+
+
+    @property
+    def shared(self) -> bool:
+        return self._shared
+
+
+    @property
+    def available(self) -> float:
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+    @property
+    def _tokens(self) -> float:
+        return self._state[0]
+
+
+    @_tokens.setter
+    def _tokens(self, tokens: float) -> None:
+        self._state[0] = tokens
+
+
+    def acquire(self) -> bool:
+        """
+        Description:
+            Take one token for a retry.
+        :return: False if the budget is exhausted.
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            return False
+
+
+    def _refill(self) -> None:
+        if self._refill_per_second > 0:
+            __now = time.monotonic()
+            self._tokens = min(float(self._max_retries), self._tokens + (__now - self._state[1]) * self._refill_per_second)
+            self._state[1] = __now
+
+
+
+class RetryPolicy:
+    """
+    Description:
+        How the retry mechanism waits and when it gives up. The option *timeout*
+        of the retry decorators is still the max amount of running the target.
+
+    :param backoff: The delays between retries. It retries immediately if it's None.
+    :param max_elapsed_time: Give up if the next retry would start after this amount of
+                             seconds since the first running.
+    :param retry_on: Only retry when the exception is one of these classes.
+    :param giveup_on: Never retry when the exception is one of these classes.
+    :param budget: The retry budget which be shared with other targets or workers.
+    """
+
+    def __init__(self, backoff: Optional[BaseBackoff] = None, max_elapsed_time: Optional[float] = None,
+                 retry_on: Union[Type[BaseException], Tuple[Type[BaseException], ...]] = Exception,
+                 giveup_on: Union[Type[BaseException], Tuple[Type[BaseException], ...]] = (),
+                 budget: Optional[RetryBudget] = None):
+        if max_elapsed_time is not None and max_elapsed_time <= 0:
+            raise ValueError("The option *max_elapsed_time* should be bigger than 0.")
+
+        self.backoff = backoff
+        self.max_elapsed_time = max_elapsed_time
+        self.retry_on = retry_on
+        self.giveup_on = giveup_on
+        self.budget = budget
+
+
+    def is_retryable(self, exception: BaseException) -> bool:
+        return isinstance(exception, self.retry_on) and not isinstance(exception, self.giveup_on)
+
+
+    def delays(self) -> Iterator[float]:
+        if self.backoff is None:
+            while True:
+                yield 0
+        yield from self.backoff.delays()
+
+
+    def is_expired(self, start_time: float, delay: float) -> bool:
+        if self.max_elapsed_time is None:
+            return False
+        return time.monotonic() - start_time + delay > self.max_elapsed_time
+
+
+    @staticmethod
+    def sleep(seconds: float) -> None:
+        """
+        Description:
+            Wait before next retry. It yields to the gevent hub in green thread, so
+            it doesn't block other green threads.
+        :param seconds:
+        :return:
+        """
+        if seconds <= 0:
+            return
+        if isinstance(_get_current_greenlet(), _Greenlet):
+            _gevent_sleep(seconds)
+        else:
+            time.sleep(seconds)
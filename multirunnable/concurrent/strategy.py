@@ -1,20 +1,31 @@
 from multiprocessing.pool import AsyncResult, ApplyResult
 from multiprocessing.pool import ThreadPool
-from multipledispatch import dispatch
 from collections.abc import Iterable
 from threading import Thread, current_thread
+from queue import Queue as _ThreadQueue
 from functools import wraps, partial as PartialFunction
-from typing import List, Dict, Callable, Iterable as IterableType, Optional, Union, Tuple
+from typing import List, Dict, Callable, Iterable as IterableType, Iterator, Optional, Union, Tuple, Any
 from types import FunctionType, MethodType
 from abc import ABC
 from os import getpid
+import time
 
 from ..framework.runnable import (
     MRResult as _MRResult,
     GeneralRunnableStrategy as _GeneralRunnableStrategy,
     PoolRunnableStrategy as _PoolRunnableStrategy,
     Resultable as _Resultable,
-    ResultState as _ResultState
+    ScalingPolicy as _ScalingPolicy,
+    AutoScaler as _AutoScaler,
+    ResultState as _ResultState,
+    ResultStore as _ResultStore
+)
+from ..framework.runnable.strategy import _consume_feeder
+from ..framework.runnable.metrics import (
+    Metrics as _Metrics,
+    untime_result as _untime_result,
+    start_timing as _start_timing,
+    stop_timing as _stop_timing
 )
 from ..framework.factory import (
     BaseFeatureAdapterFactory as _BaseFeatureAdapterFactory,
@@ -25,21 +36,50 @@ from ..concurrent.result import ConcurrentResult as _ConcurrentResult, ThreadPoo
 from ..types import MRTasks as _MRTasks
 from ..mode import FeatureMode as _FeatureMode
 from .. import PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION
+from .._dispatch import method_dispatch
+
+
+
+def _close_pool(pool: ThreadPool) -> None:
+    pool.close()
+    pool.join()
 
 
 
 class ConcurrentStrategy(_Resultable, ABC):
 
     _Strategy_Feature_Mode = _FeatureMode.Concurrent
-    _Thread_Running_Result: List[Dict[str, Union[AsyncResult, bool]]] = []
+    _Thread_Running_Result: _ResultStore = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Each strategy instance saves its own running result.
+        self._Thread_Running_Result = _ResultStore()
+
+
+    @property
+    def result_max_size(self) -> Optional[int]:
+        return self._Thread_Running_Result.max_size
+
+
+    @result_max_size.setter
+    def result_max_size(self, max_size: Optional[int]) -> None:
+        self._Thread_Running_Result.max_size = max_size
+
+
+    def _attach_metrics(self, metrics: Optional[_Metrics]) -> None:
+        self._Thread_Running_Result.metrics = metrics
+
 
     @classmethod
-    def save_return_value(cls, function: Callable) -> Callable:
-        __self = cls
+    def save_return_value(cls, function: Callable, store: _ResultStore) -> Callable:
+        # Only measure the timing if the metrics is enabled, so it costs nothing if it isn't.
+        __enqueue_time = time.time() if store.metrics is not None else None
 
         @wraps(function)
         def save_value_fun(*args, **kwargs) -> None:
             _current_thread = current_thread()
+            __start = _start_timing() if __enqueue_time is not None else None
 
             if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) >= (3, 8):
                 _thread_result = {
@@ -68,7 +108,9 @@ class ConcurrentStrategy(_Resultable, ABC):
                     "successful": True
                 })
             finally:
-                __self._Thread_Running_Result.append(_thread_result)
+                if __start is not None:
+                    _stop_timing(_thread_result, enqueue_time=__enqueue_time, start=__start)
+                store.append(_thread_result)
 
         return save_value_fun
 
@@ -80,7 +122,7 @@ class ConcurrentStrategy(_Resultable, ABC):
 
 
     def reset_result(self):
-        self._Thread_Running_Result[:] = []
+        self._Thread_Running_Result.clear()
 
 
 
@@ -95,14 +137,14 @@ class ThreadStrategy(ConcurrentStrategy, _GeneralRunnableStrategy):
         super(ThreadStrategy, self).initialization(queue_tasks=queue_tasks, features=features, *args, **kwargs)
 
 
-    @dispatch((FunctionType, MethodType, PartialFunction), args=tuple, kwargs=dict)
+    @method_dispatch((FunctionType, MethodType, PartialFunction), args=tuple, kwargs=dict)
     def _start_new_worker(self, target: Callable, args: Tuple = (), kwargs: Dict = {}) -> Thread:
         __worker = self.generate_worker(target, *args, **kwargs)
         self.activate_workers(__worker)
         return __worker
 
 
-    @dispatch(Iterable, args=tuple, kwargs=dict)
+    @method_dispatch(Iterable, args=tuple, kwargs=dict)
     def _start_new_worker(self, target: List[Callable], args: Tuple = (), kwargs: Dict = {}) -> List[Thread]:
         __workers = [self.generate_worker(__function, *args, **kwargs) for __function in target]
         self.activate_workers(__workers)
@@ -112,7 +154,7 @@ class ThreadStrategy(ConcurrentStrategy, _GeneralRunnableStrategy):
     def generate_worker(self, target: Callable, *args, **kwargs) -> _MRTasks:
 
         @wraps(target)
-        @ConcurrentStrategy.save_return_value
+        @PartialFunction(ConcurrentStrategy.save_return_value, store=self._Thread_Running_Result)
         def _target_function(*_args, **_kwargs):
             result_value = target(*_args, **_kwargs)
             return result_value
@@ -120,26 +162,41 @@ class ThreadStrategy(ConcurrentStrategy, _GeneralRunnableStrategy):
         return Thread(target=_target_function, args=args, kwargs=kwargs)
 
 
-    @dispatch(Thread)
+    def _generate_feeder(self, maxsize: int) -> _ThreadQueue:
+        return _ThreadQueue(maxsize=maxsize)
+
+
+    def _generate_feeding_worker(self, function: Callable, feeder: _ThreadQueue) -> Thread:
+
+        @wraps(function)
+        @PartialFunction(ConcurrentStrategy.save_return_value, store=self._Thread_Running_Result)
+        def _target_function(*_args, **_kwargs):
+            result_value = function(*_args, **_kwargs)
+            return result_value
+
+        return Thread(target=_consume_feeder, args=(_target_function, feeder))
+
+
+    @method_dispatch(Thread)
     def activate_workers(self, workers: Thread) -> None:
         workers.start()
 
 
-    @dispatch(Iterable)
+    @method_dispatch(Iterable)
     def activate_workers(self, workers: List[Thread]) -> None:
         for worker in workers:
-            self.activate_workers(worker)
+            worker.start()
 
 
-    @dispatch(Thread)
+    @method_dispatch(Thread)
     def close(self, workers: Thread) -> None:
         workers.join()
 
 
-    @dispatch(Iterable)
+    @method_dispatch(Iterable)
     def close(self, workers: List[Thread]) -> None:
         for worker in workers:
-            self.close(worker)
+            worker.join()
 
 
     def get_result(self) -> List[_MRResult]:
@@ -168,6 +225,7 @@ class ThreadStrategy(ConcurrentStrategy, _GeneralRunnableStrategy):
             # # # # Save running result of process
             _cresult.data = __result.get("result", None)
             _cresult.exception = __result.get("exception", None)
+            _cresult._save_timing(__result)
 
             __concurrent_results.append(_cresult)
 
@@ -180,8 +238,16 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
     _Thread_Pool: ThreadPool = None
     _Thread_List: List[Union[ApplyResult, AsyncResult]] = None
 
-    def __init__(self, pool_size: int):
+    def __init__(self, pool_size: int, autoscale: Optional[_ScalingPolicy] = None):
+        """
+        Description:
+            The strategy of threads pool.
+        :param pool_size: The size of pool. It's the initial size if it's autoscaling.
+        :param autoscale: Scale the size of pool between the bounds of the policy by the load.
+        """
         super().__init__(pool_size=pool_size)
+        if autoscale is not None:
+            self._Auto_Scaler = _AutoScaler(policy=autoscale, size=pool_size)
 
 
     def initialization(self, queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
@@ -192,13 +258,19 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
         # Initialize and build the Processes Pool.
         __pool_initializer: Callable = kwargs.get("pool_initializer", None)
         __pool_initargs: IterableType = kwargs.get("pool_initargs", None)
-        self._Thread_Pool = ThreadPool(processes=self.pool_size, initializer=__pool_initializer, initargs=__pool_initargs)
+        self._Thread_Pool = self._acquire_pool(
+            factory=lambda: ThreadPool(processes=self._pool_workers, initializer=__pool_initializer, initargs=__pool_initargs),
+            closer=_close_pool,
+            config=(__pool_initializer, __pool_initargs))
+        if self._Auto_Scaler is not None:
+            Thread(target=self._Auto_Scaler.monitor, daemon=True).start()
 
 
     def apply(self, tasks_size: int, function: Callable, args: Tuple = (), kwargs: Dict = {}) -> None:
         self.reset_result()
         __process_running_result = None
 
+        function = self._scaling(self._timing(function), tasks=tasks_size)
         self._Thread_List = [
             self._Thread_Pool.apply(func=function, args=args, kwds=kwargs)
             for _ in range(tasks_size)]
@@ -220,11 +292,12 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
                     kwargs: Dict = {}, callback: Callable = None, error_callback: Callable = None) -> None:
 
         self.reset_result()
+        function = self._scaling(self._timing(function), tasks=tasks_size)
         self._Thread_List = [
             self._Thread_Pool.apply_async(func=function,
                                           args=args,
                                           kwds=kwargs,
-                                          callback=callback,
+                                          callback=self._untime_callback(callback),
                                           error_callback=error_callback)
             for _ in range(tasks_size)]
 
@@ -255,7 +328,7 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
             kwargs_iter = [{} for _ in functions_iter]
 
         self._Thread_List = [
-            self._Thread_Pool.apply(func=_func, args=_args, kwds=_kwargs)
+            self._Thread_Pool.apply(func=self._scaling(self._timing(_func)), args=_args, kwds=_kwargs)
             for _func, _args, _kwargs in zip(functions_iter, args_iter, kwargs_iter)
         ]
 
@@ -292,10 +365,10 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
 
         self._Thread_List = [
             self._Thread_Pool.apply_async(
-                func=_func,
+                func=self._scaling(self._timing(_func)),
                 args=_args,
                 kwds=_kwargs,
-                callback=_callback)
+                callback=self._untime_callback(_callback))
             for _func, _args, _kwargs, _callback in zip(functions_iter, args_iter, kwargs_iter, callback_iter)
         ]
 
@@ -319,6 +392,7 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
         self.reset_result()
         __process_running_result = None
 
+        function, args_iter = self._scaling_iter(self._timing(function), args_iter)
         try:
             __process_running_result = self._Thread_Pool.map(
                 func=function, iterable=args_iter, chunksize=chunksize)
@@ -337,11 +411,12 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
                   callback: Callable = None, error_callback: Callable = None) -> None:
 
         self.reset_result()
+        function, args_iter = self._scaling_iter(self._timing(function), args_iter)
         __map_result = self._Thread_Pool.map_async(
             func=function,
             iterable=args_iter,
             chunksize=chunksize,
-            callback=callback,
+            callback=self._untime_callback(callback),
             error_callback=error_callback)
         __process_running_result = __map_result.get()
         __process_run_successful = __map_result.successful()
@@ -355,6 +430,7 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
         self.reset_result()
         __process_running_result = None
 
+        function, args_iter = self._scaling_iter(self._timing(function), args_iter)
         try:
             __process_running_result = self._Thread_Pool.starmap(
                 func=function, iterable=args_iter, chunksize=chunksize)
@@ -373,11 +449,12 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
                           chunksize: int = None, callback: Callable = None, error_callback: Callable = None) -> None:
 
         self.reset_result()
+        function, args_iter = self._scaling_iter(self._timing(function), args_iter)
         __map_result = self._Thread_Pool.starmap_async(
             func=function,
             iterable=args_iter,
             chunksize=chunksize,
-            callback=callback,
+            callback=self._untime_callback(callback),
             error_callback=error_callback)
         __process_running_result = __map_result.get()
         __process_run_successful = __map_result.successful()
@@ -387,10 +464,15 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
             self._result_saving(successful=__process_run_successful, result=__result, exception=None)
 
 
-    def imap(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1) -> None:
+    def imap(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1,
+             stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_ThreadPoolResult]]:
+        if stream is True:
+            return self._stream_imap(function=function, args_iter=args_iter, window=window, ordered=True)
+
         self.reset_result()
         __process_running_result = None
 
+        function, args_iter = self._scaling_iter(self._timing(function), args_iter)
         try:
             imap_running_result = self._Thread_Pool.imap(func=function, iterable=args_iter, chunksize=chunksize)
             __process_running_result = [result for result in imap_running_result]
@@ -405,10 +487,15 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
             self._result_saving(successful=__process_run_successful, result=__result, exception=None)
 
 
-    def imap_unordered(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1) -> None:
+    def imap_unordered(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1,
+                       stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_ThreadPoolResult]]:
+        if stream is True:
+            return self._stream_imap(function=function, args_iter=args_iter, window=window, ordered=False)
+
         self.reset_result()
         __process_running_result = None
 
+        function, args_iter = self._scaling_iter(self._timing(function), args_iter)
         try:
             imap_running_result = self._Thread_Pool.imap_unordered(func=function, iterable=args_iter, chunksize=chunksize)
             __process_running_result = [result for result in imap_running_result]
@@ -424,18 +511,44 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
 
 
     def _result_saving(self, successful: bool, result: List, exception: Exception) -> None:
+        result, __timing = _untime_result(result, exception=exception)
         _thread_result = {"successful": successful, "result": result, "exception": exception}
+        if __timing is not None:
+            _thread_result.update(__timing)
         # Saving value into list
         self._Thread_Running_Result.append(_thread_result)
 
 
+    def _generate_done_queue(self) -> _ThreadQueue:
+        return _ThreadQueue()
+
+
+    def _submit_streaming_task(self, function: Callable, element: Any, callback: Callable, error_callback: Callable) -> None:
+        self._Thread_Pool.apply_async(func=self._scaling(self._timing(function)), args=(element,),
+                                      callback=self._untime_callback(callback, recording=True),
+                                      error_callback=self._recording_error_callback(error_callback))
+
+
+    def _generate_streaming_result(self, successful: bool, result: Any, exception: Optional[Exception]) -> _ThreadPoolResult:
+        _pool_result = _ThreadPoolResult()
+        _pool_result.is_successful = successful
+        _pool_result.data = result
+        _pool_result.exception = exception
+        return _pool_result
+
+
     def close(self) -> None:
-        self._Thread_Pool.close()
-        self._Thread_Pool.join()
+        if self._Auto_Scaler is not None:
+            self._Auto_Scaler.stop()
+        if self._release_pool() is False:
+            _close_pool(self._Thread_Pool)
 
 
     def terminal(self) -> None:
+        if self._Auto_Scaler is not None:
+            self._Auto_Scaler.stop()
         self._Thread_Pool.terminate()
+        self._discard_pool()
 
 
     def get_result(self) -> List[_ConcurrentResult]:
@@ -448,6 +561,8 @@ class ThreadPoolStrategy(ConcurrentStrategy, _PoolRunnableStrategy, _Resultable)
             _pool_result = _ThreadPoolResult()
             _pool_result.is_successful = __result["successful"]
             _pool_result.data = __result["result"]
+            _pool_result.exception = __result["exception"]
+            _pool_result._save_timing(__result)
             _pool_results.append(_pool_result)
         return _pool_results
 
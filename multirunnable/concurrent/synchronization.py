@@ -9,7 +9,9 @@ from typing import Union
 
 from ..framework.runnable.synchronization import (
     PosixThreadLock as _PosixThreadLock,
-    PosixThreadCommunication as _PosixThreadCommunication)
+    PosixThreadCommunication as _PosixThreadCommunication,
+    ReadWriteLock as _ReadWriteLock,
+    ShardedLock as _ShardedLock)
 
 
 
@@ -31,6 +33,14 @@ class ThreadLock(_PosixThreadLock):
         return _Thread_BoundedSemaphore(value=value)
 
 
+    def get_read_write_lock(self, **kwargs) -> _ReadWriteLock:
+        return _ReadWriteLock(turnstile=_Thread_Lock(), resource=_Thread_Semaphore(value=1), readers_lock=_Thread_Lock())
+
+
+    def get_sharded_lock(self, shards: int, **kwargs) -> _ShardedLock:
+        return _ShardedLock(locks=[_Thread_Lock() for _ in range(shards)])
+
+
 
 class ThreadCommunication(_PosixThreadCommunication):
 
@@ -0,0 +1,177 @@
+from asyncio import AbstractEventLoop
+from threading import Thread, Event, Lock, current_thread
+from typing import Callable, Coroutine, Optional, Any
+import asyncio
+import atexit
+import os
+
+from .. import PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION
+
+
+
+class AsyncRuntime:
+    """
+    Description:
+        A long-lived event loop which runs the coroutines of Asynchronous mode.
+        It keeps the same event loop across calls, so the objects which are bound
+        to an event loop (e.g., asyncio.Lock, connection pools) could be reused.
+
+        It runs a new event loop in a dedicated daemon thread by default. It also
+        could reuse an event loop which be supplied by caller:
+
+            * If the event loop is running in other thread, the coroutines are
+              submitted to it thread-safely.
+            * If the event loop isn't running, the coroutines are run by it in
+              current thread.
+
+        The dedicated event loop would be started lazily and it would be stopped
+        and closed by method 'shutdown'. The event loop supplied by caller would
+        never be stopped or closed by this runtime.
+
+        The coroutines run in the thread of the dedicated event loop, not in the
+        thread of caller. Use 'AsyncRuntime.shared' to get the runtime which is
+        shared in the whole process, so there is only one thread of event loop and
+        it's shut down when the interpreter exits.
+    """
+
+    _Thread_Name: str = "multirunnable-async-runtime"
+
+    _Shared_Runtime: Optional["AsyncRuntime"] = None
+    _Shared_Runtime_PID: Optional[int] = None
+    _Shared_Runtime_Lock: Lock = Lock()
+
+    def __init__(self, event_loop: Optional[AbstractEventLoop] = None):
+        self.__event_loop = event_loop
+        self.__is_owner = event_loop is None
+        self.__loop_thread: Optional[Thread] = None
+        self.__lock = Lock()
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(event_loop={self.__event_loop}, dedicated={self.__is_owner})"
+
+
+    @classmethod
+    def shared(cls) -> "AsyncRuntime":
+        """
+        Description:
+            The dedicated runtime which is shared by all the callers in the current process.
+            It's shut down at exit. The children process has its own one because the thread
+            of event loop isn't inherited.
+        :return:
+        """
+
+        with cls._Shared_Runtime_Lock:
+            if cls._Shared_Runtime is None or cls._Shared_Runtime_PID != os.getpid():
+                cls._Shared_Runtime = cls()
+                cls._Shared_Runtime_PID = os.getpid()
+                atexit.register(cls._Shared_Runtime.shutdown)
+            return cls._Shared_Runtime
+
+
+    @property
+    def event_loop(self) -> Optional[AbstractEventLoop]:
+        return self.__event_loop
+
+
+    @property
+    def is_running(self) -> bool:
+        return self.__event_loop is not None and self.__event_loop.is_closed() is False
+
+
+    def activate(self) -> AbstractEventLoop:
+        """
+        Description:
+            Start the dedicated event loop if it doesn't run yet.
+        :return: The event loop of this runtime.
+        """
+
+        with self.__lock:
+            if self.__is_owner is True and self.is_running is False:
+                __event_loop = asyncio.new_event_loop()
+                __started = Event()
+                self.__loop_thread = Thread(
+                    target=AsyncRuntime.__run_event_loop,
+                    args=(__event_loop, __started),
+                    name=self._Thread_Name,
+                    daemon=True)
+                self.__loop_thread.start()
+                __started.wait()
+                self.__event_loop = __event_loop
+            return self.__event_loop
+
+
+    @staticmethod
+    def __run_event_loop(event_loop: AbstractEventLoop, started: Event) -> None:
+        asyncio.set_event_loop(event_loop)
+        event_loop.call_soon(started.set)
+        event_loop.run_forever()
+
+
+    def run(self, function: Callable[[], Coroutine]) -> Any:
+        """
+        Description:
+            Run the coroutine which be generated by *function* in the event loop
+            and block until it's done.
+        :param function: A callable object which returns a coroutine.
+        :return: The return value of coroutine.
+        """
+
+        __event_loop = self.activate()
+        if self.__is_owner is True or __event_loop.is_running() is True:
+            if self.__in_event_loop_thread(__event_loop) is True:
+                raise RuntimeError("It couldn't wait for the coroutine in the thread which runs the event loop.")
+            return asyncio.run_coroutine_threadsafe(function(), __event_loop).result()
+        return __event_loop.run_until_complete(function())
+
+
+    def __in_event_loop_thread(self, event_loop: AbstractEventLoop) -> bool:
+        if self.__is_owner is True:
+            return current_thread() is self.__loop_thread
+
+        if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
+            try:
+                return asyncio.get_running_loop() is event_loop
+            except RuntimeError:
+                return False
+        else:
+            return asyncio.get_event_loop() is event_loop
+
+
+    def shutdown(self) -> None:
+        """
+        Description:
+            Cancel all the pending tasks, stop and close the dedicated event loop and
+            wait for its thread. It would start a new one if it runs coroutine again.
+            It does nothing to the event loop supplied by caller.
+        :return:
+        """
+
+        with self.__lock:
+            if self.__is_owner is False or self.is_running is False:
+                return
+
+            __event_loop = self.__event_loop
+            if self.__in_event_loop_thread(__event_loop) is True:
+                raise RuntimeError("It couldn't shutdown the event loop in the thread which runs it.")
+
+            asyncio.run_coroutine_threadsafe(AsyncRuntime.__cancel_pending_tasks(), __event_loop).result()
+            __event_loop.call_soon_threadsafe(__event_loop.stop)
+            self.__loop_thread.join()
+            __event_loop.close()
+            self.__loop_thread = None
+
+
+    @staticmethod
+    async def __cancel_pending_tasks() -> None:
+        if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
+            __current_task = asyncio.current_task()
+            __tasks = [_task for _task in asyncio.all_tasks() if _task is not __current_task]
+        else:
+            __current_task = asyncio.Task.current_task()
+            __tasks = [_task for _task in asyncio.Task.all_tasks() if _task is not __current_task]
+
+        for __task in __tasks:
+            __task.cancel()
+        await asyncio.gather(*__tasks, return_exceptions=True)
+        await asyncio.get_event_loop().shutdown_asyncgens()
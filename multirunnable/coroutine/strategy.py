@@ -1,23 +1,36 @@
-from multipledispatch import dispatch
 from gevent.threading import get_ident, getcurrent
 from gevent.greenlet import Greenlet
-from collections.abc import Iterable
+from collections.abc import Iterable, Sized
+from collections import deque
 from asyncio.tasks import Task
 from gevent.pool import Pool
-from typing import List, Iterable as IterableType, Callable, Optional, Union, Tuple, Dict
+from gevent.lock import Semaphore as _GreenSemaphore
+from gevent.queue import Queue as Greenlet_Queue
+from typing import List, Iterable as IterableType, Iterator, AsyncIterator, Callable, Optional, Union, Tuple, Dict, Any
 from types import FunctionType, MethodType
 from abc import ABCMeta, ABC
 from os import getpid
 import functools
 import asyncio
 import gevent
+import time
 
 from ..framework.runnable import (
     GeneralRunnableStrategy as _GeneralRunnableStrategy,
     PoolRunnableStrategy as _PoolRunnableStrategy,
     AsyncRunnableStrategy as _AsyncRunnableStrategy,
     Resultable as _Resultable,
-    ResultState as _ResultState
+    ResultState as _ResultState,
+    ResultStore as _ResultStore,
+    ScalingPolicy as _ScalingPolicy,
+    AutoScaler as _AutoScaler
+)
+from ..framework.runnable.strategy import _Feeder_Stop_Signal, _chk_max_workers
+from ..framework.runnable.metrics import (
+    Metrics as _Metrics,
+    untime_result as _untime_result,
+    start_timing as _start_timing,
+    stop_timing as _stop_timing
 )
 from ..framework.factory import (
     BaseFeatureAdapterFactory as _BaseFeatureAdapterFactory,
@@ -28,24 +41,41 @@ from ..coroutine.result import (
     CoroutineResult as _CoroutineResult,
     GreenThreadPoolResult as _GreenThreadPoolResult,
     AsynchronousResult as _AsynchronousResult)
+from ..coroutine.runtime import AsyncRuntime as _AsyncRuntime
 from ..mode import FeatureMode as _FeatureMode
 from .. import PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION
+from .._dispatch import method_dispatch
+
+
+
+def _greenlet_name() -> str:
+    return f"{getpid()}:{getattr(getcurrent(), 'name', get_ident())}"
 
 
 
 class CoroutineStrategy(metaclass=ABCMeta):
 
-    _GreenThread_Running_Result_By_Name: Dict[str, dict] = {}
-    _GreenThread_Running_Result: List = []
-    _Async_Running_Result: List = []
+    _GreenThread_Running_Result: _ResultStore = None
+    _Async_Running_Result: _ResultStore = None
 
     @classmethod
-    def save_return_value(cls, function: Callable) -> Callable:
-        __self = cls
+    def save_return_value(cls, function: Callable, timing: bool = False) -> Callable:
+        """
+        Description:
+            Record the running result of function. The record would be the return
+            value of green thread, so it doesn't need to be saved anywhere else
+            before the green thread be closed.
+        :param function:
+        :param timing: Record the timing of function or not, it's True if the metrics is enabled.
+        :return:
+        """
+
+        __enqueue_time = time.time() if timing is True else None
 
         @functools.wraps(function)
-        def save_value_fun(*args, **kwargs) -> None:
+        def save_value_fun(*args, **kwargs) -> Dict:
             _current_thread = getcurrent()
+            __start = _start_timing() if __enqueue_time is not None else None
 
             _thread_result = {
                 "pid": getpid(),
@@ -65,18 +95,30 @@ class CoroutineStrategy(metaclass=ABCMeta):
                     "result": value,
                     "successful": True,
                 })
-            finally:
-                __self._GreenThread_Running_Result_By_Name[str(_current_thread.name)] = _thread_result
+            if __start is not None:
+                # Green threads share one thread, so the CPU time of thread isn't the one of this task.
+                _stop_timing(_thread_result, enqueue_time=__enqueue_time, start=__start, cpu_time=False)
+            return _thread_result
 
         return save_value_fun
 
 
     @classmethod
-    def async_save_return_value(cls, function: Callable) -> Callable:
-        __self = cls
+    def async_save_return_value(cls, function: Callable, store: _ResultStore, saving: bool = True) -> Callable:
+        """
+        Description:
+            Record the running result of coroutine function. The record would be returned,
+            and it also would be saved for 'get_result' if *saving* is True.
+        :param function:
+        :param store: The result store of strategy instance which saves the record.
+        :param saving:
+        :return:
+        """
+        __enqueue_time = time.time() if store.metrics is not None else None
 
         @functools.wraps(function)
-        async def save_value_fun(*args, **kwargs) -> None:
+        async def save_value_fun(*args, **kwargs) -> Dict:
+            __start = _start_timing() if __enqueue_time is not None else None
             if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
                 _current_task = asyncio.current_task()
             else:
@@ -108,7 +150,11 @@ class CoroutineStrategy(metaclass=ABCMeta):
                     "successful": True,
                 })
             finally:
-                __self._Async_Running_Result.append(_task_result)
+                if __start is not None:
+                    _stop_timing(_task_result, enqueue_time=__enqueue_time, start=__start, cpu_time=False)
+                if saving is True:
+                    store.append(_task_result)
+            return _task_result
 
         return save_value_fun
 
@@ -117,8 +163,26 @@ class CoroutineStrategy(metaclass=ABCMeta):
 class BaseGreenThreadStrategy(CoroutineStrategy, _Resultable, ABC):
 
     _Strategy_Feature_Mode: _FeatureMode = _FeatureMode.GreenThread
-    # _Gevent_Running_Result: List = []
-    # _GreenThread_Running_Result: List = []
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Each strategy instance saves its own running result.
+        self._GreenThread_Running_Result = _ResultStore()
+
+
+    @property
+    def result_max_size(self) -> Optional[int]:
+        return self._GreenThread_Running_Result.max_size
+
+
+    @result_max_size.setter
+    def result_max_size(self, max_size: Optional[int]) -> None:
+        self._GreenThread_Running_Result.max_size = max_size
+
+
+    def _attach_metrics(self, metrics: Optional[_Metrics]) -> None:
+        self._GreenThread_Running_Result.metrics = metrics
+
 
     def result(self) -> List[_CoroutineResult]:
         __coroutine_results = self._saving_process()
@@ -127,7 +191,7 @@ class BaseGreenThreadStrategy(CoroutineStrategy, _Resultable, ABC):
 
 
     def reset_result(self):
-        self._GreenThread_Running_Result[:] = []
+        self._GreenThread_Running_Result.clear()
 
 
 
@@ -141,14 +205,14 @@ class GreenThreadStrategy(BaseGreenThreadStrategy, _GeneralRunnableStrategy):
         super(GreenThreadStrategy, self).initialization(queue_tasks=queue_tasks, features=features, *args, **kwargs)
 
 
-    @dispatch((FunctionType, MethodType, functools.partial), args=tuple, kwargs=dict)
+    @method_dispatch((FunctionType, MethodType, functools.partial), args=tuple, kwargs=dict)
     def _start_new_worker(self, target: Callable, args: Tuple = (), kwargs: Dict = {}) -> Greenlet:
         __worker = self.generate_worker(target, *args, **kwargs)
         self.activate_workers(__worker)
         return __worker
 
 
-    @dispatch(Iterable, args=tuple, kwargs=dict)
+    @method_dispatch(Iterable, args=tuple, kwargs=dict)
     def _start_new_worker(self, target: List[Callable], args: Tuple = (), kwargs: Dict = {}) -> List[Greenlet]:
         __workers = [self.generate_worker(__function, *args, **kwargs) for __function in target]
         self.activate_workers(__workers)
@@ -158,7 +222,7 @@ class GreenThreadStrategy(BaseGreenThreadStrategy, _GeneralRunnableStrategy):
     def generate_worker(self, target: Callable, *args, **kwargs) -> Greenlet:
 
         @functools.wraps(target)
-        @CoroutineStrategy.save_return_value
+        @functools.partial(CoroutineStrategy.save_return_value, timing=self._Metrics is not None)
         def _target_function(*_args, **_kwargs):
             result_value = target(*_args, **_kwargs)
             return result_value
@@ -167,29 +231,59 @@ class GreenThreadStrategy(BaseGreenThreadStrategy, _GeneralRunnableStrategy):
         return Greenlet(_target_function, *args, **kwargs)
 
 
-    @dispatch(Greenlet)
+    def _map_with_bounded_workers(self, function: Callable, args_iter: IterableType, max_workers: int) -> None:
+        """
+        Description:
+            Green thread is cheap, so it still runs one green thread for
+            each arguments. But the gevent pool only lets *max_workers*
+            green threads run at the same time. The finished green threads
+            are closed (saving their results by order) and dropped while
+            feeding, so it doesn't keep all of them.
+        :param function:
+        :param args_iter:
+        :param max_workers:
+        :return:
+        """
+        _chk_max_workers(max_workers)
+
+        self._GreenThread_Running_Result.clear()
+        __pool = Pool(size=max_workers)
+        __workers_queue = deque()
+        for __args in args_iter:
+            __worker = self._generate_worker(function, __args)
+            # It would be blocked until there is any space in pool.
+            __pool.start(__worker)
+            __workers_queue.append(__worker)
+            while __workers_queue and __workers_queue[0].ready():
+                self.close(__workers_queue.popleft())
+
+        while __workers_queue:
+            self.close(__workers_queue.popleft())
+
+
+    @method_dispatch(Greenlet)
     def activate_workers(self, workers: Greenlet) -> None:
         workers.start()
 
 
-    @dispatch(Iterable)
+    @method_dispatch(Iterable)
     def activate_workers(self, workers: List[Greenlet]) -> None:
         for worker in workers:
-            self.activate_workers(worker)
+            worker.start()
 
 
-    @dispatch(Greenlet)
+    @method_dispatch(Greenlet)
     def close(self, workers: Greenlet) -> None:
         workers.join()
         result = self._format_result(worker=workers)
         self._GreenThread_Running_Result.append(result)
 
 
-    @dispatch(Iterable)
+    @method_dispatch(Iterable)
     def close(self, workers: List[Greenlet]) -> None:
         gevent.joinall(workers)
-        results = map(self._format_result, workers)
-        self._GreenThread_Running_Result = [_r for _r in results]
+        self._GreenThread_Running_Result.clear()
+        self._GreenThread_Running_Result.extend(map(self._format_result, workers))
 
 
     def kill(self) -> None:
@@ -203,8 +297,8 @@ class GreenThreadStrategy(BaseGreenThreadStrategy, _GeneralRunnableStrategy):
 
 
     def _format_result(self, worker: Greenlet) -> Dict:
-        assert worker.name in self._GreenThread_Running_Result_By_Name, f"It should must have the AsyncTask which be named as '{worker.name}'."
-        _async_task_result = self._GreenThread_Running_Result_By_Name[worker.name]
+        _async_task_result = worker.value
+        assert isinstance(_async_task_result, dict), f"It should must have the running result of green thread '{worker.name}'."
         _async_task_result.update({
             # "loop": worker.loop,
             "parent": worker.parent,
@@ -237,6 +331,7 @@ class GreenThreadStrategy(BaseGreenThreadStrategy, _GeneralRunnableStrategy):
             # # # # Save running result of process
             _cresult.data = __result.get("result", None)
             _cresult.exception = __result.get("exception", None)
+            _cresult._save_timing(__result)
             __coroutine_results.append(_cresult)
 
         return __coroutine_results
@@ -249,10 +344,19 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
 
     _GreenThread_Pool: Pool = None
     _GreenThread_List: List[Greenlet] = []
-    # _GreenThread_Running_Result: List = []
+    _Timing_Worker_Name: Callable[[], str] = staticmethod(_greenlet_name)
+    _Timing_CPU_Time: bool = False
 
-    def __init__(self, pool_size: int):
+    def __init__(self, pool_size: int, autoscale: Optional[_ScalingPolicy] = None):
+        """
+        Description:
+            The strategy of green threads pool.
+        :param pool_size: The size of pool. It's the initial size if it's autoscaling.
+        :param autoscale: Scale the size of pool between the bounds of the policy by the load.
+        """
         super().__init__(pool_size=pool_size)
+        if autoscale is not None:
+            self._Auto_Scaler = _AutoScaler(policy=autoscale, size=pool_size, semaphore_factory=_GreenSemaphore)
 
 
     def initialization(self, queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
@@ -263,12 +367,15 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
 
         # Initialize and build the Processes Pool.
         # self._GreenThread_Pool = Pool(size=self.pool_size, greenlet_class=greenlet_class)
-        self._GreenThread_Pool = Pool(size=self.pool_size)
+        self._GreenThread_Pool = self._acquire_pool(factory=lambda: Pool(size=self._pool_workers), closer=Pool.join)
+        if self._Auto_Scaler is not None:
+            gevent.spawn(self._Auto_Scaler.monitor, gevent.sleep)
 
 
     def apply(self, tasks_size: int, function: Callable, args: Tuple = (), kwargs: Dict = {}) -> None:
         self.reset_result()
 
+        function = self._scaling(self._timing(function), tasks=tasks_size)
         self._GreenThread_List = [
             self._GreenThread_Pool.apply(func=function, args=args, kwds=kwargs)
             for _ in range(tasks_size)]
@@ -294,11 +401,12 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
                     kwargs: Dict = {}, callback: Callable = None, error_callback: Callable = None) -> None:
 
         self.reset_result()
+        function = self._scaling(self._timing(function), tasks=tasks_size)
         self._GreenThread_List = [
             self._GreenThread_Pool.apply_async(func=function,
                                                args=args,
                                                kwds=kwargs,
-                                               callback=callback)
+                                               callback=self._untime_callback(callback))
             for _ in range(tasks_size)]
 
         for process in self._GreenThread_List:
@@ -330,7 +438,7 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
             kwargs_iter = [{} for _ in functions_iter]
 
         self._GreenThread_List = [
-            self._GreenThread_Pool.apply(func=_func, args=_args, kwds=_kwargs)
+            self._GreenThread_Pool.apply(func=self._scaling(self._timing(_func)), args=_args, kwds=_kwargs)
             for _func, _args, _kwargs in zip(functions_iter, args_iter, kwargs_iter)
         ]
 
@@ -371,10 +479,10 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
 
         self._GreenThread_List = [
             self._GreenThread_Pool.apply_async(
-                func=_func,
+                func=self._scaling(self._timing(_func)),
                 args=_args,
                 kwds=_kwargs,
-                callback=_callback)
+                callback=self._untime_callback(_callback))
             for _func, _args, _kwargs, _callback in zip(functions_iter, args_iter, kwargs_iter, callback_iter)
         ]
 
@@ -398,6 +506,7 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
         self.reset_result()
         __process_running_result = None
 
+        function, args_iter = self._scaling_iter(self._timing(function), args_iter)
         try:
             __process_running_result = self._GreenThread_Pool.map(
                 func=function, iterable=args_iter)
@@ -421,10 +530,11 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
         __process_run_successful = None
         __exception = None
 
+        function, args_iter = self._scaling_iter(self._timing(function), args_iter)
         __map_result = self._GreenThread_Pool.map_async(
             func=function,
             iterable=args_iter,
-            callback=callback)
+            callback=self._untime_callback(callback))
         try:
             __process_running_result = __map_result.get()
             __process_run_successful = __map_result.successful()
@@ -456,6 +566,7 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
             __results = []
             __process_run_successful = None
 
+            function = self._scaling(self._timing(function), tasks=len(args_iter))
             try:
                 for _args in args_iter:
                     _greenlet = self._GreenThread_Pool.spawn(function, *_args)
@@ -507,6 +618,7 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
             __results = []
             __process_run_successful = None
 
+            function = self._scaling(self._timing(function), tasks=len(args_iter))
             try:
                 for _args in args_iter:
                     _greenlet = self._GreenThread_Pool.spawn(function, *_args)
@@ -546,10 +658,15 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
         self.async_map(function=partial_function, args_iter=_last_args, chunksize=chunksize, callback=callback)
 
 
-    def imap(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1) -> None:
+    def imap(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1,
+             stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_GreenThreadPoolResult]]:
+        if stream is True:
+            return self._stream_imap(function=function, args_iter=args_iter, window=window, ordered=True)
+
         self.reset_result()
         __process_running_result = None
 
+        function, args_iter = self._scaling_iter(self._timing(function), args_iter)
         try:
             imap_running_result = self._GreenThread_Pool.imap(function, args_iter)
             __process_running_result = [result for result in imap_running_result]
@@ -564,10 +681,15 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
             self._result_saving(successful=__process_run_successful, result=__result, exception=__exception)
 
 
-    def imap_unordered(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1) -> None:
+    def imap_unordered(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1,
+                       stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_GreenThreadPoolResult]]:
+        if stream is True:
+            return self._stream_imap(function=function, args_iter=args_iter, window=window, ordered=False)
+
         self.reset_result()
         __process_running_result = None
 
+        function, args_iter = self._scaling_iter(self._timing(function), args_iter)
         try:
             imap_running_result = self._GreenThread_Pool.imap_unordered(function, args_iter)
             __process_running_result = [result for result in imap_running_result]
@@ -583,17 +705,45 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
 
 
     def _result_saving(self, successful: bool, result: List, exception: Exception) -> None:
+        result, __timing = _untime_result(result, exception=exception)
         process_result = {"successful": successful, "result": result, "exception": exception}
+        if __timing is not None:
+            process_result.update(__timing)
         # Saving value into list
         self._GreenThread_Running_Result.append(process_result)
 
 
+    def _generate_done_queue(self) -> Greenlet_Queue:
+        return Greenlet_Queue()
+
+
+    def _submit_streaming_task(self, function: Callable, element: Any, callback: Callable, error_callback: Callable) -> None:
+        __greenlet = self._GreenThread_Pool.spawn(self._scaling(self._timing(function)), element)
+        __callback = self._untime_callback(callback, recording=True)
+        __error_callback = self._recording_error_callback(error_callback)
+        __greenlet.link_value(lambda _greenlet: __callback(_greenlet.value))
+        __greenlet.link_exception(lambda _greenlet: __error_callback(_greenlet.exception))
+
+
+    def _generate_streaming_result(self, successful: bool, result: Any, exception: Optional[Exception]) -> _GreenThreadPoolResult:
+        _pool_result = _GreenThreadPoolResult()
+        _pool_result.is_successful = successful
+        _pool_result.data = result
+        _pool_result.exception = exception
+        return _pool_result
+
+
     def close(self) -> None:
+        # A gevent pool could still be used after joining, so it only needs to release it.
         self._GreenThread_Pool.join()
+        if self._Auto_Scaler is not None:
+            self._Auto_Scaler.stop()
+        self._release_pool()
 
 
     def terminal(self) -> None:
-        pass
+        if self._Auto_Scaler is not None:
+            self._Auto_Scaler.stop()
         # self._GreenThread_Pool.terminate()
 
 
@@ -608,6 +758,7 @@ class GreenThreadPoolStrategy(BaseGreenThreadStrategy, _PoolRunnableStrategy, _R
             _pool_result.is_successful = __result["successful"]
             _pool_result.data = __result["result"]
             _pool_result.exception = __result["exception"]
+            _pool_result._save_timing(__result)
             _pool_results.append(_pool_result)
         return _pool_results
 
@@ -617,8 +768,28 @@ class BaseAsyncStrategy(CoroutineStrategy, _AsyncRunnableStrategy, ABC):
 
     _Strategy_Feature_Mode = _FeatureMode.Asynchronous
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Each strategy instance saves its own running result.
+        self._Async_Running_Result = _ResultStore()
+
+
+    @property
+    def result_max_size(self) -> Optional[int]:
+        return self._Async_Running_Result.max_size
+
+
+    @result_max_size.setter
+    def result_max_size(self, max_size: Optional[int]) -> None:
+        self._Async_Running_Result.max_size = max_size
+
+
+    def _attach_metrics(self, metrics: Optional[_Metrics]) -> None:
+        self._Async_Running_Result.metrics = metrics
+
+
     def reset_result(self):
-        self._Async_Running_Result[:] = []
+        self._Async_Running_Result.clear()
 
 
 
@@ -626,7 +797,45 @@ class AsynchronousStrategy(BaseAsyncStrategy, _Resultable):
 
     _Strategy_Feature_Mode: _FeatureMode = _FeatureMode.Asynchronous
 
-    @dispatch((FunctionType, MethodType, functools.partial), args=tuple, kwargs=dict)
+    def __init__(self, executors: int, event_loop: Optional[asyncio.AbstractEventLoop] = None):
+        """
+        Description:
+            All the coroutines are run in the same event loop across calls. It's the
+            dedicated event loop which is shared by the whole process (it runs in its
+            own thread, so the coroutines don't run in the thread of caller) by default,
+            or the event loop which be supplied by option *event_loop*. The shared event
+            loop is used by all the strategies in the process, so it's only stopped and
+            closed at exit.
+        """
+        super().__init__(executors=executors)
+        if event_loop is None:
+            # Get the shared runtime when it's used, the children process has its own one.
+            self._Async_Runtime: Optional[_AsyncRuntime] = None
+        else:
+            self._Async_Runtime = _AsyncRuntime(event_loop=event_loop)
+
+
+    @property
+    def runtime(self) -> _AsyncRuntime:
+        if self._Async_Runtime is None:
+            return _AsyncRuntime.shared()
+        return self._Async_Runtime
+
+
+    def shutdown(self) -> None:
+        """
+        Description:
+            Shut down the runtime of this strategy. It does nothing to the shared runtime
+            because the other strategies (maybe in the other threads) may still be running
+            coroutines in it, it's shut down at exit.
+        :return:
+        """
+
+        if self._Async_Runtime is not None:
+            self._Async_Runtime.shutdown()
+
+
+    @method_dispatch((FunctionType, MethodType, functools.partial), args=tuple, kwargs=dict)
     def _start_new_worker(self, target: Callable, args: Tuple = (), kwargs: Dict = {}) -> None:
         self.reset_result()
 
@@ -634,10 +843,10 @@ class AsynchronousStrategy(BaseAsyncStrategy, _Resultable):
             __worker = await self.generate_worker(target, *args, **kwargs)
             await self.activate_workers(__worker)
 
-        AsynchronousStrategy._run_async_task(__start_new_async_task)
+        self._run_async_task(__start_new_async_task)
 
 
-    @dispatch(Iterable, args=tuple, kwargs=dict)
+    @method_dispatch(Iterable, args=tuple, kwargs=dict)
     def _start_new_worker(self, target: List[Callable], args: Tuple = (), kwargs: Dict = {}) -> None:
         self.reset_result()
 
@@ -645,7 +854,7 @@ class AsynchronousStrategy(BaseAsyncStrategy, _Resultable):
             __workers = [await self.generate_worker(__function, *args, **kwargs) for __function in target]
             await self.activate_workers(__workers)
 
-        AsynchronousStrategy._run_async_task(__start_new_async_tasks)
+        self._run_async_task(__start_new_async_tasks)
 
 
     def run(self, function: Callable, args: Optional[Union[Tuple, Dict]] = None,
@@ -659,21 +868,180 @@ class AsynchronousStrategy(BaseAsyncStrategy, _Resultable):
             workers_list = [self._generate_worker(function, args) for _ in range(self.executors_number)]
             await self.activate_workers(workers_list)
 
-        AsynchronousStrategy._run_async_task(__run_process)
+        self._run_async_task(__run_process)
 
 
     def map(self, function: Callable, args_iter: IterableType = [],
             queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
-            features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None) -> None:
+            features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None,
+            max_workers: Optional[int] = None) -> None:
 
         self.reset_result()
 
         async def __map_process():
             await self.initialization(queue_tasks=queue_tasks, features=features)
+            if max_workers is not None:
+                await self._map_with_bounded_workers(function=function, args_iter=args_iter, max_workers=max_workers)
+                return
+
             __workers_list = [self._generate_worker(function, args) for args in args_iter]
             await self.activate_workers(__workers_list)
 
-        AsynchronousStrategy._run_async_task(__map_process)
+        self._run_async_task(__map_process)
+
+
+    async def _map_with_bounded_workers(self, function: Callable, args_iter: IterableType, max_workers: int) -> None:
+        """
+        Description:
+            Asynchronous version of method '_map_with_bounded_workers'.
+        :param function:
+        :param args_iter:
+        :param max_workers:
+        :return:
+        """
+        _chk_max_workers(max_workers)
+
+        __workers_size = max_workers
+        if isinstance(args_iter, Sized):
+            __workers_size = max(min(max_workers, len(args_iter)), 1)
+
+        __feeder = self._generate_feeder(maxsize=__workers_size * 2)
+        __workers_list = [self._generate_feeding_worker(function, __feeder) for _ in range(__workers_size)]
+
+        for __args in args_iter:
+            await __feeder.put((__args,))
+        for _ in range(__workers_size):
+            await __feeder.put(_Feeder_Stop_Signal)
+
+        await self.activate_workers(__workers_list)
+
+
+    def _generate_feeder(self, maxsize: int) -> asyncio.Queue:
+        return asyncio.Queue(maxsize=maxsize)
+
+
+    def _generate_feeding_worker(self, function: Callable, feeder: asyncio.Queue) -> Task:
+
+        @functools.wraps(function)
+        @functools.partial(CoroutineStrategy.async_save_return_value, store=self._Async_Running_Result)
+        def _target_function(*_args, **_kwargs):
+            result_value = function(*_args, **_kwargs)
+            return result_value
+
+        async def _consume_feeder():
+            while True:
+                __feeding = await feeder.get()
+                if __feeding is _Feeder_Stop_Signal:
+                    break
+
+                __args = __feeding[0]
+                if isinstance(__args, dict):
+                    await _target_function(**__args)
+                elif __args is None:
+                    await _target_function()
+                else:
+                    await _target_function(*__args)
+
+        if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
+            return asyncio.create_task(_consume_feeder())
+        else:
+            _event_loop = asyncio.get_event_loop()
+            return _event_loop.create_task(_consume_feeder())
+
+
+    def map_as_completed(self, function: Callable, args_iter: IterableType = (), limit: Optional[int] = None,
+                         timeout: Optional[float] = None) -> Iterator[_AsynchronousResult]:
+        """
+        Description:
+            Run the coroutine function with each element of *args_iter* and yield the
+            running results by the order of done. The coroutines are run in the event
+            loop of the runtime, so it could be iterated in synchronous code.
+        :param function:
+        :param args_iter:
+        :param limit: The max amount of in-flight coroutines. No limit if it's None.
+        :param timeout: The timeout (seconds) of each coroutine. No timeout if it's None.
+        :return:
+        """
+
+        __results = self.async_map_as_completed(function=function, args_iter=args_iter, limit=limit, timeout=timeout)
+        try:
+            while True:
+                try:
+                    yield self.runtime.run(__results.__anext__)
+                except StopAsyncIteration:
+                    break
+        finally:
+            self.runtime.run(__results.aclose)
+
+
+    async def async_map_as_completed(self, function: Callable, args_iter: IterableType = (), limit: Optional[int] = None,
+                                     timeout: Optional[float] = None) -> AsyncIterator[_AsynchronousResult]:
+        """
+        Description:
+            Asynchronous version of method 'map_as_completed'. It only gets the next element
+            from *args_iter* when the amount of in-flight coroutines is less than *limit*. The
+            coroutine which runs over *timeout* would be cancelled and its running result
+            would be failed with 'asyncio.TimeoutError'. The running results which be yielded
+            would not be saved for 'get_result'.
+        :param function:
+        :param args_iter:
+        :param limit: The max amount of in-flight coroutines. No limit if it's None.
+        :param timeout: The timeout (seconds) of each coroutine. No timeout if it's None.
+        :return:
+        """
+
+        if limit is not None and (isinstance(limit, int) is False or limit < 1):
+            raise ValueError("The option *limit* should be a positive integer.")
+        if timeout is not None and timeout <= 0:
+            raise ValueError("The option *timeout* should be a positive number.")
+
+        @functools.wraps(function)
+        async def _timeout_function(*args, **kwargs):
+            return await asyncio.wait_for(function(*args, **kwargs), timeout=timeout)
+
+        __function = _timeout_function if timeout is not None else function
+        __target_function = CoroutineStrategy.async_save_return_value(__function, saving=False, store=self._Async_Running_Result)
+        __args_iter = iter(args_iter)
+        __in_flight = set()
+
+        def __submit_task() -> bool:
+            try:
+                __args = next(__args_iter)
+            except StopIteration:
+                return False
+
+            if isinstance(__args, dict):
+                __coroutine = __target_function(**__args)
+            elif __args is None:
+                __coroutine = __target_function()
+            elif isinstance(__args, tuple):
+                __coroutine = __target_function(*__args)
+            else:
+                __coroutine = __target_function(__args)
+            __in_flight.add(asyncio.ensure_future(__coroutine))
+            return True
+
+        try:
+            while (limit is None or len(__in_flight) < limit) and __submit_task() is True:
+                pass
+
+            while __in_flight:
+                __done, __in_flight = await asyncio.wait(__in_flight, return_when=asyncio.FIRST_COMPLETED)
+                # Fill the in-flight slots before yielding, so that they keep running while the results be handled.
+                for _ in range(len(__done)):
+                    if __submit_task() is False:
+                        break
+                for __task in __done:
+                    __record = __task.result()
+                    if self._Metrics is not None:
+                        # The records of streaming mode aren't saved, so they're aggregated here.
+                        self._Metrics.record(__record)
+                    yield self._generate_result(__record)
+        finally:
+            for __task in __in_flight:
+                __task.cancel()
+            if __in_flight:
+                await asyncio.gather(*__in_flight, return_exceptions=True)
 
 
     def map_with_function(self, functions: IterableType[Callable], args_iter: IterableType = [],
@@ -691,7 +1059,7 @@ class AsynchronousStrategy(BaseAsyncStrategy, _Resultable):
             __workers_list = [self._generate_worker(fun, args) for fun, args in zip(functions, args_iter)]
             await self.activate_workers(__workers_list)
 
-        AsynchronousStrategy._run_async_task(__map_with_function_process)
+        self._run_async_task(__map_with_function_process)
 
 
     async def initialization(self, queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
@@ -712,7 +1080,7 @@ class AsynchronousStrategy(BaseAsyncStrategy, _Resultable):
     def generate_worker(self, target: Callable, *args, **kwargs) -> Task:
 
         @functools.wraps(target)
-        @CoroutineStrategy.async_save_return_value
+        @functools.partial(CoroutineStrategy.async_save_return_value, store=self._Async_Running_Result)
         def _target_function(*_args, **_kwargs):
             result_value = target(*_args, **_kwargs)
             return result_value
@@ -727,7 +1095,7 @@ class AsynchronousStrategy(BaseAsyncStrategy, _Resultable):
             return _event_loop.create_task(_target_function(*args, **kwargs))
 
 
-    @dispatch(Task)
+    @method_dispatch(Task)
     async def activate_workers(self, workers: Task) -> None:
         value = await workers
         # self._Async_Running_Result.append({
@@ -735,20 +1103,19 @@ class AsynchronousStrategy(BaseAsyncStrategy, _Resultable):
         # })
 
 
-    @dispatch(Iterable)
+    @method_dispatch(Iterable)
     async def activate_workers(self, workers: List[Task]) -> None:
-        for worker in workers:
-            await self.activate_workers(worker)
+        await asyncio.gather(*workers)
 
 
-    @dispatch(Task)
+    @method_dispatch(Task)
     async def close(self, workers: Task) -> None:
         if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) <= (3, 6):
             _event_loop = asyncio.get_event_loop()
             _event_loop.close()
 
 
-    @dispatch(Iterable)
+    @method_dispatch(Iterable)
     async def close(self, workers: List[Task]) -> None:
         pass
 
@@ -760,35 +1127,32 @@ class AsynchronousStrategy(BaseAsyncStrategy, _Resultable):
 
 
     def _saving_process(self) -> List[_AsynchronousResult]:
-        _async_results = []
-        for __result in self._Async_Running_Result:
-            _async_result = _AsynchronousResult()
+        return [self._generate_result(__result) for __result in self._Async_Running_Result]
 
-            # # # # Save some basic info of Process
-            _async_result.pid = __result["pid"]
-            _async_result.worker_name = __result["name"]
-            _async_result.worker_ident = __result["mem_id"]
 
-            # # # # Save state of process
-            __coroutine_successful = __result.get("successful", None)
-            if __coroutine_successful is True:
-                _async_result.state = _ResultState.SUCCESS.value
-            else:
-                _async_result.state = _ResultState.FAIL.value
-
-            # # # # Save running result of process
-            _async_result.data = __result.get("result", None)
-            _async_result.exception = __result.get("exception", None)
-            _async_results.append(_async_result)
+    @staticmethod
+    def _generate_result(result: Dict) -> _AsynchronousResult:
+        _async_result = _AsynchronousResult()
+
+        # # # # Save some basic info of Process
+        _async_result.pid = result["pid"]
+        _async_result.worker_name = result["name"]
+        _async_result.worker_ident = result["mem_id"]
+
+        # # # # Save state of process
+        __coroutine_successful = result.get("successful", None)
+        if __coroutine_successful is True:
+            _async_result.state = _ResultState.SUCCESS.value
+        else:
+            _async_result.state = _ResultState.FAIL.value
 
-        return _async_results
+        # # # # Save running result of process
+        _async_result.data = result.get("result", None)
+        _async_result.exception = result.get("exception", None)
+        _async_result._save_timing(result)
+        return _async_result
 
 
-    @staticmethod
-    def _run_async_task(_function):
-        if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
-            asyncio.run(_function())
-        else:
-            _event_loop = asyncio.get_event_loop()
-            _event_loop.run_until_complete(_function())
+    def _run_async_task(self, _function):
+        self.runtime.run(_function)
 
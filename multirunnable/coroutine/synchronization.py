@@ -16,7 +16,10 @@ import logging
 
 from ..framework.runnable.synchronization import (
     PosixThreadLock as _PosixThreadLock,
-    PosixThreadCommunication as _PosixThreadCommunication)
+    PosixThreadCommunication as _PosixThreadCommunication,
+    ReadWriteLock as _ReadWriteLock,
+    AsyncReadWriteLock as _AsyncReadWriteLock,
+    ShardedLock as _ShardedLock)
 from ..types import (
     MRCondition as _MRCondition,
     MREvent as _MREvent
@@ -43,6 +46,14 @@ class GreenThreadLock(_PosixThreadLock):
         return _Greenlet_BoundedSemaphore(value=value)
 
 
+    def get_read_write_lock(self, **kwargs) -> _ReadWriteLock:
+        return _ReadWriteLock(turnstile=_Greenlet_Lock(), resource=_Greenlet_Semaphore(value=1), readers_lock=_Greenlet_Lock())
+
+
+    def get_sharded_lock(self, shards: int, **kwargs) -> _ShardedLock:
+        return _ShardedLock(locks=[_Greenlet_Lock() for _ in range(shards)])
+
+
 
 class GreenThreadCommunicationSpec(_PosixThreadCommunication):
 
@@ -86,6 +97,19 @@ class AsynchronousLock(_PosixThreadLock):
         return _Async_BoundedSemaphore(**__param)
 
 
+    def get_read_write_lock(self, **kwargs) -> _AsyncReadWriteLock:
+        __param = _AsyncUtils.chk_loop(loop=kwargs.get("loop", None))
+        return _AsyncReadWriteLock(
+            turnstile=_Async_Lock(**__param),
+            resource=_Async_Semaphore(value=1, **__param),
+            readers_lock=_Async_Lock(**__param))
+
+
+    def get_sharded_lock(self, shards: int, **kwargs) -> _ShardedLock:
+        __param = _AsyncUtils.chk_loop(loop=kwargs.get("loop", None))
+        return _ShardedLock(locks=[_Async_Lock(**__param) for _ in range(shards)])
+
+
 
 class AsynchronousCommunication(_PosixThreadCommunication):
 
@@ -1,3 +1,7 @@
+from queue import Full
+
+
+
 
 class VersionError(Exception):
 
@@ -29,3 +33,50 @@ class FunctionSignatureConflictError(RuntimeError):
     def __str__(self):
         return "The signature of 'build_workers' and target function " \
                "occur conflict, please don't use 'task' naming in sugnature of target function."
+
+
+
+class ConnectionPoolTimeoutError(TimeoutError):
+
+    def __init__(self, pool_name: str, timeout: float):
+        self.__pool_name = pool_name
+        self.__timeout = timeout
+
+
+    def __str__(self):
+        return f"It's timeout ({self.__timeout} seconds) to wait for a connection of database connection pool '{self.__pool_name}'."
+
+
+
+class ConnectionPoolExhaustedError(RuntimeError):
+
+    def __init__(self, pool_name: str, max_waiters: int):
+        self.__pool_name = pool_name
+        self.__max_waiters = max_waiters
+
+
+    def __str__(self):
+        return f"There are already {self.__max_waiters} workers waiting for a connection of database connection pool '{self.__pool_name}'."
+
+
+
+class QueuePutTimeoutError(Full):
+
+    def __init__(self, amount: int, timeout: float):
+        self.__amount = amount
+        self.__timeout = timeout
+
+
+    @property
+    def amount(self) -> int:
+        """
+        Description:
+            The amount of values which have been put into the queue before it's timeout.
+        :return:
+        """
+
+        return self.__amount
+
+
+    def __str__(self):
+        return f"It's timeout ({self.__timeout} seconds) to wait for a free slot of queue after putting {self.__amount} values."
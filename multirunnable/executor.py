@@ -5,7 +5,9 @@ from abc import ABC
 from .framework.runnable import (
     GeneralRunnableStrategy as _GeneralRunnableStrategy,
     Resultable as _Resultable,
-    MRResult as _MRResult
+    MRResult as _MRResult,
+    Metrics as _Metrics,
+    MetricsExporter as _MetricsExporter
 )
 from .framework.factory import (
     BaseFeatureAdapterFactory as _BaseFeatureAdapterFactory,
@@ -53,7 +55,8 @@ class Executor(ABC, _BaseExecutor):
 
     def map(self, function: CallableType, args_iter: IterableType = [],
             queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
-            features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None) -> None:
+            features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None,
+            max_workers: Optional[int] = None) -> None:
 
         # Check the arguments format. Its formatter should be like ((arg1, ), (arg2, ), ...)
         # It should change to like that if the formatter is (arg1, arg2, ...)
@@ -77,7 +80,8 @@ class Executor(ABC, _BaseExecutor):
             function=function,
             args_iter=_valid_args_iter,
             queue_tasks=queue_tasks,
-            features=features)
+            features=features,
+            max_workers=max_workers)
 
 
     def map_with_function(self, functions: IterableType[Callable], args_iter: IterableType = [],
@@ -95,6 +99,12 @@ class Executor(ABC, _BaseExecutor):
         General_Runnable_Strategy.close(workers)
 
 
+    def shutdown(self) -> None:
+        __shutdown = getattr(General_Runnable_Strategy, "shutdown", None)
+        if __shutdown is not None:
+            __shutdown()
+
+
     def result(self) -> List[_MRResult]:
         if isinstance(General_Runnable_Strategy, _Resultable):
             return General_Runnable_Strategy.get_result()
@@ -102,10 +112,91 @@ class Executor(ABC, _BaseExecutor):
             raise ValueError("This running strategy isn't a Resultable object.")
 
 
+    @property
+    def metrics(self) -> Optional[_Metrics]:
+        """
+        Description:
+            The metrics of tasks, it's None if it isn't enabled.
+        :return:
+        """
+        return getattr(General_Runnable_Strategy, "metrics", None)
+
+
+    def enable_metrics(self, exporter: Optional[_MetricsExporter] = None) -> _Metrics:
+        """
+        Description:
+            Measure the timing (queue wait, run time and CPU time) of the tasks which run from
+            now on, and aggregate them into histograms, throughput and error rate. It doesn't
+            measure anything before it's enabled, so it costs nothing if it isn't needed.
+        :param exporter: The exporter which 'export_metrics' sends the snapshot to.
+        :return: The metrics.
+        """
+        if isinstance(General_Runnable_Strategy, _Resultable):
+            return General_Runnable_Strategy.enable_metrics(exporter=exporter)
+        else:
+            raise ValueError("This running strategy isn't a Resultable object.")
+
+
+    def disable_metrics(self) -> None:
+        if isinstance(General_Runnable_Strategy, _Resultable):
+            General_Runnable_Strategy.disable_metrics()
+
+
+    def export_metrics(self) -> Optional[Dict]:
+        """
+        Description:
+            Export the snapshot of metrics by its exporter.
+        :return: The snapshot, or None if the metrics isn't enabled.
+        """
+        __metrics = self.metrics
+        if __metrics is None:
+            return None
+        return __metrics.export()
+
+
+    @property
+    def result_max_size(self) -> Optional[int]:
+        """
+        Description:
+            The maximum number of running result records which be kept. Only the last
+            *result_max_size* records are kept if it's set, and 0 drops every record.
+            None means keeping all of them until 'result'.
+        :return:
+        """
+        if isinstance(General_Runnable_Strategy, _Resultable):
+            return General_Runnable_Strategy.result_max_size
+        else:
+            raise ValueError("This running strategy isn't a Resultable object.")
+
+
+    @result_max_size.setter
+    def result_max_size(self, max_size: Optional[int]) -> None:
+        if isinstance(General_Runnable_Strategy, _Resultable):
+            General_Runnable_Strategy.result_max_size = max_size
+        else:
+            raise ValueError("This running strategy isn't a Resultable object.")
+
+
 
 class SimpleExecutor(Executor):
 
-    def __init__(self, executors: int, mode: _RunningMode = None):
+    def __init__(self, executors: int, mode: _RunningMode = None, processes: Optional[int] = None,
+                 shared_memory_threshold: Optional[int] = None, result_max_size: Optional[int] = None):
+        """
+        Description:
+            The executor with the strategy of the running mode.
+        :param executors: The amount of workers. It's the amount of workers in each process with hybrid mode.
+        :param mode: The running mode. It uses the current mode if it's None.
+        :param processes: The amount of processes. It only works with hybrid mode, e.g., RunningMode.ParallelConcurrent.
+                          It's the amount of CPU if it's None.
+        :param shared_memory_threshold: Pass the large buffer objects (bytes, bytearray, memoryview and numpy.ndarray)
+                                        in arguments and return value through shared memory if they're bigger than
+                                        this size (bytes). It only works with RunningMode.Parallel.
+        :param result_max_size: The maximum number of running result records which be kept. Only the last
+                                records are kept if it's set, and 0 drops every record. It keeps all of
+                                them until 'result' if it's None.
+        """
+
         if mode is not None:
             if isinstance(mode, _RunningMode) is not True:
                 raise TypeError("The option *mode* should be one of 'multirunnable.mode.RunningMode'.")
@@ -115,8 +206,12 @@ class SimpleExecutor(Executor):
         else:
             self._mode = get_current_mode(force=True)
 
+        self._processes = processes
+        self._shared_memory_threshold = shared_memory_threshold
         super().__init__(executors=executors)
         self._initial_running_strategy()
+        if result_max_size is not None:
+            self.result_max_size = result_max_size
 
         if self._mode is _RunningMode.Parallel:
             self.terminal = General_Runnable_Strategy.terminal
@@ -139,10 +234,29 @@ class SimpleExecutor(Executor):
         return __instance_brief
 
 
+    def start_new_worker(self, target: Callable, args: Tuple = (), kwargs: Dict = {}):
+        self._chk_worker_operation(operation="start_new_worker")
+        return super().start_new_worker(target, args=args, kwargs=kwargs)
+
+
+    def close(self, workers: Union[_MRTasks, List[_MRTasks]]) -> None:
+        self._chk_worker_operation(operation="close")
+        super().close(workers)
+
+
+    def _chk_worker_operation(self, operation: str) -> None:
+        # The workers of hybrid mode live in the child processes, so they couldn't be operated one by one.
+        if "inner_mode" in self._mode.value.keys():
+            raise ValueError(f"The operation '{operation}' isn't supported with hybrid RunningMode.{self._mode.name}, "
+                             f"please use 'run', 'map' or 'map_with_function'.")
+
+
     def _initial_running_strategy(self) -> None:
         __running_strategy_adapter = _ExecutorStrategyAdapter(
             mode=self._mode,
-            executors=self._executors_number)
+            executors=self._executors_number,
+            processes=self._processes,
+            shared_memory_threshold=self._shared_memory_threshold)
 
         global General_Runnable_Strategy
         General_Runnable_Strategy = __running_strategy_adapter.get_simple()
@@ -1,5 +1,5 @@
 from multirunnable.factory.queue import Queue
-from multirunnable.factory.lock import LockFactory, RLockFactory, SemaphoreFactory, BoundedSemaphoreFactory
+from multirunnable.factory.lock import LockFactory, RLockFactory, SemaphoreFactory, BoundedSemaphoreFactory, ReadWriteLockFactory, ShardedLockFactory
 from multirunnable.factory.communication import EventFactory, ConditionFactory
 from multirunnable.factory.collection import FeatureList, QueueTaskList
 from multirunnable.factory.strategy import ExecutorStrategyAdapter, PoolStrategyAdapter
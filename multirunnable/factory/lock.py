@@ -1,4 +1,7 @@
-from ..framework.runnable import PosixThreadLock as _PosixThreadLock
+from ..framework.runnable import (
+    PosixThreadLock as _PosixThreadLock,
+    ReadWriteLock as _ReadWriteLock,
+    ShardedLock as _ShardedLock)
 from ..factory._utils import _ModuleFactory
 from ..factory.base import FeatureAdapterFactory as _FeatureAdapterFactory
 from ..api.manage import Globalize as _Globalize
@@ -130,3 +133,62 @@ class BoundedSemaphoreFactory(_FeatureAdapterFactory):
     def globalize_instance(self, obj) -> None:
         _Globalize.bounded_semaphore(bsmp=obj)
 
+
+
+
+class ReadWriteLockFactory(_FeatureAdapterFactory):
+
+    def __str__(self):
+        return super(ReadWriteLockFactory, self).__str__().replace("TargetObject", "Read-Write Lock")
+
+
+    def __repr__(self):
+        return super(ReadWriteLockFactory, self).__repr__().replace("TargetObject", "ReadWriteLock")
+
+
+    def get_instance(self, **kwargs) -> _ReadWriteLock:
+        if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) < (3, 10):
+            self._chk_param_by_mode(**kwargs)
+
+        if self.feature_mode is None:
+            raise ValueError("FeatureMode is None. Please configure it as one of 'multirunnable.mode.FeatureMode'.")
+
+        lock_instance: _PosixThreadLock = _ModuleFactory.get_lock_adapter(mode=self.feature_mode)
+        return lock_instance.get_read_write_lock(**self._kwargs)
+
+
+    def globalize_instance(self, obj) -> None:
+        _Globalize.read_write_lock(rwlock=obj)
+
+
+
+class ShardedLockFactory(_FeatureAdapterFactory):
+
+    def __init__(self, shards: int = 16):
+        super(ShardedLockFactory, self).__init__()
+        if shards < 1:
+            raise ValueError("The option *shards* should be bigger than or equal to 1.")
+        self.__shards = shards
+
+
+    def __str__(self):
+        return super(ShardedLockFactory, self).__str__().replace("TargetObject", "Sharded Lock")
+
+
+    def __repr__(self):
+        return f"<ShardedLock(shards={self.__shards}) object with {self._Mode} mode at {id(self)}>"
+
+
+    def get_instance(self, **kwargs) -> _ShardedLock:
+        if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) < (3, 10):
+            self._chk_param_by_mode(**kwargs)
+
+        if self.feature_mode is None:
+            raise ValueError("FeatureMode is None. Please configure it as one of 'multirunnable.mode.FeatureMode'.")
+
+        lock_instance: _PosixThreadLock = _ModuleFactory.get_lock_adapter(mode=self.feature_mode)
+        return lock_instance.get_sharded_lock(shards=self.__shards, **self._kwargs)
+
+
+    def globalize_instance(self, obj) -> None:
+        _Globalize.sharded_lock(slock=obj)
@@ -1,9 +1,10 @@
-from typing import Dict
+from typing import Dict, Optional
 from abc import ABCMeta
 
 from ..framework.runnable.strategy import (
     GeneralRunnableStrategy as _GeneralRunnableStrategy,
     PoolRunnableStrategy as _PoolRunnableStrategy)
+from ..framework.runnable.autoscale import ScalingPolicy as _ScalingPolicy
 from .._import_utils import ImportMultiRunnable as _ImportMultiRunnable
 from ..mode import RunningMode as _RunningMode
 
@@ -11,23 +12,38 @@ from ..mode import RunningMode as _RunningMode
 
 class BaseStrategyAdapter(metaclass=ABCMeta):
 
-    def __init__(self, mode: _RunningMode):
+    def __init__(self, mode: _RunningMode, processes: Optional[int] = None, shared_memory_threshold: Optional[int] = None):
         self._running_info: Dict[str, str] = mode.value
         self._module: str = self._running_info.get("strategy_module")
+        # The amount of processes only works with hybrid mode, e.g., RunningMode.ParallelConcurrent.
+        self._is_hybrid: bool = "inner_mode" in self._running_info.keys()
+        if processes is not None and self._is_hybrid is False:
+            raise ValueError("The option *processes* only could be used with hybrid RunningMode.")
+        self._processes = processes
+        # The shared memory transport only works with the strategies of processes.
+        if shared_memory_threshold is not None and mode is not _RunningMode.Parallel:
+            raise ValueError("The option *shared_memory_threshold* only could be used with RunningMode.Parallel.")
+        self._shared_memory_threshold = shared_memory_threshold
 
 
 
 class ExecutorStrategyAdapter(BaseStrategyAdapter):
 
-    def __init__(self, mode: _RunningMode, executors: int):
-        super().__init__(mode=mode)
+    def __init__(self, mode: _RunningMode, executors: int, processes: Optional[int] = None,
+                 shared_memory_threshold: Optional[int] = None):
+        super().__init__(mode=mode, processes=processes, shared_memory_threshold=shared_memory_threshold)
         self._executors_number = executors
         self.__strategy_cls_name: str = self._running_info.get("executor_strategy")
 
 
     def get_simple(self) -> _GeneralRunnableStrategy:
         __strategy_cls = _ImportMultiRunnable.get_class(pkg_path=self._module, cls_name=self.__strategy_cls_name)
-        __strategy_instance = __strategy_cls(executors=self._executors_number)
+        if self._is_hybrid is True:
+            __strategy_instance = __strategy_cls(executors=self._executors_number, processes=self._processes)
+        elif self._shared_memory_threshold is not None:
+            __strategy_instance = __strategy_cls(executors=self._executors_number, shared_memory_threshold=self._shared_memory_threshold)
+        else:
+            __strategy_instance = __strategy_cls(executors=self._executors_number)
         # __strategy_instance = cast(Union[RunnableStrategy, AsyncRunnableStrategy], __strategy_instance)
         return __strategy_instance
 
@@ -35,14 +51,26 @@ class ExecutorStrategyAdapter(BaseStrategyAdapter):
 
 class PoolStrategyAdapter(BaseStrategyAdapter):
 
-    def __init__(self, mode: _RunningMode, pool_size: int):
-        super().__init__(mode=mode)
+    def __init__(self, mode: _RunningMode, pool_size: int, processes: Optional[int] = None,
+                 autoscale: Optional[_ScalingPolicy] = None, shared_memory_threshold: Optional[int] = None):
+        super().__init__(mode=mode, processes=processes, shared_memory_threshold=shared_memory_threshold)
+        # Only the pools of threads and green threads could be autoscaling.
+        if autoscale is not None and mode not in (_RunningMode.Concurrent, _RunningMode.GreenThread):
+            raise ValueError("The option *autoscale* only could be used with RunningMode.Concurrent or RunningMode.GreenThread.")
         self._pool_size = pool_size
+        self._autoscale = autoscale
         self.__strategy_cls_name: str = self._running_info.get("pool_strategy")
 
 
     def get_simple(self) -> _PoolRunnableStrategy:
         __strategy_cls = _ImportMultiRunnable.get_class(pkg_path=self._module, cls_name=self.__strategy_cls_name)
-        __strategy_instance = __strategy_cls(pool_size=self._pool_size)
+        if self._is_hybrid is True:
+            __strategy_instance = __strategy_cls(pool_size=self._pool_size, processes=self._processes)
+        elif self._autoscale is not None:
+            __strategy_instance = __strategy_cls(pool_size=self._pool_size, autoscale=self._autoscale)
+        elif self._shared_memory_threshold is not None:
+            __strategy_instance = __strategy_cls(pool_size=self._pool_size, shared_memory_threshold=self._shared_memory_threshold)
+        else:
+            __strategy_instance = __strategy_cls(pool_size=self._pool_size)
         return __strategy_instance
 
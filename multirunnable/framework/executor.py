@@ -52,7 +52,8 @@ class BaseExecutor(metaclass=ABCMeta):
     @abstractmethod
     def map(self, function: CallableType, args_iter: IterableType = [],
             queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
-            features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None) -> None:
+            features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None,
+            max_workers: Optional[int] = None) -> None:
         """
         Description:
             Receive a parameters (the arguments of target function) List
@@ -63,6 +64,7 @@ class BaseExecutor(metaclass=ABCMeta):
         :param args_iter:
         :param queue_tasks:
         :param features:
+        :param max_workers: Only activate this amount of workers at the same time if it isn't None.
         :return:
         """
         pass
@@ -97,6 +99,18 @@ class BaseExecutor(metaclass=ABCMeta):
         pass
 
 
+    @abstractmethod
+    def shutdown(self) -> None:
+        """
+        Description:
+            Release the runtime which is kept across calls by the running strategy,
+            e.g., the event loop of Asynchronous mode. It does nothing if the running
+            strategy doesn't keep any runtime.
+        :return:
+        """
+        pass
+
+
     @abstractmethod
     def result(self) -> List[_MRResult]:
         """
@@ -93,3 +93,27 @@ class BaseGlobalizeAPI(metaclass=ABCMeta):
         """
         pass
 
+
+    @staticmethod
+    @abstractmethod
+    def read_write_lock(rwlock) -> None:
+        """
+        Description:
+            Globalize Read-Write Lock object.
+        :param rwlock:
+        :return:
+        """
+        pass
+
+
+    @staticmethod
+    @abstractmethod
+    def sharded_lock(slock) -> None:
+        """
+        Description:
+            Globalize Sharded Lock object.
+        :param slock:
+        :return:
+        """
+        pass
+
@@ -1,7 +1,7 @@
-from typing import List, Tuple, Dict, Iterable, Callable
+from typing import List, Tuple, Dict, Iterable, Iterator, Callable, Optional
 from abc import ABCMeta, abstractmethod
 
-from .runnable.result import MRResult as _MRResult
+from .runnable.result import MRResult as _MRResult, PoolResult as _PoolResult
 from ..types import MRTasks as _MRTasks
 
 
@@ -167,26 +167,34 @@ class BasePool(metaclass=ABCMeta):
 
 
     @abstractmethod
-    def imap(self, function: Callable, args_iter: Iterable = (), chunksize: int = 1) -> None:
+    def imap(self, function: Callable, args_iter: Iterable = (), chunksize: int = 1,
+             stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_PoolResult]]:
         """
         Description:
             The adapter of multiprocessing.pool.imap.
         :param function:
         :param args_iter:
         :param chunksize:
+        :param stream: Return a generator which yields the running result (PoolResult) by the order of
+                       *args_iter* as soon as it's done. The results would not be saved for 'get_result'.
+        :param window: The max amount of in-flight tasks of streaming mode. Default is double of pool size.
         :return:
         """
         pass
 
 
     @abstractmethod
-    def imap_unordered(self, function: Callable, args_iter: Iterable = (), chunksize: int = 1) -> None:
+    def imap_unordered(self, function: Callable, args_iter: Iterable = (), chunksize: int = 1,
+                       stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_PoolResult]]:
         """
         Description:
             The adapter of multiprocessing.pool.imap_unordered.
         :param function:
         :param args_iter:
         :param chunksize:
+        :param stream: Return a generator which yields the running result (PoolResult) by the order of
+                       done as soon as it's done. The results would not be saved for 'get_result'.
+        :param window: The max amount of in-flight tasks of streaming mode. Default is double of pool size.
         :return:
         """
         pass
@@ -1,5 +1,8 @@
 from .context import BaseContext
 from .strategy import GeneralRunnableStrategy, PoolRunnableStrategy, AsyncRunnableStrategy, Resultable
-from .result import BaseResult, MRResult, PoolResult, ResultState
-from .synchronization import PosixThreadLock, PosixThreadCommunication
-from .queue import BaseQueue, BaseQueueType, BaseGlobalizeAPI
+from .result import BaseResult, MRResult, PoolResult, ResultState, ResultStore
+from .pool_registry import PoolLifecycle, PoolRegistry, Pool_Registry
+from .autoscale import ScalingPolicy, ScalingEvent, AutoScaler
+from .metrics import Metrics, MetricsExporter, LoggingExporter, InMemoryExporter, Histogram
+from .synchronization import PosixThreadLock, PosixThreadCommunication, ReadWriteLock, AsyncReadWriteLock, ShardedLock
+from .queue import BaseQueue, BaseQueueType, BaseGlobalizeAPI, QueueBatch
@@ -0,0 +1,338 @@
+from typing import List, Deque, Callable, Optional, Any
+from collections import deque
+from functools import wraps
+from threading import Lock, Semaphore
+import logging
+import time
+
+
+_Scale_Up: str = "scale_up"
+_Scale_Down: str = "scale_down"
+
+
+
+class ScalingPolicy:
+    """
+    Description:
+        The policy of an autoscaling pool. The pool runs at most *max_size* tasks
+        at the same time, and the amount of them which could run (the size) is
+        scaled between *min_size* and *max_size* by the load.
+
+    :param min_size: The minimum size of pool.
+    :param max_size: The maximum size of pool.
+    :param scale_up_backlog: Scale up if the amount of waiting tasks per worker is bigger than or equal to this.
+    :param scale_up_latency: Scale up if the average waiting time (seconds) of the recent tasks is bigger than
+                             or equal to this. It doesn't check the latency if it's None.
+    :param scale_down_idle_time: Scale down if the pool isn't saturated (no waiting task and not all
+                                 the workers are busy) for this amount of seconds.
+    :param step: The amount of workers to add or remove in one scaling.
+    :param cooldown: The minimum interval (seconds) between two scalings.
+    :param interval: The interval (seconds) of checking idleness in the background.
+    """
+
+    def __init__(self, min_size: int, max_size: int, scale_up_backlog: float = 1.0, scale_up_latency: Optional[float] = None,
+                 scale_down_idle_time: float = 1.0, step: int = 1, cooldown: float = 0.0, interval: float = 0.1):
+        if min_size < 1:
+            raise ValueError("The option *min_size* should be bigger than 0.")
+        if max_size < min_size:
+            raise ValueError("The option *max_size* should be bigger than or equal to *min_size*.")
+        if scale_up_backlog <= 0:
+            raise ValueError("The option *scale_up_backlog* should be bigger than 0.")
+        if scale_up_latency is not None and scale_up_latency < 0:
+            raise ValueError("The option *scale_up_latency* should be bigger than or equal to 0.")
+        if scale_down_idle_time < 0 or cooldown < 0:
+            raise ValueError("The options *scale_down_idle_time* and *cooldown* should be bigger than or equal to 0.")
+        if step < 1:
+            raise ValueError("The option *step* should be bigger than 0.")
+        if interval <= 0:
+            raise ValueError("The option *interval* should be bigger than 0.")
+
+        self.min_size = min_size
+        self.max_size = max_size
+        self.scale_up_backlog = scale_up_backlog
+        self.scale_up_latency = scale_up_latency
+        self.scale_down_idle_time = scale_down_idle_time
+        self.step = step
+        self.cooldown = cooldown
+        self.interval = interval
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(min_size={self.min_size}, max_size={self.max_size}, " \
+               f"scale_up_backlog={self.scale_up_backlog}, scale_up_latency={self.scale_up_latency}, " \
+               f"scale_down_idle_time={self.scale_down_idle_time}, step={self.step}, " \
+               f"cooldown={self.cooldown}, interval={self.interval})"
+
+
+    def clamp(self, size: int) -> int:
+        return min(max(size, self.min_size), self.max_size)
+
+
+
+class ScalingEvent:
+    """
+    Description:
+        A scaling decision of the autoscaling pool.
+
+    :param action: 'scale_up' or 'scale_down'.
+    :param from_size: The size before scaling.
+    :param to_size: The size after scaling.
+    :param reason: Why it scales, e.g., 'backlog', 'latency' or 'idle'.
+    :param backlog: The amount of waiting tasks at that time.
+    :param busy: The amount of running tasks at that time.
+    :param latency: The average waiting time (seconds) of the recent tasks at that time.
+    """
+
+    def __init__(self, action: str, from_size: int, to_size: int, reason: str, backlog: int, busy: int, latency: float):
+        self.action = action
+        self.from_size = from_size
+        self.to_size = to_size
+        self.reason = reason
+        self.backlog = backlog
+        self.busy = busy
+        self.latency = latency
+        self.time = time.time()
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(action={self.action}, from_size={self.from_size}, to_size={self.to_size}, " \
+               f"reason={self.reason}, backlog={self.backlog}, busy={self.busy}, latency={self.latency:.6f})"
+
+
+
+class AutoScaler:
+    """
+    Description:
+        Scale the amount of tasks which could run in a pool at the same time.
+
+        The pool is built with *max_size* workers, and each task has to get a
+        slot of this scaler before it runs, so the slots are the real size of
+        pool. Growing releases more slots and shrinking takes them back (at once
+        if they're free, or when the running tasks are done). It's cheaper than
+        spawning and joining workers, so it could follow a bursty load closely.
+
+        The decisions are made when a task starts or finishes, and by *monitor*
+        in the background for the idleness. Each decision is saved as a
+        *ScalingEvent* and is passed to the listeners.
+    """
+
+    _Max_Events: int = 1000
+    _Latency_Window: int = 100
+
+    def __init__(self, policy: ScalingPolicy, size: Optional[int] = None, semaphore_factory: Callable[[int], Any] = Semaphore):
+        """
+        Description:
+            The autoscaler.
+        :param policy: The scaling policy.
+        :param size: The initial size. It's the *min_size* of policy if it's None.
+        :param semaphore_factory: Build the semaphore of slots. It should be a green
+                                  semaphore (e.g., gevent.lock.Semaphore) for green threads.
+        """
+
+        self.__policy = policy
+        self.__size = policy.clamp(size or policy.min_size)
+        self.__slots = semaphore_factory(self.__size)
+        # The amount of slots which should be taken back because of shrinking.
+        self.__debt = 0
+        self.__lock = Lock()
+
+        self.__backlog = 0
+        self.__busy = 0
+        self.__latencies: Deque[float] = deque(maxlen=self._Latency_Window)
+        self.__last_saturated_time = time.monotonic()
+        self.__last_scaling_time = 0.0
+
+        self.__events: Deque[ScalingEvent] = deque(maxlen=self._Max_Events)
+        self.__listeners: List[Callable[[ScalingEvent], None]] = []
+        self.__monitoring = False
+
+
+    @property
+    def policy(self) -> ScalingPolicy:
+        return self.__policy
+
+
+    @property
+    def size(self) -> int:
+        """
+        Description:
+            The current size of pool.
+        :return:
+        """
+        return self.__size
+
+
+    @property
+    def backlog(self) -> int:
+        return self.__backlog
+
+
+    @property
+    def busy(self) -> int:
+        return self.__busy
+
+
+    @property
+    def latency(self) -> float:
+        """
+        Description:
+            The average waiting time (seconds) of the recent tasks.
+        :return:
+        """
+        __latencies = list(self.__latencies)
+        return sum(__latencies) / len(__latencies) if __latencies else 0.0
+
+
+    @property
+    def events(self) -> List[ScalingEvent]:
+        """
+        Description:
+            The recent scaling events, it only keeps the last 1000 ones.
+        :return:
+        """
+        return list(self.__events)
+
+
+    def add_listener(self, listener: Callable[[ScalingEvent], None]) -> None:
+        """
+        Description:
+            Call the listener with the *ScalingEvent* when it scales.
+        :param listener:
+        :return:
+        """
+        self.__listeners.append(listener)
+
+
+    def track(self, function: Callable, tasks: int = 1) -> Callable:
+        """
+        Description:
+            Wrap the target function of *tasks* tasks which are submitted now. The
+            wrapped function waits for a slot before running the function.
+        :param function: The target function.
+        :param tasks: The amount of tasks which run the function.
+        :return: The wrapped function.
+        """
+
+        __submitted_time = time.monotonic()
+        with self.__lock:
+            self.__backlog += tasks
+
+        @wraps(function)
+        def _scaled_function(*args, **kwargs):
+            self.__start(submitted_time=__submitted_time)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.__finish()
+
+        return _scaled_function
+
+
+    def evaluate(self) -> Optional[ScalingEvent]:
+        """
+        Description:
+            Scale the pool if it's needed by the policy.
+        :return: The scaling event, or None if it doesn't scale.
+        """
+
+        __event = None
+        with self.__lock:
+            __now = time.monotonic()
+            __policy = self.__policy
+            __latency = self.latency
+            if self.__backlog > 0 or self.__busy >= self.__size:
+                self.__last_saturated_time = __now
+
+            if __now - self.__last_scaling_time < __policy.cooldown:
+                return None
+
+            __reason = None
+            if self.__size < __policy.max_size:
+                if self.__backlog >= self.__size * __policy.scale_up_backlog:
+                    __reason = "backlog"
+                elif __policy.scale_up_latency is not None and self.__backlog > 0 and __latency >= __policy.scale_up_latency:
+                    __reason = "latency"
+            if __reason is not None:
+                __event = self.__resize(_Scale_Up, self.__size + __policy.step, __reason, __latency)
+            elif self.__size > __policy.min_size and __now - self.__last_saturated_time >= __policy.scale_down_idle_time:
+                __event = self.__resize(_Scale_Down, max(self.__size - __policy.step, self.__busy), "idle", __latency)
+                self.__last_saturated_time = __now
+
+            if __event is not None:
+                self.__last_scaling_time = __now
+                self.__events.append(__event)
+
+        if __event is not None:
+            self.__notify(__event)
+        return __event
+
+
+    def monitor(self, sleep: Callable[[float], None] = time.sleep) -> None:
+        """
+        Description:
+            Keep evaluating until *stop* is called. It should run in a background thread
+            (or a green thread with *gevent.sleep*) because it's blocking.
+        :param sleep: The function which sleeps between two evaluations.
+        :return:
+        """
+
+        self.__monitoring = True
+        while self.__monitoring is True:
+            sleep(self.__policy.interval)
+            if self.__monitoring is True:
+                self.evaluate()
+
+
+    def stop(self) -> None:
+        self.__monitoring = False
+
+
+    def __start(self, submitted_time: float) -> None:
+        self.__slots.acquire()
+        with self.__lock:
+            self.__backlog = max(self.__backlog - 1, 0)
+            self.__busy += 1
+            self.__latencies.append(time.monotonic() - submitted_time)
+        self.evaluate()
+
+
+    def __finish(self) -> None:
+        with self.__lock:
+            self.__busy -= 1
+            if self.__debt > 0:
+                # Shrinking: keep the slot instead of releasing it.
+                self.__debt -= 1
+            else:
+                self.__slots.release()
+        self.evaluate()
+
+
+    def __resize(self, action: str, size: int, reason: str, latency: float) -> Optional[ScalingEvent]:
+        __from_size, __to_size = self.__size, self.__policy.clamp(size)
+        if __to_size == __from_size:
+            return None
+
+        if __to_size > __from_size:
+            __grow = __to_size - __from_size
+            __paid = min(__grow, self.__debt)
+            self.__debt -= __paid
+            for _ in range(__grow - __paid):
+                self.__slots.release()
+        else:
+            for _ in range(__from_size - __to_size):
+                # Take back the free slots at once, or the busy ones when they're done.
+                if self.__slots.acquire(blocking=False) is False:
+                    self.__debt += 1
+
+        self.__size = __to_size
+        return ScalingEvent(action=action, from_size=__from_size, to_size=__to_size, reason=reason,
+                            backlog=self.__backlog, busy=self.__busy, latency=latency)
+
+
+    def __notify(self, event: ScalingEvent) -> None:
+        logging.debug(f"Scale the pool: {event}")
+        for __listener in self.__listeners:
+            try:
+                __listener(event)
+            except Exception as e:
+                logging.warning(f"Fail to call the scaling listener {__listener}: {e}")
@@ -0,0 +1,371 @@
+from typing import List, Tuple, Dict, Deque, Callable, Optional, Any
+from collections import deque
+from threading import Lock, current_thread
+from abc import ABCMeta, abstractmethod
+from os import getpid
+import logging
+import math
+import time
+
+from ... import PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION
+
+if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
+    _thread_time = time.thread_time
+else:
+    # Python 3.6 doesn't have the CPU time of thread, it's the one of the whole process.
+    _thread_time = time.process_time
+
+
+# The keys of timing in a running result record.
+_Enqueue_Time: str = "enqueue_time"
+_Start_Time: str = "start_time"
+_End_Time: str = "end_time"
+_CPU_Time: str = "cpu_time"
+_Worker: str = "worker"
+# The attribute of the exception of a pool task which keeps its timing.
+_Exception_Timing: str = "_multirunnable_timing"
+
+
+
+class Histogram:
+    """
+    Description:
+        The distribution of a measurement, e.g., the running time of tasks.
+        It counts all the values, but only keeps the last *max_samples* ones
+        for percentiles, so the memory it uses is bounded.
+    """
+
+    def __init__(self, max_samples: int = 10000):
+        self.__samples: Deque[float] = deque(maxlen=max_samples)
+        self.__count = 0
+        self.__total = 0.0
+        self.__max = 0.0
+
+
+    def __len__(self) -> int:
+        return self.__count
+
+
+    def add(self, value: float) -> None:
+        self.__samples.append(value)
+        self.__count += 1
+        self.__total += value
+        if value > self.__max:
+            self.__max = value
+
+
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Description:
+            The value at *percent* (0 - 100) by the nearest-rank method.
+        :param percent:
+        :return: None if there isn't any value.
+        """
+        if not self.__samples:
+            return None
+        return Histogram._nearest_rank(sorted(self.__samples), percent)
+
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        if not self.__samples:
+            return {"count": 0, "mean": None, "p50": None, "p95": None, "p99": None, "max": None}
+        __samples = sorted(self.__samples)
+        return {
+            "count": self.__count,
+            "mean": self.__total / self.__count,
+            "p50": Histogram._nearest_rank(__samples, 50),
+            "p95": Histogram._nearest_rank(__samples, 95),
+            "p99": Histogram._nearest_rank(__samples, 99),
+            "max": self.__max,
+        }
+
+
+    @staticmethod
+    def _nearest_rank(sorted_samples: List[float], percent: float) -> float:
+        __rank = math.ceil(percent / 100 * len(sorted_samples))
+        return sorted_samples[min(max(__rank, 1), len(sorted_samples)) - 1]
+
+
+
+class MetricsExporter(metaclass=ABCMeta):
+    """
+    Description:
+        Send the metrics of an executor or a pool to somewhere else, e.g.,
+        a log, a time series database or a monitoring system.
+    """
+
+    @abstractmethod
+    def export(self, name: str, metrics: Dict[str, Any]) -> None:
+        """
+        Description:
+            Export the snapshot of metrics.
+        :param name: The name of executor or pool.
+        :param metrics: The snapshot of metrics, it's the return value of 'Metrics.snapshot'.
+        :return:
+        """
+        pass
+
+
+
+class LoggingExporter(MetricsExporter):
+
+    def __init__(self, level: int = logging.INFO, logger: Optional[logging.Logger] = None):
+        self.__level = level
+        self.__logger = logger or logging.getLogger("multirunnable.metrics")
+
+
+    def export(self, name: str, metrics: Dict[str, Any]) -> None:
+        self.__logger.log(self.__level, f"Metrics of {name}: {metrics}")
+
+
+
+class InMemoryExporter(MetricsExporter):
+    """
+    Description:
+        Keep the last snapshot of each name, for polling by something else.
+    """
+
+    def __init__(self):
+        self.metrics: Dict[str, Dict[str, Any]] = {}
+
+
+    def export(self, name: str, metrics: Dict[str, Any]) -> None:
+        self.metrics[name] = metrics
+
+
+
+class Metrics:
+    """
+    Description:
+        The metrics of the tasks of an executor or a pool. It's aggregated from
+        the timing of the running result records:
+
+            * queue_wait: from the task is submitted to it starts.
+            * run_time: from the task starts to it's done.
+            * latency: from the task is submitted to it's done.
+            * cpu_time: the CPU time of the thread which runs the task.
+
+        The records without timing (e.g., the metrics is enabled after the tasks
+        were submitted) are only counted for the amount of tasks and errors.
+    """
+
+    _Stragglers: int = 3
+
+    def __init__(self, name: str, exporter: Optional[MetricsExporter] = None, max_samples: int = 10000):
+        self.name = name
+        self.exporter = exporter
+        self.__max_samples = max_samples
+        self.__lock = Lock()
+        self.reset()
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name}, exporter={self.exporter}, tasks={self.__tasks})"
+
+
+    def reset(self) -> None:
+        self.__tasks = 0
+        self.__errors = 0
+        self.__first_enqueue_time: Optional[float] = None
+        self.__last_end_time: Optional[float] = None
+        self.__queue_wait = Histogram(max_samples=self.__max_samples)
+        self.__run_time = Histogram(max_samples=self.__max_samples)
+        self.__latency = Histogram(max_samples=self.__max_samples)
+        self.__cpu_time = Histogram(max_samples=self.__max_samples)
+        # The slowest task of each worker: {worker: (max running time, tasks)}
+        self.__workers: Dict[str, Tuple[float, int]] = {}
+
+
+    def record(self, record: Dict) -> None:
+        """
+        Description:
+            Aggregate a running result record.
+        :param record:
+        :return:
+        """
+
+        with self.__lock:
+            self.__tasks += 1
+            if record.get("successful", None) is not True:
+                self.__errors += 1
+
+            __enqueue_time, __start_time, __end_time = record.get(_Enqueue_Time, None), record.get(_Start_Time, None), record.get(_End_Time, None)
+            if __start_time is None or __end_time is None:
+                return
+
+            __run_time = __end_time - __start_time
+            self.__run_time.add(__run_time)
+            if __enqueue_time is not None:
+                self.__queue_wait.add(max(__start_time - __enqueue_time, 0.0))
+                self.__latency.add(__end_time - __enqueue_time)
+                if self.__first_enqueue_time is None or __enqueue_time < self.__first_enqueue_time:
+                    self.__first_enqueue_time = __enqueue_time
+            if self.__last_end_time is None or __end_time > self.__last_end_time:
+                self.__last_end_time = __end_time
+            if record.get(_CPU_Time, None) is not None:
+                self.__cpu_time.add(record[_CPU_Time])
+
+            __worker = record.get(_Worker, None) or f"{record.get('pid', '')}:{record.get('name', '')}"
+            __max_run_time, __worker_tasks = self.__workers.get(__worker, (0.0, 0))
+            self.__workers[__worker] = (max(__max_run_time, __run_time), __worker_tasks + 1)
+
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Description:
+            The current metrics. The throughput is the amount of tasks per second from the
+            first task is submitted to the last task is done. The stragglers are the workers
+            which have the slowest tasks.
+        :return:
+        """
+
+        with self.__lock:
+            __throughput = None
+            if self.__first_enqueue_time is not None and self.__last_end_time is not None and self.__last_end_time > self.__first_enqueue_time:
+                __throughput = len(self.__run_time) / (self.__last_end_time - self.__first_enqueue_time)
+            __stragglers = sorted(self.__workers.items(), key=lambda _worker: _worker[1][0], reverse=True)[:self._Stragglers]
+            return {
+                "tasks": self.__tasks,
+                "errors": self.__errors,
+                "error_rate": self.__errors / self.__tasks if self.__tasks else 0.0,
+                "throughput": __throughput,
+                "queue_wait": self.__queue_wait.summary(),
+                "run_time": self.__run_time.summary(),
+                "latency": self.__latency.summary(),
+                "cpu_time": self.__cpu_time.summary(),
+                "stragglers": [{"worker": _worker, "max_run_time": _max_run_time, "tasks": _tasks}
+                               for _worker, (_max_run_time, _tasks) in __stragglers],
+            }
+
+
+    def export(self) -> Dict[str, Any]:
+        """
+        Description:
+            Export the snapshot by the exporter (if it has).
+        :return: The snapshot.
+        """
+
+        __snapshot = self.snapshot()
+        if self.exporter is not None:
+            try:
+                self.exporter.export(self.name, __snapshot)
+            except Exception as e:
+                logging.warning(f"Fail to export the metrics of {self.name}: {e}")
+        return __snapshot
+
+
+
+class TimedValue:
+    """
+    Description:
+        The return value of a pool task with its timing. It's unwrapped when
+        the running result is saved, so it's never returned to developers.
+    """
+
+    __slots__ = ("value", "timing")
+
+    def __init__(self, value: Any, timing: Dict[str, Any]):
+        self.value = value
+        self.timing = timing
+
+
+
+def _thread_name() -> str:
+    return f"{getpid()}:{current_thread().name}"
+
+
+
+class TimedTarget:
+    """
+    Description:
+        The target function of pool tasks which measures their timing. It's a
+        class (not a closure) so that it could be pickled to process pool.
+
+        The CPU time should not be measured (*cpu_time* is False) if the tasks
+        share one thread, e.g., green threads, because the CPU time of thread
+        includes the other tasks which run while this one is waiting.
+    """
+
+    def __init__(self, function: Callable, worker_name: Callable[[], str] = _thread_name, cpu_time: bool = True):
+        self.function = function
+        self.worker_name = worker_name
+        self.cpu_time = cpu_time
+        self.enqueue_time = time.time()
+
+
+    def __call__(self, *args, **kwargs) -> TimedValue:
+        __start = start_timing()
+        try:
+            __value = self.function(*args, **kwargs)
+        except Exception as e:
+            # The failed tasks are measured too, the timing goes with the exception (it's pickled with it).
+            __timing = {_Worker: self.worker_name()}
+            stop_timing(__timing, enqueue_time=self.enqueue_time, start=__start, cpu_time=self.cpu_time)
+            try:
+                setattr(e, _Exception_Timing, __timing)
+            except AttributeError:
+                pass
+            raise
+        __timing = {_Worker: self.worker_name()}
+        stop_timing(__timing, enqueue_time=self.enqueue_time, start=__start, cpu_time=self.cpu_time)
+        return TimedValue(value=__value, timing=__timing)
+
+
+
+def untime_result(result: Any, exception: Optional[BaseException] = None) -> Tuple[Any, Optional[Dict[str, Any]]]:
+    """
+    Description:
+        Split the return value of a pool task into the value and its timing.
+        The timing of a failed task is kept by its exception.
+    :param result:
+    :param exception: The exception of the task if it fails.
+    :return: The value and the timing (None if it isn't measured).
+    """
+    if isinstance(result, TimedValue):
+        return result.value, result.timing
+    if exception is not None:
+        return result, getattr(exception, _Exception_Timing, None)
+    return result, None
+
+
+
+def untime_callback(callback: Optional[Callable]) -> Optional[Callable]:
+    """
+    Description:
+        Let the callback of pool get the value instead of *TimedValue*.
+    :param callback:
+    :return:
+    """
+    if callback is None:
+        return None
+
+    def _untimed_callback(value: Any) -> Any:
+        # The value is a list for the callback of 'map_async' and 'starmap_async'.
+        if isinstance(value, list):
+            return callback([untime_result(_v)[0] for _v in value])
+        return callback(untime_result(value)[0])
+
+    return _untimed_callback
+
+
+
+def start_timing() -> Tuple[float, float]:
+    return time.time(), _thread_time()
+
+
+
+def stop_timing(record: Dict, enqueue_time: float, start: Tuple[float, float], cpu_time: bool = True) -> None:
+    """
+    Description:
+        Save the timing into the running result record.
+    :param record:
+    :param enqueue_time: The time of the task is submitted.
+    :param start: The return value of 'start_timing' when the task starts.
+    :param cpu_time: Save the CPU time or not. It should be False if the task shares its thread with others.
+    :return:
+    """
+    record[_Enqueue_Time] = enqueue_time
+    record[_Start_Time] = start[0]
+    record[_End_Time] = time.time()
+    if cpu_time is True:
+        record[_CPU_Time] = _thread_time() - start[1]
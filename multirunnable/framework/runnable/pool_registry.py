@@ -0,0 +1,276 @@
+from typing import List, Tuple, Dict, Callable, Optional, Any
+from threading import RLock, Timer
+import logging
+import atexit
+import time
+import os
+
+
+# The key of registered pool: (name, strategy class name, pool size).
+_Pool_Key = Tuple[str, str, int]
+
+
+
+class PoolLifecycle:
+    """
+    Description:
+        The lifecycle of a registered (warm) pool.
+
+    :param max_idle_time: Close the pool if nobody uses it for this amount of seconds.
+                          It keeps the pool until closing it explicitly if it's None.
+    :param max_tasks_per_child: The amount of tasks which a worker process runs before it's
+                                replaced by a new one. It only works with processes pool.
+    :param max_memory: Recycle the pool when it's released if any worker process uses more
+                       memory (RSS, bytes) than this. It only works with processes pool.
+    """
+
+    def __init__(self, max_idle_time: Optional[float] = None, max_tasks_per_child: Optional[int] = None,
+                 max_memory: Optional[int] = None):
+        if max_idle_time is not None and max_idle_time < 0:
+            raise ValueError("The option *max_idle_time* should be bigger than or equal to 0.")
+        if max_tasks_per_child is not None and max_tasks_per_child < 1:
+            raise ValueError("The option *max_tasks_per_child* should be bigger than 0.")
+        if max_memory is not None and max_memory < 1:
+            raise ValueError("The option *max_memory* should be bigger than 0.")
+
+        self.max_idle_time = max_idle_time
+        self.max_tasks_per_child = max_tasks_per_child
+        self.max_memory = max_memory
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(max_idle_time={self.max_idle_time}, " \
+               f"max_tasks_per_child={self.max_tasks_per_child}, max_memory={self.max_memory})"
+
+
+    def __eq__(self, other):
+        if isinstance(other, PoolLifecycle) is False:
+            return NotImplemented
+        return self.__options() == other.__options()
+
+
+    def __hash__(self):
+        return hash(self.__options())
+
+
+    def __options(self) -> Tuple[Optional[float], Optional[int], Optional[int]]:
+        return self.max_idle_time, self.max_tasks_per_child, self.max_memory
+
+
+
+class _RegisteredPool:
+
+    def __init__(self, pool: Any, closer: Callable[[Any], None], lifecycle: PoolLifecycle,
+                 memory_usage: Optional[Callable[[Any], Optional[int]]] = None, config: Any = None):
+        self.pool = pool
+        self.closer = closer
+        self.lifecycle = lifecycle
+        self.memory_usage = memory_usage
+        self.config = config
+        self.users = 0
+        self.last_used_time = time.monotonic()
+        self.closing = False
+        self.idle_timer: Optional[Timer] = None
+
+
+    def cancel_idle_timer(self) -> None:
+        if self.idle_timer is not None:
+            self.idle_timer.cancel()
+            self.idle_timer = None
+
+
+    def is_idle_timeout(self, now: float) -> bool:
+        if self.users > 0 or self.lifecycle.max_idle_time is None:
+            return False
+        return now - self.last_used_time >= self.lifecycle.max_idle_time
+
+
+    def is_over_memory(self) -> bool:
+        if self.lifecycle.max_memory is None or self.memory_usage is None:
+            return False
+        __memory = self.memory_usage(self.pool)
+        return __memory is not None and __memory > self.lifecycle.max_memory
+
+
+
+class PoolRegistry:
+    """
+    Description:
+        The named pools which keep running in the current process. A pool strategy
+        which has a pool name attaches to the running pool with the same name, mode
+        (strategy) and size, instead of building a new one. Closing the strategy only
+        releases the pool back to registry, so the next one which attaches to it
+        doesn't pay the cost of spawning workers and running the pool initializer again.
+
+        The registered pool is closed when it idles over the *max_idle_time* of its
+        lifecycle (a daemon timer checks it when the pool is released), when it uses
+        too much memory, or when it's closed explicitly. The pool which is still used
+        is closed when its last user releases it.
+
+        It raises ValueError if a strategy attaches to the running pool with different
+        lifecycle or configuration (e.g., the pool initializer), because the running
+        pool couldn't be changed.
+    """
+
+    def __init__(self):
+        self.__pools: Dict[_Pool_Key, _RegisteredPool] = {}
+        self.__lock = RLock()
+
+
+    def __len__(self) -> int:
+        return len(self.__pools)
+
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.names()
+
+
+    def names(self) -> List[str]:
+        with self.__lock:
+            return sorted(set(__key[0] for __key in self.__pools.keys()))
+
+
+    def acquire(self, name: str, mode: str, pool_size: int, factory: Callable[[], Any], closer: Callable[[Any], None],
+                lifecycle: Optional[PoolLifecycle] = None, memory_usage: Optional[Callable[[Any], Optional[int]]] = None,
+                config: Any = None) -> Tuple[Any, bool]:
+        """
+        Description:
+            Attach to the running pool, or build one by *factory* if there isn't.
+        :param name: The name of pool.
+        :param mode: The mode of pool, it's the class name of strategy.
+        :param pool_size: The size of pool.
+        :param factory: The function which builds a new pool.
+        :param closer: The function which closes the pool.
+        :param lifecycle: The lifecycle of a new pool.
+        :param memory_usage: The function which returns the max memory usage of worker processes of the pool.
+        :param config: The configuration which the pool is built with, e.g., the pool initializer and its arguments.
+        :return: The pool and it's warm (already running) or not.
+        """
+
+        with self.__lock:
+            self.prune()
+            __key = (name, mode, pool_size)
+            __lifecycle = lifecycle or PoolLifecycle()
+            __registered_pool = self.__pools.get(__key, None)
+            __is_warm = __registered_pool is not None
+            if __is_warm is False:
+                __registered_pool = _RegisteredPool(pool=factory(), closer=closer, lifecycle=__lifecycle, memory_usage=memory_usage, config=config)
+                self.__pools[__key] = __registered_pool
+            elif __registered_pool.lifecycle != __lifecycle or __registered_pool.config != config:
+                raise ValueError(f"The pool {__key} is running with different lifecycle or configuration "
+                                 f"({__registered_pool.lifecycle}, {__registered_pool.config}), please use another name.")
+
+            __registered_pool.cancel_idle_timer()
+            __registered_pool.users += 1
+            __registered_pool.last_used_time = time.monotonic()
+            return __registered_pool.pool, __is_warm
+
+
+    def release(self, name: str, mode: str, pool_size: int) -> None:
+        """
+        Description:
+            Detach from the pool and keep it running. It closes the pool if nobody
+            uses it and it has been closed explicitly or it uses too much memory (recycle),
+            or it starts the timer which closes the pool when it idles over *max_idle_time*.
+        :param name:
+        :param mode:
+        :param pool_size:
+        :return:
+        """
+
+        with self.__lock:
+            __key = (name, mode, pool_size)
+            __registered_pool = self.__pools.get(__key, None)
+            if __registered_pool is None:
+                return
+
+            __registered_pool.users = max(__registered_pool.users - 1, 0)
+            __registered_pool.last_used_time = time.monotonic()
+            if __registered_pool.users == 0:
+                if __registered_pool.closing is True:
+                    self.__close(__key)
+                elif __registered_pool.is_over_memory() is True:
+                    logging.info(f"Recycle the pool {__key} because it uses more memory than {__registered_pool.lifecycle.max_memory} bytes.")
+                    self.__close(__key)
+                elif __registered_pool.lifecycle.max_idle_time is not None:
+                    self.__start_idle_timer(__registered_pool)
+            self.prune()
+
+
+    def __start_idle_timer(self, registered_pool: _RegisteredPool) -> None:
+        registered_pool.cancel_idle_timer()
+        registered_pool.idle_timer = Timer(registered_pool.lifecycle.max_idle_time, self.prune)
+        registered_pool.idle_timer.daemon = True
+        registered_pool.idle_timer.start()
+
+
+    def discard(self, name: str, mode: str, pool_size: int) -> None:
+        """
+        Description:
+            Remove the pool from registry without closing it, e.g., it has been terminated.
+        :param name:
+        :param mode:
+        :param pool_size:
+        :return:
+        """
+
+        with self.__lock:
+            __registered_pool = self.__pools.pop((name, mode, pool_size), None)
+            if __registered_pool is not None:
+                __registered_pool.cancel_idle_timer()
+
+
+    def prune(self) -> int:
+        """
+        Description:
+            Close the pools which idle over their *max_idle_time*.
+        :return: The amount of closed pools.
+        """
+
+        with self.__lock:
+            __now = time.monotonic()
+            __idle_keys = [__key for __key, __registered_pool in self.__pools.items() if __registered_pool.is_idle_timeout(__now)]
+            for __key in __idle_keys:
+                self.__close(__key)
+            return len(__idle_keys)
+
+
+    def close(self, name: Optional[str] = None, force: bool = False) -> None:
+        """
+        Description:
+            Close the pools with the name, or all the pools if *name* is None. The pool
+            which is still used is closed when its last user releases it.
+        :param name:
+        :param force: Close the pools even if they're still used, e.g., at exit.
+        :return:
+        """
+
+        with self.__lock:
+            for __key in list(self.__pools.keys()):
+                if name is None or __key[0] == name:
+                    if force is False and self.__pools[__key].users > 0:
+                        self.__pools[__key].closing = True
+                    else:
+                        self.__close(__key)
+
+
+    def __close(self, key: _Pool_Key) -> None:
+        __registered_pool = self.__pools.pop(key)
+        __registered_pool.cancel_idle_timer()
+        try:
+            __registered_pool.closer(__registered_pool.pool)
+        except Exception as e:
+            logging.warning(f"Fail to close the pool {key}: {e}")
+
+
+    def _reset_in_child(self) -> None:
+        # The pools of parent process cannot be used in the forked child process.
+        self.__pools = {}
+        self.__lock = RLock()
+
+
+
+Pool_Registry: PoolRegistry = PoolRegistry()
+atexit.register(Pool_Registry.close, force=True)
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=Pool_Registry._reset_in_child)
@@ -11,6 +11,19 @@ class BaseQueueType(Enum):
 
 
 
+class QueueBatch(list):
+    """
+    Description:
+        A chunk of values which is put into the queue as one item, so that it only
+        pickles and transfers once for all of them (multiprocessing Queue) or only
+        acquires the lock once (the other queues). 'QueueOperator.get_many' unpacks
+        it back to the values.
+    """
+
+    pass
+
+
+
 class BaseQueue(metaclass=ABCMeta):
 
     @abstractmethod
@@ -1,4 +1,5 @@
-from typing import List, Any
+from typing import List, Dict, Iterator, Iterable, Optional, Any
+from collections import deque
 from enum import Enum
 from abc import ABCMeta, abstractmethod
 
@@ -52,7 +53,56 @@ class BaseResult(metaclass=ABCMeta):
 
 
 
-class MRResult(BaseResult):
+class TimingResult:
+    """
+    Description:
+        The timing of a task. They're all None if the metrics isn't enabled.
+    """
+
+    _Enqueue_Time: Optional[float] = None
+    _Start_Time: Optional[float] = None
+    _End_Time: Optional[float] = None
+    _CPU_Time: Optional[float] = None
+
+    @property
+    def enqueue_time(self) -> Optional[float]:
+        """
+        Description:
+            The time (epoch seconds) when the task is submitted.
+        :return:
+        """
+        return self._Enqueue_Time
+
+
+    @property
+    def start_time(self) -> Optional[float]:
+        return self._Start_Time
+
+
+    @property
+    def end_time(self) -> Optional[float]:
+        return self._End_Time
+
+
+    @property
+    def cpu_time(self) -> Optional[float]:
+        """
+        Description:
+            The CPU time (seconds) of the thread which runs the task.
+        :return:
+        """
+        return self._CPU_Time
+
+
+    def _save_timing(self, record: Dict) -> None:
+        self._Enqueue_Time = record.get("enqueue_time", None)
+        self._Start_Time = record.get("start_time", None)
+        self._End_Time = record.get("end_time", None)
+        self._CPU_Time = record.get("cpu_time", None)
+
+
+
+class MRResult(BaseResult, TimingResult):
 
     _PID: str = ""
     _Worker_Name: str = ""
@@ -122,7 +172,7 @@ class MRResult(BaseResult):
 
 
 
-class PoolResult:
+class PoolResult(TimingResult):
 
     _Data: List[Any] = None
     _Is_Successful: bool = None
@@ -157,3 +207,73 @@ class PoolResult:
     def exception(self, exception) -> None:
         self._Exception = exception
 
+
+
+class ResultStore:
+    """
+    Description:
+        The records of running result which belong to one strategy instance.
+        It keeps all the records until they're dropped by 'get_result' (method
+        'reset_result') by default. It only keeps the last *max_size* records
+        if the option be set, the older ones would be dropped when the new one
+        be saved. So the memory it uses is bounded even if it runs millions of
+        workers and never calls 'get_result'.
+
+        Set *max_size* as 0 to drop every record directly, it's useful if the
+        running result isn't needed.
+    """
+
+    def __init__(self, max_size: Optional[int] = None):
+        ResultStore._chk_max_size(max_size)
+        self.__records = deque(maxlen=max_size)
+        # The metrics which aggregates each record when it's saved, it's None if the metrics isn't enabled.
+        self.metrics = None
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(max_size={self.max_size}, records={len(self.__records)})"
+
+
+    def __len__(self) -> int:
+        return len(self.__records)
+
+
+    def __iter__(self) -> Iterator[Dict]:
+        return iter(self.__records)
+
+
+    @staticmethod
+    def _chk_max_size(max_size: Optional[int]) -> None:
+        if max_size is None:
+            return
+        if isinstance(max_size, bool) or isinstance(max_size, int) is False or max_size < 0:
+            raise ValueError("The option *max_size* should be None or an integer which is larger than or equal to 0.")
+
+
+    @property
+    def max_size(self) -> Optional[int]:
+        return self.__records.maxlen
+
+
+    @max_size.setter
+    def max_size(self, max_size: Optional[int]) -> None:
+        ResultStore._chk_max_size(max_size)
+        self.__records = deque(self.__records, maxlen=max_size)
+
+
+    def append(self, record: Dict) -> None:
+        if self.metrics is not None:
+            self.metrics.record(record)
+        self.__records.append(record)
+
+
+    def extend(self, records: Iterable[Dict]) -> None:
+        if self.metrics is not None:
+            records = list(records)
+            for __record in records:
+                self.metrics.record(__record)
+        self.__records.extend(records)
+
+
+    def clear(self) -> None:
+        self.__records.clear()
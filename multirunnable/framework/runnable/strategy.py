@@ -1,19 +1,74 @@
-from multipledispatch import dispatch
 from functools import partial as PartialFunctionType
-from typing import cast, List, Tuple, Dict, Iterable, Callable, Optional, Union
+from collections.abc import Sized
+from typing import cast, List, Tuple, Dict, Iterable, Iterator, Callable, Optional, Union, Any
 from types import MethodType, FunctionType
 from abc import ABCMeta, ABC, abstractmethod
+from queue import Full
 
 from .result import MRResult as _MRResult, PoolResult as _PoolResult
+from .pool_registry import PoolLifecycle as _PoolLifecycle, Pool_Registry as _Pool_Registry
+from .autoscale import AutoScaler as _AutoScaler
+from .metrics import (
+    Metrics as _Metrics,
+    MetricsExporter as _MetricsExporter,
+    TimedTarget as _TimedTarget,
+    untime_result as _untime_result,
+    untime_callback as _untime_callback,
+    _thread_name
+)
 from ..adapter.lock import BaseFeatureAdapter
 from ..factory import BaseFeatureAdapterFactory as _BaseFeatureAdapterFactory, BaseList as _BaseList
 from ..task import BaseQueueTask as _BaseQueueTask
 from ...api._retry import _BaseRetry
 from ...types import MRTasks as _MRTasks
 from ...mode import FeatureMode as _FeatureMode
+from ..._dispatch import method_dispatch
 import multirunnable._utils as _utils
 
 
+# The signal which be put into feeder to let the feeding worker stop.
+_Feeder_Stop_Signal = None
+
+# The seconds to wait for a space of feeder before checking whether the feeding workers are still alive.
+_Feeder_Put_Timeout: float = 1.0
+
+
+def _consume_feeder(function: Callable, feeder: Any) -> None:
+    """
+    Description:
+        The target of feeding worker. It keeps getting arguments from feeder
+        and running the target function until it gets the stop signal.
+        Each element in feeder is a tuple which only has one element, the
+        arguments (tuple or dict) of target function.
+    :param function: The target function which has been wrapped to save its running result.
+    :param feeder: A queue object which could be used in the current running strategy.
+    :return:
+    """
+
+    while True:
+        __feeding = feeder.get()
+        if __feeding is _Feeder_Stop_Signal:
+            break
+
+        __args = __feeding[0]
+        if isinstance(__args, dict):
+            function(**__args)
+        elif __args is None:
+            function()
+        else:
+            function(*__args)
+
+
+def _chk_max_workers(max_workers: int) -> None:
+    if isinstance(max_workers, int) is False or max_workers < 1:
+        raise ValueError("The option *max_workers* should be a positive integer.")
+
+
+def _chk_window(window: int) -> None:
+    if isinstance(window, int) is False or window < 1:
+        raise ValueError("The option *window* should be a positive integer.")
+
+
 
 class BaseRunnableStrategy(metaclass=ABCMeta):
 
@@ -85,7 +140,7 @@ class RunnableInitialization:
         self._Strategy_Feature_Mode = mode
 
 
-    @dispatch(_BaseQueueTask)
+    @method_dispatch(_BaseQueueTask)
     def init_queue_process(self, queue_tasks: _BaseQueueTask) -> None:
         """
         Description:
@@ -97,7 +152,7 @@ class RunnableInitialization:
         queue_tasks.init_queue_with_values()
 
 
-    @dispatch(_BaseList)
+    @method_dispatch(_BaseList)
     def init_queue_process(self, queue_tasks: _BaseList) -> None:
         """
         Description:
@@ -112,7 +167,7 @@ class RunnableInitialization:
             __queue_adapter.init_queue_with_values()
 
 
-    @dispatch((_BaseFeatureAdapterFactory, BaseFeatureAdapter))
+    @method_dispatch((_BaseFeatureAdapterFactory, BaseFeatureAdapter))
     def init_lock_or_communication_process(self, features: _BaseFeatureAdapterFactory, **kwargs) -> None:
         """
         Description:
@@ -128,7 +183,7 @@ class RunnableInitialization:
         features.globalize_instance(__instance)
 
 
-    @dispatch(_BaseList)
+    @method_dispatch(_BaseList)
     def init_lock_or_communication_process(self, features: _BaseList, **kwargs) -> None:
         """
         Description:
@@ -229,7 +284,8 @@ class GeneralRunnableStrategy(RunnableStrategy):
 
     def map(self, function: Callable, args_iter: Iterable = [],
             queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
-            features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None) -> None:
+            features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None,
+            max_workers: Optional[int] = None) -> None:
         """
         Description:
             Map version of running target function by the iterator of arguments.
@@ -237,15 +293,100 @@ class GeneralRunnableStrategy(RunnableStrategy):
         :param args_iter:
         :param queue_tasks:
         :param features:
+        :param max_workers: The max amount of workers which run at the same time. It activates one worker
+                            for each arguments if it's None. Or it only activates this amount of workers and
+                            each of them keeps getting arguments to run the target function repeatedly.
         :return:
         """
         self.initialization(queue_tasks=queue_tasks, features=features)
+        if max_workers is not None:
+            self._map_with_bounded_workers(function=function, args_iter=args_iter, max_workers=max_workers)
+            return
+
         # __workers_list = map(self._generate_worker, args_iter)
         __workers_list = [self._generate_worker(function, args) for args in args_iter]
         self.activate_workers(__workers_list)
         self.close(__workers_list)
 
 
+    def _map_with_bounded_workers(self, function: Callable, args_iter: Iterable, max_workers: int) -> None:
+        """
+        Description:
+            Activate *max_workers* feeding workers and feed them with the
+            arguments. Every running of target function still saves one
+            running result.
+        :param function:
+        :param args_iter:
+        :param max_workers:
+        :return:
+        """
+        _chk_max_workers(max_workers)
+
+        __workers_size = max_workers
+        if isinstance(args_iter, Sized):
+            __workers_size = max(min(max_workers, len(args_iter)), 1)
+
+        # Bounded feeder makes the memory usage be constant with the size of arguments.
+        __feeder = self._generate_feeder(maxsize=__workers_size * 2)
+        __workers_list = [self._generate_feeding_worker(function, __feeder) for _ in range(__workers_size)]
+        self.activate_workers(__workers_list)
+
+        __is_fed = all(self._feed(__feeder, (__args,), __workers_list) for __args in args_iter) and \
+            all(self._feed(__feeder, _Feeder_Stop_Signal, __workers_list) for _ in range(__workers_size))
+
+        self.close(__workers_list)
+        if __is_fed is False:
+            raise RuntimeError("All the feeding workers have stopped before consuming all the arguments.")
+
+
+    def _feed(self, feeder: Any, feeding: Any, workers: List[_MRTasks]) -> bool:
+        """
+        Description:
+            Put the feeding into feeder. It waits for a space of feeder by
+            timeout and checks whether any of feeding workers is still alive
+            every time it times out, so it doesn't block forever if all of
+            them have stopped (e.g., be killed).
+        :param feeder:
+        :param feeding:
+        :param workers:
+        :return: False if all the feeding workers have stopped.
+        """
+        while True:
+            try:
+                feeder.put(feeding, timeout=_Feeder_Put_Timeout)
+                return True
+            except Full:
+                if any(self._is_worker_alive(__worker) for __worker in workers) is False:
+                    return False
+
+
+    def _is_worker_alive(self, worker: _MRTasks) -> bool:
+        return worker.is_alive()
+
+
+    def _generate_feeder(self, maxsize: int) -> Any:
+        """
+        Description:
+            Generate a queue object which could be used between the workers
+            of the current strategy to feed arguments.
+        :param maxsize:
+        :return:
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support bounded workers mode.")
+
+
+    def _generate_feeding_worker(self, function: Callable, feeder: Any) -> _MRTasks:
+        """
+        Description:
+            Initial and instantiate an executor which keeps getting arguments
+            from feeder and running target function with them.
+        :param function:
+        :param feeder:
+        :return:
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support bounded workers mode.")
+
+
     def map_with_function(self, functions: Iterable[Callable], args_iter: Iterable = [],
                           queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
                           features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None) -> None:
@@ -268,19 +409,19 @@ class GeneralRunnableStrategy(RunnableStrategy):
         self.close(__workers_list)
 
 
-    @dispatch((FunctionType, MethodType, PartialFunctionType, _BaseRetry), type(None))
+    @method_dispatch((FunctionType, MethodType, PartialFunctionType, _BaseRetry), type(None))
     def _generate_worker(self, function: Callable, args) -> _MRTasks:
         __worker = self.generate_worker(function)
         return __worker
 
 
-    @dispatch((FunctionType, MethodType, PartialFunctionType, _BaseRetry), tuple)
+    @method_dispatch((FunctionType, MethodType, PartialFunctionType, _BaseRetry), tuple)
     def _generate_worker(self, function: Callable, args) -> _MRTasks:
         __worker = self.generate_worker(function, *args)
         return __worker
 
 
-    @dispatch((FunctionType, MethodType, PartialFunctionType, _BaseRetry), dict)
+    @method_dispatch((FunctionType, MethodType, PartialFunctionType, _BaseRetry), dict)
     def _generate_worker(self, function: Callable, args) -> _MRTasks:
         __worker = self.generate_worker(function, **args)
         return __worker
@@ -347,6 +488,15 @@ class GeneralRunnableStrategy(RunnableStrategy):
 
 class PoolRunnableStrategy(RunnableStrategy):
 
+    _Pool_Name: Optional[str] = None
+    _Pool_Lifecycle: Optional[_PoolLifecycle] = None
+    _Pool_Is_Warm: bool = False
+    _Auto_Scaler: Optional[_AutoScaler] = None
+    # The function which returns the name of worker, for the timing of tasks. It should be pickleable.
+    _Timing_Worker_Name: Callable[[], str] = staticmethod(_thread_name)
+    # Measure the CPU time of tasks or not, it's meaningless if the workers share one thread.
+    _Timing_CPU_Time: bool = True
+
     def __init__(self, pool_size: int):
         super(PoolRunnableStrategy, self).__init__()
         self._pool_size = pool_size
@@ -363,6 +513,189 @@ class PoolRunnableStrategy(RunnableStrategy):
         return self._pool_size
 
 
+    @property
+    def auto_scaler(self) -> Optional[_AutoScaler]:
+        """
+        Description:
+            The autoscaler of pool. It's None if the size of pool is fixed.
+            Its property *size* is the current size, and *events* are the
+            scaling decisions.
+        :return:
+        """
+        return self._Auto_Scaler
+
+
+    @property
+    def _pool_workers(self) -> int:
+        # An autoscaling pool keeps the max amount of workers, and its scaler limits how many of them could run.
+        if self._Auto_Scaler is not None:
+            return self._Auto_Scaler.policy.max_size
+        return self.pool_size
+
+
+    @property
+    def pool_name(self) -> Optional[str]:
+        """
+        Description:
+            The name of registered pool which this strategy uses. It builds
+            its own pool if it's None.
+        :return:
+        """
+        return self._Pool_Name
+
+
+    @property
+    def is_warm(self) -> bool:
+        """
+        Description:
+            It's True if the strategy attaches to an already running pool.
+        :return:
+        """
+        return self._Pool_Is_Warm
+
+
+    def register_pool(self, name: str, lifecycle: Optional[_PoolLifecycle] = None) -> None:
+        """
+        Description:
+            Use the named pool in registry 'Pool_Registry'. It attaches to the running
+            pool which has the same name, strategy and pool size when initializing, and
+            only releases it back to registry when closing, so the pool keeps running
+            for the next strategy. It raises ValueError when initializing if the running
+            pool has different lifecycle or pool initializer.
+        :param name: The name of pool.
+        :param lifecycle: The lifecycle of the pool if it builds a new one.
+        :return:
+        """
+        self._Pool_Name = name
+        self._Pool_Lifecycle = lifecycle or _PoolLifecycle()
+
+
+    def _acquire_pool(self, factory: Callable[[], Any], closer: Callable[[Any], None],
+                      memory_usage: Optional[Callable[[Any], Optional[int]]] = None, config: Any = None) -> Any:
+        """
+        Description:
+            Build the pool by *factory*, or attach to the registered one if the
+            strategy has a pool name.
+        :param factory: The function which builds a new pool.
+        :param closer: The function which closes the pool.
+        :param memory_usage: The function which returns the max memory usage of worker processes.
+        :param config: The configuration of the pool, the registered pool with different one couldn't be attached.
+        :return:
+        """
+        if self._Pool_Name is None:
+            self._Pool_Is_Warm = False
+            return factory()
+
+        __pool, self._Pool_Is_Warm = _Pool_Registry.acquire(
+            name=self._Pool_Name, mode=self.__class__.__name__, pool_size=self._pool_workers,
+            factory=factory, closer=closer, lifecycle=self._Pool_Lifecycle, memory_usage=memory_usage, config=config)
+        return __pool
+
+
+    def _release_pool(self) -> bool:
+        """
+        Description:
+            Release the pool back to registry if the strategy has a pool name.
+        :return: False if the pool isn't registered, so it should be closed by the strategy.
+        """
+        if self._Pool_Name is None:
+            return False
+        _Pool_Registry.release(name=self._Pool_Name, mode=self.__class__.__name__, pool_size=self._pool_workers)
+        return True
+
+
+    def _discard_pool(self) -> None:
+        if self._Pool_Name is not None:
+            _Pool_Registry.discard(name=self._Pool_Name, mode=self.__class__.__name__, pool_size=self._pool_workers)
+
+
+    def _timing(self, function: Callable) -> Callable:
+        """
+        Description:
+            Measure the timing of the tasks of target function if the metrics is enabled.
+            Their return values would be 'TimedValue' and should be unwrapped by
+            '_untime_result' before saving them.
+        :param function:
+        :return:
+        """
+        if getattr(self, "_Metrics", None) is None:
+            return function
+        return _TimedTarget(function, worker_name=self._Timing_Worker_Name, cpu_time=self._Timing_CPU_Time)
+
+
+    def _untime_callback(self, callback: Optional[Callable], recording: bool = False) -> Optional[Callable]:
+        """
+        Description:
+            Let the callback get the return value instead of 'TimedValue'. The timing
+            is aggregated by the metrics if *recording* is True, it's for the tasks
+            which don't save running results, e.g., streaming mode.
+        :param callback:
+        :param recording:
+        :return:
+        """
+        __metrics = getattr(self, "_Metrics", None)
+        if __metrics is None or callback is None:
+            return callback
+        if recording is False:
+            return _untime_callback(callback)
+
+        def _recording_callback(value: Any) -> Any:
+            __value, __timing = _untime_result(value)
+            __metrics.record(dict(__timing or {}, successful=True))
+            return callback(__value)
+
+        return _recording_callback
+
+
+    def _recording_error_callback(self, error_callback: Optional[Callable]) -> Optional[Callable]:
+        """
+        Description:
+            Let the failed tasks which don't save running results (e.g., streaming mode)
+            be aggregated by the metrics with the timing which their exceptions keep.
+        :param error_callback:
+        :return:
+        """
+        __metrics = getattr(self, "_Metrics", None)
+        if __metrics is None or error_callback is None:
+            return error_callback
+
+        def _recording_error_callback(error: BaseException) -> Any:
+            _, __timing = _untime_result(None, exception=error)
+            __metrics.record(dict(__timing or {}, successful=False))
+            return error_callback(error)
+
+        return _recording_error_callback
+
+
+    def _scaling(self, function: Callable, tasks: int = 1) -> Callable:
+        """
+        Description:
+            Let the tasks of target function be limited and measured by the autoscaler.
+            It returns the function directly if the size of pool is fixed.
+        :param function: The target function.
+        :param tasks: The amount of tasks which run the function.
+        :return:
+        """
+        if self._Auto_Scaler is None:
+            return function
+        return self._Auto_Scaler.track(function, tasks=tasks)
+
+
+    def _scaling_iter(self, function: Callable, args_iter: Iterable) -> Tuple[Callable, Iterable]:
+        """
+        Description:
+            The same as *_scaling*, but the amount of tasks is the length of *args_iter*.
+        :param function:
+        :param args_iter:
+        :return: The function and arguments which should be submitted.
+        """
+        if self._Auto_Scaler is None:
+            return function, args_iter
+        if isinstance(args_iter, Sized) is False:
+            args_iter = list(args_iter)
+        return self._Auto_Scaler.track(function, tasks=len(args_iter)), args_iter
+
+
     @abstractmethod
     def apply(self, tasks_size: int, function: Callable, args: Tuple = (), kwargs: Dict = {}) -> None:
         """
@@ -439,25 +772,138 @@ class PoolRunnableStrategy(RunnableStrategy):
 
 
     @abstractmethod
-    def imap(self, function: Callable, args_iter: Iterable[Iterable] = (), chunksize: int = 1) -> None:
+    def imap(self, function: Callable, args_iter: Iterable[Iterable] = (), chunksize: int = 1,
+             stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_PoolResult]]:
         """
         Description:
             Refer to multiprocessing.pool.imap.
+            It returns a generator of running results if *stream* is True.
         :return:
         """
         pass
 
 
     @abstractmethod
-    def imap_unordered(self, function: Callable, args_iter: Iterable[Iterable] = (), chunksize: int = 1) -> None:
+    def imap_unordered(self, function: Callable, args_iter: Iterable[Iterable] = (), chunksize: int = 1,
+                       stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_PoolResult]]:
         """
         Description:
             Refer to multiprocessing.pool.imap_unordered.
+            It returns a generator of running results if *stream* is True.
         :return:
         """
         pass
 
 
+    def _stream_imap(self, function: Callable, args_iter: Iterable, window: Optional[int] = None,
+                     ordered: bool = True) -> Iterator[_PoolResult]:
+        """
+        Description:
+            Run target function with each element of *args_iter* in pool
+            and yield the running result as soon as it's done. It only gets
+            the next element from *args_iter* when the amount of the tasks
+            which are submitted but not yielded yet is less than *window*,
+            so the memory usage doesn't grow with the size of *args_iter*.
+            The running results which be yielded would not be saved.
+        :param function:
+        :param args_iter:
+        :param window: The max amount of in-flight tasks. Default is double of pool size.
+        :param ordered: Yield the running results by the order of *args_iter* or by the order of done.
+        :return:
+        """
+
+        if window is None:
+            window = self.pool_size * 2
+        _chk_window(window)
+
+        __done_queue = self._generate_done_queue()
+        __args_iterator = iter(args_iter)
+        __submitted = 0
+        __yielded = 0
+
+        def __submit() -> bool:
+            nonlocal __submitted
+            try:
+                __element = next(__args_iterator)
+            except StopIteration:
+                return False
+
+            __index = __submitted
+            self._submit_streaming_task(
+                function=function,
+                element=__element,
+                callback=lambda value: __done_queue.put((__index, True, value, None)),
+                error_callback=lambda error: __done_queue.put((__index, False, None, error)))
+            __submitted += 1
+            return True
+
+        def __streaming() -> Iterator[_PoolResult]:
+            nonlocal __yielded
+            __finished: Dict[int, _PoolResult] = {}
+            __next_index = 0
+
+            while __submitted - __yielded < window and __submit() is True:
+                pass
+
+            while __yielded < __submitted:
+                __index, __successful, __value, __exception = __done_queue.get()
+                __finished[__index] = self._generate_streaming_result(
+                    successful=__successful, result=__value, exception=__exception)
+
+                __ready_results = []
+                if ordered is True:
+                    while __next_index in __finished:
+                        __ready_results.append(__finished.pop(__next_index))
+                        __next_index += 1
+                else:
+                    __ready_results.append(__finished.pop(__index))
+
+                for __result in __ready_results:
+                    __yielded += 1
+                    yield __result
+                    while __submitted - __yielded < window and __submit() is True:
+                        pass
+
+        return __streaming()
+
+
+    def _generate_done_queue(self) -> Any:
+        """
+        Description:
+            Generate a queue object which could receive the running result
+            from the callback of pool in main worker.
+        :return:
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support streaming mode.")
+
+
+    def _submit_streaming_task(self, function: Callable, element: Any, callback: Callable, error_callback: Callable) -> None:
+        """
+        Description:
+            Submit one task into pool without blocking. The *callback* would
+            be called with the return value of the task and *error_callback*
+            would be called with the exception if it fails.
+        :param function:
+        :param element:
+        :param callback:
+        :param error_callback:
+        :return:
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support streaming mode.")
+
+
+    def _generate_streaming_result(self, successful: bool, result: Any, exception: Optional[Exception]) -> _PoolResult:
+        """
+        Description:
+            Generate the running result object of one task of streaming mode.
+        :param successful:
+        :param result:
+        :param exception:
+        :return:
+        """
+        raise NotImplementedError(f"{self.__class__.__name__} doesn't support streaming mode.")
+
+
     @abstractmethod
     def close(self) -> None:
         """
@@ -503,7 +949,7 @@ class AsyncRunnableStrategy(GeneralRunnableStrategy, ABC):
             super()._init_lock_or_communication_process(features, **kwargs)
 
 
-    @dispatch(_BaseQueueTask)
+    @method_dispatch(_BaseQueueTask)
     async def _init_queue_process(self, queue_tasks: _BaseQueueTask) -> None:
         """
         Description:
@@ -515,7 +961,7 @@ class AsyncRunnableStrategy(GeneralRunnableStrategy, ABC):
         await queue_tasks.async_init_queue_with_values()
 
 
-    @dispatch(_BaseList)
+    @method_dispatch(_BaseList)
     async def _init_queue_process(self, queue_tasks: _BaseList) -> None:
         """
         Description:
@@ -581,6 +1027,8 @@ class AsyncRunnableStrategy(GeneralRunnableStrategy, ABC):
 
 class Resultable(metaclass=ABCMeta):
 
+    _Metrics: Optional[_Metrics] = None
+
     @abstractmethod
     def get_result(self) -> List[Union[_MRResult, _PoolResult]]:
         """
@@ -596,3 +1044,54 @@ class Resultable(metaclass=ABCMeta):
         pass
 
 
+    @property
+    def result_max_size(self) -> Optional[int]:
+        """
+        Description:
+            The maximum number of running result records which be kept. Only the
+            last *result_max_size* records are kept if it's set, the older ones
+            would be dropped. None means keeping all of them until 'get_result'.
+        :return:
+        """
+        raise NotImplementedError
+
+
+    @property
+    def metrics(self) -> Optional[_Metrics]:
+        """
+        Description:
+            The metrics of tasks (timing, throughput and error rate). It's None
+            if it isn't enabled, and then it doesn't measure anything.
+        :return:
+        """
+        return self._Metrics
+
+
+    def enable_metrics(self, exporter: Optional[_MetricsExporter] = None, name: Optional[str] = None) -> _Metrics:
+        """
+        Description:
+            Measure the timing of the tasks which are submitted from now on. Each
+            running result records the enqueue, start and end time and CPU time.
+        :param exporter: The exporter which 'Metrics.export' sends the snapshot to.
+        :param name: The name of metrics, it's the class name of strategy by default.
+        :return: The metrics.
+        """
+        self._Metrics = _Metrics(name=name or self.__class__.__name__, exporter=exporter)
+        self._attach_metrics(self._Metrics)
+        return self._Metrics
+
+
+    def disable_metrics(self) -> None:
+        self._Metrics = None
+        self._attach_metrics(None)
+
+
+    def _attach_metrics(self, metrics: Optional[_Metrics]) -> None:
+        """
+        Description:
+            Let the records of running result be aggregated by the metrics
+            when they're saved. It should set the metrics to its result store.
+        :param metrics:
+        :return:
+        """
+        pass
@@ -1,4 +1,8 @@
+from typing import List, Hashable, Callable, Awaitable, Optional, Any
+from contextlib import contextmanager
 from abc import ABCMeta, abstractmethod
+import inspect
+import zlib
 
 from ...types import (
     MRLock as _MRLock, MRRLock as _MRRLock,
@@ -115,6 +119,27 @@ class PosixThreadLock(PosixThread):
         pass
 
 
+    @abstractmethod
+    def get_read_write_lock(self, **kwargs) -> "ReadWriteLock":
+        """
+        Description:
+            Get Read-Write Lock object.
+        :return:
+        """
+        pass
+
+
+    @abstractmethod
+    def get_sharded_lock(self, shards: int, **kwargs) -> "ShardedLock":
+        """
+        Description:
+            Get Sharded Lock object.
+        :param shards: The amount of locks.
+        :return:
+        """
+        pass
+
+
 
 class PosixThreadCommunication(PosixThread):
 
@@ -139,3 +164,209 @@ class PosixThreadCommunication(PosixThread):
         """
         pass
 
+
+
+
+class _Counter:
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: int = 0):
+        self.value = value
+
+
+
+class ReadWriteLock:
+    """
+    Description:
+        A lock which many readers could hold at the same time, but a writer holds
+        it exclusively. The writers don't starve: once a writer is waiting, the new
+        readers wait behind it.
+
+        It's built by binary semaphores (or locks) and a counter of readers which
+        are given by each RunningMode, so that it works between processes, threads
+        and green threads as long as the primitives do:
+
+            * turnstile: the writer holds it while it's waiting, so the new readers wait.
+            * resource: the first reader or the writer acquires it. It's released by the
+              last reader, so it should be a semaphore which any worker could release.
+            * readers_lock: protects the counter of readers.
+            * readers: an object with attribute 'value', e.g., *multiprocessing.Value*.
+              It's a local counter if it's None.
+    """
+
+    def __init__(self, turnstile: Any, resource: Any, readers_lock: Any, readers: Optional[Any] = None):
+        self._turnstile = turnstile
+        self._resource = resource
+        self._readers_lock = readers_lock
+        self._readers = _Counter() if readers is None else readers
+
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(readers={self.readers}) object at {id(self)}>"
+
+
+    @property
+    def readers(self) -> int:
+        return self._readers.value
+
+
+    def acquire_read(self) -> None:
+        self._turnstile.acquire()
+        self._turnstile.release()
+        with self._readers_lock:
+            self._readers.value += 1
+            if self._readers.value == 1:
+                self._resource.acquire()
+
+
+    def release_read(self) -> None:
+        with self._readers_lock:
+            self._readers.value -= 1
+            if self._readers.value == 0:
+                self._resource.release()
+
+
+    def acquire_write(self) -> None:
+        self._turnstile.acquire()
+        self._resource.acquire()
+        self._turnstile.release()
+
+
+    def release_write(self) -> None:
+        self._resource.release()
+
+
+    @contextmanager
+    def reading(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+
+    @contextmanager
+    def writing(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
+
+
+
+class AsyncLockContext:
+    """
+    Description:
+        The async context manager which awaits *acquire* when entering and calls
+        (or awaits) *release* when exiting. It works like the function which is
+        decorated by *contextlib.asynccontextmanager*, but that is only in Python
+        3.7 or later.
+    """
+
+    def __init__(self, acquire: Callable[[], Awaitable], release: Callable[[], Any]):
+        self._acquire = acquire
+        self._release = release
+
+
+    async def __aenter__(self) -> None:
+        await self._acquire()
+        return None
+
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        __released = self._release()
+        if inspect.isawaitable(__released):
+            await __released
+
+
+
+class AsyncReadWriteLock(ReadWriteLock):
+    """
+    Description:
+        Asynchronous version of ReadWriteLock. The primitives are *asyncio.Lock*
+        and *asyncio.Semaphore*.
+    """
+
+    async def acquire_read(self) -> None:
+        await self._turnstile.acquire()
+        self._turnstile.release()
+        async with self._readers_lock:
+            self._readers.value += 1
+            if self._readers.value == 1:
+                await self._resource.acquire()
+
+
+    async def release_read(self) -> None:
+        async with self._readers_lock:
+            self._readers.value -= 1
+            if self._readers.value == 0:
+                self._resource.release()
+
+
+    async def acquire_write(self) -> None:
+        await self._turnstile.acquire()
+        await self._resource.acquire()
+        self._turnstile.release()
+
+
+    def reading(self) -> "AsyncLockContext":
+        return AsyncLockContext(acquire=self.acquire_read, release=self.release_read)
+
+
+    def writing(self) -> "AsyncLockContext":
+        return AsyncLockContext(acquire=self.acquire_write, release=self.release_write)
+
+
+
+def _stable_hash(key: Hashable) -> int:
+    # The hash of str is randomized by each interpreter, so processes
+    # which aren't forked would choose the different shard with it.
+    if isinstance(key, int):
+        return key
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+    if isinstance(key, (bytes, bytearray)):
+        return zlib.crc32(key)
+    return hash(key)
+
+
+
+class ShardedLock:
+    """
+    Description:
+        Some locks which are chosen by a key, e.g., the key of a shared cache, so
+        that the workers which operate the different keys don't wait for each other.
+        The same key is always the same lock. The locks could be any Lock of the
+        RunningModes; with *asyncio.Lock*, 'acquire' returns the coroutine to await.
+    """
+
+    def __init__(self, locks: List[Any]):
+        if not locks:
+            raise ValueError("The option *locks* should have 1 lock at least.")
+        self._locks = list(locks)
+
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(shards={len(self._locks)}) object at {id(self)}>"
+
+
+    def __len__(self) -> int:
+        return len(self._locks)
+
+
+    def index(self, key: Hashable) -> int:
+        return _stable_hash(key) % len(self._locks)
+
+
+    def shard(self, key: Hashable) -> Any:
+        return self._locks[self.index(key)]
+
+
+    def acquire(self, key: Hashable) -> Any:
+        return self.shard(key).acquire()
+
+
+    def release(self, key: Hashable) -> None:
+        self.shard(key).release()
@@ -1,4 +1,4 @@
-from typing import Iterable
+from typing import Iterable, Optional
 from abc import ABCMeta, abstractmethod
 
 import multirunnable._utils as _utils
@@ -11,6 +11,7 @@ class BaseQueueTask(metaclass=ABCMeta):
     _Name: str = ""
     _Queue_Instance: _MRQueue = None
     _Value: Iterable = None
+    _Chunk_Size: Optional[int] = None
 
     def __str__(self):
         __instance_brief = None
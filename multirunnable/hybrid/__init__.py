@@ -0,0 +1,6 @@
+from .strategy import (
+    BaseHybridStrategy,
+    ProcessThreadStrategy, ProcessThreadPoolStrategy,
+    ProcessGreenThreadStrategy, ProcessGreenThreadPoolStrategy,
+    ProcessAsynchronousStrategy, ProcessAsynchronousPoolStrategy)
+from .result import HybridResult, HybridPoolResult
@@ -0,0 +1,27 @@
+from ..framework.runnable.result import MRResult as _MRResult, PoolResult as _PoolResult
+
+
+
+class HybridResult(_MRResult):
+    """
+    Description:
+        The running result of one task in hybrid mode. The *pid* and
+        *worker_name* are the info of the process which runs the task.
+    """
+    pass
+
+
+
+class HybridPoolResult(_PoolResult):
+
+    _PID: str = ""
+
+    @property
+    def pid(self) -> str:
+        return self._PID
+
+
+    @pid.setter
+    def pid(self, pid: str) -> None:
+        self._PID = pid
+
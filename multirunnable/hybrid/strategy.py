@@ -0,0 +1,527 @@
+from multiprocessing import current_process
+from typing import List, Tuple, Dict, Iterable as IterableType, Iterator, Callable, Optional, Union, Any
+from abc import ABC
+from os import cpu_count
+import math
+
+from ..framework.runnable.metrics import Metrics as _Metrics
+from ..framework.runnable import (
+    GeneralRunnableStrategy as _GeneralRunnableStrategy,
+    PoolRunnableStrategy as _PoolRunnableStrategy,
+    Resultable as _Resultable,
+    ResultState as _ResultState,
+    ResultStore as _ResultStore,
+    PoolLifecycle as _PoolLifecycle
+)
+from ..framework.factory import (
+    BaseFeatureAdapterFactory as _BaseFeatureAdapterFactory,
+    BaseList as _BaseList
+)
+from ..framework import BaseQueueTask as _BaseQueueTask
+from ..parallel.strategy import ProcessPoolStrategy as _ProcessPoolStrategy
+from ..concurrent.strategy import ThreadPoolStrategy as _ThreadPoolStrategy
+from ..coroutine.strategy import (
+    GreenThreadPoolStrategy as _GreenThreadPoolStrategy,
+    AsynchronousStrategy as _AsynchronousStrategy
+)
+from ..hybrid.result import HybridResult as _HybridResult, HybridPoolResult as _HybridPoolResult
+from ..types import MRTasks as _MRTasks
+from ..mode import RunningMode as _RunningMode, FeatureMode as _FeatureMode
+
+
+# One task is the target function with its arguments and keyword arguments.
+_Task = Tuple[Callable, Tuple, Dict]
+
+
+def _run_tasks_in_child(inner_mode: str, workers: int, tasks: List[_Task], timing: bool = False) -> List[Dict]:
+    """
+    Description:
+        The target of each task of the processes pool. It runs the tasks by the
+        strategy of *inner_mode* in the child process with *workers* workers, and
+        returns the running result records of the tasks to the main process.
+    :param inner_mode: The name of RunningMode which runs the tasks in the child process.
+    :param workers: The amount of workers (threads, green threads or coroutines) in the child process.
+    :param tasks: The tasks which be run in the child process.
+    :param timing: Record the timing of tasks or not, it's True if the metrics is enabled.
+    :return:
+    """
+
+    if inner_mode == _RunningMode.Asynchronous.name:
+        __records = _run_async_tasks(workers=workers, tasks=tasks, timing=timing)
+    else:
+        __records = _run_pool_tasks(inner_mode=inner_mode, workers=workers, tasks=tasks, timing=timing)
+
+    __process = current_process()
+    for __record in __records:
+        __record["pid"] = __process.pid
+        __record["name"] = __process.name
+    return __records
+
+
+def _run_pool_tasks(inner_mode: str, workers: int, tasks: List[_Task], timing: bool = False) -> List[Dict]:
+    if inner_mode == _RunningMode.Concurrent.name:
+        __strategy = _ThreadPoolStrategy(pool_size=workers)
+    else:
+        __strategy = _GreenThreadPoolStrategy(pool_size=workers)
+
+    if timing is True:
+        __strategy.enable_metrics()
+    __strategy.initialization()
+    try:
+        __strategy.async_apply_with_iter(
+            functions_iter=[__function for __function, _, _ in tasks],
+            args_iter=[__args for _, __args, _ in tasks],
+            kwargs_iter=[__kwargs for _, _, __kwargs in tasks])
+        __results = __strategy.get_result()
+    finally:
+        __strategy.close()
+
+    return [_with_timing({"successful": __result.is_successful is True, "result": __result.data, "exception": __result.exception}, __result)
+            for __result in __results]
+
+
+async def _await_task(function: Callable, args: Tuple, kwargs: Dict) -> Any:
+    return await function(*args, **kwargs)
+
+
+def _run_async_tasks(workers: int, tasks: List[_Task], timing: bool = False) -> List[Dict]:
+    __strategy = _AsynchronousStrategy(executors=workers)
+    if timing is True:
+        __strategy.enable_metrics()
+    try:
+        __strategy.map(function=_await_task, args_iter=tasks, max_workers=workers)
+        __results = __strategy.get_result()
+    finally:
+        __strategy.shutdown()
+
+    return [_with_timing({"successful": __result.state == _ResultState.SUCCESS.value, "result": __result.data, "exception": __result.exception}, __result)
+            for __result in __results]
+
+
+def _with_timing(record: Dict, result: Any) -> Dict:
+    # The timing is measured in the child process, so the queue wait doesn't include the time of sending the tasks to it.
+    if result.start_time is not None:
+        record.update({"enqueue_time": result.enqueue_time, "start_time": result.start_time,
+                       "end_time": result.end_time, "cpu_time": result.cpu_time})
+    return record
+
+
+def _to_task(function: Callable, args: Optional[Union[Tuple, Dict]] = None, kwargs: Optional[Dict] = None) -> _Task:
+    if isinstance(args, dict):
+        return function, (), args
+    return function, tuple(args or ()), dict(kwargs or {})
+
+
+def _chk_processes(processes: Optional[int]) -> None:
+    if processes is None:
+        return
+    if isinstance(processes, bool) or isinstance(processes, int) is False or processes < 1:
+        raise ValueError("The option *processes* should be None or an integer which is larger than 0.")
+
+
+
+class BaseHybridStrategy(_Resultable, ABC):
+    """
+    Description:
+        Run tasks in multiple processes, and each process runs its tasks by the
+        strategy of *inner mode* (thread pool, green thread pool or event loop).
+        It composes 'ProcessPoolStrategy' which spreads the tasks to processes,
+        and merges the running results of all processes into one list.
+
+        The target function should be pickleable (be defined in module level)
+        because it's sent to the child process. The features (Lock, Queue, etc)
+        are initialized in Parallel mode so that they work between processes.
+    """
+
+    _Strategy_Feature_Mode: _FeatureMode = _FeatureMode.Parallel
+    _Inner_Mode: _RunningMode = None
+
+    def __init__(self, processes: Optional[int] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        _chk_processes(processes)
+        self._Processes = processes or cpu_count() or 1
+        self._Process_Pool_Strategy = _ProcessPoolStrategy(pool_size=self._Processes)
+        self._Hybrid_Running_Result = _ResultStore()
+
+
+    @property
+    def processes(self) -> int:
+        """
+        Description:
+            The amount of processes which run the tasks.
+        :return:
+        """
+        return self._Processes
+
+
+    @property
+    def _inner_workers(self) -> int:
+        """
+        Description:
+            The amount of workers (threads, green threads or coroutines) in each process.
+        :return:
+        """
+        raise NotImplementedError
+
+
+    @property
+    def result_max_size(self) -> Optional[int]:
+        return self._Hybrid_Running_Result.max_size
+
+
+    @result_max_size.setter
+    def result_max_size(self, max_size: Optional[int]) -> None:
+        self._Hybrid_Running_Result.max_size = max_size
+
+
+    def _attach_metrics(self, metrics: Optional[_Metrics]) -> None:
+        self._Hybrid_Running_Result.metrics = metrics
+
+
+    def _run_tasks(self, tasks: List[_Task], chunksize: Optional[int] = None) -> List[Dict]:
+        """
+        Description:
+            Split the tasks into chunks and run each chunk in one task of the
+            processes pool. The chunks are split evenly by the amount of
+            processes if *chunksize* is None or not bigger than 1 (e.g., the
+            default value of 'imap'), because each chunk builds its own pool
+            of workers in the child process.
+        :param tasks:
+        :param chunksize:
+        :return: The running result records of the tasks. The chunks are in order, and the records
+                 in each chunk are in order too except the inner mode is Asynchronous, whose records
+                 are in the order of completion.
+        """
+
+        if chunksize is None or chunksize <= 1:
+            chunksize = max(math.ceil(len(tasks) / self._Processes), 1)
+        __chunks = [tasks[__index:__index + chunksize] for __index in range(0, len(tasks), chunksize)]
+
+        self._Process_Pool_Strategy.async_apply_with_iter(
+            functions_iter=[_run_tasks_in_child for _ in __chunks],
+            args_iter=[(self._Inner_Mode.name, self._inner_workers, __chunk, self._Metrics is not None) for __chunk in __chunks])
+
+        __records = []
+        for __chunk, __process_result in zip(__chunks, self._Process_Pool_Strategy.get_result()):
+            if __process_result.is_successful is True:
+                __records.extend(__process_result.data)
+            else:
+                # The whole chunk fails if the child process fails, e.g., the target isn't pickleable.
+                __records.extend({"successful": False, "result": None, "exception": __process_result.exception}
+                                 for _ in __chunk)
+
+        self._Hybrid_Running_Result.extend(__records)
+        return __records
+
+
+    def reset_result(self) -> None:
+        self._Hybrid_Running_Result.clear()
+
+
+    def get_result(self) -> List[Union[_HybridResult, _HybridPoolResult]]:
+        __results = self._saving_process()
+        self.reset_result()
+        return __results
+
+
+
+class HybridGeneralStrategy(BaseHybridStrategy, _GeneralRunnableStrategy, ABC):
+    """
+    Description:
+        The hybrid strategy for 'Executor'. Each process runs its tasks with
+        *executors* workers at the same time. It only runs tasks by 'run', 'map'
+        and 'map_with_function' because the workers live in the child processes.
+    """
+
+    def __init__(self, executors: int, processes: Optional[int] = None):
+        super().__init__(processes=processes, executors=executors)
+
+
+    @property
+    def _inner_workers(self) -> int:
+        return self.executors_number
+
+
+    def initialization(self, queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
+                       features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None,
+                       *args, **kwargs) -> None:
+        self._Process_Pool_Strategy.initialization(queue_tasks=queue_tasks, features=features, *args, **kwargs)
+
+
+    def run(self, function: Callable, args: Optional[Union[Tuple, Dict]] = None,
+            queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
+            features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None) -> None:
+        """
+        Description:
+            Each process runs the target function *executors* times, so it runs
+            *processes* x *executors* times totally.
+        """
+
+        __tasks = [_to_task(function, args) for _ in range(self._Processes * self.executors_number)]
+        self._run_with_pool(__tasks, queue_tasks=queue_tasks, features=features)
+
+
+    def map(self, function: Callable, args_iter: IterableType = [],
+            queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
+            features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None,
+            max_workers: Optional[int] = None) -> None:
+        """
+        Description:
+            The arguments are split evenly to processes. The option *max_workers* is
+            ignored because each process already runs with *executors* workers.
+        """
+
+        __tasks = [_to_task(function, __args) for __args in args_iter]
+        self._run_with_pool(__tasks, queue_tasks=queue_tasks, features=features)
+
+
+    def map_with_function(self, functions: IterableType[Callable], args_iter: IterableType = [],
+                          queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
+                          features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None) -> None:
+
+        __functions = list(functions)
+        if args_iter is None or args_iter == []:
+            args_iter = [() for _ in __functions]
+        __tasks = [_to_task(__function, __args) for __function, __args in zip(__functions, args_iter)]
+        self._run_with_pool(__tasks, queue_tasks=queue_tasks, features=features)
+
+
+    def _run_with_pool(self, tasks: List[_Task], queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
+                       features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None) -> None:
+        self.initialization(queue_tasks=queue_tasks, features=features)
+        try:
+            self._run_tasks(tasks)
+        finally:
+            self._Process_Pool_Strategy.close()
+
+
+    def generate_worker(self, target: Callable, *args, **kwargs) -> _MRTasks:
+        raise NotImplementedError(f"{self.__class__.__name__} only runs tasks by 'run', 'map' and 'map_with_function'.")
+
+
+    def activate_workers(self, workers: Union[_MRTasks, List[_MRTasks]]) -> None:
+        raise NotImplementedError(f"{self.__class__.__name__} only runs tasks by 'run', 'map' and 'map_with_function'.")
+
+
+    def _start_new_worker(self, target: Callable, args: Tuple = (), kwargs: Dict = {}) -> _MRTasks:
+        raise NotImplementedError(f"{self.__class__.__name__} only runs tasks by 'run', 'map' and 'map_with_function'.")
+
+
+    def close(self, workers: Union[_MRTasks, List[_MRTasks]]) -> None:
+        raise NotImplementedError(f"{self.__class__.__name__} only runs tasks by 'run', 'map' and 'map_with_function'.")
+
+
+    def _saving_process(self) -> List[_HybridResult]:
+        __hybrid_results = []
+        for __result in self._Hybrid_Running_Result:
+            _hresult = _HybridResult()
+            _hresult.pid = __result.get("pid", None)
+            _hresult.worker_name = __result.get("name", None)
+            if __result.get("successful", None) is True:
+                _hresult.state = _ResultState.SUCCESS.value
+            else:
+                _hresult.state = _ResultState.FAIL.value
+            _hresult.data = __result.get("result", None)
+            _hresult.exception = __result.get("exception", None)
+            _hresult._save_timing(__result)
+            __hybrid_results.append(_hresult)
+        return __hybrid_results
+
+
+
+class HybridPoolStrategy(BaseHybridStrategy, _PoolRunnableStrategy, ABC):
+    """
+    Description:
+        The hybrid strategy for 'Pool'. The option *pool_size* is the size of
+        the pool (or the amount of coroutines) in each process. The processes
+        pool keeps alive until it's closed.
+    """
+
+    def __init__(self, pool_size: int, processes: Optional[int] = None):
+        super().__init__(processes=processes, pool_size=pool_size)
+
+
+    @property
+    def _inner_workers(self) -> int:
+        return self.pool_size
+
+
+    @property
+    def is_warm(self) -> bool:
+        return self._Process_Pool_Strategy.is_warm
+
+
+    def register_pool(self, name: str, lifecycle: Optional[_PoolLifecycle] = None) -> None:
+        # The processes pool is the one which keeps running in registry.
+        super().register_pool(name=name, lifecycle=lifecycle)
+        self._Process_Pool_Strategy.register_pool(name=name, lifecycle=lifecycle)
+
+
+    def initialization(self, queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
+                       features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None,
+                       *args, **kwargs) -> None:
+        self._Process_Pool_Strategy.initialization(queue_tasks=queue_tasks, features=features, *args, **kwargs)
+
+
+    def apply(self, tasks_size: int, function: Callable, args: Tuple = (), kwargs: Dict = {}) -> None:
+        self.reset_result()
+        self._run_tasks([_to_task(function, args, kwargs) for _ in range(tasks_size)])
+
+
+    def async_apply(self, tasks_size: int, function: Callable, args: Tuple = (),
+                    kwargs: Dict = {}, callback: Callable = None, error_callback: Callable = None) -> None:
+        self.reset_result()
+        __records = self._run_tasks([_to_task(function, args, kwargs) for _ in range(tasks_size)])
+        for __record in __records:
+            HybridPoolStrategy._call_back(__record, callback=callback, error_callback=error_callback)
+
+
+    def apply_with_iter(self, functions_iter: List[Callable], args_iter: List[Tuple] = None, kwargs_iter: List[Dict] = None) -> None:
+        self.reset_result()
+        self._run_tasks(HybridPoolStrategy._to_tasks(functions_iter, args_iter, kwargs_iter))
+
+
+    def async_apply_with_iter(self, functions_iter: List[Callable], args_iter: List[Tuple] = None,
+                              kwargs_iter: List[Dict] = None, callback_iter: List[Callable] = None,
+                              error_callback_iter: List[Callable] = None) -> None:
+        self.reset_result()
+        if callback_iter is None:
+            callback_iter = [None for _ in functions_iter]
+        if error_callback_iter is None:
+            error_callback_iter = [None for _ in functions_iter]
+
+        __records = self._run_tasks(HybridPoolStrategy._to_tasks(functions_iter, args_iter, kwargs_iter))
+        for __record, __callback, __error_callback in zip(__records, callback_iter, error_callback_iter):
+            HybridPoolStrategy._call_back(__record, callback=__callback, error_callback=__error_callback)
+
+
+    def map(self, function: Callable, args_iter: IterableType = (), chunksize: int = None) -> None:
+        self.reset_result()
+        self._run_tasks([(function, (__arg,), {}) for __arg in args_iter], chunksize=chunksize)
+
+
+    def async_map(self, function: Callable, args_iter: IterableType = (), chunksize: int = None,
+                  callback: Callable = None, error_callback: Callable = None) -> None:
+        self.reset_result()
+        __records = self._run_tasks([(function, (__arg,), {}) for __arg in args_iter], chunksize=chunksize)
+        HybridPoolStrategy._call_back_with_list(__records, callback=callback, error_callback=error_callback)
+
+
+    def map_by_args(self, function: Callable, args_iter: IterableType[IterableType] = (), chunksize: int = None) -> None:
+        self.reset_result()
+        self._run_tasks([(function, tuple(__args), {}) for __args in args_iter], chunksize=chunksize)
+
+
+    def async_map_by_args(self, function: Callable, args_iter: IterableType[IterableType] = (),
+                          chunksize: int = None, callback: Callable = None, error_callback: Callable = None) -> None:
+        self.reset_result()
+        __records = self._run_tasks([(function, tuple(__args), {}) for __args in args_iter], chunksize=chunksize)
+        HybridPoolStrategy._call_back_with_list(__records, callback=callback, error_callback=error_callback)
+
+
+    def imap(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1,
+             stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_HybridPoolResult]]:
+        if stream is True:
+            raise NotImplementedError(f"{self.__class__.__name__} doesn't support streaming mode.")
+        self.map(function=function, args_iter=args_iter, chunksize=chunksize)
+
+
+    def imap_unordered(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1,
+                       stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_HybridPoolResult]]:
+        if stream is True:
+            raise NotImplementedError(f"{self.__class__.__name__} doesn't support streaming mode.")
+        self.map(function=function, args_iter=args_iter, chunksize=chunksize)
+
+
+    def close(self) -> None:
+        self._Process_Pool_Strategy.close()
+
+
+    def terminal(self) -> None:
+        self._Process_Pool_Strategy.terminal()
+
+
+    @staticmethod
+    def _to_tasks(functions_iter: List[Callable], args_iter: List[Tuple] = None, kwargs_iter: List[Dict] = None) -> List[_Task]:
+        if args_iter is None:
+            args_iter = [() for _ in functions_iter]
+        if kwargs_iter is None:
+            kwargs_iter = [{} for _ in functions_iter]
+        return [_to_task(__function, __args, __kwargs) for __function, __args, __kwargs in zip(functions_iter, args_iter, kwargs_iter)]
+
+
+    @staticmethod
+    def _call_back(record: Dict, callback: Optional[Callable], error_callback: Optional[Callable]) -> None:
+        if record["successful"] is True and callback is not None:
+            callback(record["result"])
+        elif record["successful"] is False and error_callback is not None:
+            error_callback(record["exception"])
+
+
+    @staticmethod
+    def _call_back_with_list(records: List[Dict], callback: Optional[Callable], error_callback: Optional[Callable]) -> None:
+        # Same as 'multiprocessing.pool.Pool.map_async': the callback receives the list of
+        # all results, and the error callback receives the first exception.
+        __failed_records = [__record for __record in records if __record["successful"] is False]
+        if not __failed_records and callback is not None:
+            callback([__record["result"] for __record in records])
+        elif __failed_records and error_callback is not None:
+            error_callback(__failed_records[0]["exception"])
+
+
+    def _saving_process(self) -> List[_HybridPoolResult]:
+        __hybrid_results = []
+        for __result in self._Hybrid_Running_Result:
+            _hresult = _HybridPoolResult()
+            _hresult.pid = __result.get("pid", None)
+            _hresult.is_successful = __result.get("successful", None)
+            _hresult.data = __result.get("result", None)
+            _hresult.exception = __result.get("exception", None)
+            _hresult._save_timing(__result)
+            __hybrid_results.append(_hresult)
+        return __hybrid_results
+
+
+
+class ProcessThreadStrategy(HybridGeneralStrategy):
+
+    _Inner_Mode: _RunningMode = _RunningMode.Concurrent
+
+
+
+class ProcessThreadPoolStrategy(HybridPoolStrategy):
+
+    _Inner_Mode: _RunningMode = _RunningMode.Concurrent
+
+
+
+class ProcessGreenThreadStrategy(HybridGeneralStrategy):
+
+    _Inner_Mode: _RunningMode = _RunningMode.GreenThread
+
+
+
+class ProcessGreenThreadPoolStrategy(HybridPoolStrategy):
+
+    _Inner_Mode: _RunningMode = _RunningMode.GreenThread
+
+
+
+class ProcessAsynchronousStrategy(HybridGeneralStrategy):
+    """
+    Description:
+        The target function should be a coroutine function.
+    """
+
+    _Inner_Mode: _RunningMode = _RunningMode.Asynchronous
+
+
+
+class ProcessAsynchronousPoolStrategy(HybridPoolStrategy):
+    """
+    Description:
+        The target function should be a coroutine function.
+    """
+
+    _Inner_Mode: _RunningMode = _RunningMode.Asynchronous
+
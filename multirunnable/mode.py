@@ -4,6 +4,7 @@ from enum import Enum
 _Parallel_Package: str = ".parallel."
 _Concurrent_Package: str = ".concurrent."
 _Coroutine_Package: str = ".coroutine."
+_Hybrid_Package: str = ".hybrid."
 _Context_Package: str = "context"
 _Strategy_Package: str = "strategy"
 _Synchronization_Package: str = "synchronization"
@@ -27,6 +28,8 @@ _Parallel_Class: str = "Process"
 _Concurrent_Class: str = "Thread"
 _GreenThread_Class: str = "GreenThread"
 _Asynchronous_Class: str = "Asynchronous"
+# It's the prefix of hybrid mode class, e.g., ProcessThreadStrategy.
+_Hybrid_Class: str = _Parallel_Class
 
 _Queue_Class: str = "Queue"
 _Lock_Class: str = "Lock"
@@ -128,3 +131,36 @@ class RunningMode(Enum):
         "context": ContextMode.Asynchronous
     }
 
+    # # Hybrid modes: it runs multiple processes and each process hosts a
+    # # thread pool, green thread pool or event loop which runs the tasks.
+    # # The features (Lock, Queue, etc) should be able to work between processes.
+    ParallelConcurrent = {
+        "strategy_module": _Hybrid_Package + _Strategy_Package,
+        "class_key": _Hybrid_Class + _Concurrent_Class,
+        "executor_strategy": _Hybrid_Class + _Concurrent_Class + _Strategy_Class,
+        "pool_strategy": _Hybrid_Class + _Concurrent_Class + _Pool_Strategy_Class,
+        "inner_mode": "Concurrent",
+        "feature": FeatureMode.Parallel,
+        "context": ContextMode.Parallel
+    }
+
+    ParallelGreenThread = {
+        "strategy_module": _Hybrid_Package + _Strategy_Package,
+        "class_key": _Hybrid_Class + _GreenThread_Class,
+        "executor_strategy": _Hybrid_Class + _GreenThread_Class + _Strategy_Class,
+        "pool_strategy": _Hybrid_Class + _GreenThread_Class + _Pool_Strategy_Class,
+        "inner_mode": "GreenThread",
+        "feature": FeatureMode.Parallel,
+        "context": ContextMode.Parallel
+    }
+
+    ParallelAsynchronous = {
+        "strategy_module": _Hybrid_Package + _Strategy_Package,
+        "class_key": _Hybrid_Class + _Asynchronous_Class,
+        "executor_strategy": _Hybrid_Class + _Asynchronous_Class + _Strategy_Class,
+        "pool_strategy": _Hybrid_Class + _Asynchronous_Class + _Pool_Strategy_Class,
+        "inner_mode": "Asynchronous",
+        "feature": FeatureMode.Parallel,
+        "context": ContextMode.Parallel
+    }
+
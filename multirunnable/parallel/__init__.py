@@ -44,5 +44,5 @@ if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) >= (3, 9):
 from .context import context
 from .strategy import ParallelStrategy, ProcessStrategy, ProcessPoolStrategy
 from .synchronization import ProcessLock, ProcessCommunication
-from .queue import Queue, SimpleQueue
+from .queue import Queue, SimpleQueue, SharedMemoryQueue
 from .result import ParallelResult
@@ -1,6 +1,229 @@
-from multiprocessing import Queue, SimpleQueue, JoinableQueue
-from typing import Union
+from multiprocessing import Queue, SimpleQueue, JoinableQueue, Lock, Semaphore
+from multiprocessing.context import assert_spawning
+from queue import Empty, Full
+from typing import List, Tuple, Iterable, Optional, Union, Any
+from itertools import islice
+import weakref
+import struct
+import os
 
+from .shared_memory import SharedMemory, activate_resource_tracker
+from ..exceptions import QueuePutTimeoutError
 
-ProcessQueueDataType = Union[Queue, SimpleQueue, JoinableQueue]
 
+ProcessQueueDataType = Union[Queue, SimpleQueue, JoinableQueue, "SharedMemoryQueue"]
+
+
+
+class SharedMemoryQueue:
+    """
+    Description:
+        A bounded FIFO queue of fixed-size records which are saved in a ring buffer of
+        a shared memory segment. Each record is packed by the format of module *struct*
+        (e.g., 'q' for an integer, 'qd' for an integer with a float), so there is no
+        pickle, no pipe and no feeder thread like 'multiprocessing.Queue'.
+
+        The producers and the consumers only wait for each other when the queue is full
+        or empty. The producers share one lock to move the tail and the consumers share
+        another one to move the head, so many producers and many consumers could work
+        with it.
+
+        Same as 'multiprocessing.Queue', it's shared to the children processes by
+        inheritance (e.g., the arguments of Process or the globalized queue of
+        'QueueTask'). The process which creates it releases the segment when it's
+        collected, or by 'unlink'. Please note that 'QueueTask' seeds the queue before
+        running the workers, so *maxsize* should be enough for all its values.
+    """
+
+    _Header: struct.Struct = struct.Struct("QQ")
+
+    def __init__(self, maxsize: int = 1024, fmt: str = "q"):
+        if SharedMemory is None:
+            raise RuntimeError("SharedMemoryQueue needs Python 3.8 or newer version.")
+        if maxsize < 1:
+            raise ValueError("The option *maxsize* should be bigger than 0.")
+
+        self._maxsize = maxsize
+        self._fmt = fmt
+        self._put_lock = Lock()
+        self._get_lock = Lock()
+        self._items = Semaphore(0)
+        self._spaces = Semaphore(maxsize)
+
+        activate_resource_tracker()
+        __record = struct.Struct(fmt)
+        self._segment = SharedMemory(create=True, size=self._Header.size + __record.size * maxsize)
+        self._Header.pack_into(self._segment.buf, 0, 0, 0)
+        self._finalizer = weakref.finalize(self, _release_queue_segment, self._segment, os.getpid())
+        self._init_record()
+
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}(maxsize={self._maxsize}, fmt={self._fmt}) at {id(self)}>"
+
+
+    def __getstate__(self) -> Tuple:
+        assert_spawning(self)
+        return self._segment.name, self._maxsize, self._fmt, self._put_lock, self._get_lock, self._items, self._spaces
+
+
+    def __setstate__(self, state: Tuple) -> None:
+        __name, self._maxsize, self._fmt, self._put_lock, self._get_lock, self._items, self._spaces = state
+        self._segment = SharedMemory(name=__name)
+        self._finalizer = None
+        self._init_record()
+
+
+    def _init_record(self) -> None:
+        self._record = struct.Struct(self._fmt)
+        self._scalar = len(self._record.unpack(bytes(self._record.size))) == 1
+
+
+    @property
+    def maxsize(self) -> int:
+        return self._maxsize
+
+
+    def qsize(self) -> int:
+        __head, __tail = self._Header.unpack_from(self._segment.buf, 0)
+        return __tail - __head
+
+
+    def empty(self) -> bool:
+        return self.qsize() <= 0
+
+
+    def full(self) -> bool:
+        return self.qsize() >= self._maxsize
+
+
+    def put(self, obj: Any, block: bool = True, timeout: Optional[float] = None) -> None:
+        if not self._spaces.acquire(block, timeout):
+            raise Full
+        self._write([obj])
+
+
+    def put_nowait(self, obj: Any) -> None:
+        self.put(obj, block=False)
+
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        if not self._items.acquire(block, timeout):
+            raise Empty
+        return self._read(1)[0]
+
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+
+    def put_many(self, values: Iterable, timeout: Optional[float] = None) -> int:
+        """
+        Description:
+            Put the values with moving the tail once for each group of free slots.
+            It raises 'QueuePutTimeoutError' (a sub-class of 'queue.Full') if it's
+            timeout, its *amount* is the amount of values which have been put.
+        :param values:
+        :param timeout: The most seconds it waits for each free slot. It waits forever if it's None.
+        :return: The amount of values.
+        """
+
+        __values = iter(values)
+        __amount = 0
+        while True:
+            __chunk = list(islice(__values, self._maxsize))
+            if not __chunk:
+                return __amount
+            while __chunk:
+                if not self._spaces.acquire(True, timeout):
+                    raise QueuePutTimeoutError(amount=__amount, timeout=timeout)
+                __spaces = 1
+                while __spaces < len(__chunk) and self._spaces.acquire(False):
+                    __spaces += 1
+                self._write(__chunk[:__spaces])
+                __chunk = __chunk[__spaces:]
+                __amount += __spaces
+
+
+    def get_many(self, max_items: int, timeout: Optional[float] = None) -> List[Any]:
+        """
+        Description:
+            Get at most *max_items* values with moving the head once. It blocks until there
+            is a value (or the timeout), then takes the other values without blocking.
+        :param max_items: The most amount of values it gets.
+        :param timeout: The most seconds it waits for the first value. It waits forever if it's None.
+        :return: The values. It's an empty list if it's timeout.
+        """
+
+        if max_items < 1:
+            raise ValueError("The option *max_items* should be bigger than 0.")
+        if not self._items.acquire(True, timeout):
+            return []
+        __amount = 1
+        while __amount < max_items and self._items.acquire(False):
+            __amount += 1
+        return self._read(__amount)
+
+
+    def _write(self, values: List[Any]) -> None:
+        __buffer, __size = self._segment.buf, self._record.size
+        with self._put_lock:
+            __tail = struct.unpack_from("Q", __buffer, 8)[0]
+            for __index, __value in enumerate(values):
+                __offset = self._Header.size + ((__tail + __index) % self._maxsize) * __size
+                if self._scalar:
+                    self._record.pack_into(__buffer, __offset, __value)
+                else:
+                    self._record.pack_into(__buffer, __offset, *__value)
+            struct.pack_into("Q", __buffer, 8, __tail + len(values))
+        for _ in range(len(values)):
+            self._items.release()
+
+
+    def _read(self, amount: int) -> List[Any]:
+        __buffer, __size = self._segment.buf, self._record.size
+        with self._get_lock:
+            __head = struct.unpack_from("Q", __buffer, 0)[0]
+            __values = []
+            for __index in range(amount):
+                __offset = self._Header.size + ((__head + __index) % self._maxsize) * __size
+                __value = self._record.unpack_from(__buffer, __offset)
+                __values.append(__value[0] if self._scalar else __value)
+            struct.pack_into("Q", __buffer, 0, __head + amount)
+        for _ in range(amount):
+            self._spaces.release()
+        return __values
+
+
+    def close(self) -> None:
+        """
+        Description:
+            Close the segment in this process. It couldn't be used in this process after closing.
+        :return:
+        """
+
+        self._segment.close()
+
+
+    def unlink(self) -> None:
+        """
+        Description:
+            Close and release the segment. It should be called by the process which creates it
+            after all the processes finish using it.
+        :return:
+        """
+
+        if self._finalizer is not None:
+            self._finalizer()
+        else:
+            self._segment.close()
+
+
+
+def _release_queue_segment(segment: SharedMemory, owner_pid: int) -> None:
+    segment.close()
+    if os.getpid() == owner_pid:
+        try:
+            segment.unlink()
+        except FileNotFoundError:
+            pass
@@ -1,7 +1,9 @@
 from multiprocessing.managers import BaseManager
 from multiprocessing import managers, Manager
 from inspect import isclass as inspect_isclass
-from typing import Dict, Any
+from threading import RLock
+from typing import Dict, Callable, Optional, Any
+from os import getpid
 
 """
 Note:
@@ -27,34 +29,179 @@ Note:
 # managers.AutoProxy = redefined_autoproxy
 
 
-_Assign_Manager_Flag: Dict[str, bool] = {}
-_Manager_Start_Flag: bool = False
-_Current_Sharing_Manager: BaseManager = None
+class _ManagerServer:
+    """
+    Description:
+        Hold the server process of a 'multiprocessing.managers.BaseManager'
+        which only be started when somebody really needs it.
+
+        * acquire / release: reference counting. The server process would
+          be shutdown when the last reference be released.
+        * pin: keep the server process alive until the main process exits.
+          It's for the shared objects (proxies) which we don't know when
+          they would be dropped, e.g., module level shared objects.
+
+        A child process which be forked from the main process inherits the
+        running server. It never starts or shuts down the server by itself.
+    """
+
+    def __init__(self, factory: Callable[[], BaseManager]):
+        self.__factory = factory
+        self.__manager: Optional[BaseManager] = None
+        self.__owner_pid: Optional[int] = None
+        self.__references: int = 0
+        self.__pinned: bool = False
+        self.__lock = RLock()
+
+
+    @property
+    def is_running(self) -> bool:
+        return self.__manager is not None
+
+
+    @property
+    def references(self) -> int:
+        return self.__references
+
+
+    @property
+    def pinned(self) -> bool:
+        return self.__pinned
+
+
+    def get(self) -> BaseManager:
+        with self.__lock:
+            if self.__manager is None:
+                self.__manager = self.__factory()
+                self.__owner_pid = getpid()
+            return self.__manager
+
+
+    def acquire(self) -> BaseManager:
+        with self.__lock:
+            __manager = self.get()
+            self.__references += 1
+            return __manager
+
+
+    def release(self) -> None:
+        with self.__lock:
+            if self.__references > 0:
+                self.__references -= 1
+            if self.__references == 0 and self.__pinned is False:
+                self.shutdown()
+
+
+    def pin(self) -> BaseManager:
+        with self.__lock:
+            __manager = self.get()
+            self.__pinned = True
+            return __manager
+
+
+    def shutdown(self) -> None:
+        with self.__lock:
+            if self.__manager is not None and self.__owner_pid == getpid():
+                self.__manager.shutdown()
+            self.__manager = None
+            self.__owner_pid = None
+            self.__references = 0
+            self.__pinned = False
+
+
+
+class _LazyManager:
+    """
+    Description:
+        A stand-in of 'multiprocessing.Manager()' which starts the server
+        process at the first time any attribute be accessed, e.g.,
+        Global_Manager.list(), Global_Manager.Value(int, 0), etc.
+    """
+
+    def __init__(self, server: _ManagerServer):
+        self.__server = server
+
+
+    def __repr__(self):
+        return f"<LazyManager(running={self.__server.is_running}) at {id(self)}>"
+
+
+    def __getattr__(self, attr: str) -> Any:
+        if attr.startswith("_"):
+            raise AttributeError(attr)
+        # # The objects be generated by the manager would be kept by outside,
+        # # so it needs to keep the server process alive.
+        return getattr(self.__server.pin(), attr)
 
-Global_Manager = Manager()
 
 
 class _SharingManager(BaseManager):
     pass
 
 
-def get_current_manager() -> BaseManager:
-    return _Current_Sharing_Manager
+def _start_sharing_manager() -> _SharingManager:
+    __manager = _SharingManager()
+    __manager.start()
+    return __manager
+
+
+_Assign_Manager_Flag: Dict[str, bool] = {}
+
+_Global_Manager_Server = _ManagerServer(factory=Manager)
+_Sharing_Manager_Server = _ManagerServer(factory=_start_sharing_manager)
+
+Global_Manager = _LazyManager(server=_Global_Manager_Server)
+
+
+def get_global_manager_server() -> _ManagerServer:
+    return _Global_Manager_Server
+
+
+def get_sharing_manager_server() -> _ManagerServer:
+    return _Sharing_Manager_Server
 
 
-def activate_manager_server() -> _SharingManager:
-    return SharingManager()
+def get_current_manager() -> Optional[BaseManager]:
+    if _Sharing_Manager_Server.is_running is False:
+        return None
+    return _Sharing_Manager_Server.get()
+
+
+def activate_manager_server() -> Optional[_SharingManager]:
+    """
+    Description:
+        Take a reference of the sharing manager server. It only starts the
+        server process if there is any class be registered to it.
+    :return: The running sharing manager or None if nothing needs to share.
+    """
+
+    if not _Assign_Manager_Flag:
+        return None
+    return _Sharing_Manager_Server.acquire()
+
+
+def deactivate_manager_server() -> None:
+    """
+    Description:
+        Release the reference which be taken by 'activate_manager_server'.
+    :return:
+    """
+
+    if _Sharing_Manager_Server.is_running is True:
+        _Sharing_Manager_Server.release()
 
 
 def get_manager_attr(attr: str) -> Any:
-    if _Current_Sharing_Manager is None:
+    if not _Assign_Manager_Flag:
         raise ValueError("Object _SharingManager not be initialed yet.")
 
-    # if hasattr(_Current_Sharing_Manager, attr):    # The built-in function will not work finely here.
-    if attr not in dir(_Current_Sharing_Manager):
+    # # The instances be generated by it would be kept by outside.
+    __manager = _Sharing_Manager_Server.pin()
+    # if hasattr(__manager, attr):    # The built-in function will not work finely here.
+    if attr not in dir(__manager):
         raise AttributeError("Target attribute doesn't exist.")
 
-    return getattr(_Current_Sharing_Manager, attr)
+    return getattr(__manager, attr)
 
 
 def register_to_manager(target_cls: Any, proxytype: Any = None) -> None:
@@ -87,13 +234,7 @@ def SharingManager() -> _SharingManager:
         Initial sub-class of  'multiprocessing.managers.BaseManager'.
     :return:
     """
-    global _Manager_Start_Flag, _Current_Sharing_Manager
-    if _Manager_Start_Flag is False:
-        _Current_Sharing_Manager = _SharingManager()
-        _Current_Sharing_Manager.start()
-        _Manager_Start_Flag = True
-
-    return _Current_Sharing_Manager
+    return _Sharing_Manager_Server.pin()
 
 
 def sharing_in_processes(proxytype: Any = None):
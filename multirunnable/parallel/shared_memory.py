@@ -0,0 +1,245 @@
+"""
+The transport which moves large buffer objects between processes through
+named shared memory segments instead of pickling them. Only a small handle
+object be pickled and passed to the other side.
+
+    * Arguments: the main process copies the buffer into a segment once and
+      the children processes attach to it. The segments are released when
+      the strategy closes.
+    * Return values: the children process copies the buffer into a segment
+      and the main process copies it back once and releases the segment
+      immediately when it saves the running result.
+
+The objects which be restored from a segment in children process are:
+
+    * memoryview -> a read-only memoryview of the segment (zero-copy).
+    * numpy.ndarray -> a numpy.ndarray view of the segment (zero-copy).
+    * bytes, bytearray -> copied from the segment once.
+"""
+
+from typing import List, Tuple, Dict, Callable, Optional, Any
+import os
+
+from .. import PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION
+
+if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) >= (3, 8):
+    from multiprocessing.shared_memory import SharedMemory
+    from multiprocessing import resource_tracker
+else:
+    SharedMemory = None
+    resource_tracker = None
+
+
+
+class SharedMemoryHandle:
+    """
+    Description:
+        The picklable handle of an object which be saved in a named shared memory segment.
+    """
+
+    __slots__ = ("name", "size", "kind", "dtype", "shape")
+
+    def __init__(self, name: str, size: int, kind: str, dtype: Optional[str] = None, shape: Optional[Tuple] = None):
+        self.name = name
+        self.size = size
+        self.kind = kind
+        self.dtype = dtype
+        self.shape = shape
+
+
+    def __getstate__(self) -> Tuple:
+        return self.name, self.size, self.kind, self.dtype, self.shape
+
+
+    def __setstate__(self, state: Tuple) -> None:
+        self.name, self.size, self.kind, self.dtype, self.shape = state
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self.name}, size={self.size}, kind={self.kind})"
+
+
+
+def chk_shared_memory_threshold(threshold: Optional[int]) -> None:
+    if threshold is None:
+        return
+    if SharedMemory is None:
+        raise RuntimeError("The shared memory transport needs Python 3.8 or newer version.")
+    if isinstance(threshold, int) is False or threshold < 1:
+        raise ValueError("The option *shared_memory_threshold* should be a positive integer.")
+
+
+def activate_resource_tracker() -> None:
+    """
+    Description:
+        Start the resource tracker of main process before forking any children processes.
+        So that all the children processes share it. Otherwise, each of them starts its own
+        resource tracker which unlinks the segments still be used when the process exits.
+    :return:
+    """
+
+    if os.name == "posix":
+        resource_tracker.ensure_running()
+
+
+def _is_ndarray(obj: Any) -> bool:
+    return type(obj).__module__ == "numpy" and type(obj).__name__ == "ndarray"
+
+
+def _get_buffer(obj: Any) -> Optional[Tuple[memoryview, str, Optional[str], Optional[Tuple]]]:
+    if isinstance(obj, bytes):
+        return memoryview(obj), "bytes", None, None
+    elif isinstance(obj, bytearray):
+        return memoryview(obj), "bytearray", None, None
+    elif isinstance(obj, memoryview):
+        return obj.cast("B"), "memoryview", None, None
+    elif _is_ndarray(obj):
+        import numpy
+        __array = numpy.ascontiguousarray(obj)
+        return memoryview(__array).cast("B"), "ndarray", __array.dtype.str, __array.shape
+    else:
+        return None
+
+
+def share_object(obj: Any, threshold: int, segments: Optional[List] = None) -> Any:
+    """
+    Description:
+        Copy the object into a new shared memory segment and return its handle
+        if it's a buffer object which size is larger than or equal to *threshold*.
+        Otherwise, return the object directly.
+    :param obj:
+    :param threshold: The minimum size (bytes) of object to be shared.
+    :param segments: The list to keep the new segment for releasing it later.
+    :return:
+    """
+
+    __buffer = _get_buffer(obj)
+    if __buffer is None:
+        return obj
+
+    __view, __kind, __dtype, __shape = __buffer
+    if __view.nbytes < threshold:
+        return obj
+
+    __segment = SharedMemory(create=True, size=__view.nbytes)
+    __segment.buf[:__view.nbytes] = __view
+    __handle = SharedMemoryHandle(name=__segment.name, size=__view.nbytes, kind=__kind, dtype=__dtype, shape=__shape)
+    if segments is not None:
+        segments.append(__segment)
+    else:
+        __segment.close()
+    return __handle
+
+
+def share_arguments(args: Tuple, kwargs: Dict, threshold: int, segments: List) -> Tuple[Tuple, Dict]:
+    __args = tuple([share_object(_arg, threshold=threshold, segments=segments) for _arg in args])
+    __kwargs = {_key: share_object(_value, threshold=threshold, segments=segments) for _key, _value in kwargs.items()}
+    return __args, __kwargs
+
+
+def attach_object(obj: Any, segments: List) -> Any:
+    """
+    Description:
+        Restore the object from its shared memory segment in children process.
+        The segment is attached only, it's still owned by the process which creates it.
+    :param obj:
+    :param segments: The list to keep the attached segment for closing it after using.
+    :return:
+    """
+
+    if isinstance(obj, SharedMemoryHandle) is False:
+        return obj
+
+    __segment = SharedMemory(name=obj.name)
+    segments.append(__segment)
+    __view = __segment.buf[:obj.size]
+    if obj.kind == "memoryview":
+        return __view.toreadonly()
+    elif obj.kind == "ndarray":
+        import numpy
+        return numpy.ndarray(shape=obj.shape, dtype=numpy.dtype(obj.dtype), buffer=__view)
+    else:
+        __value = bytes(__view) if obj.kind == "bytes" else bytearray(__view)
+        __view.release()
+        return __value
+
+
+def detach_segments(segments: List) -> None:
+    for __segment in segments:
+        try:
+            __segment.close()
+        except BufferError:
+            # The target function still keeps a view of the segment. It would be
+            # closed when the object be collected.
+            pass
+    segments.clear()
+
+
+def restore_object(obj: Any) -> Any:
+    """
+    Description:
+        Copy the object back from its shared memory segment in main process
+        and release the segment.
+    :param obj:
+    :return:
+    """
+
+    if isinstance(obj, SharedMemoryHandle) is False:
+        return obj
+
+    __segment = SharedMemory(name=obj.name)
+    try:
+        __view = __segment.buf[:obj.size]
+        if obj.kind == "bytes":
+            __value = bytes(__view)
+        elif obj.kind == "bytearray":
+            __value = bytearray(__view)
+        elif obj.kind == "memoryview":
+            __value = memoryview(bytes(__view))
+        else:
+            import numpy
+            __array = numpy.frombuffer(__view, dtype=numpy.dtype(obj.dtype))
+            __value = __array.reshape(obj.shape).copy()
+            del __array
+        __view.release()
+    finally:
+        __segment.close()
+        __segment.unlink()
+    return __value
+
+
+def release_segments(segments: List) -> None:
+    for __segment in segments:
+        __segment.close()
+        try:
+            __segment.unlink()
+        except FileNotFoundError:
+            pass
+    segments.clear()
+
+
+
+class SharedMemoryTarget:
+    """
+    Description:
+        The picklable wrapper of target function which restores the arguments from
+        shared memory segments before calling target function, and moves its return
+        value into a new shared memory segment if it's large enough.
+    """
+
+    def __init__(self, function: Callable, threshold: int):
+        self.function = function
+        self.threshold = threshold
+
+
+    def __call__(self, *args, **kwargs) -> Any:
+        __segments = []
+        try:
+            __args = tuple([attach_object(_arg, segments=__segments) for _arg in args])
+            __kwargs = {_key: attach_object(_value, segments=__segments) for _key, _value in kwargs.items()}
+            __value = self.function(*__args, **__kwargs)
+            # The return value may be one of arguments, so it should be shared before detaching segments.
+            return share_object(__value, threshold=self.threshold)
+        finally:
+            __args, __kwargs, __value = None, None, None
+            detach_segments(__segments)
@@ -1,18 +1,30 @@
 from multiprocessing.pool import Pool, AsyncResult, ApplyResult
-from multiprocessing import Process, current_process
-from multipledispatch import dispatch
+from multiprocessing.connection import Connection, wait as wait_connections
+from multiprocessing import Process, Pipe, Queue as _ProcessQueue, current_process
+from queue import Queue as _ThreadQueue
+from threading import Thread
 from collections.abc import Iterable
 from functools import wraps, partial as PartialFunction
-from typing import List, Tuple, Dict, Iterable as IterableType, Union, Callable, Optional
+from typing import List, Set, Tuple, Dict, Iterable as IterableType, Iterator, Union, Callable, Optional, Any
 from types import FunctionType, MethodType
 from abc import ABC, abstractmethod
 from os import getpid, getppid
+import time
+import os
 
 from ..framework.runnable import (
     GeneralRunnableStrategy as _GeneralRunnableStrategy,
     PoolRunnableStrategy as _PoolRunnableStrategy,
     Resultable as _Resultable,
-    ResultState as _ResultState
+    ResultState as _ResultState,
+    ResultStore as _ResultStore
+)
+from ..framework.runnable.strategy import _consume_feeder
+from ..framework.runnable.metrics import (
+    Metrics as _Metrics,
+    untime_result as _untime_result,
+    start_timing as _start_timing,
+    stop_timing as _stop_timing
 )
 from ..framework.factory import (
     BaseFeatureAdapterFactory as _BaseFeatureAdapterFactory,
@@ -20,15 +32,196 @@ from ..framework.factory import (
 )
 from ..framework import BaseQueueTask as _BaseQueueTask
 from ..parallel.result import ParallelResult as _ParallelResult, ProcessPoolResult as _ProcessPoolResult
-from ..parallel.share import Global_Manager, activate_manager_server
+from ..parallel.share import Global_Manager, activate_manager_server, deactivate_manager_server
+from ..parallel.shared_memory import (
+    SharedMemoryHandle as _SharedMemoryHandle,
+    SharedMemoryTarget as _SharedMemoryTarget,
+    chk_shared_memory_threshold as _chk_shared_memory_threshold,
+    activate_resource_tracker as _activate_resource_tracker,
+    share_object as _share_object,
+    share_arguments as _share_arguments,
+    restore_object as _restore_object,
+    release_segments as _release_segments
+)
 from ..mode import FeatureMode as _FeatureMode
+from .._dispatch import method_dispatch
+
+
+# # The end point of the result channel in the children process. It would be set by
+# # '_ResultChannelProcess' when the process starts to run.
+_Worker_Result_Sender: Optional[Connection] = None
+_Result_Channel_Closed: str = "__multirunnable_result_channel_closed__"
+
+# '/proc/<pid>/statm' counts memory in pages. It's only for Linux, so it's fine that Windows doesn't have 'sysconf'.
+_Page_Size: int = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def _close_pool(pool: Pool) -> None:
+    pool.close()
+    pool.join()
+
+
+def _get_pool_memory_usage(pool: Pool) -> Optional[int]:
+    """
+    Description:
+        The max memory usage (RSS, bytes) of the worker processes of pool. It reads
+        '/proc/<pid>/statm' so it returns None if the platform doesn't have it.
+    :param pool:
+    :return:
+    """
+
+    __memory_usages = []
+    for __worker in list(getattr(pool, "_pool", [])):
+        try:
+            with open(f"/proc/{__worker.pid}/statm", "r") as __statm:
+                __memory_usages.append(int(__statm.read().split()[1]) * _Page_Size)
+        except (OSError, ValueError, IndexError):
+            continue
+    return max(__memory_usages) if __memory_usages else None
+
+
+def _releasing_segments(callback: Callable, segments: List) -> Callable:
+    """
+    Description:
+        Release the shared memory segments of the arguments of a task before calling
+        its callback (or error callback), the task doesn't use them anymore when it's done.
+    :param callback:
+    :param segments:
+    :return:
+    """
+
+    def _callback(value: Any) -> Any:
+        _release_segments(segments)
+        return callback(value)
+
+    return _callback
+
+
+
+class _ResultChannelProcess(Process):
+    """
+    Description:
+        A process which ships the running results to the parent process through its own
+        one-way pipe. The results are received by a thread in the parent process as soon
+        as they are sent, so that the children process never blocks at sending its result
+        and the parent process doesn't need any proxy object of manager server.
+    """
+
+    def __init__(self, results: List[Dict], metrics: Optional[_Metrics] = None, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        if kwargs.get("name", None) is None:
+            # Keep the default name as same as 'multiprocessing.Process'.
+            self.name = self.name.replace(self.__class__.__name__, Process.__name__, 1)
+        self.__results = results
+        self.__metrics = metrics
+        self.__result_receiver, self.__result_sender = Pipe(duplex=False)
+        self.__result_receiving_thread: Optional[Thread] = None
+
+
+    def start(self) -> None:
+        super().start()
+        # The parent process doesn't send anything, it only keeps the end point of receiving.
+        self.__result_sender.close()
+        self.__result_receiving_thread = Thread(target=self.__receive_results, daemon=True)
+        self.__result_receiving_thread.start()
+
+
+    def run(self) -> None:
+        global _Worker_Result_Sender
+        _Worker_Result_Sender = self.__result_sender
+        try:
+            super().run()
+        finally:
+            self.__result_sender.send(_Result_Channel_Closed)
+            self.__result_sender.close()
+            _Worker_Result_Sender = None
+
+
+    def join(self, timeout: Optional[float] = None) -> None:
+        super().join(timeout=timeout)
+        if self.__result_receiving_thread is not None and self.exitcode is not None:
+            self.__result_receiving_thread.join()
+
+
+    def __receive_results(self) -> None:
+        try:
+            while True:
+                if self.__result_receiver.poll() is False:
+                    # Stop receiving if the process has been gone without sending the end signal,
+                    # e.g., it has been terminated or killed.
+                    __ready = wait_connections([self.__result_receiver, self.sentinel])
+                    if self.__result_receiver not in __ready and self.__result_receiver.poll() is False:
+                        break
+                    continue
+
+                try:
+                    __result = self.__result_receiver.recv()
+                except EOFError:
+                    break
+                if __result == _Result_Channel_Closed:
+                    break
+                if self.__metrics is not None:
+                    self.__metrics.record(__result)
+                self.__results.append(__result)
+        finally:
+            self.__result_receiver.close()
 
 
 
 class ParallelStrategy(_Resultable, ABC):
 
     _Strategy_Feature_Mode = _FeatureMode.Parallel
-    _Processors_Running_Result: List[Dict] = Global_Manager.list()
+    # # The running results only be saved in main process. The children processes ship
+    # # their results to here through their own result channel.
+    _Processors_Running_Result: _ResultStore = None
+    # # The minimum size (bytes) of buffer object to be passed through shared memory. It's disabled if it's None.
+    _Shared_Memory_Threshold: Optional[int] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Each strategy instance saves its own running result.
+        self._Processors_Running_Result = _ResultStore()
+
+
+    @property
+    def result_max_size(self) -> Optional[int]:
+        return self._Processors_Running_Result.max_size
+
+
+    @result_max_size.setter
+    def result_max_size(self, max_size: Optional[int]) -> None:
+        self._Processors_Running_Result.max_size = max_size
+
+
+    @property
+    def shared_memory_threshold(self) -> Optional[int]:
+        return self._Shared_Memory_Threshold
+
+
+    @shared_memory_threshold.setter
+    def shared_memory_threshold(self, threshold: Optional[int]) -> None:
+        _chk_shared_memory_threshold(threshold)
+        if threshold is not None:
+            _activate_resource_tracker()
+        self._Shared_Memory_Threshold = threshold
+
+
+    def _share_function(self, function: Callable) -> Callable:
+        if self._Shared_Memory_Threshold is None:
+            return function
+        return _SharedMemoryTarget(function=function, threshold=self._Shared_Memory_Threshold)
+
+
+    def _share_arguments(self, args: Tuple, kwargs: Dict, segments: List) -> Tuple[Tuple, Dict]:
+        if self._Shared_Memory_Threshold is None:
+            return args, kwargs
+        return _share_arguments(args, kwargs, threshold=self._Shared_Memory_Threshold, segments=segments)
+
+
+    def _restore_result(self, result: Any) -> Any:
+        if isinstance(result, _SharedMemoryHandle) is False:
+            return result
+        return _restore_object(result)
 
 
     @abstractmethod
@@ -42,12 +235,23 @@ class ParallelStrategy(_Resultable, ABC):
 
 
     @classmethod
-    def save_return_value(cls, function: Callable) -> Callable:
-        __self = cls
+    def save_return_value(cls, function: Callable, timing: bool = False) -> Callable:
+        """
+        Description:
+            Record the running result of function. The record would be shipped to the
+            main process through the result channel of worker, and it also would be the
+            return value of function, e.g., it isn't run in a worker of strategy.
+        :param function:
+        :param timing: Record the timing of function or not, it's True if the metrics is enabled.
+        :return:
+        """
+
+        __enqueue_time = time.time() if timing is True else None
 
         @wraps(function)
-        def save_value_fun(*args, **kwargs) -> None:
+        def save_value_fun(*args, **kwargs) -> Dict:
             _current_process = current_process()
+            __start = _start_timing() if __enqueue_time is not None else None
 
             _process_result = {
                 "ppid": getppid(),
@@ -71,7 +275,11 @@ class ParallelStrategy(_Resultable, ABC):
                     "exitcode": _current_process.exitcode
                 })
             finally:
-                __self._Processors_Running_Result.append(_process_result)
+                if __start is not None:
+                    _stop_timing(_process_result, enqueue_time=__enqueue_time, start=__start)
+                if _Worker_Result_Sender is not None:
+                    _Worker_Result_Sender.send(_process_result)
+            return _process_result
 
         return save_value_fun
 
@@ -83,7 +291,7 @@ class ParallelStrategy(_Resultable, ABC):
 
 
     def reset_result(self) -> None:
-        self._Processors_Running_Result[:] = []
+        self._Processors_Running_Result.clear()
 
 
 
@@ -91,13 +299,19 @@ class ProcessStrategy(ParallelStrategy, _GeneralRunnableStrategy):
 
     _Strategy_Feature_Mode: _FeatureMode = _FeatureMode.Parallel
     __Process_List: List[Process] = None
+    __Manager_Activated: bool = False
 
-    def __init__(self, executors: int):
+    def __init__(self, executors: int, shared_memory_threshold: Optional[int] = None):
         """
         Description:
-            Converting the object to multiprocessing.manager.Namespace type object at initial state.
+            The option *shared_memory_threshold* enables passing the large buffer objects (bytes,
+            bytearray, memoryview and numpy.ndarray) in arguments and return value through shared
+            memory. It's the minimum size (bytes) of buffer object to be shared.
         """
         super().__init__(executors=executors)
+        self.shared_memory_threshold = shared_memory_threshold
+        self.__Shared_Memory_Segments: Dict[Process, List] = {}
+        self.__Running_Workers: Set[Process] = set()
 
 
     def initialization(self, queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
@@ -106,22 +320,19 @@ class ProcessStrategy(ParallelStrategy, _GeneralRunnableStrategy):
 
         super(ProcessStrategy, self).initialization(queue_tasks=queue_tasks, features=features, *args, **kwargs)
 
-        # Initial sub-class of 'multiprocessing.managers.BaseManager'
-        # # **** Thinking ****
-        # Thinking about how to make sure that weather it needs to start
-        # multiprocessing.managers.BaseManager server or not.
-        # # *****************
-        activate_manager_server()
+        # Activate multiprocessing.managers.BaseManager server, it's released after all the workers are closed.
+        if self.__Manager_Activated is False:
+            self.__Manager_Activated = activate_manager_server() is not None
 
 
-    @dispatch((FunctionType, MethodType, PartialFunction), args=tuple, kwargs=dict)
+    @method_dispatch((FunctionType, MethodType, PartialFunction), args=tuple, kwargs=dict)
     def _start_new_worker(self, target: Callable, args: Tuple = (), kwargs: Dict = {}) -> Process:
         __worker = self.generate_worker(target, *args, **kwargs)
         self.activate_workers(__worker)
         return __worker
 
 
-    @dispatch(Iterable, args=tuple, kwargs=dict)
+    @method_dispatch(Iterable, args=tuple, kwargs=dict)
     def _start_new_worker(self, target: List[Callable], args: Tuple = (), kwargs: Dict = {}) -> List[Process]:
         __workers = [self.generate_worker(__function, *args, **kwargs) for __function in target]
         self.activate_workers(__workers)
@@ -129,40 +340,78 @@ class ProcessStrategy(ParallelStrategy, _GeneralRunnableStrategy):
 
 
     def generate_worker(self, target: Callable, *args, **kwargs) -> Process:
+        __segments = []
+        __target = self._share_function(target)
+        args, kwargs = self._share_arguments(args, kwargs, segments=__segments)
 
         @wraps(target)
-        @ParallelStrategy.save_return_value
+        @PartialFunction(ParallelStrategy.save_return_value, timing=self._Metrics is not None)
         def _target_function(*_args, **_kwargs):
-            result_value = target(*_args, **_kwargs)
+            result_value = __target(*_args, **_kwargs)
             return result_value
 
-        return Process(target=_target_function, args=args, kwargs=kwargs)
+        __worker = _ResultChannelProcess(results=self._Processors_Running_Result, metrics=self._Metrics, target=_target_function, args=args, kwargs=kwargs)
+        if __segments:
+            self.__Shared_Memory_Segments[__worker] = __segments
+        return __worker
+
+
+    def _generate_feeder(self, maxsize: int) -> _ProcessQueue:
+        return _ProcessQueue(maxsize=maxsize)
 
 
-    @dispatch(Process)
+    def _generate_feeding_worker(self, function: Callable, feeder: _ProcessQueue) -> Process:
+        __function = self._share_function(function)
+
+        @wraps(function)
+        @PartialFunction(ParallelStrategy.save_return_value, timing=self._Metrics is not None)
+        def _target_function(*_args, **_kwargs):
+            result_value = __function(*_args, **_kwargs)
+            return result_value
+
+        return _ResultChannelProcess(results=self._Processors_Running_Result, metrics=self._Metrics, target=_consume_feeder, args=(_target_function, feeder))
+
+
+    @method_dispatch(Process)
     def activate_workers(self, workers: Process) -> None:
         workers.start()
+        self.__Running_Workers.add(workers)
 
 
-    @dispatch(Iterable)
+    @method_dispatch(Iterable)
     def activate_workers(self, workers: List[Process]) -> None:
         for worker in workers:
-            self.activate_workers(worker)
+            worker.start()
+            self.__Running_Workers.add(worker)
 
 
-    @dispatch(Process)
+    @method_dispatch(Process)
     def close(self, workers: Process) -> None:
-        workers.join()
+        self._close_worker(workers)
+
+
+    @method_dispatch(Iterable)
+    def close(self, workers: List[Process]) -> None:
+        for worker in workers:
+            self._close_worker(worker)
+
+
+    def _close_worker(self, worker: Process) -> None:
+        worker.join()
+        _release_segments(self.__Shared_Memory_Segments.pop(worker, []))
+        self.__Running_Workers.discard(worker)
+        if not self.__Running_Workers:
+            self._deactivate_manager_server()
 
         from .. import PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION
         if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
-            workers.close()
+            worker.close()
 
 
-    @dispatch(Iterable)
-    def close(self, workers: List[Process]) -> None:
-        for worker in workers:
-            self.close(worker)
+    def _deactivate_manager_server(self) -> None:
+        if self.__Manager_Activated is True:
+            deactivate_manager_server()
+            self.__Manager_Activated = False
 
 
     def terminal(self):
@@ -199,9 +448,10 @@ class ProcessStrategy(ParallelStrategy, _GeneralRunnableStrategy):
 
             # # # # Save running result of process
             __process_result = __result.get("result", None)
-            _presult.data = __process_result
+            _presult.data = self._restore_result(__process_result)
             _presult.exit_code = __result["exitcode"]
             _presult.exception = __result.get("exception", None)
+            _presult._save_timing(__result)
 
             __parallel_results.append(_presult)
 
@@ -213,9 +463,18 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
 
     _Processors_Pool: Pool = None
     _Processors_List: List[Union[ApplyResult, AsyncResult]] = None
+    __Manager_Activated: bool = False
 
-    def __init__(self, pool_size: int):
+    def __init__(self, pool_size: int, shared_memory_threshold: Optional[int] = None):
+        """
+        Description:
+            The option *shared_memory_threshold* is same as 'ProcessStrategy'. It also could be set
+            by the option of 'initialization'. The segments of arguments are released when closing.
+        """
         super().__init__(pool_size=pool_size)
+        self.shared_memory_threshold = shared_memory_threshold
+        self._Shared_Memory_Segments: List = []
+        self._Shared_Memory_Restored_Results: Dict[str, Any] = {}
 
 
     def initialization(self, queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
@@ -225,17 +484,28 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
         super(ProcessPoolStrategy, self).initialization(queue_tasks=queue_tasks, features=features, *args, **kwargs)
 
         # Activate multiprocessing.managers.BaseManager server
-        activate_manager_server()
+        if self.__Manager_Activated is False:
+            self.__Manager_Activated = activate_manager_server() is not None
+
+        if "shared_memory_threshold" in kwargs.keys():
+            self.shared_memory_threshold = kwargs["shared_memory_threshold"]
 
         # Initialize and build the Processes Pool.
         __pool_initializer: Callable = kwargs.get("pool_initializer", None)
         __pool_initargs: IterableType = kwargs.get("pool_initargs", None)
-        self._Processors_Pool = Pool(processes=self.pool_size, initializer=__pool_initializer, initargs=__pool_initargs)
+        __max_tasks_per_child = self._Pool_Lifecycle.max_tasks_per_child if self._Pool_Lifecycle is not None else None
+        self._Processors_Pool = self._acquire_pool(
+            factory=lambda: Pool(processes=self.pool_size, initializer=__pool_initializer, initargs=__pool_initargs, maxtasksperchild=__max_tasks_per_child),
+            closer=_close_pool,
+            memory_usage=_get_pool_memory_usage,
+            config=(__pool_initializer, __pool_initargs))
 
 
     def apply(self, tasks_size: int, function: Callable, args: Tuple = (), kwargs: Dict = {}) -> None:
         self.reset_result()
         __process_running_result = None
+        function = self._timing(self._share_function(function))
+        args, kwargs = self._share_arguments(args, kwargs, segments=self._Shared_Memory_Segments)
 
         self._Processors_List = [
             self._Processors_Pool.apply(func=function, args=args, kwds=kwargs)
@@ -258,6 +528,9 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
                     kwargs: Dict = {}, callback: Callable = None, error_callback: Callable = None) -> None:
 
         self.reset_result()
+        function = self._timing(self._share_function(function))
+        args, kwargs = self._share_arguments(args, kwargs, segments=self._Shared_Memory_Segments)
+        callback = self._untime_callback(self._restore_callback(callback))
         self._Processors_List = [
             self._Processors_Pool.apply_async(func=function,
                                               args=args,
@@ -293,8 +566,8 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
             kwargs_iter = [{} for _ in functions_iter]
 
         self._Processors_List = [
-            self._Processors_Pool.apply(func=_func, args=_args, kwds=_kwargs)
-            for _func, _args, _kwargs in zip(functions_iter, args_iter, kwargs_iter)
+            self._Processors_Pool.apply(func=self._timing(self._share_function(_func)), args=_args, kwds=_kwargs)
+            for _func, (_args, _kwargs) in zip(functions_iter, self._share_arguments_iter(args_iter, kwargs_iter))
         ]
 
         for prcoess in self._Processors_List:
@@ -329,12 +602,12 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
             error_callback_iter = [None for _ in functions_iter]
 
         self._Processors_List = [
-            self._Processors_Pool.apply_async(func=_func,
+            self._Processors_Pool.apply_async(func=self._timing(self._share_function(_func)),
                                               args=_args,
                                               kwds=_kwargs,
-                                              callback=_callback,
+                                              callback=self._untime_callback(self._restore_callback(_callback)),
                                               error_callback=_error_callback)
-            for _func, _args, _kwargs, _callback, _error_callback in zip(functions_iter, args_iter, kwargs_iter, callback_iter, error_callback_iter)
+            for _func, (_args, _kwargs), _callback, _error_callback in zip(functions_iter, self._share_arguments_iter(args_iter, kwargs_iter), callback_iter, error_callback_iter)
         ]
 
         for process in self._Processors_List:
@@ -359,7 +632,7 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
 
         try:
             _process_running_result = self._Processors_Pool.map(
-                func=function, iterable=args_iter, chunksize=chunksize)
+                func=self._timing(self._share_function(function)), iterable=self._share_elements(args_iter), chunksize=chunksize)
             _exception = None
             _process_run_successful = True
         except Exception as e:
@@ -380,10 +653,10 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
         _exception = None
 
         _map_result = self._Processors_Pool.map_async(
-            func=function,
-            iterable=args_iter,
+            func=self._timing(self._share_function(function)),
+            iterable=self._share_elements(args_iter),
             chunksize=chunksize,
-            callback=callback,
+            callback=self._untime_callback(self._restore_callback(callback)),
             error_callback=error_callback)
 
         try:
@@ -404,7 +677,7 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
 
         try:
             _process_running_result = self._Processors_Pool.starmap(
-                func=function, iterable=args_iter, chunksize=chunksize)
+                func=self._timing(self._share_function(function)), iterable=self._share_elements(args_iter, unpack=True), chunksize=chunksize)
             _exception = None
             _process_run_successful = True
         except Exception as e:
@@ -421,10 +694,10 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
 
         self.reset_result()
         _map_result = self._Processors_Pool.starmap_async(
-            func=function,
-            iterable=args_iter,
+            func=self._timing(self._share_function(function)),
+            iterable=self._share_elements(args_iter, unpack=True),
             chunksize=chunksize,
-            callback=callback,
+            callback=self._untime_callback(self._restore_callback(callback)),
             error_callback=error_callback)
         _process_running_result = _map_result.get()
         _process_run_successful = _map_result.successful()
@@ -434,12 +707,17 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
             self._result_saving(successful=_process_run_successful, result=__result, exception=None)
 
 
-    def imap(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1) -> None:
+    def imap(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1,
+             stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_ProcessPoolResult]]:
+        if stream is True:
+            return self._stream_imap(function=function, args_iter=args_iter, window=window, ordered=True)
+
         self.reset_result()
         _process_running_result = None
 
         try:
-            imap_running_result = self._Processors_Pool.imap(func=function, iterable=args_iter, chunksize=chunksize)
+            imap_running_result = self._Processors_Pool.imap(
+                func=self._timing(self._share_function(function)), iterable=self._share_elements(args_iter), chunksize=chunksize)
             _process_running_result = [result for result in imap_running_result]
             _exception = None
             _process_run_successful = True
@@ -452,12 +730,17 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
             self._result_saving(successful=_process_run_successful, result=__result, exception=_exception)
 
 
-    def imap_unordered(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1) -> None:
+    def imap_unordered(self, function: Callable, args_iter: IterableType = (), chunksize: int = 1,
+                       stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_ProcessPoolResult]]:
+        if stream is True:
+            return self._stream_imap(function=function, args_iter=args_iter, window=window, ordered=False)
+
         self.reset_result()
         _process_running_result = None
 
         try:
-            imap_running_result = self._Processors_Pool.imap_unordered(func=function, iterable=args_iter, chunksize=chunksize)
+            imap_running_result = self._Processors_Pool.imap_unordered(
+                func=self._timing(self._share_function(function)), iterable=self._share_elements(args_iter), chunksize=chunksize)
             _process_running_result = [result for result in imap_running_result]
             _exception = None
             _process_run_successful = True
@@ -471,17 +754,104 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
 
 
     def _result_saving(self, successful: bool, result: List, exception: Exception) -> None:
-        _process_result = {"successful": successful, "result": result, "exception": exception}
+        result, __timing = _untime_result(result, exception=exception)
+        _process_result = {"successful": successful, "result": self._restore_result(result), "exception": exception}
+        if __timing is not None:
+            _process_result.update(__timing)
+        if self._Metrics is not None:
+            self._Metrics.record(_process_result)
         self._Processors_Running_Result.append(_process_result)
 
 
+    def _share_arguments_iter(self, args_iter: List[Tuple], kwargs_iter: List[Dict]) -> IterableType[Tuple[Tuple, Dict]]:
+        return (self._share_arguments(_args, _kwargs, segments=self._Shared_Memory_Segments)
+                for _args, _kwargs in zip(args_iter, kwargs_iter))
+
+
+    def _share_elements(self, args_iter: IterableType, unpack: bool = False) -> IterableType:
+        if self._Shared_Memory_Threshold is None:
+            return args_iter
+        if unpack is True:
+            return (self._share_arguments(tuple(_args), {}, segments=self._Shared_Memory_Segments)[0] for _args in args_iter)
+        return (_share_object(_arg, threshold=self._Shared_Memory_Threshold, segments=self._Shared_Memory_Segments)
+                for _arg in args_iter)
+
+
+    def _restore_result(self, result: Any) -> Any:
+        # The result may have been restored for the callback already.
+        if isinstance(result, _SharedMemoryHandle) and result.name in self._Shared_Memory_Restored_Results.keys():
+            return self._Shared_Memory_Restored_Results.pop(result.name)
+        return super(ProcessPoolStrategy, self)._restore_result(result)
+
+
+    def _restore_callback(self, callback: Optional[Callable]) -> Optional[Callable]:
+        if callback is None or self._Shared_Memory_Threshold is None:
+            return callback
+
+        def _restored_callback(value: Any) -> Any:
+            # The value is a list for the callback of 'map_async' and 'starmap_async'.
+            if isinstance(value, list):
+                return callback([self._keep_restored_result(_v) for _v in value])
+            return callback(self._keep_restored_result(value))
+
+        return _restored_callback
+
+
+    def _keep_restored_result(self, result: Any) -> Any:
+        if isinstance(result, _SharedMemoryHandle) is False:
+            return result
+        __value = _restore_object(result)
+        self._Shared_Memory_Restored_Results[result.name] = __value
+        return __value
+
+
+    def _generate_done_queue(self) -> _ThreadQueue:
+        return _ThreadQueue()
+
+
+    def _submit_streaming_task(self, function: Callable, element: Any, callback: Callable, error_callback: Callable) -> None:
+        # The segments of each task are released when it's done, so they're bounded by the window instead of the input.
+        __segments = []
+        __args, _ = self._share_arguments((element,), {}, segments=__segments)
+        if __segments:
+            callback = _releasing_segments(callback, segments=__segments)
+            error_callback = _releasing_segments(error_callback, segments=__segments)
+
+        try:
+            self._Processors_Pool.apply_async(func=self._timing(self._share_function(function)), args=__args,
+                                              callback=self._untime_callback(callback, recording=True),
+                                              error_callback=self._recording_error_callback(error_callback))
+        except Exception:
+            _release_segments(__segments)
+            raise
+
+
+    def _generate_streaming_result(self, successful: bool, result: Any, exception: Optional[Exception]) -> _ProcessPoolResult:
+        _pool_result = _ProcessPoolResult()
+        _pool_result.is_successful = successful
+        _pool_result.data = self._restore_result(result)
+        _pool_result.exception = exception
+        return _pool_result
+
+
     def close(self) -> None:
-        self._Processors_Pool.close()
-        self._Processors_Pool.join()
+        if self._release_pool() is False:
+            _close_pool(self._Processors_Pool)
+        _release_segments(self._Shared_Memory_Segments)
+        self._deactivate_manager_server()
 
 
     def terminal(self) -> None:
         self._Processors_Pool.terminate()
+        self._discard_pool()
+        _release_segments(self._Shared_Memory_Segments)
+        self._deactivate_manager_server()
+
+
+    def _deactivate_manager_server(self) -> None:
+        if self.__Manager_Activated is True:
+            deactivate_manager_server()
+            self.__Manager_Activated = False
 
 
     def get_result(self) -> List[_ProcessPoolResult]:
@@ -495,6 +865,7 @@ class ProcessPoolStrategy(ParallelStrategy, _PoolRunnableStrategy, _Resultable):
             _pool_result.is_successful = __result["successful"]
             _pool_result.data = __result["result"]
             _pool_result.exception = __result["exception"]
+            _pool_result._save_timing(__result)
             _pool_results.append(_pool_result)
         return _pool_results
 
@@ -1,12 +1,14 @@
 from multiprocessing import (
     Lock as _Process_Lock, RLock as _Process_RLock,
     Semaphore as _Process_Semaphore, BoundedSemaphore as _Process_BoundedSemaphore,
-    Event as _Process_Event, Condition as _Process_Condition)
+    Event as _Process_Event, Condition as _Process_Condition, Value as _Process_Value)
 from typing import Union
 
 from ..framework.runnable import (
     PosixThreadLock as _PosixThreadLock,
-    PosixThreadCommunication as _PosixThreadCommunication)
+    PosixThreadCommunication as _PosixThreadCommunication,
+    ReadWriteLock as _ReadWriteLock,
+    ShardedLock as _ShardedLock)
 
 
 
@@ -28,6 +30,19 @@ class ProcessLock(_PosixThreadLock):
         return _Process_BoundedSemaphore(value=value)
 
 
+    def get_read_write_lock(self, **kwargs) -> _ReadWriteLock:
+        # The counter of readers is in the shared memory, and it's protected by *readers_lock*.
+        return _ReadWriteLock(
+            turnstile=_Process_Lock(),
+            resource=_Process_Semaphore(value=1),
+            readers_lock=_Process_Lock(),
+            readers=_Process_Value("i", 0, lock=False))
+
+
+    def get_sharded_lock(self, shards: int, **kwargs) -> _ShardedLock:
+        return _ShardedLock(locks=[_Process_Lock() for _ in range(shards)])
+
+
 
 class ProcessCommunication(_PosixThreadCommunication):
 
@@ -1,3 +1,8 @@
-from .strategy import BaseSingleConnection, BaseConnectionPool, Globalize
-from .operator import DatabaseOperator
-from .layer import BaseDao
+from .strategy import (
+    BaseSingleConnection, BaseConnectionPool, BaseManagedConnectionPool, ManagedConnectionPool,
+    AsyncBaseSingleConnection, AsyncBaseConnectionPool, AsyncManagedConnectionPool, Globalize)
+from .operator import DatabaseOperator, AsyncDatabaseOperator, OffloadDatabaseOperator
+from .layer import BaseDao, AsyncBaseDao
+from .offload import ExecutorOffload
+from .write_behind import WriteBehindBuffer
+from .statement_cache import PreparedStatementCache
@@ -1,8 +1,14 @@
-from typing import Tuple, TypeVar, Generic, Any
+from typing import Tuple, Dict, TypeVar, Generic, Optional, Any
 from abc import ABC, abstractmethod
+import logging
 
 from .strategy import BaseDatabaseConnection, BaseConnectionPool
-from .operator import DatabaseOperator
+from .operator import DatabaseOperator, AsyncDatabaseOperator
+from .write_behind import (
+    WriteBehindBuffer as _WriteBehindBuffer,
+    get_write_behind_buffer as _get_write_behind_buffer,
+    is_write_statement as _is_write_statement,
+    is_transient_error as _is_transient_error)
 from ..interface import DataPersistenceLayer
 from ... import get_current_mode
 
@@ -17,9 +23,32 @@ class DatabaseAccessObject(DataPersistenceLayer, ABC):
 
 class BaseDao(DatabaseAccessObject):
 
+    """
+    Note:
+        Write-behind: if '_Write_Behind' is True, 'execute' keeps the writing statements
+        (INSERT, UPDATE, DELETE and REPLACE with parameters) in a buffer which is shared
+        by all the workers of this Dao class in the same process, and writes them by
+        'execute_many' with one commit when the buffer has '_Write_Behind_Max_Size' rows,
+        the oldest row waits '_Write_Behind_Max_Delay' seconds (it checks that when
+        'execute' or 'commit' is called), 'flush' or 'close_connection' is called.
+        Because of that, 'commit' only commits the statements which are executed directly,
+        and the rows in the buffer couldn't be read before they're flushed.
+
+        The consecutive rows of the same statement are written as one batch, and the batches
+        keep the order of the rows. If it fails to flush, it rolls back and puts the rows back
+        to the buffer to retry, but it drops the failing batch if the error isn't transient
+        (e.g., IntegrityError) or it has retried '_Write_Behind_Max_Retries' times.
+    """
+
     _Database_Connection_Strategy: BaseDatabaseConnection = None
     _Database_Opts_Instance: DatabaseOperator = None
 
+    _Write_Behind: bool = False
+    _Write_Behind_Max_Size: int = 1000
+    _Write_Behind_Max_Delay: float = 1.0
+    _Write_Behind_Max_Retries: int = 3
+    _has_direct_execution: bool = False
+
     def __init__(self):
         self._Database_Connection_Strategy = self._instantiate_strategy()
         if isinstance(self._Database_Connection_Strategy, BaseConnectionPool):
@@ -47,15 +76,133 @@ class BaseDao(DatabaseAccessObject):
         pass
 
 
+    @property
+    def write_behind_buffer(self) -> Optional[_WriteBehindBuffer]:
+        """
+        Description:
+            The write-behind buffer of this Dao class in the current process. It's None if
+            write-behind is disabled.
+        :return:
+        """
+
+        if self._Write_Behind is False:
+            return None
+        return _get_write_behind_buffer(
+            name=f"{self.__class__.__module__}.{self.__class__.__qualname__}",
+            max_size=self._Write_Behind_Max_Size,
+            max_delay=self._Write_Behind_Max_Delay,
+            max_retries=self._Write_Behind_Max_Retries)
+
+
+    def statement_cache_stats(self) -> Dict[str, Any]:
+        return self.database_opts.statement_cache_stats()
+
+
     def reconnect(self, timeout: int = 1, force: bool = False) -> None:
         self.database_opts.reconnect(timeout=timeout, force=force)
 
 
     def commit(self) -> None:
-        self.database_opts.commit()
+        __buffer = self.write_behind_buffer
+        if __buffer is None:
+            self.database_opts.commit()
+            return
+
+        if self._has_direct_execution is True:
+            self.database_opts.commit()
+            self._has_direct_execution = False
+        if __buffer.is_due():
+            self.flush(blocking=False)
+
+
+    def flush(self, blocking: bool = True) -> int:
+        """
+        Description:
+            Write all the rows in the write-behind buffer by 'execute_many' (one time for
+            each batch of statement by order) and commit once. If it fails, it rolls back and
+            the rows are put back to the buffer to be retried by the next flush, except the
+            failing batch is dropped if the error isn't transient or it has been retried
+            '_Write_Behind_Max_Retries' times. It raises the error anyway.
+        :param blocking: Wait for the other worker which is flushing the buffer if it's True,
+                         or skip this time.
+        :return: The amount of rows it writes.
+        """
+
+        __buffer = self.write_behind_buffer
+        if __buffer is None:
+            return 0
+        if __buffer.flush_lock.acquire(blocking) is False:
+            return 0
+
+        try:
+            if self._has_direct_execution is True:
+                # Don't roll back the statements which are executed directly if it fails.
+                self.database_opts.commit()
+                self._has_direct_execution = False
+            __batches = __buffer.drain()
+            if not __batches:
+                return 0
+
+            __failing_batch: Optional[int] = None
+            try:
+                for __index, (__operator, __rows) in enumerate(__batches):
+                    __failing_batch = __index
+                    self.database_opts.execute_many(operator=__operator, seq_params=__rows)
+                __failing_batch = None
+                self.database_opts.commit()
+            except Exception as e:
+                self._rollback_flush(__buffer, __batches, __failing_batch, e)
+                raise
+            __buffer.reset_failures()
+            return sum(len(__rows) for _, __rows in __batches)
+        finally:
+            __buffer.flush_lock.release()
+
+
+    def _rollback_flush(self, buffer: _WriteBehindBuffer, batches: list, failing_batch: Optional[int], error: Exception) -> None:
+        """
+        Description:
+            Roll back the batches which have been written (but not committed) and put
+            them back to the buffer, or drop the failing batch (all the batches if it
+            fails to commit) if the error isn't transient or it has been retried too
+            many times.
+        :param buffer: The write-behind buffer.
+        :param batches: The batches of this flush.
+        :param failing_batch: The index of the failing batch, None if it fails to commit.
+        :param error: The exception.
+        :return:
+        """
+
+        try:
+            self.database_opts.rollback()
+        except Exception as e:
+            logging.warning(f"Fail to roll back the write-behind batches: {e}")
+
+        if _is_transient_error(error) is True and buffer.failures < buffer.max_retries:
+            buffer.restore(batches)
+            return
+
+        if failing_batch is None:
+            __dropped, __kept = batches, []
+        else:
+            __dropped, __kept = [batches[failing_batch]], batches[:failing_batch] + batches[failing_batch + 1:]
+        for __operator, __rows in __dropped:
+            logging.error(f"Drop {len(__rows)} rows of the write-behind statement '{__operator}' because of the error: {error}")
+        buffer.restore(__kept)
+        buffer.reset_failures()
 
 
     def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> Generic[T]:
+        __buffer = self.write_behind_buffer
+        if __buffer is None:
+            return self.database_opts.execute(operator=operator, params=params, multi=multi)
+
+        if params is not None and multi is False and _is_write_statement(operator):
+            if __buffer.add(operator, params) is True:
+                self.flush(blocking=False)
+            return None
+
+        self._has_direct_execution = True
         return self.database_opts.execute(operator=operator, params=params, multi=multi)
 
 
@@ -80,5 +227,79 @@ class BaseDao(DatabaseAccessObject):
 
 
     def close_connection(self) -> Generic[T]:
+        self.flush()
         self.database_opts.close_connection()
 
+
+
+class AsyncBaseDao(DatabaseAccessObject):
+
+    """
+    Note:
+        The async counterpart of 'BaseDao' for RunningMode.Asynchronous, all the operators
+        are awaitable. The database operator could be an 'AsyncDatabaseOperator' with an async
+        driver, or an 'OffloadDatabaseOperator' which runs a sync 'DatabaseOperator' in an
+        executor (the strategy is None in this case because the sync operator has its own one).
+        It doesn't support write-behind.
+    """
+
+    _Database_Connection_Strategy: Optional[BaseDatabaseConnection] = None
+    _Database_Opts_Instance: AsyncDatabaseOperator = None
+
+    def __init__(self):
+        self._Database_Connection_Strategy = self._instantiate_strategy()
+        self._Database_Opts_Instance = self._instantiate_database_opts(strategy=self._Database_Connection_Strategy)
+
+
+    @property
+    def database_opts(self) -> AsyncDatabaseOperator:
+        if self._Database_Opts_Instance is None:
+            self._Database_Connection_Strategy = self._instantiate_strategy()
+            self._Database_Opts_Instance = self._instantiate_database_opts(strategy=self._Database_Connection_Strategy)
+        return self._Database_Opts_Instance
+
+
+    @abstractmethod
+    def _instantiate_strategy(self) -> Optional[BaseDatabaseConnection]:
+        pass
+
+
+    @abstractmethod
+    def _instantiate_database_opts(self, strategy: Optional[BaseDatabaseConnection]) -> AsyncDatabaseOperator:
+        pass
+
+
+    async def reconnect(self, timeout: int = 1, force: bool = False) -> None:
+        await self.database_opts.reconnect(timeout=timeout, force=force)
+
+
+    async def commit(self) -> None:
+        await self.database_opts.commit()
+
+
+    async def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> Generic[T]:
+        return await self.database_opts.execute(operator=operator, params=params, multi=multi)
+
+
+    async def execute_many(self, operator: Any, seq_params: Tuple = None) -> Generic[T]:
+        return await self.database_opts.execute_many(operator=operator, seq_params=seq_params)
+
+
+    async def fetch_one(self) -> list:
+        return await self.database_opts.fetch_one()
+
+
+    async def fetch_many(self, size: int = None) -> list:
+        return await self.database_opts.fetch_many(size=size)
+
+
+    async def fetch_all(self) -> list:
+        return await self.database_opts.fetch_all()
+
+
+    async def close_cursor(self) -> Generic[T]:
+        return await self.database_opts.close_cursor()
+
+
+    async def close_connection(self) -> Generic[T]:
+        await self.database_opts.close_connection()
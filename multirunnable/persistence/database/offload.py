@@ -0,0 +1,65 @@
+"""
+Run the blocking calls of a sync-only database driver in an executor, so that
+the async database layer (AsyncBaseDao, AsyncDatabaseOperator, etc) doesn't
+block the event loop with them.
+"""
+
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Callable, Optional, Any
+import functools
+import asyncio
+
+from ... import PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION
+
+
+
+class ExecutorOffload:
+    """
+    Description:
+        Run the blocking calls in an executor. By default, it's a thread pool with
+        *max_workers* threads (only one), so the calls run one by one in the same
+        thread as most of the sync drivers expect. It creates the thread pool lazily
+        and only shuts down the executor it creates.
+    """
+
+    def __init__(self, executor: Optional[Executor] = None, max_workers: int = 1):
+        if max_workers < 1:
+            raise ValueError("The option *max_workers* should be bigger than 0.")
+
+        self._executor = executor
+        self._own_executor = executor is None
+        self._max_workers = max_workers
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(executor={self._executor}, max_workers={self._max_workers})"
+
+
+    @property
+    def executor(self) -> Executor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="DatabaseOffload")
+        return self._executor
+
+
+    async def run(self, function: Callable, *args, **kwargs) -> Any:
+        """
+        Description:
+            Run the function in the executor and wait for its result without blocking
+            the event loop.
+        :param function: The blocking function.
+        :param args: The arguments of function.
+        :param kwargs: The keyword arguments of function.
+        :return: The return value of function.
+        """
+        if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
+            __loop = asyncio.get_running_loop()
+        else:
+            __loop = asyncio.get_event_loop()
+        return await __loop.run_in_executor(self.executor, functools.partial(function, *args, **kwargs))
+
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._own_executor is True and self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
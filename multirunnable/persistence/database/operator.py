@@ -1,7 +1,10 @@
-from typing import Tuple, Dict, TypeVar, Generic, Any
+from typing import Tuple, Dict, Callable, Optional, TypeVar, Generic, Any
 from abc import ABC, abstractmethod
+import asyncio
 
-from .strategy import BaseDatabaseConnection as _BaseDataBaseConnection, BaseConnectionPool
+from .strategy import BaseDatabaseConnection as _BaseDataBaseConnection, BaseConnectionPool, AsyncBaseConnectionPool
+from .statement_cache import PreparedStatementCache
+from .offload import ExecutorOffload
 
 
 T = TypeVar("T")
@@ -9,10 +12,19 @@ T = TypeVar("T")
 
 class BaseDatabaseOperator:
 
+    # The max number of prepared statements which are cached by the SQL text. It disables the cache if it's 0.
+    _Statement_Cache_Size: int = 128
+
     def __init__(self, conn_strategy: _BaseDataBaseConnection, db_config: Dict = {}, timeout: int = 1):
         self._conn_strategy = conn_strategy
         self._db_conn_config = db_config
 
+        self._statement_cache: Optional[PreparedStatementCache] = None
+        if self._Statement_Cache_Size > 0:
+            self._statement_cache = PreparedStatementCache(max_size=self._Statement_Cache_Size, release=self._release_statement)
+        self._statement_connection: Generic[T] = None
+        self._last_statement: Generic[T] = None
+
         self._db_connection: Generic[T] = self._conn_strategy.current_connection
 
         if self._db_connection is None:
@@ -50,6 +62,95 @@ class BaseDatabaseOperator:
         return self._db_cursor
 
 
+    @property
+    def statement_cache(self) -> Optional[PreparedStatementCache]:
+        return self._statement_cache
+
+
+    @property
+    def _result_cursor(self) -> Generic[T]:
+        """
+        Description:
+            The cursor of the last executed statement, the fetch operators should get
+            the result from it.
+        :return:
+        """
+        if self._last_statement is None:
+            return self._cursor
+        return self._last_statement
+
+
+    def _statement(self, operator: Any) -> Generic[T]:
+        """
+        Description:
+            Get the prepared statement of the SQL from the cache of current connection,
+            or prepare it by *_prepare_statement* if it isn't in the cache. It returns the
+            common cursor if the cache is disabled.
+        :param operator: The SQL.
+        :return:
+        """
+        if self._statement_cache is None or isinstance(operator, str) is False:
+            self._last_statement = self._cursor
+            return self._last_statement
+
+        if self._statement_connection is not self._connection:
+            # The prepared statements belong to the connection.
+            self._statement_cache.clear()
+            self._statement_connection = self._connection
+
+        __statement = self._statement_cache.get(operator)
+        if __statement is None:
+            __statement = self._prepare_statement(operator)
+            self._statement_cache.put(operator, __statement)
+        self._last_statement = __statement
+        return __statement
+
+
+    def _prepare_statement(self, operator: str) -> Generic[T]:
+        """
+        Description:
+            Prepare the statement of the SQL. By default, it's a new cursor of current
+            connection. Override it to prepare the statement in the database server if
+            the driver supports it, e.g., 'connection.cursor(prepared=True)' of
+            mysql-connector-python.
+        :param operator: The SQL.
+        :return:
+        """
+        return self.initial_cursor(connection=self._connection)
+
+
+    def _release_statement(self, statement: Generic[T]) -> None:
+        """
+        Description:
+            Release the prepared statement which is evicted from the cache.
+        :param statement: The prepared statement.
+        :return:
+        """
+        if statement is self._db_cursor:
+            return
+        if callable(getattr(statement, "close", None)):
+            statement.close()
+
+
+    def statement_cache_stats(self) -> Dict[str, Any]:
+        """
+        Description:
+            The hit / miss statistics of the prepared statement cache. It's empty if the
+            cache is disabled.
+        :return:
+        """
+        if self._statement_cache is None:
+            return {}
+        return self._statement_cache.stats()
+
+
+    def clear_statement_cache(self) -> None:
+        if self._statement_cache is not None:
+            self._statement_cache.clear()
+        self._statement_connection = None
+        self._last_statement = None
+
+
     @abstractmethod
     def reconnect(self, timeout: int = 1, force: bool = False) -> None:
         pass
@@ -101,6 +202,7 @@ class BaseDatabaseOperator:
 class DatabaseOperator(BaseDatabaseOperator, ABC):
 
     def reconnect(self, timeout: int = 1, force: bool = False) -> None:
+        self.clear_statement_cache()
         self._db_connection = self._conn_strategy.reconnect(timeout=timeout, force=force)
         self._db_cursor = self.initial_cursor(connection=self._db_connection)
 
@@ -109,6 +211,196 @@ class DatabaseOperator(BaseDatabaseOperator, ABC):
         self._conn_strategy.commit(**kwargs)
 
 
+    def rollback(self) -> None:
+        """
+        Description:
+            Roll back the current transaction of connection. Override it if the
+            connection object of driver doesn't have DB-API *rollback*.
+        :return:
+        """
+        self._connection.rollback()
+
+
     def close_connection(self, **kwargs) -> None:
+        self.clear_statement_cache()
         self._conn_strategy.close_connection(**kwargs)
 
+
+
+class AsyncDatabaseOperator(ABC):
+    """
+    Description:
+        The async counterpart of *DatabaseOperator* with the async strategies
+        (*AsyncBaseSingleConnection* or *AsyncBaseConnectionPool*). It gets the
+        connection and initializes the cursor at the first operation because it
+        couldn't await in the constructor. The sub-class implements the operators
+        with the async driver by awaiting '_get_cursor' first.
+    """
+
+    def __init__(self, conn_strategy: Optional[_BaseDataBaseConnection], db_config: Dict = {}, timeout: int = 1):
+        self._conn_strategy = conn_strategy
+        self._db_conn_config = db_config
+        self._timeout = timeout
+
+        self._db_connection: Generic[T] = None
+        self._db_cursor: Generic[T] = None
+
+
+    async def _get_connection(self) -> Generic[T]:
+        if self._db_connection is not None:
+            return self._db_connection
+
+        self._db_connection = self._conn_strategy.current_connection
+        if self._db_connection is None:
+            await self._conn_strategy.initial(**self._db_conn_config)
+            if isinstance(self._conn_strategy, AsyncBaseConnectionPool) is True:
+                _pool_name = self._db_conn_config.get("pool_name", None)
+                if _pool_name is None:
+                    raise ValueError("Pool name could not be empty value.")
+                self._db_connection = await self._conn_strategy.get_one_connection(pool_name=_pool_name)
+            else:
+                self._db_connection = await self._conn_strategy.get_one_connection()
+        elif self._conn_strategy.is_connected() is False:
+            self._db_connection = await self._conn_strategy.reconnect(timeout=self._timeout, force=True)
+
+        assert self._db_connection is not None, "The database connection should not be None object."
+        return self._db_connection
+
+
+    async def _get_cursor(self) -> Generic[T]:
+        if self._db_cursor is None:
+            self._db_cursor = await self.initial_cursor(connection=await self._get_connection())
+            assert self._db_cursor is not None, "The cursor instance of database connection should not be None object."
+        return self._db_cursor
+
+
+    async def reconnect(self, timeout: int = 1, force: bool = False) -> None:
+        self._db_connection = await self._conn_strategy.reconnect(timeout=timeout, force=force)
+        self._db_cursor = await self.initial_cursor(connection=self._db_connection)
+
+
+    async def commit(self, **kwargs) -> None:
+        await self._conn_strategy.commit(**kwargs)
+
+
+    async def close_connection(self, **kwargs) -> None:
+        await self._conn_strategy.close_connection(**kwargs)
+        self._db_connection = None
+        self._db_cursor = None
+
+
+    @abstractmethod
+    async def initial_cursor(self, connection: Generic[T]) -> Generic[T]:
+        pass
+
+
+    @abstractmethod
+    async def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> Generic[T]:
+        pass
+
+
+    async def execute_many(self, operator: Any, seq_params=None) -> Generic[T]:
+        raise NotImplementedError
+
+
+    async def fetch_one(self) -> list:
+        raise NotImplementedError
+
+
+    @abstractmethod
+    async def fetch_many(self, size: int = None) -> list:
+        pass
+
+
+    async def fetch_all(self) -> list:
+        raise NotImplementedError
+
+
+    @abstractmethod
+    async def close_cursor(self) -> Generic[T]:
+        pass
+
+
+
+class OffloadDatabaseOperator(AsyncDatabaseOperator):
+    """
+    Description:
+        The fallback of the sync-only database drivers: it wraps a sync *DatabaseOperator*
+        and runs all its operators in an executor by *ExecutorOffload*, so they don't block
+        the event loop. The sync operator is instantiated in the executor too, because it
+        connects to database in its constructor.
+
+        By default, the executor has only one thread, so all the operators of the wrapped
+        connection run one by one in the same thread. The executor is shut down when closing
+        the connection, and the sync operator would be instantiated again if it's used after that.
+    """
+
+    def __init__(self, operator: Callable[[], DatabaseOperator], offload: ExecutorOffload = None):
+        super().__init__(conn_strategy=None)
+        self._operator_factory = operator
+        self._operator: Optional[DatabaseOperator] = None
+        # It's created in the event loop which runs the operators (asyncio.Lock binds the current event loop before 3.10).
+        self._operator_lock: Optional[asyncio.Lock] = None
+        self._offload = offload or ExecutorOffload()
+
+
+    @property
+    def offload(self) -> ExecutorOffload:
+        return self._offload
+
+
+    async def _run(self, name: str, *args, **kwargs) -> Any:
+        if self._operator is None:
+            if self._operator_lock is None:
+                self._operator_lock = asyncio.Lock()
+            async with self._operator_lock:
+                # The other task may have instantiated it while waiting for the lock.
+                if self._operator is None:
+                    self._operator = await self._offload.run(self._operator_factory)
+        return await self._offload.run(getattr(self._operator, name), *args, **kwargs)
+
+
+    async def initial_cursor(self, connection: Generic[T]) -> Generic[T]:
+        return await self._run("initial_cursor", connection=connection)
+
+
+    async def reconnect(self, timeout: int = 1, force: bool = False) -> None:
+        await self._run("reconnect", timeout=timeout, force=force)
+
+
+    async def commit(self, **kwargs) -> None:
+        await self._run("commit", **kwargs)
+
+
+    async def close_connection(self, **kwargs) -> None:
+        try:
+            if self._operator is not None:
+                await self._run("close_connection", **kwargs)
+        finally:
+            self._operator = None
+            # Nothing runs in the executor after the connection is closed, so it doesn't block the event loop.
+            self._offload.shutdown()
+
+
+    async def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> Generic[T]:
+        return await self._run("execute", operator=operator, params=params, multi=multi)
+
+
+    async def execute_many(self, operator: Any, seq_params=None) -> Generic[T]:
+        return await self._run("execute_many", operator=operator, seq_params=seq_params)
+
+
+    async def fetch_one(self) -> list:
+        return await self._run("fetch_one")
+
+
+    async def fetch_many(self, size: int = None) -> list:
+        return await self._run("fetch_many", size=size)
+
+
+    async def fetch_all(self) -> list:
+        return await self._run("fetch_all")
+
+
+    async def close_cursor(self) -> Generic[T]:
+        return await self._run("close_cursor")
@@ -0,0 +1,130 @@
+"""
+The prepared-statement cache of the database operator. It keeps the prepared
+statements (the cursors by default, or the server-side prepared statements of
+the drivers which support them) of a connection by the SQL text, so the
+statements which are executed again and again don't need to be prepared for
+each time.
+"""
+
+from typing import Dict, Callable, Optional, Any
+from collections import OrderedDict
+import logging
+
+
+
+class PreparedStatementCache:
+    """
+    Description:
+        A LRU cache of the prepared statements of a connection, keyed by the SQL text.
+        The least recently used statement is released by *release* when it has more
+        than *max_size* statements.
+
+        It isn't thread-safe, each database operator (and its connection) has its own
+        cache which is used by one worker.
+    """
+
+    def __init__(self, max_size: int = 128, release: Callable[[Any], None] = None):
+        if max_size < 1:
+            raise ValueError("The option *max_size* should be bigger than 0.")
+
+        self._max_size = max_size
+        self._release = release
+        self._statements: Dict[str, Any] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+
+    def __contains__(self, operator: str) -> bool:
+        return operator in self._statements
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(max_size={self._max_size}, size={len(self._statements)})"
+
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+
+    def get(self, operator: str) -> Optional[Any]:
+        """
+        Description:
+            Get the prepared statement of the SQL and mark it as the most recently used one.
+        :param operator: The SQL text.
+        :return: None if it isn't in the cache.
+        """
+
+        __statement = self._statements.get(operator)
+        if __statement is None:
+            self._misses += 1
+            return None
+        self._statements.move_to_end(operator)
+        self._hits += 1
+        return __statement
+
+
+    def put(self, operator: str, statement: Any) -> None:
+        """
+        Description:
+            Keep the prepared statement of the SQL, and release the least recently used
+            one if it has too many statements.
+        :param operator: The SQL text.
+        :param statement: The prepared statement.
+        :return:
+        """
+
+        self._statements[operator] = statement
+        self._statements.move_to_end(operator)
+        while len(self._statements) > self._max_size:
+            _, __evicted = self._statements.popitem(last=False)
+            self._evictions += 1
+            self._release_statement(__evicted)
+
+
+    def clear(self) -> None:
+        """
+        Description:
+            Release all the statements, e.g., the connection is closed or changed.
+            The statistics are kept.
+        :return:
+        """
+
+        __statements = list(self._statements.values())
+        self._statements.clear()
+        for __statement in __statements:
+            self._release_statement(__statement)
+
+
+    def _release_statement(self, statement: Any) -> None:
+        if self._release is None:
+            return
+        try:
+            self._release(statement)
+        except Exception as e:
+            # The connection may have been closed.
+            logging.debug(f"Fail to release the prepared statement: {e}")
+
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Description:
+            The statistics of the cache: hits, misses, evictions, the hit ratio (None if it
+            isn't used yet), the current size and the max size.
+        :return:
+        """
+
+        __lookups = self._hits + self._misses
+        return {
+            "hits": self._hits,
+            "misses": self._misses,
+            "evictions": self._evictions,
+            "hit_ratio": self._hits / __lookups if __lookups else None,
+            "size": len(self._statements),
+            "max_size": self._max_size,
+        }
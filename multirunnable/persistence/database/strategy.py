@@ -1,12 +1,27 @@
 from multiprocessing import cpu_count
-from collections import defaultdict
-from typing import Dict, Any, TypeVar, Generic, cast, Union
+from collections import defaultdict, deque
+from typing import Dict, Deque, Tuple, Callable, Awaitable, Optional, Any, TypeVar, Generic, cast, Union
 from abc import ABC, abstractmethod
+from threading import Lock
+import threading
+import warnings
+import asyncio
+import inspect
 import logging
+import weakref
+import time
+import os
 
+from ...framework.runnable.metrics import Histogram
 from ...persistence.interface import BasePersistence
-from ...adapter.context import context
-from ...exceptions import GlobalizeObjectError
+from ...exceptions import GlobalizeObjectError, ConnectionPoolTimeoutError, ConnectionPoolExhaustedError
+from ...mode import RunningMode
+from ... import _config, PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION
+
+if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
+    from contextvars import ContextVar
+else:
+    ContextVar = None
 
 
 T = TypeVar("T")
@@ -37,6 +52,160 @@ def get_connection_pool(pool_name: str) -> Generic[T]:
         return _db_conn_pool
 
 
+async def _resolve(value: Any) -> Any:
+    """
+    Description:
+        Await the value if it's awaitable. Some async drivers return coroutines but
+        some don't, e.g., the method *close*.
+    :param value:
+    :return:
+    """
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def _worker_kind(mode: Optional[RunningMode]) -> str:
+    """
+    Description:
+        What the worker is in the running mode: 'Parallel', 'Concurrent', 'GreenThread'
+        or 'Asynchronous'. It's the mode inside each process for the hybrid modes.
+    :param mode: The running mode. It's 'Concurrent' if it's None.
+    :return:
+    """
+    if mode is None:
+        return RunningMode.Concurrent.name
+    return mode.value.get("inner_mode", mode.name)
+
+
+
+def _current_task() -> Optional[asyncio.Task]:
+    try:
+        if (PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION) > (3, 6):
+            return asyncio.current_task()
+        else:
+            return asyncio.Task.current_task()
+    except RuntimeError:
+        # There isn't any running event loop.
+        return None
+
+
+
+class _WorkerConnection:
+
+    __slots__ = ("connection", "is_connected")
+
+    def __init__(self):
+        self.connection = None
+        self.is_connected = False
+
+
+
+class _WorkerLocal:
+    """
+    Description:
+        The connection binding of the current worker: thread-local in Concurrent mode,
+        greenlet-local in GreenThread mode, a context variable of the current task in
+        Asynchronous mode and process-global in Parallel mode.
+
+        The storage is resolved once for the running mode, so it doesn't look up the
+        current worker by the context adapter for every statement. The bindings are
+        dropped if the running mode changes, unless the kind of worker is fixed by *kind*.
+
+        If *key* is given, the bindings are kept by the key of current worker which it
+        returns instead (the way of the deprecated 'BaseConnectionPool._get_connections_key').
+    """
+
+    def __init__(self, kind: Optional[str] = None, key: Optional[Callable[[], str]] = None):
+        self._kind = kind
+        self._key = key
+        self._lock = Lock()
+        self._mode: Optional[RunningMode] = None
+        self._get: Optional[Callable[[], _WorkerConnection]] = None
+
+
+    def get(self) -> _WorkerConnection:
+        __get = self._get
+        if __get is None or (self._kind is None and self._mode is not _config.RUNNING_MODE):
+            with self._lock:
+                if self._get is None or (self._kind is None and self._mode is not _config.RUNNING_MODE):
+                    self._mode = _config.RUNNING_MODE
+                    if self._key is not None:
+                        self._get = _WorkerLocal._new_keyed_storage(key=self._key)
+                    else:
+                        self._get = _WorkerLocal._new_storage(kind=self._kind or _worker_kind(self._mode))
+                __get = self._get
+        return __get()
+
+
+    @staticmethod
+    def _new_keyed_storage(key: Callable[[], str]) -> Callable[[], _WorkerConnection]:
+        __bindings: Dict[str, _WorkerConnection] = {}
+
+        def _get_by_key() -> _WorkerConnection:
+            __key = key()
+            if __key not in __bindings:
+                __bindings[__key] = _WorkerConnection()
+            return __bindings[__key]
+        return _get_by_key
+
+
+    @staticmethod
+    def _new_storage(kind: str) -> Callable[[], _WorkerConnection]:
+        if kind == RunningMode.Parallel.name:
+            __process_binding = {}
+
+            def _get_by_process() -> _WorkerConnection:
+                __pid = os.getpid()
+                if __pid not in __process_binding:
+                    # Don't inherit the binding of the parent process.
+                    __process_binding.clear()
+                    __process_binding[__pid] = _WorkerConnection()
+                return __process_binding[__pid]
+            return _get_by_process
+
+        if kind == RunningMode.Asynchronous.name and ContextVar is None:
+            # Python 3.6 doesn't have contextvars, keep the bindings by the task object.
+            __task_binding = weakref.WeakKeyDictionary()
+            __no_task_binding = _WorkerConnection()
+
+            def _get_by_task_object() -> _WorkerConnection:
+                __task = _current_task()
+                if __task is None:
+                    return __no_task_binding
+                if __task not in __task_binding:
+                    __task_binding[__task] = _WorkerConnection()
+                return __task_binding[__task]
+            return _get_by_task_object
+
+        if kind == RunningMode.Asynchronous.name:
+            __context_binding = ContextVar("worker_connection", default=None)
+
+            def _get_by_task() -> _WorkerConnection:
+                __task = _current_task()
+                __binding = __context_binding.get()
+                # The task copies the context of its parent, the binding should be its own one.
+                if __binding is None or __binding[0] is not __task:
+                    __binding = (__task, _WorkerConnection())
+                    __context_binding.set(__binding)
+                return __binding[1]
+            return _get_by_task
+
+        if kind == RunningMode.GreenThread.name:
+            from gevent.local import local as _GreenletLocal
+            __local = _GreenletLocal()
+        else:
+            __local = threading.local()
+
+        def _get_by_local() -> _WorkerConnection:
+            try:
+                return __local.binding
+            except AttributeError:
+                __local.binding = _WorkerConnection()
+                return __local.binding
+        return _get_by_local
+
+
 
 class BaseDatabaseConnection(BasePersistence):
 
@@ -435,8 +604,15 @@ class BaseConnectionPool(BaseDatabaseConnection):
 
         super().__init__(**kwargs)
 
-        self._current_db_conn: Dict[str, Generic[T]] = defaultdict(lambda: None)
-        self._connection_is_connected: Dict[str, bool] = defaultdict(lambda: False)
+        if type(self)._get_connections_key is not BaseConnectionPool._get_connections_key:
+            warnings.warn(
+                f"Overriding '_get_connections_key' of {self.__class__.__name__} is deprecated, the connection is bound "
+                "to the current worker (thread, green thread, task or process) locally. It keeps the connections by "
+                "the key for now but it's slower, and it would be removed in the future.",
+                DeprecationWarning, stacklevel=2)
+            self._worker_connection = _WorkerLocal(key=self._get_connections_key)
+        else:
+            self._worker_connection = _WorkerLocal()
 
         if initial is True:
             self.initial(**self.database_config)
@@ -460,6 +636,21 @@ class BaseConnectionPool(BaseDatabaseConnection):
         self._DB_Pooled_Connection_Config[str(_instance_cls_name)][self._pool_name].update(_current_db_config)
 
 
+    def _get_connections_key(self) -> str:
+        """
+        Description:
+            Deprecated. It saved the connection instance by the worker name (ex: Process-1, Thread-1, etc)
+            which this method returns. The connection is bound to the current worker locally now, it only
+            keeps the connections by this key if the sub-class overrides it.
+        :return:
+        """
+        from ...adapter.context import context
+
+        _ident = context.get_current_worker_name()
+        _cls_name = self._get_instance_name()
+        return f"{_cls_name}_{_ident}"
+
+
     @property
     def database_config(self) -> Dict[str, object]:
         _instance_cls_name = self._get_instance_name()
@@ -596,12 +787,12 @@ class BaseConnectionPool(BaseDatabaseConnection):
                     _pool_name = self.database_config.get("pool_name", "")
                     Globalize.connection_pool(name=_pool_name, pool=_db_pool)
 
-                    _conn_key = self._get_connections_key()
-                    if force is True or self._current_db_conn[_conn_key] is None or self._connection_is_connected[_conn_key] is False:
-                        self._current_db_conn[_conn_key] = self.get_one_connection(pool_name=_pool_name)
+                    _worker = self._worker_connection.get()
+                    if force is True or _worker.connection is None or _worker.is_connected is False:
+                        self.get_one_connection(pool_name=_pool_name)
 
-                    if self._current_db_conn[_conn_key] is not None and self._connection_is_connected[_conn_key] is True:
-                        return self._current_db_conn[_conn_key]
+                    if _worker.connection is not None and _worker.is_connected is True:
+                        return _worker.connection
 
             _running_time += 1
         else:
@@ -611,14 +802,12 @@ class BaseConnectionPool(BaseDatabaseConnection):
 
 
     @property
-    def current_connection(self) -> Dict[str, Any]:
-        _conn_key = self._get_connections_key()
-        return self._current_db_conn[_conn_key]
+    def current_connection(self) -> Generic[T]:
+        return self._worker_connection.get().connection
 
 
     def is_connected(self) -> bool:
-        _conn_key = self._get_connections_key()
-        return self._connection_is_connected[_conn_key]
+        return self._worker_connection.get().is_connected
 
 
     def get_one_connection(self, pool_name: str = "", **kwargs) -> Generic[T]:
@@ -631,10 +820,10 @@ class BaseConnectionPool(BaseDatabaseConnection):
         if pool_name not in _pools.keys():
             raise ValueError(f"Cannot get the one connection instance from connection pool because it doesn't exist the connection pool with the name '{pool_name}'.")
 
-        _conn_key = self._get_connections_key()
         _connection = self._get_one_connection(pool_name=pool_name, **kwargs)
-        self._current_db_conn[_conn_key] = _connection
-        self._connection_is_connected[_conn_key] = True
+        _worker = self._worker_connection.get()
+        _worker.connection = _connection
+        _worker.is_connected = True
         return _connection
 
 
@@ -651,9 +840,8 @@ class BaseConnectionPool(BaseDatabaseConnection):
     def commit(self, conn: Any = None) -> None:
         _conn = conn
         if _conn is None:
-            _conn_key = self._get_connections_key()
-            _conn = self._current_db_conn[_conn_key]
-            assert _conn is not None, f"The database connection instance with key '{_conn_key}' shouldn't be None object.'"
+            _conn = self._worker_connection.get().connection
+            assert _conn is not None, "The database connection instance of current worker shouldn't be None object."
         self._commit(conn=_conn)
 
 
@@ -673,11 +861,11 @@ class BaseConnectionPool(BaseDatabaseConnection):
             Close connection instance.
         :return:
         """
-        _conn_key = self._get_connections_key()
+        _worker = self._worker_connection.get()
         if conn is None:
-            conn = self._current_db_conn[_conn_key]
+            conn = _worker.connection
         self._close_connection(conn=conn)
-        self._connection_is_connected[_conn_key] = False
+        _worker.is_connected = False
 
 
     @abstractmethod
@@ -700,16 +888,1077 @@ class BaseConnectionPool(BaseDatabaseConnection):
         pass
 
 
-    def _get_connections_key(self) -> str:
+
+def _managed_pool_config(pool_options: Dict[str, Any], **kwargs) -> Dict[str, Any]:
+    """
+    Description:
+        The configuration which the managed pool is built with: the database
+        configuration, the size of pool and the pool options.
+    :param pool_options: The pool options of strategy.
+    :param kwargs: The database configuration of strategy.
+    :return:
+    """
+    return {
+        "database": {_key: _value for _key, _value in kwargs.items() if _key not in ("pool_name", "pool_size")},
+        "pool_size": kwargs.get("pool_size") or cpu_count(),
+        "options": dict(pool_options)
+    }
+
+
+
+class _PooledConnection:
+
+    __slots__ = ("connection", "created_time", "checked_time")
+
+    def __init__(self, connection: Any):
+        self.connection = connection
+        self.created_time = time.monotonic()
+        self.checked_time = self.created_time
+
+
+
+class ManagedConnectionPool:
+    """
+    Description:
+        A database connection pool which doesn't depend on any database driver,
+        it only needs the callables to connect, check (ping) and close a connection.
+
+        * It creates the connections lazily when they're needed, up to *max_size*,
+          and tries to keep at least *min_idle* idle connections. The idle connections
+          are created in background (a thread, or a greenlet in GreenThread mode)
+          after releasing, so the worker which releases doesn't wait for connecting.
+        * It pings the idle connection before checking it out if it isn't checked
+          in the last *validation_interval* seconds.
+        * It closes the connection which is older than *max_lifetime* seconds
+          instead of reusing it.
+        * The workers wait at most *checkout_timeout* seconds for a connection,
+          and at most *max_waiters* workers could wait at the same time.
+
+        The pool belongs to the process which creates it. The children process
+        (by fork) doesn't reuse the connections of its parent process, it creates
+        its own ones.
+
+    Note:
+        The waiting is a gevent semaphore if the running mode is GreenThread,
+        otherwise it's a semaphore of threading.
+    """
+
+    def __init__(self, name: str, connect: Callable[[], Any], ping: Callable[[Any], bool] = None,
+                 close: Callable[[Any], None] = None, max_size: int = cpu_count(), min_idle: int = 0,
+                 pre_ping: bool = True, validation_interval: float = 30.0, max_lifetime: Optional[float] = 1800.0,
+                 checkout_timeout: Optional[float] = 30.0, max_waiters: Optional[int] = None, config: Any = None):
+        if max_size < 1:
+            raise ValueError("The max size of database connection pool should be bigger than 0.")
+        if min_idle < 0 or min_idle > max_size:
+            raise ValueError("The min idle connections of database connection pool should be between 0 and the max size.")
+        if max_waiters is not None and max_waiters < 0:
+            raise ValueError("The max waiters of database connection pool should not be negative.")
+
+        self._name = name
+        self._connect = connect
+        self._ping = ping
+        self._close = close
+        self._max_size = max_size
+        self._min_idle = min_idle
+        self._pre_ping = pre_ping
+        self._validation_interval = validation_interval
+        self._max_lifetime = max_lifetime
+        self._checkout_timeout = checkout_timeout
+        self._max_waiters = max_waiters
+        # The configuration which the pool is built with, the strategy compares it when reusing the pool.
+        self._config = config
+
+        # It's only held for the short operations, never when connecting or waiting.
+        self._lock = Lock()
+        self._reset()
+        self._fill_min_idle(raise_error=True)
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self._name}, max_size={self._max_size}, size={self._size}, idle={len(self._idle)})"
+
+
+    def _reset(self) -> None:
+        self._pid = os.getpid()
+        # A permit for each connection which is checked out or being created.
+        self._permits = ManagedConnectionPool._new_semaphore(self._max_size)
+        self._idle: Deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0
+        self._waiters = 0
+        self._closed = False
+        self._filling = False
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._checkout_time = Histogram()
+        self._wait_time = Histogram()
+
+
+    @staticmethod
+    def _new_semaphore(value: int):
+        if _worker_kind(_config.RUNNING_MODE) == RunningMode.GreenThread.name:
+            from gevent.lock import Semaphore as _GeventSemaphore
+            return _GeventSemaphore(value)
+        # Look it up at runtime so that it's the one of gevent if threading is monkey-patched.
+        return threading.Semaphore(value)
+
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+    @property
+    def config(self) -> Any:
+        return self._config
+
+
+    def get_connection(self, timeout: Optional[float] = None) -> Any:
         """
         Description:
-            In the ConnectionPoolStrategy, it would save the connection instance by the worker name (ex: Process-1, Thread-1, etc).
-            This method responses of how it determine the key index to save it.
+            Check out a connection. It reuses an idle connection or creates a new one
+            if the pool doesn't reach the max size, otherwise it waits for the other
+            workers to release one.
+        :param timeout: How long it waits at most, it's *checkout_timeout* if it's None.
+        :return: A database connection instance.
+        """
+
+        if self._pid != os.getpid():
+            with self._lock:
+                if self._pid != os.getpid():
+                    self._reset()
+        if self._closed is True:
+            raise ConnectionError(f"The database connection pool '{self._name}' has been closed.")
+
+        __start = time.monotonic()
+        self._acquire_permit(timeout=self._checkout_timeout if timeout is None else timeout)
+        try:
+            __record = self._checkout()
+        except BaseException:
+            self._permits.release()
+            raise
+
+        with self._lock:
+            self._in_use[id(__record.connection)] = __record
+            self._counters["checkouts"] += 1
+            self._checkout_time.add(time.monotonic() - __start)
+        return __record.connection
+
+
+    def _acquire_permit(self, timeout: Optional[float]) -> None:
+        if self._permits.acquire(blocking=False) is True:
+            return
+
+        with self._lock:
+            if self._max_waiters is not None and self._waiters >= self._max_waiters:
+                self._counters["rejections"] += 1
+                raise ConnectionPoolExhaustedError(pool_name=self._name, max_waiters=self._max_waiters)
+            self._waiters += 1
+            self._counters["waits"] += 1
+
+        __start = time.monotonic()
+        try:
+            __acquired = self._permits.acquire(blocking=True, timeout=timeout)
+        finally:
+            with self._lock:
+                self._waiters -= 1
+                self._wait_time.add(time.monotonic() - __start)
+
+        if __acquired is not True:
+            with self._lock:
+                self._counters["timeouts"] += 1
+            raise ConnectionPoolTimeoutError(pool_name=self._name, timeout=timeout)
+        if self._closed is True:
+            self._permits.release()
+            raise ConnectionError(f"The database connection pool '{self._name}' has been closed.")
+
+
+    def _checkout(self) -> _PooledConnection:
+        while True:
+            with self._lock:
+                __record = self._idle.pop() if self._idle else None
+                if __record is None:
+                    self._size += 1
+
+            if __record is None:
+                return self._create()
+
+            if self._is_expired(__record) is True:
+                self._discard(__record, reason="expired")
+                continue
+
+            __now = time.monotonic()
+            if self._pre_ping is True and __now - __record.checked_time >= self._validation_interval:
+                if self._is_alive(__record) is False:
+                    self._discard(__record, reason="invalid")
+                    continue
+                __record.checked_time = __now
+            return __record
+
+
+    def _create(self) -> _PooledConnection:
+        """
+        Description:
+            Create a new connection. The caller should have counted it in the size of pool.
         :return:
         """
-        _ident = context.get_current_worker_name()
-        _cls_name = self._get_instance_name()
-        return f"{_cls_name}_{_ident}"
+        try:
+            __record = _PooledConnection(self._connect())
+        except BaseException:
+            with self._lock:
+                self._size -= 1
+            raise
+        with self._lock:
+            self._counters["created"] += 1
+        return __record
+
+
+    def _is_expired(self, record: _PooledConnection) -> bool:
+        return self._max_lifetime is not None and time.monotonic() - record.created_time >= self._max_lifetime
+
+
+    def _is_alive(self, record: _PooledConnection) -> bool:
+        if self._ping is None:
+            return True
+        try:
+            return self._ping(record.connection) is not False
+        except Exception as e:
+            logging.warning(f"The connection of database connection pool '{self._name}' is invalid: {e}")
+            return False
+
+
+    def _discard(self, record: _PooledConnection, reason: str) -> None:
+        with self._lock:
+            self._size -= 1
+            self._counters[reason] += 1
+        self._disconnect(record)
+
+
+    def _disconnect(self, record: _PooledConnection) -> None:
+        if self._close is None:
+            return
+        try:
+            self._close(record.connection)
+        except Exception as e:
+            logging.warning(f"Fail to close the connection of database connection pool '{self._name}': {e}")
+
+
+    def _fill_min_idle(self, raise_error: bool = False) -> None:
+        while True:
+            with self._lock:
+                if self._closed is True or len(self._idle) >= self._min_idle or self._size >= self._max_size:
+                    return
+            if self._permits.acquire(blocking=False) is False:
+                return
+            try:
+                with self._lock:
+                    self._size += 1
+                try:
+                    __record = self._create()
+                except Exception as e:
+                    if raise_error is True:
+                        raise
+                    logging.warning(f"Fail to create the idle connection of database connection pool '{self._name}': {e}")
+                    return
+                with self._lock:
+                    self._idle.append(__record)
+            finally:
+                self._permits.release()
+
+
+    def _fill_min_idle_in_background(self) -> None:
+        with self._lock:
+            if self._filling is True or self._closed is True or len(self._idle) >= self._min_idle or self._size >= self._max_size:
+                return
+            self._filling = True
+
+        if _worker_kind(_config.RUNNING_MODE) == RunningMode.GreenThread.name:
+            import gevent
+            gevent.spawn(self._run_filling)
+        else:
+            threading.Thread(target=self._run_filling, name=f"{self._name}-min-idle", daemon=True).start()
+
+
+    def _run_filling(self) -> None:
+        try:
+            self._fill_min_idle()
+        finally:
+            with self._lock:
+                self._filling = False
+
+
+    def release(self, connection: Any, discard: bool = False) -> None:
+        """
+        Description:
+            Release the connection back to pool. It would be closed instead of being
+            reused if *discard* is True, it's too old or the pool has been closed.
+        :param connection: The connection which is checked out from this pool.
+        :param discard: Close the connection, e.g., it's broken.
+        :return:
+        """
+
+        if self._pid != os.getpid():
+            # The pool has been reset in the children process, the connection isn't its one.
+            return
+
+        with self._lock:
+            __record = self._in_use.pop(id(connection), None)
+        if __record is None:
+            raise ValueError(f"The connection doesn't belong to the database connection pool '{self._name}'.")
+
+        try:
+            if discard is True or self._closed is True:
+                self._discard(__record, reason="discarded")
+            elif self._is_expired(__record) is True:
+                self._discard(__record, reason="expired")
+            else:
+                __record.checked_time = time.monotonic()
+                with self._lock:
+                    self._idle.append(__record)
+        finally:
+            self._permits.release()
+        self._fill_min_idle_in_background()
+
+
+    def close(self) -> None:
+        """
+        Description:
+            Close the pool and all the idle connections. The connections which are
+            checked out would be closed when they're released.
+        :return:
+        """
+
+        with self._lock:
+            self._closed = True
+            __idle = list(self._idle)
+            self._idle.clear()
+            self._size -= len(__idle)
+        for __record in __idle:
+            self._disconnect(__record)
+
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Description:
+            The state and statistics of the pool:
+
+            * size, idle, in_use and waiters: the amount of connections and waiting workers now.
+            * checkouts, waits, timeouts and rejections: the amount of checking out, the ones
+              which had to wait, and the ones which fail because of timeout or too many waiters.
+            * created, expired, invalid and discarded: the amount of connections which are created,
+              and closed because of *max_lifetime*, pinging fails or being discarded by workers.
+            * checkout_time and wait_time: the summary (seconds) of how long it takes to check out
+              a connection and how long the workers wait.
+        :return:
+        """
+
+        with self._lock:
+            __metrics = {
+                "name": self._name,
+                "max_size": self._max_size,
+                "size": self._size,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                "waiters": self._waiters,
+            }
+            for __counter in ("checkouts", "waits", "timeouts", "rejections", "created", "expired", "invalid", "discarded"):
+                __metrics[__counter] = self._counters[__counter]
+            __metrics["checkout_time"] = self._checkout_time.summary()
+            __metrics["wait_time"] = self._wait_time.summary()
+        return __metrics
+
+
+
+class BaseManagedConnectionPool(BaseConnectionPool, ABC):
+    """
+    Description:
+        The connection pool strategy which pools the connections by *ManagedConnectionPool*
+        instead of the pool of database driver, so the sub-class only needs to implement how
+        to connect to database (*_connect_database*).
+
+        The options of pool could be set by the class attributes or the keyword arguments
+        with the same name in lower case (e.g., *min_idle*). The option *pool_size* is the
+        max size of pool.
+    """
+
+    _Pool_Options: Tuple[str, ...] = ("min_idle", "pre_ping", "validation_interval", "max_lifetime", "checkout_timeout", "max_waiters")
+
+    _Min_Idle: int = 0
+    _Pre_Ping: bool = True
+    _Validation_Interval: float = 30.0
+    _Max_Lifetime: Optional[float] = 1800.0
+    _Checkout_Timeout: Optional[float] = 30.0
+    _Max_Waiters: Optional[int] = None
+
+    def __init__(self, initial: bool = True, **kwargs):
+        self._pool_options: Dict[str, Any] = {
+            __option: kwargs.pop(__option, getattr(self, f"_{__option.title()}")) for __option in self._Pool_Options
+        }
+        super().__init__(initial=initial, **kwargs)
+
+
+    def initial(self, **kwargs) -> None:
+        """
+        Description:
+            Create the connection pool and globalize it. It reuses the pool if there
+            is one which hasn't been closed in this process, and raises ValueError if
+            that pool is built with different database configuration or pool options.
+        :param kwargs:
+        :return:
+        """
+        _pool_name = kwargs.get("pool_name", self._pool_name)
+        _pool = get_connection_pool(pool_name=_pool_name)
+        if isinstance(_pool, ManagedConnectionPool) and _pool.closed is False:
+            _config = _managed_pool_config(self._pool_options, **{**self.database_config, **kwargs})
+            if _pool.config is not None and _pool.config != _config:
+                raise ValueError(f"The database connection pool '{_pool_name}' is open with different configuration, "
+                                 f"please close it or use another pool name.")
+            self.database_config.update(kwargs)
+            return
+        super().initial(**kwargs)
+
+
+    def connect_database(self, **kwargs) -> ManagedConnectionPool:
+        _config = _managed_pool_config(self._pool_options, **kwargs)
+        _db_config = _config["database"]
+        return ManagedConnectionPool(
+            name=kwargs.get("pool_name", self._pool_name),
+            connect=lambda: self._connect_database(**_db_config),
+            ping=self._ping_connection,
+            close=self._disconnect,
+            max_size=_config["pool_size"],
+            config=_config,
+            **self._pool_options
+        )
+
+    @abstractmethod
+    def _connect_database(self, **kwargs) -> Generic[T]:
+        """
+        Description:
+            Connect to database and return a new connection instance.
+        :return:
+        """
+        pass
+
+
+    def _ping_connection(self, conn: Any) -> bool:
+        """
+        Description:
+            Check whether the connection is still alive. It uses the method *ping* or
+            *is_connected* of the connection if it has, or else runs 'SELECT 1'.
+        :param conn: Database connection instance.
+        :return:
+        """
+        if callable(getattr(conn, "ping", None)):
+            conn.ping()
+            return True
+        if callable(getattr(conn, "is_connected", None)):
+            return conn.is_connected()
+        _cursor = conn.cursor()
+        try:
+            _cursor.execute("SELECT 1")
+            _cursor.fetchall()
+        finally:
+            _cursor.close()
+        return True
+
+
+    def _disconnect(self, conn: Any) -> None:
+        """
+        Description:
+            Truly close the connection instance, it's called by the pool.
+        :param conn: Database connection instance.
+        :return:
+        """
+        conn.close()
+
+
+    def reconnect(self, timeout: int = 3, force: bool = False) -> Generic[T]:
+        """
+        Description:
+            Check out a new connection for the current worker and discard the current
+            one if *force* is True. It only rebuilds the pool if there isn't one.
+        :return:
+        """
+        _pool = get_connection_pool(pool_name=self._pool_name)
+        if not isinstance(_pool, ManagedConnectionPool) or _pool.closed is True:
+            return super().reconnect(timeout=timeout, force=force)
+
+        _worker = self._worker_connection.get()
+        if _worker.connection is not None and _worker.is_connected is True:
+            if force is False:
+                return _worker.connection
+            self._release_connection(pool=_pool, conn=_worker.connection, discard=True)
+            _worker.is_connected = False
+        return self.get_one_connection(pool_name=self._pool_name, timeout=timeout)
+
+
+    def _get_one_connection(self, pool_name: str = "", timeout: Optional[float] = None, **kwargs) -> Generic[T]:
+        return get_connection_pool(pool_name=pool_name).get_connection(timeout=timeout)
+
+
+    def _commit(self, conn: Any) -> None:
+        conn.commit()
+
+
+    def _close_connection(self, conn: Any) -> None:
+        """
+        Description:
+            Release the connection instance back to pool.
+        :param conn: Database connection instance.
+        :return:
+        """
+        if conn is not None:
+            self._release_connection(pool=get_connection_pool(pool_name=self._pool_name), conn=conn)
+
+
+    def _release_connection(self, pool: Optional[ManagedConnectionPool], conn: Any, discard: bool = False) -> None:
+        try:
+            pool.release(conn, discard=discard)
+        except (AttributeError, ValueError):
+            # The pool which the connection comes from doesn't exist anymore.
+            self._disconnect(conn)
+
+
+    def close_pool(self, pool_name: str) -> None:
+        _pool = get_connection_pool(pool_name=pool_name)
+        if _pool is not None:
+            _pool.close()
+
+
+    def pool_metrics(self) -> Dict[str, Any]:
+        """
+        Description:
+            The metrics of the connection pool, please refer to *ManagedConnectionPool.metrics*.
+        :return:
+        """
+        return get_connection_pool(pool_name=self._pool_name).metrics()
+
+
+
+class AsyncManagedConnectionPool:
+    """
+    Description:
+        The async counterpart of *ManagedConnectionPool* for the async database drivers.
+        The callables to connect, check (ping) and close a connection are coroutine functions.
+
+        * It creates the connections lazily when they're needed, up to *max_size*.
+        * It pings the idle connection before checking it out if it isn't checked in the last
+          *validation_interval* seconds.
+        * It closes the connection which is older than *max_lifetime* seconds instead of reusing it.
+        * The tasks wait at most *checkout_timeout* seconds for a connection.
+
+        It works in the event loop which uses it first.
+    """
+
+    def __init__(self, name: str, connect: Callable[[], Awaitable[Any]], ping: Callable[[Any], Awaitable[bool]] = None,
+                 close: Callable[[Any], Awaitable[None]] = None, max_size: int = cpu_count(), pre_ping: bool = True,
+                 validation_interval: float = 30.0, max_lifetime: Optional[float] = 1800.0,
+                 checkout_timeout: Optional[float] = 30.0, config: Any = None):
+        if max_size < 1:
+            raise ValueError("The max size of database connection pool should be bigger than 0.")
+
+        self._name = name
+        self._connect = connect
+        self._ping = ping
+        self._close = close
+        self._max_size = max_size
+        self._pre_ping = pre_ping
+        self._validation_interval = validation_interval
+        self._max_lifetime = max_lifetime
+        self._checkout_timeout = checkout_timeout
+        # The configuration which the pool is built with, the strategy compares it when reusing the pool.
+        self._config = config
+
+        # Create it in the event loop lazily.
+        self._permits: Optional[asyncio.Semaphore] = None
+        self._idle: Deque[_PooledConnection] = deque()
+        self._in_use: Dict[int, _PooledConnection] = {}
+        self._size = 0
+        self._waiters = 0
+        self._closed = False
+        self._counters: Dict[str, int] = defaultdict(int)
+        self._checkout_time = Histogram()
+        self._wait_time = Histogram()
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(name={self._name}, max_size={self._max_size}, size={self._size}, idle={len(self._idle)})"
+
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+    @property
+    def config(self) -> Any:
+        return self._config
+
+
+    async def get_connection(self, timeout: Optional[float] = None) -> Any:
+        """
+        Description:
+            Check out a connection. It reuses an idle connection or creates a new one
+            if the pool doesn't reach the max size, otherwise it waits for the other
+            tasks to release one.
+        :param timeout: How long it waits at most, it's *checkout_timeout* if it's None.
+        :return: A database connection instance.
+        """
+
+        if self._closed is True:
+            raise ConnectionError(f"The database connection pool '{self._name}' has been closed.")
+        if self._permits is None:
+            self._permits = asyncio.Semaphore(self._max_size)
+
+        __start = time.monotonic()
+        __timeout = self._checkout_timeout if timeout is None else timeout
+        if self._permits.locked() is True:
+            self._waiters += 1
+            self._counters["waits"] += 1
+            try:
+                await asyncio.wait_for(self._permits.acquire(), timeout=__timeout)
+            except asyncio.TimeoutError:
+                self._counters["timeouts"] += 1
+                raise ConnectionPoolTimeoutError(pool_name=self._name, timeout=__timeout) from None
+            finally:
+                self._waiters -= 1
+                self._wait_time.add(time.monotonic() - __start)
+            if self._closed is True:
+                self._permits.release()
+                raise ConnectionError(f"The database connection pool '{self._name}' has been closed.")
+        else:
+            await self._permits.acquire()
+
+        try:
+            __record = await self._checkout()
+        except BaseException:
+            self._permits.release()
+            raise
+
+        self._in_use[id(__record.connection)] = __record
+        self._counters["checkouts"] += 1
+        self._checkout_time.add(time.monotonic() - __start)
+        return __record.connection
+
+
+    async def _checkout(self) -> _PooledConnection:
+        while True:
+            if not self._idle:
+                self._size += 1
+                try:
+                    __record = _PooledConnection(await self._connect())
+                except BaseException:
+                    self._size -= 1
+                    raise
+                self._counters["created"] += 1
+                return __record
+
+            __record = self._idle.pop()
+            if self._max_lifetime is not None and time.monotonic() - __record.created_time >= self._max_lifetime:
+                await self._discard(__record, reason="expired")
+                continue
+
+            __now = time.monotonic()
+            if self._pre_ping is True and __now - __record.checked_time >= self._validation_interval:
+                if await self._is_alive(__record) is False:
+                    await self._discard(__record, reason="invalid")
+                    continue
+                __record.checked_time = __now
+            return __record
+
+
+    async def _is_alive(self, record: _PooledConnection) -> bool:
+        if self._ping is None:
+            return True
+        try:
+            return await self._ping(record.connection) is not False
+        except Exception as e:
+            logging.warning(f"The connection of database connection pool '{self._name}' is invalid: {e}")
+            return False
+
+
+    async def _discard(self, record: _PooledConnection, reason: str) -> None:
+        self._size -= 1
+        self._counters[reason] += 1
+        if self._close is None:
+            return
+        try:
+            await self._close(record.connection)
+        except Exception as e:
+            logging.warning(f"Fail to close the connection of database connection pool '{self._name}': {e}")
+
+
+    async def release(self, connection: Any, discard: bool = False) -> None:
+        """
+        Description:
+            Release the connection back to pool. It would be closed instead of being
+            reused if *discard* is True, it's too old or the pool has been closed.
+        :param connection: The connection which is checked out from this pool.
+        :param discard: Close the connection, e.g., it's broken.
+        :return:
+        """
+
+        __record = self._in_use.pop(id(connection), None)
+        if __record is None:
+            raise ValueError(f"The connection doesn't belong to the database connection pool '{self._name}'.")
+
+        try:
+            if discard is True or self._closed is True:
+                await self._discard(__record, reason="discarded")
+            elif self._max_lifetime is not None and time.monotonic() - __record.created_time >= self._max_lifetime:
+                await self._discard(__record, reason="expired")
+            else:
+                __record.checked_time = time.monotonic()
+                self._idle.append(__record)
+        finally:
+            self._permits.release()
+
+
+    async def close(self) -> None:
+        """
+        Description:
+            Close the pool and all the idle connections. The connections which are
+            checked out would be closed when they're released.
+        :return:
+        """
+
+        self._closed = True
+        while self._idle:
+            await self._discard(self._idle.pop(), reason="closed")
+
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Description:
+            The state and statistics of the pool, the same as *ManagedConnectionPool.metrics*
+            except for 'rejections'.
+        :return:
+        """
+
+        __metrics = {
+            "name": self._name,
+            "max_size": self._max_size,
+            "size": self._size,
+            "idle": len(self._idle),
+            "in_use": len(self._in_use),
+            "waiters": self._waiters,
+        }
+        for __counter in ("checkouts", "waits", "timeouts", "created", "expired", "invalid", "discarded"):
+            __metrics[__counter] = self._counters[__counter]
+        __metrics["checkout_time"] = self._checkout_time.summary()
+        __metrics["wait_time"] = self._wait_time.summary()
+        return __metrics
+
+
+
+class AsyncBaseSingleConnection(BaseSingleConnection, ABC):
+    """
+    Description:
+        The async counterpart of *BaseSingleConnection* for the async database drivers (or
+        the sync ones by *ExecutorOffload*). It doesn't connect to database when it's
+        instantiated because it couldn't await there, it connects by 'initial' or lazily
+        by 'get_one_connection'.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(initial=False, **kwargs)
+
+
+    async def initial(self, **kwargs) -> None:
+        self.database_config.update(kwargs)
+        self._database_connection = await self.connect_database(**self.database_config)
+
+
+    async def get_one_connection(self) -> Generic[T]:
+        if self._database_connection is not None and self.is_connected() is True:
+            return self._database_connection
+        self._database_connection = await self.connect_database(**self.database_config)
+        return self._database_connection
+
+
+    async def connect_database(self, **kwargs) -> Generic[T]:
+        _connection = await self._connect_database(**kwargs)
+        self._connection_is_connected = True
+        return _connection
+
+
+    @abstractmethod
+    async def _connect_database(self, **kwargs) -> Generic[T]:
+        """
+        Description:
+            Connect to database and return the connection instance.
+        :return:
+        """
+        pass
+
+
+    async def reconnect(self, timeout: int = 3, force: bool = False) -> Generic[T]:
+        if force is False and self._database_connection is not None and self.is_connected() is True:
+            return self._database_connection
+
+        _running_time = 0
+        _db_connect_error = None
+        while _running_time <= timeout:
+            try:
+                self._database_connection = await self.connect_database(**self.database_config)
+            except Exception as e:
+                _db_connect_error = e
+                logging.error(e)
+            else:
+                if self._database_connection is not None and self.is_connected() is True:
+                    return self._database_connection
+
+            _running_time += 1
+        else:
+            if _db_connect_error is not None:
+                raise _db_connect_error from _db_connect_error
+            raise ConnectionError(f"It's timeout to retry (Retry value is {timeout}). "
+                                  f"Cannot reconnect to database.")
+
+
+    async def commit(self) -> None:
+        await _resolve(self._database_connection.commit())
+
+
+    async def close_connection(self) -> None:
+        await self._close_connection()
+        self._connection_is_connected = False
+
+
+    async def _close_connection(self) -> None:
+        if self._database_connection is not None:
+            await _resolve(self._database_connection.close())
+
+
+
+class AsyncBaseConnectionPool(BaseConnectionPool, ABC):
+    """
+    Description:
+        The async counterpart of *BaseManagedConnectionPool*. It pools the connections by
+        *AsyncManagedConnectionPool* and each asyncio task has its own current connection.
+        The sub-class only needs to implement how to connect to database (*_connect_database*).
+
+        The options of pool could be set by the class attributes or the keyword arguments
+        with the same name in lower case, the same as *BaseManagedConnectionPool*.
+    """
+
+    _Pool_Options: Tuple[str, ...] = ("pre_ping", "validation_interval", "max_lifetime", "checkout_timeout")
+
+    _Pre_Ping: bool = True
+    _Validation_Interval: float = 30.0
+    _Max_Lifetime: Optional[float] = 1800.0
+    _Checkout_Timeout: Optional[float] = 30.0
+
+    def __init__(self, **kwargs):
+        self._pool_options: Dict[str, Any] = {
+            __option: kwargs.pop(__option, getattr(self, f"_{__option.title()}")) for __option in self._Pool_Options
+        }
+        super().__init__(initial=False, **kwargs)
+        self._worker_connection = _WorkerLocal(kind=RunningMode.Asynchronous.name)
+
+
+    async def initial(self, **kwargs) -> None:
+        """
+        Description:
+            Create the connection pool and globalize it. It reuses the pool if there
+            is one which hasn't been closed, and raises ValueError if that pool is
+            built with different database configuration or pool options.
+        :param kwargs:
+        :return:
+        """
+        _pool_name = kwargs.get("pool_name", self._pool_name)
+        _pool = get_connection_pool(pool_name=_pool_name)
+        if isinstance(_pool, AsyncManagedConnectionPool) and _pool.closed is False:
+            if _pool.config is not None and _pool.config != _managed_pool_config(self._pool_options, **{**self.database_config, **kwargs}):
+                raise ValueError(f"The database connection pool '{_pool_name}' is open with different configuration, "
+                                 f"please close it or use another pool name.")
+            self.database_config.update(kwargs)
+            return
+        self.database_config.update(kwargs)
+        _db_pool = await self.connect_database(**self.database_config)
+        Globalize.connection_pool(name=_pool_name, pool=_db_pool)
+
+
+    async def connect_database(self, **kwargs) -> AsyncManagedConnectionPool:
+        _config = _managed_pool_config(self._pool_options, **kwargs)
+        _db_config = _config["database"]
+
+        async def _connect() -> Generic[T]:
+            return await self._connect_database(**_db_config)
+
+        return AsyncManagedConnectionPool(
+            name=kwargs.get("pool_name", self._pool_name),
+            connect=_connect,
+            ping=self._ping_connection,
+            close=self._disconnect,
+            max_size=_config["pool_size"],
+            config=_config,
+            **self._pool_options
+        )
+
+
+    @abstractmethod
+    async def _connect_database(self, **kwargs) -> Generic[T]:
+        """
+        Description:
+            Connect to database and return a new connection instance.
+        :return:
+        """
+        pass
+
+
+    async def _ping_connection(self, conn: Any) -> bool:
+        """
+        Description:
+            Check whether the connection is still alive. It uses the method *ping* of the
+            connection if it has, or else runs 'SELECT 1'.
+        :param conn: Database connection instance.
+        :return:
+        """
+        if callable(getattr(conn, "ping", None)):
+            await _resolve(conn.ping())
+            return True
+        _cursor = await _resolve(conn.cursor())
+        try:
+            await _resolve(_cursor.execute("SELECT 1"))
+            await _resolve(_cursor.fetchall())
+        finally:
+            await _resolve(_cursor.close())
+        return True
+
+
+    async def _disconnect(self, conn: Any) -> None:
+        """
+        Description:
+            Truly close the connection instance, it's called by the pool.
+        :param conn: Database connection instance.
+        :return:
+        """
+        await _resolve(conn.close())
+
+
+    async def reconnect(self, timeout: int = 3, force: bool = False) -> Generic[T]:
+        """
+        Description:
+            Check out a new connection for the current task and discard the current one
+            if *force* is True. It only creates the pool if there isn't one.
+        :return:
+        """
+        _pool = get_connection_pool(pool_name=self._pool_name)
+        if not isinstance(_pool, AsyncManagedConnectionPool) or _pool.closed is True:
+            await self.initial(**self.database_config)
+            _pool = get_connection_pool(pool_name=self._pool_name)
+
+        _worker = self._worker_connection.get()
+        if _worker.connection is not None and _worker.is_connected is True:
+            if force is False:
+                return _worker.connection
+            await self._release_connection(pool=_pool, conn=_worker.connection, discard=True)
+            _worker.is_connected = False
+        return await self.get_one_connection(pool_name=self._pool_name, timeout=timeout)
+
+
+    async def get_one_connection(self, pool_name: str = "", **kwargs) -> Generic[T]:
+        """
+        Description:
+            Check out one connection instance for the current task.
+        :return:
+        """
+        if pool_name not in database_connection_pools().keys():
+            raise ValueError(f"Cannot get the one connection instance from connection pool because it doesn't exist the connection pool with the name '{pool_name}'.")
+
+        _connection = await self._get_one_connection(pool_name=pool_name, **kwargs)
+        _worker = self._worker_connection.get()
+        _worker.connection = _connection
+        _worker.is_connected = True
+        return _connection
+
+
+    async def _get_one_connection(self, pool_name: str = "", timeout: Optional[float] = None, **kwargs) -> Generic[T]:
+        return await get_connection_pool(pool_name=pool_name).get_connection(timeout=timeout)
+
+
+    async def commit(self, conn: Any = None) -> None:
+        _conn = conn
+        if _conn is None:
+            _conn = self._worker_connection.get().connection
+            assert _conn is not None, "The database connection instance of current task shouldn't be None object."
+        await self._commit(conn=_conn)
+
+
+    async def _commit(self, conn: Any) -> None:
+        await _resolve(conn.commit())
+
+
+    async def close_connection(self, conn: Any = None) -> None:
+        """
+        Description:
+            Release the connection instance back to pool.
+        :return:
+        """
+        _worker = self._worker_connection.get()
+        if conn is None:
+            conn = _worker.connection
+        await self._close_connection(conn=conn)
+        _worker.is_connected = False
+
+
+    async def _close_connection(self, conn: Any) -> None:
+        if conn is not None:
+            await self._release_connection(pool=get_connection_pool(pool_name=self._pool_name), conn=conn)
+
+
+    async def _release_connection(self, pool: Optional[AsyncManagedConnectionPool], conn: Any, discard: bool = False) -> None:
+        try:
+            await pool.release(conn, discard=discard)
+        except (AttributeError, ValueError):
+            # The pool which the connection comes from doesn't exist anymore.
+            await self._disconnect(conn)
+
+
+    async def close_pool(self, pool_name: str) -> None:
+        _pool = get_connection_pool(pool_name=pool_name)
+        if _pool is not None:
+            await _pool.close()
+
+
+    def pool_metrics(self) -> Dict[str, Any]:
+        """
+        Description:
+            The metrics of the connection pool, please refer to *AsyncManagedConnectionPool.metrics*.
+        :return:
+        """
+        return get_connection_pool(pool_name=self._pool_name).metrics()
 
 
 
@@ -0,0 +1,216 @@
+"""
+The write-behind buffer of the database persistence layer. It keeps the
+writing statements (INSERT, UPDATE, DELETE and REPLACE with parameters)
+instead of sending them to database immediately, and sends them as batches
+by *execute_many* with only one commit for each batch.
+
+The buffer is shared by all the workers in the same process (threads or
+green threads), and each process has its own buffer.
+"""
+
+from typing import List, Tuple, Dict, Optional, Any
+from threading import Lock
+import threading
+import time
+import os
+import re
+
+
+_Write_Statement = re.compile(r"^\s*(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+# The exceptions of DB-API (PEP 249) which retrying doesn't help, e.g., violating a constraint.
+_Non_Transient_Errors: Tuple[str, ...] = ("IntegrityError", "ProgrammingError", "DataError", "NotSupportedError")
+# The exceptions of DB-API (PEP 249) which may be fixed by retrying, e.g., disconnected or locked.
+_Transient_Errors: Tuple[str, ...] = ("OperationalError", "InterfaceError", "InternalError")
+
+# The buffers of this process: {the name of Dao class: WriteBehindBuffer}
+_Write_Behind_Buffers: Dict[str, "WriteBehindBuffer"] = {}
+_Write_Behind_Buffers_Lock: Lock = Lock()
+_Write_Behind_Buffers_PID: int = os.getpid()
+
+
+def is_write_statement(operator: Any) -> bool:
+    return isinstance(operator, str) and _Write_Statement.match(operator) is not None
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Description:
+        Check whether the error of writing may be fixed by retrying. It checks the
+        exception names of DB-API (PEP 249) so that it works with any driver, and
+        the errors of network (OSError) are transient too.
+    :param error: The exception.
+    :return:
+    """
+
+    __names = [__cls.__name__ for __cls in type(error).__mro__]
+    if any(__name in _Non_Transient_Errors for __name in __names):
+        return False
+    return any(__name in _Transient_Errors for __name in __names) or isinstance(error, OSError)
+
+
+
+class WriteBehindBuffer:
+    """
+    Description:
+        The statements which wait for being written to database. The parameters
+        of the consecutive rows of the same statement are coalesced as one batch,
+        and the batches keep the order of the rows across statements. It's due to
+        flush if the amount of rows reaches *max_size* or the oldest row waits
+        longer than *max_delay* seconds.
+
+        It counts the flushes which fail in a row, the writer gives up the failing
+        batch if it has failed more than *max_retries* times.
+
+        It doesn't hold its lock when flushing, so the workers could keep adding
+        rows while the other one is writing. The flushes are serialized by
+        *flush_lock* instead.
+    """
+
+    def __init__(self, max_size: int = 1000, max_delay: float = 1.0, max_retries: int = 3):
+        if max_size < 1:
+            raise ValueError("The option *max_size* should be bigger than 0.")
+        if max_delay < 0:
+            raise ValueError("The option *max_delay* should not be negative.")
+        if max_retries < 0:
+            raise ValueError("The option *max_retries* should not be negative.")
+
+        self._max_size = max_size
+        self._max_delay = max_delay
+        self._max_retries = max_retries
+        self._lock = Lock()
+        # Look it up at runtime so that it's the lock of gevent if threading is monkey-patched.
+        self.flush_lock = threading.Lock()
+        # The batches by order: [(statement, rows of parameters)]
+        self._batches: List[Tuple[Any, List[Any]]] = []
+        self._size = 0
+        self._oldest_time: Optional[float] = None
+        self._failures = 0
+
+
+    def __len__(self) -> int:
+        return self._size
+
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(max_size={self._max_size}, max_delay={self._max_delay}, size={self._size})"
+
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+
+    @property
+    def max_delay(self) -> float:
+        return self._max_delay
+
+
+    @property
+    def max_retries(self) -> int:
+        return self._max_retries
+
+
+    @property
+    def failures(self) -> int:
+        """
+        Description:
+            The amount of the flushes which fail in a row.
+        :return:
+        """
+        return self._failures
+
+
+    def add(self, operator: Any, params: Any) -> bool:
+        """
+        Description:
+            Keep a row of the statement.
+        :param operator: The statement.
+        :param params: The parameters of statement.
+        :return: True if it's due to flush.
+        """
+
+        with self._lock:
+            if self._batches and self._batches[-1][0] == operator:
+                self._batches[-1][1].append(params)
+            else:
+                self._batches.append((operator, [params]))
+            self._size += 1
+            if self._oldest_time is None:
+                self._oldest_time = time.monotonic()
+            return self._is_due()
+
+
+    def is_due(self) -> bool:
+        with self._lock:
+            return self._is_due()
+
+
+    def _is_due(self) -> bool:
+        if self._size >= self._max_size:
+            return True
+        return self._oldest_time is not None and time.monotonic() - self._oldest_time >= self._max_delay
+
+
+    def drain(self) -> List[Tuple[Any, List[Any]]]:
+        """
+        Description:
+            Take all the rows out of the buffer.
+        :return: The batches as (statement, rows of parameters) by the order they're added.
+        """
+
+        with self._lock:
+            __batches = self._batches
+            self._batches = []
+            self._size = 0
+            self._oldest_time = None
+        return __batches
+
+
+    def restore(self, batches: List[Tuple[Any, List[Any]]]) -> None:
+        """
+        Description:
+            Put the batches which fail to be written back to the front of buffer,
+            so that the next flush retries them, and count the failure.
+        :param batches: The return value of 'drain'.
+        :return:
+        """
+
+        with self._lock:
+            self._failures += 1
+            if not batches:
+                return
+            __batches = [(__operator, list(__rows)) for __operator, __rows in batches]
+            if self._batches and self._batches[0][0] == __batches[-1][0]:
+                __batches[-1][1].extend(self._batches.pop(0)[1])
+            self._batches = __batches + self._batches
+            self._size += sum(len(__rows) for _, __rows in batches)
+            self._oldest_time = time.monotonic()
+
+
+    def reset_failures(self) -> None:
+        with self._lock:
+            self._failures = 0
+
+
+
+def get_write_behind_buffer(name: str, max_size: int = 1000, max_delay: float = 1.0, max_retries: int = 3) -> WriteBehindBuffer:
+    """
+    Description:
+        Get the buffer of this process by name, create it if it doesn't exist. The
+        children process doesn't inherit the rows from the parent process.
+    :param name: The name of buffer (the module and qualified name of Dao class).
+    :param max_size: The option of new buffer.
+    :param max_delay: The option of new buffer.
+    :param max_retries: The option of new buffer.
+    :return:
+    """
+
+    global _Write_Behind_Buffers, _Write_Behind_Buffers_PID
+    with _Write_Behind_Buffers_Lock:
+        if _Write_Behind_Buffers_PID != os.getpid():
+            _Write_Behind_Buffers = {}
+            _Write_Behind_Buffers_PID = os.getpid()
+        if name not in _Write_Behind_Buffers:
+            _Write_Behind_Buffers[name] = WriteBehindBuffer(max_size=max_size, max_delay=max_delay, max_retries=max_retries)
+        return _Write_Behind_Buffers[name]
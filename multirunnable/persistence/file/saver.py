@@ -7,7 +7,7 @@ from . import (
     _Sub_Worker_Saving_File_Key,
     _Activate_Compress_Key
 )
-from ...parallel.strategy import Global_Manager
+from ...parallel.share import Global_Manager
 
 from collections import namedtuple
 from typing import List, Union
@@ -19,7 +19,16 @@ _Done_Flag = 1
 _Do_Nothing_Flag = 0
 _Error_Flag = -1
 
-_Run_Children_History_Flag: dict = Global_Manager.dict({"history": False})
+# It's shared between processes, so it only be initialized when any saver
+# registers a mediator instead of importing this module.
+_Run_Children_History_Flag: dict = None
+
+
+def _get_children_history_flag() -> dict:
+    global _Run_Children_History_Flag
+    if _Run_Children_History_Flag is None:
+        _Run_Children_History_Flag = Global_Manager.dict({"history": False})
+    return _Run_Children_History_Flag
 
 
 class BaseSaver(metaclass=ABCMeta):
@@ -47,6 +56,8 @@ class FileSaver(BaseSaver):
         self.__Mediator.super_worker_running = strategy.value[_Super_Worker_Saving_File_Key]
         self.__Mediator.child_worker_running = strategy.value[_Sub_Worker_Saving_File_Key]
         self.__Mediator.enable_compress = strategy.value[_Activate_Compress_Key]
+        # Initial the shared flag before any children workers run.
+        _get_children_history_flag()
 
 
     def save(self, file: str, mode: str, data: List[list], encoding: str = "UTF-8"):
@@ -65,8 +76,7 @@ class FileSaver(BaseSaver):
 
     def _one_worker_one_file_process(self, file: str, mode: str, encoding: str, data: List) -> int:
         if self._is_children_worker():
-            global _Run_Children_History_Flag
-            _Run_Children_History_Flag["history"] = True
+            _get_children_history_flag()["history"] = True
             # It must to be 'One Thread One File' strategy.
             self._saving_process(file=file, mode=mode, encoding=encoding, data=data)
             self.__Has_Data = False
@@ -87,8 +97,7 @@ class FileSaver(BaseSaver):
     def _all_workers_one_file_process(self, file: str, mode: str, encoding: str, data: List) -> Union[int, list]:
         # 'ALL_THREADS_ONE_FILE' strategy.
         if self._is_children_worker():
-            global _Run_Children_History_Flag
-            _Run_Children_History_Flag["history"] = True
+            _get_children_history_flag()["history"] = True
             # This's child worker and its responsibility is compressing all files
             self.__Has_Data = True
             return data
@@ -104,8 +113,7 @@ class FileSaver(BaseSaver):
     def _one_worker_one_file_and_compress_all_process(self, file: str, data: List):
         # 'ONE_THREAD_ONE_FILE_AND_COMPRESS_ALL' strategy.
         if self._is_children_worker():
-            global _Run_Children_History_Flag
-            _Run_Children_History_Flag["history"] = True
+            _get_children_history_flag()["history"] = True
             # This's child worker and its responsibility is generating data stream with one specific file format
             data_stream = self._saving_stream(file=file, data=data)
             self.__Has_Data = True
@@ -131,7 +139,7 @@ class FileSaver(BaseSaver):
 
 
     def _has_run_children_before(self) -> bool:
-        return _Run_Children_History_Flag["history"] is True
+        return _get_children_history_flag()["history"] is True
 
 
     def _is_main_worker(self) -> bool:
@@ -1,10 +1,15 @@
-from typing import List, Tuple, Dict, Iterable, Callable, Optional, Union
+from typing import List, Tuple, Dict, Iterable, Iterator, Callable, Optional, Union
 from abc import ABC
 
 from .framework.runnable import (
     PoolRunnableStrategy as _PoolRunnableStrategy,
     Resultable as _Resultable,
-    PoolResult as _PoolResult
+    PoolResult as _PoolResult,
+    PoolLifecycle as _PoolLifecycle,
+    ScalingPolicy as _ScalingPolicy,
+    AutoScaler as _AutoScaler,
+    Metrics as _Metrics,
+    MetricsExporter as _MetricsExporter
 )
 from .framework.factory import (
     BaseFeatureAdapterFactory as _BaseFeatureAdapterFactory,
@@ -42,6 +47,87 @@ class Pool(ABC, _BasePool):
         self.close()
 
 
+    @property
+    def is_warm(self) -> bool:
+        """
+        Description:
+            It's True if the pool attaches to an already running (named) pool.
+        :return:
+        """
+        return Pool_Runnable_Strategy.is_warm
+
+
+    @property
+    def auto_scaler(self) -> Optional[_AutoScaler]:
+        """
+        Description:
+            The autoscaler of pool, it's None if the size of pool is fixed.
+        :return:
+        """
+        return Pool_Runnable_Strategy.auto_scaler
+
+
+    @property
+    def metrics(self) -> Optional[_Metrics]:
+        """
+        Description:
+            The metrics of tasks, it's None if it isn't enabled.
+        :return:
+        """
+        return Pool_Runnable_Strategy.metrics
+
+
+    def enable_metrics(self, exporter: Optional[_MetricsExporter] = None) -> _Metrics:
+        """
+        Description:
+            Measure the timing (queue wait, run time and CPU time) of the tasks which are
+            submitted from now on, and aggregate them into histograms, throughput and error
+            rate. It doesn't measure anything before it's enabled, so it costs nothing if it
+            isn't needed.
+        :param exporter: The exporter which 'export_metrics' sends the snapshot to.
+        :return: The metrics.
+        """
+        return Pool_Runnable_Strategy.enable_metrics(exporter=exporter, name=self._metrics_name)
+
+
+    def disable_metrics(self) -> None:
+        Pool_Runnable_Strategy.disable_metrics()
+
+
+    @property
+    def result_max_size(self) -> Optional[int]:
+        """
+        Description:
+            The maximum number of running result records which be kept. Only the last
+            *result_max_size* records are kept if it's set, and 0 drops every record.
+            None means keeping all of them until 'get_result'.
+        :return:
+        """
+        return Pool_Runnable_Strategy.result_max_size
+
+
+    @result_max_size.setter
+    def result_max_size(self, max_size: Optional[int]) -> None:
+        Pool_Runnable_Strategy.result_max_size = max_size
+
+
+    def export_metrics(self) -> Optional[Dict]:
+        """
+        Description:
+            Export the snapshot of metrics by its exporter.
+        :return: The snapshot, or None if the metrics isn't enabled.
+        """
+        __metrics = self.metrics
+        if __metrics is None:
+            return None
+        return __metrics.export()
+
+
+    @property
+    def _metrics_name(self) -> Optional[str]:
+        return None
+
+
     def initial(self, queue_tasks: Optional[Union[_BaseQueueTask, _BaseList]] = None,
                 features: Optional[Union[_BaseFeatureAdapterFactory, _BaseList]] = None,
                 *args, **kwargs):
@@ -112,12 +198,24 @@ class Pool(ABC, _BasePool):
             error_callback=error_callback)
 
 
-    def imap(self, function: Callable, args_iter: Iterable = (), chunksize: int = 1) -> None:
-        Pool_Runnable_Strategy.imap(function=function, args_iter=args_iter, chunksize=chunksize)
+    def imap(self, function: Callable, args_iter: Iterable = (), chunksize: int = 1,
+             stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_PoolResult]]:
+        return Pool_Runnable_Strategy.imap(
+            function=function,
+            args_iter=args_iter,
+            chunksize=chunksize,
+            stream=stream,
+            window=window)
 
 
-    def imap_unordered(self, function: Callable, args_iter: Iterable = (), chunksize: int = 1) -> None:
-        Pool_Runnable_Strategy.imap_unordered(function=function, args_iter=args_iter, chunksize=chunksize)
+    def imap_unordered(self, function: Callable, args_iter: Iterable = (), chunksize: int = 1,
+                       stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_PoolResult]]:
+        return Pool_Runnable_Strategy.imap_unordered(
+            function=function,
+            args_iter=args_iter,
+            chunksize=chunksize,
+            stream=stream,
+            window=window)
 
 
     def close(self) -> None:
@@ -136,7 +234,35 @@ class Pool(ABC, _BasePool):
 
 class SimplePool(Pool):
 
-    def __init__(self, pool_size: int, mode: _RunningMode = None):
+    def __init__(self, pool_size: int, mode: _RunningMode = None, name: Optional[str] = None,
+                 lifecycle: Optional[_PoolLifecycle] = None, autoscale: Optional[_ScalingPolicy] = None,
+                 processes: Optional[int] = None, shared_memory_threshold: Optional[int] = None,
+                 result_max_size: Optional[int] = None):
+        """
+        Description:
+            The pool with the strategy of the running mode.
+        :param pool_size: The size of pool.
+        :param mode: The running mode. It uses the current mode if it's None.
+        :param name: The name of a warm pool. The pools with the same name, mode and size
+                     share one running pool in registry 'Pool_Registry', so the pool isn't
+                     built again when initializing and only released when closing.
+        :param lifecycle: The lifecycle of the named pool (max idle time, max tasks per
+                          child and memory threshold). It only works with option *name*.
+        :param autoscale: Scale the size of pool between the bounds of the policy by the load,
+                          and *pool_size* is the initial size. It only works with Concurrent
+                          and GreenThread.
+        :param processes: The amount of processes. It only works with hybrid mode, e.g.,
+                          RunningMode.ParallelConcurrent, and *pool_size* is the size of pool
+                          in each process. It's the amount of CPU if it's None.
+        :param shared_memory_threshold: Pass the large buffer objects (bytes, bytearray, memoryview
+                                        and numpy.ndarray) in arguments and return value through shared
+                                        memory if they're bigger than this size (bytes). It only works
+                                        with RunningMode.Parallel.
+        :param result_max_size: The maximum number of running result records which be kept. Only the
+                                last records are kept if it's set, and 0 drops every record. It keeps
+                                all of them until 'get_result' if it's None.
+        """
+
         if mode is _RunningMode.Asynchronous:
             raise self.NotSupportError
 
@@ -149,8 +275,18 @@ class SimplePool(Pool):
         else:
             self._mode = get_current_mode(force=True)
 
+        if name is None and lifecycle is not None:
+            raise ValueError("The option *lifecycle* only works with a named pool, please set option *name*.")
+        self._name = name
+        self._lifecycle = lifecycle
+        self._autoscale = autoscale
+        self._processes = processes
+        self._shared_memory_threshold = shared_memory_threshold
+
         super().__init__(pool_size=pool_size)
         self._initial_running_strategy()
+        if result_max_size is not None:
+            self.result_max_size = result_max_size
 
 
     def __repr__(self):
@@ -167,13 +303,43 @@ class SimplePool(Pool):
         return __instance_brief
 
 
+    @property
+    def _metrics_name(self) -> Optional[str]:
+        # The metrics of a named pool is named by the pool.
+        return self._name
+
+
+    def imap(self, function: Callable, args_iter: Iterable = (), chunksize: int = 1,
+             stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_PoolResult]]:
+        self._chk_streaming(stream=stream)
+        return super().imap(function=function, args_iter=args_iter, chunksize=chunksize, stream=stream, window=window)
+
+
+    def imap_unordered(self, function: Callable, args_iter: Iterable = (), chunksize: int = 1,
+                       stream: bool = False, window: Optional[int] = None) -> Optional[Iterator[_PoolResult]]:
+        self._chk_streaming(stream=stream)
+        return super().imap_unordered(function=function, args_iter=args_iter, chunksize=chunksize, stream=stream, window=window)
+
+
+    def _chk_streaming(self, stream: bool) -> None:
+        # The results of hybrid mode are sent back when the whole chunk is done in the child process.
+        if stream is True and "inner_mode" in self._mode.value.keys():
+            raise ValueError(f"The streaming mode isn't supported with hybrid RunningMode.{self._mode.name}, "
+                             f"please use 'imap' or 'imap_unordered' with stream=False.")
+
+
     def _initial_running_strategy(self) -> None:
         __running_strategy_adapter = _PoolStrategyAdapter(
             mode=self._mode,
-            pool_size=self.pool_size)
+            pool_size=self.pool_size,
+            processes=self._processes,
+            autoscale=self._autoscale,
+            shared_memory_threshold=self._shared_memory_threshold)
 
         global Pool_Runnable_Strategy
         Pool_Runnable_Strategy = __running_strategy_adapter.get_simple()
+        if self._name is not None:
+            Pool_Runnable_Strategy.register_pool(name=self._name, lifecycle=self._lifecycle)
 
 
 
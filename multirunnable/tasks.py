@@ -1,10 +1,11 @@
-from typing import Iterable
+from typing import Iterable, Optional
 
 from .framework.runnable import BaseQueueType as _BaseQueueType
 from .framework.factory import BaseList as _BaseList
 from .framework.task import BaseQueueTask as _BaseQueueTask
 from .factory.collection import QueueTaskList as _QueueTaskList
 from .factory.queue import QueueAdapter as _QueueAdapter
+from .api.operator import QueueOperator as _QueueOperator, QueueAsyncOperator as _QueueAsyncOperator
 from .types import MRQueue as _MRQueue
 
 
@@ -56,6 +57,27 @@ class QueueTask(_BaseQueueTask):
         self._Value = val
 
 
+    @property
+    def chunk_size(self) -> Optional[int]:
+        return self._Chunk_Size
+
+
+    @chunk_size.setter
+    def chunk_size(self, size: Optional[int]) -> None:
+        """
+        Description:
+            Seed the queue with the chunks of values ('QueueBatch') instead of one by one.
+            It's much faster with the queue of processes, but the workers should get the
+            values by 'QueueOperator.get_many'.
+        :param size: The amount of values in each chunk. None means one by one.
+        :return:
+        """
+
+        if size is not None and size < 1:
+            raise ValueError("The chunk size should be bigger than 0.")
+        self._Chunk_Size = size
+
+
     def get_queue(self) -> _MRQueue:
         self.__Queue_Adapter = _QueueAdapter(name=self.name, qtype=self.queue_instance)
         __queue_obj = self.__Queue_Adapter.get_instance()
@@ -68,14 +90,12 @@ class QueueTask(_BaseQueueTask):
 
     def init_queue_with_values(self) -> None:
         __queue = self.get_queue()
-        for __value in self.value:
-            __queue.put(__value)
+        _QueueOperator.put_many(__queue, self.value, chunk_size=self.chunk_size)
         self.__Queue_Adapter.globalize_instance(obj=__queue)
 
 
     async def async_init_queue_with_values(self) -> None:
         __queue = self.get_queue()
-        for __value in self.value:
-            await __queue.put(__value)
+        await _QueueAsyncOperator.put_many(__queue, self.value, chunk_size=self.chunk_size)
         self.__Queue_Adapter.globalize_instance(obj=__queue)
 
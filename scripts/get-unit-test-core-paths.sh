@@ -14,6 +14,8 @@ declare -a coroutine_tests
 declare -a factory_tests
 declare -a apis_tests
 declare -a adapter_tests
+declare -a hybrid_tests
+declare -a framework_tests
 
 getalltests() {
     declare -a testpatharray=( $(ls -F $1 | grep -v '/$' | grep -v '__init__.py' | grep -v 'test_config.py' | grep -v -E '^_[a-z_]{1,64}.py' | grep -v '__pycache__'))
@@ -41,6 +43,12 @@ getalltests() {
     elif echo $1 | grep -q "adapter";
     then
         adapter_tests=${alltestpaths[@]}
+    elif echo $1 | grep -q "hybrid";
+    then
+        hybrid_tests=${alltestpaths[@]}
+    elif echo $1 | grep -q "framework";
+    then
+        framework_tests=${alltestpaths[@]}
     else
         basic_api_tests=${alltestpaths[@]}
     fi
@@ -53,6 +61,8 @@ coroutinepath=tests/unit_test/coroutine/
 factory_path=tests/unit_test/factory/
 api_path=tests/unit_test/api/
 adapter_path=tests/unit_test/adapter/
+hybrid_path=tests/unit_test/hybrid/
+framework_path=tests/unit_test/framework/
 
 getalltests $init_path
 getalltests $parallelpath
@@ -62,8 +72,10 @@ getalltests $coroutinepath
 getalltests $factory_path
 getalltests $api_path
 getalltests $adapter_path
+getalltests $hybrid_path
+getalltests $framework_path
 
-dest=( "${array1[@]} ${basic_api_tests[@]} ${parallel_tests[@]} ${concurrent_tests[@]} ${coroutine_tests[@]} ${factory_tests[@]} ${apis_tests[@]} ${adapter_tests[@]}" )
+dest=( "${array1[@]} ${basic_api_tests[@]} ${parallel_tests[@]} ${concurrent_tests[@]} ${coroutine_tests[@]} ${factory_tests[@]} ${apis_tests[@]} ${adapter_tests[@]} ${hybrid_tests[@]} ${framework_tests[@]}" )
 
 
 if echo $runtime_os | grep -q "windows";
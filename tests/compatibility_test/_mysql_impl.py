@@ -2,7 +2,7 @@ from multiprocessing.managers import NamespaceProxy
 from mysql.connector.connection import MySQLConnection
 from mysql.connector.pooling import MySQLConnectionPool, PooledMySQLConnection
 from mysql.connector.errors import PoolError
-from mysql.connector.cursor import MySQLCursor
+from mysql.connector.cursor import MySQLCursor, MySQLCursorPrepared
 from typing import Any, Tuple, Dict, Union
 import mysql.connector
 import time
@@ -125,34 +125,43 @@ class MySQLOperator(DatabaseOperator):
         return connection.cursor(buffered=True)
 
 
+    def _prepare_statement(self, operator: str) -> MySQLCursorPrepared:
+        # Prepare the statement in MySQL server once, and the cache reuses it by the SQL.
+        return self._connection.cursor(prepared=True)
+
+
     @property
     def column_names(self) -> MySQLCursor:
-        return self._cursor.column_names
+        return self._result_cursor.column_names
 
 
     @property
     def row_count(self) -> MySQLCursor:
-        return self._cursor.rowcount
+        return self._result_cursor.rowcount
 
 
     def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> MySQLCursor:
-        return self._cursor.execute(operation=operator, params=params, multi=multi)
+        if multi is True:
+            # The prepared statement doesn't support multiple statements.
+            self._last_statement = self._cursor
+            return self._cursor.execute(operation=operator, params=params, multi=multi)
+        return self._statement(operator).execute(operation=operator, params=params or ())
 
 
     def execute_many(self, operator: Any, seq_params=None) -> MySQLCursor:
-        return self._cursor.executemany(operation=operator, seq_params=seq_params)
+        return self._statement(operator).executemany(operation=operator, seq_params=seq_params)
 
 
     def fetch_one(self) -> list:
-        return self._cursor.fetchone()
+        return self._result_cursor.fetchone()
 
 
     def fetch_many(self, size: int = None) -> list:
-        return self._cursor.fetchmany(size=size)
+        return self._result_cursor.fetchmany(size=size)
 
 
     def fetch_all(self) -> list:
-        return self._cursor.fetchall()
+        return self._result_cursor.fetchall()
 
 
     def reset(self) -> None:
@@ -0,0 +1,206 @@
+from multiprocessing import Process
+import threading
+import asyncio
+import pytest
+import time
+
+import gevent
+
+from multirunnable.framework.runnable.metrics import InMemoryExporter
+from multirunnable.api.contention import ContentionMonitor, LockContention
+from multirunnable.api.operator import LockOperator, SemaphoreOperator, BoundedSemaphoreOperator
+from multirunnable.api.decorator import RunWith, AsyncRunWith
+from multirunnable.adapter.lock import AsyncLock
+from multirunnable.mode import RunningMode, FeatureMode
+
+from ..._examples_with_synchronization import instantiate_lock, instantiate_semaphore, instantiate_bounded_semaphore
+
+
+_Workers: int = 4
+_Hold_Time: float = 0.05
+
+
+@pytest.fixture(scope="function")
+def monitor():
+    ContentionMonitor.reset()
+    ContentionMonitor.enable(sample_rate=1)
+    yield ContentionMonitor
+    ContentionMonitor.disable()
+    ContentionMonitor.reset()
+
+
+def _hold_lock() -> None:
+    with LockOperator():
+        time.sleep(_Hold_Time)
+
+
+@RunWith.Lock
+def _locked_target() -> int:
+    time.sleep(_Hold_Time)
+    return 1
+
+
+@AsyncRunWith.Lock
+async def _async_locked_target() -> int:
+    await asyncio.sleep(_Hold_Time)
+    return 1
+
+
+def _semaphore_in_process() -> None:
+    __semaphore = SemaphoreOperator()
+    assert __semaphore.acquire(blocking=True, timeout=None) is True
+    __semaphore.release()
+
+
+
+class TestContentionMonitor:
+
+    def test_cannot_instantiate(self):
+        with pytest.raises(RuntimeError):
+            ContentionMonitor()
+
+
+    def test_invalid_sample_rate(self):
+        with pytest.raises(ValueError):
+            ContentionMonitor.enable(sample_rate=0)
+
+
+    def test_disabled(self):
+        ContentionMonitor.reset()
+        instantiate_lock(RunningMode.Concurrent)
+        _hold_lock()
+        assert ContentionMonitor.is_enabled() is False
+        assert ContentionMonitor.report() == [], "It should not record anything if it's disabled."
+
+
+    def test_lock_operator(self, monitor):
+        instantiate_lock(RunningMode.Concurrent)
+        _threads = [threading.Thread(target=_hold_lock) for _ in range(_Workers)]
+        for _thread in _threads:
+            _thread.start()
+        for _thread in _threads:
+            _thread.join()
+
+        _report = monitor.report()
+        assert len(_report) == 1 and _report[0]["name"] == "Lock"
+        _contention = _report[0]
+        assert _contention["acquisitions"] == _Workers and _contention["sampled"] == _Workers, \
+            "It should measure all the acquisitions if the sample rate is 1."
+        assert _contention["hold"]["count"] == _Workers and _contention["hold"]["max"] >= _Hold_Time
+        assert _contention["wait"]["max"] >= _Hold_Time * (_Workers - 1) * 0.9, "The last worker should wait for all the others."
+        assert _contention["estimated_wait_time"] > 0
+        assert _contention["holding"] == [], "No worker holds the lock after they're done."
+        assert len(_contention["top_holders"]) == 3 and all(_holder["acquisitions"] == 1 for _holder in _contention["top_holders"])
+
+
+    def test_sampling(self, monitor):
+        monitor.enable(sample_rate=0.5)
+        instantiate_lock(RunningMode.Concurrent)
+        _lock = LockOperator()
+        for _ in range(1000):
+            _lock.acquire()
+            _lock.release()
+
+        _contention = monitor.report()[0]
+        assert _contention["acquisitions"] == 1000, "It should count all the acquisitions."
+        assert 0 < _contention["sampled"] < 1000, "It should only measure the sampled acquisitions."
+
+
+    def test_run_with(self, monitor):
+        instantiate_lock(RunningMode.GreenThread)
+        gevent.joinall([gevent.spawn(_locked_target) for _ in range(_Workers)])
+
+        _report = monitor.report()
+        assert _report[0]["name"] == f"Lock:{_locked_target.__qualname__}", "It should be named by the decorated function."
+        assert _report[0]["acquisitions"] == _Workers
+        assert all(_holder["holder"].split(":")[1].startswith("Greenlet") for _holder in _report[0]["top_holders"]), \
+            "The holder should be the green thread."
+
+
+    def test_async_run_with(self, monitor):
+
+        async def __run():
+            AsyncLock(mode=FeatureMode.Asynchronous, init=True, event_loop=asyncio.get_running_loop())
+            await asyncio.gather(*[_async_locked_target() for _ in range(_Workers)])
+
+        asyncio.run(__run())
+        _contention = monitor.report()[0]
+        assert _contention["name"] == f"Lock:{_async_locked_target.__qualname__}" and _contention["acquisitions"] == _Workers
+        assert _contention["wait"]["max"] >= _Hold_Time * (_Workers - 1) * 0.9
+        assert all(_holder["holder"].split(":")[1].startswith("Task") for _holder in _contention["top_holders"]), \
+            "The holder should be the asyncio task."
+
+
+    def test_report_top(self, monitor):
+        for _index, _wait_time in enumerate([0.01, 0.03, 0.02]):
+            _contention = monitor.get_contention(f"lock-{_index}")
+            _contention.record_acquisition(time.perf_counter() - _wait_time)
+
+        _report = monitor.report(top=2)
+        assert [_contention["name"] for _contention in _report] == ["lock-1", "lock-2"], \
+            "It should be the most contended locks."
+
+
+    def test_export(self, monitor):
+        instantiate_lock(RunningMode.Concurrent)
+        _hold_lock()
+        _exporter = InMemoryExporter()
+        _report = monitor.export(_exporter)
+        assert _exporter.metrics["contention"] == {"locks": _report}
+
+
+
+class TestLockContention:
+
+    def test_count_acquisitions(self):
+        _contention = LockContention(name="test")
+
+        def _acquire():
+            for _ in range(1000):
+                _contention.record_acquisition()
+
+        _threads = [threading.Thread(target=_acquire) for _ in range(_Workers)]
+        for _thread in _threads:
+            _thread.start()
+        for _thread in _threads:
+            _thread.join()
+        assert _contention.snapshot()["acquisitions"] == _Workers * 1000, "It shouldn't lose any acquisition."
+
+
+    def test_release_by_other_worker(self):
+        _contention = LockContention(name="test")
+        _contention.record_wait(time.perf_counter())
+        _thread = threading.Thread(target=_contention.record_hold)
+        _thread.start()
+        _thread.join()
+
+        _snapshot = _contention.snapshot()
+        assert _snapshot["hold"]["count"] == 0, "It should not measure the hold time of the other worker."
+        assert len(_snapshot["holding"]) == 1
+
+
+
+class TestSemaphoreOperatorArguments:
+
+    @pytest.mark.parametrize("mode", [RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread])
+    def test_acquire_and_release(self, mode):
+        instantiate_semaphore(mode)
+        _semaphore = SemaphoreOperator()
+        assert _semaphore.acquire(blocking=True, timeout=None) is True
+        assert _semaphore.acquire(True, 1) is True
+        _semaphore.release(n=2)
+
+
+    def test_acquire_in_process(self):
+        instantiate_semaphore(RunningMode.Parallel)
+        _process = Process(target=_semaphore_in_process)
+        _process.start()
+        _process.join()
+        assert _process.exitcode == 0, "It should work with the semaphore of multiprocessing."
+
+
+    def test_bounded_semaphore(self, monitor):
+        instantiate_bounded_semaphore(RunningMode.Concurrent)
+        with BoundedSemaphoreOperator():
+            pass
+        assert monitor.report()[0]["name"] == "BoundedSemaphore" and monitor.report()[0]["hold"]["count"] == 1
@@ -10,8 +10,9 @@ import re
 
 from multirunnable.coroutine.strategy import AsynchronousStrategy
 from multirunnable.parallel.share import Global_Manager
-from multirunnable.api.decorator import RunWith, AsyncRunWith
-from multirunnable.factory.lock import LockFactory, SemaphoreFactory, BoundedSemaphoreFactory
+from multirunnable.api.decorator import RunWith, AsyncRunWith, retry
+from multirunnable.factory.lock import LockFactory, SemaphoreFactory, BoundedSemaphoreFactory, ReadWriteLockFactory, ShardedLockFactory
+from multirunnable.mode import FeatureMode
 from multirunnable.mode import RunningMode
 from multirunnable import PYTHON_MAJOR_VERSION, PYTHON_MINOR_VERSION
 
@@ -199,6 +200,41 @@ class TestRetryMechanism:
         assert _process_flag.Error_Handling_Flag_Counter == _Retry_Time, f"The error handling flag should be '{_Retry_Time}'"
 
 
+    def test_retry_decorating_at_function_without_source_code(self):
+        _errors = []
+        _namespace = {"retry": retry, "_Retry_Time": _Retry_Time, "_errors": _errors}
+        _code = "@retry.function(timeout=_Retry_Time)\n" \
+                "def target_function():\n" \
+                "    raise ValueError('Testing retry without source code')\n" \
+                "\n" \
+                "@target_function.error_handling\n" \
+                "def _error_function(e):\n" \
+                "    _errors.append(e)\n"
+        exec(compile(_code, "<no source code>", "exec"), _namespace)
+
+        _caller = eval("lambda: target_function()", _namespace)
+        assert isinstance(_caller(), TimeoutError), "It should return a TimeoutError after retrying the target function."
+        assert len(_errors) == _Retry_Time, "It should call the handling function which be registered to it without its source code."
+
+
+    def test_retry_handling_functions_of_each_target(self):
+
+        def _generate_target(return_value: str):
+            @retry.function
+            def target_function():
+                return return_value
+
+            @target_function.done_handling
+            def _done_function(result):
+                return f"{result}_done"
+
+            return target_function
+
+        _target_a, _target_b = _generate_target("a"), _generate_target("b")
+        assert _target_a.__qualname__ == _target_b.__qualname__, "Both of target functions should have the same qualified name."
+        assert (_target_a(), _target_b()) == ("a_done", "b_done"), "The handling functions should be bound to each target function."
+
+
 
 class TestAsyncRetryMechanism:
 
@@ -662,3 +698,85 @@ class TestAsyncFeaturesDecorator:
     def _chk_done_timestamp_by_semaphore(_done_timestamp: dict):
         SemaphoreTestSpec._chk_done_timestamp(_done_timestamp=_done_timestamp)
 
+
+
+def _run_threads(target: Callable, args_list: list) -> float:
+    _threads = [threading.Thread(target=target, args=_args) for _args in args_list]
+    _start = time.time()
+    for _thread in _threads:
+        _thread.start()
+    for _thread in _threads:
+        _thread.join()
+    return time.time() - _start
+
+
+
+class TestReadWriteAndShardedLockDecorator:
+
+    def test_read_lock_and_write_lock_decorator(self):
+        _factory = ReadWriteLockFactory()
+        _factory.feature_mode = FeatureMode.Concurrent
+        _factory.globalize_instance(_factory.get_instance())
+
+        @RunWith.Read_Lock
+        def _read():
+            time.sleep(_Sleep_Time)
+
+        @RunWith.Write_Lock
+        def _write():
+            time.sleep(_Sleep_Time)
+
+        assert _run_threads(_read, [()] * 4) < _Sleep_Time * 2, "The readers should run at the same time."
+        assert _run_threads(_write, [()] * 4) >= _Sleep_Time * 4, "The writers should run one by one."
+
+
+    def test_sharded_lock_decorator(self):
+        _factory = ShardedLockFactory(shards=8)
+        _factory.feature_mode = FeatureMode.Concurrent
+        _factory.globalize_instance(_factory.get_instance())
+
+        @RunWith.Sharded_Lock(key=lambda _key: _key)
+        def _target(_key: int):
+            time.sleep(_Sleep_Time)
+
+        assert _run_threads(_target, [(_key,) for _key in range(4)]) < _Sleep_Time * 2, \
+            "The functions with the different keys should run at the same time."
+        assert _run_threads(_target, [(1,)] * 4) >= _Sleep_Time * 4, "The functions with the same key should run one by one."
+
+
+    def test_async_decorators(self):
+        _rwlock_factory = ReadWriteLockFactory()
+        _rwlock_factory.feature_mode = FeatureMode.Asynchronous
+        _sharded_lock_factory = ShardedLockFactory(shards=8)
+        _sharded_lock_factory.feature_mode = FeatureMode.Asynchronous
+
+        @AsyncRunWith.Read_Lock
+        async def _read():
+            await asyncio.sleep(_Sleep_Time)
+
+        @AsyncRunWith.Write_Lock
+        async def _write():
+            await asyncio.sleep(_Sleep_Time)
+
+        @AsyncRunWith.Sharded_Lock(key=lambda _key: _key)
+        async def _target(_key: int):
+            await asyncio.sleep(_Sleep_Time)
+
+        async def _measure(*coroutines) -> float:
+            _start = time.time()
+            await asyncio.gather(*coroutines)
+            return time.time() - _start
+
+        async def _run():
+            _rwlock_factory.globalize_instance(_rwlock_factory.get_instance())
+            _sharded_lock_factory.globalize_instance(_sharded_lock_factory.get_instance())
+            return (
+                await _measure(*[_read() for _ in range(4)]),
+                await _measure(*[_write() for _ in range(4)]),
+                await _measure(*[_target(_key) for _key in range(4)]),
+                await _measure(*[_target(1) for _ in range(4)]),
+            )
+
+        _read_time, _write_time, _shards_time, _same_shard_time = asyncio.run(_run())
+        assert _read_time < _Sleep_Time * 2 and _shards_time < _Sleep_Time * 2, "They should run at the same time."
+        assert _write_time >= _Sleep_Time * 4 and _same_shard_time >= _Sleep_Time * 4, "They should run one by one."
@@ -1,15 +1,32 @@
+from multiprocessing import Process, Value
+from queue import Full
+import threading
+import asyncio
 import pytest
+import time
 import sys
 
+import gevent
+
 from multirunnable.factory.communication import EventFactory, ConditionFactory
-from multirunnable.factory.lock import LockFactory, SemaphoreFactory, BoundedSemaphoreFactory
+from multirunnable.factory.lock import LockFactory, SemaphoreFactory, BoundedSemaphoreFactory, ReadWriteLockFactory, ShardedLockFactory
+from multirunnable.api.contention import ContentionMonitor
 from multirunnable.api.operator import (
     LockOperator, RLockOperator,
     SemaphoreOperator, BoundedSemaphoreOperator,
     EventOperator, ConditionOperator,
     LockAsyncOperator,
     SemaphoreAsyncOperator, BoundedSemaphoreAsyncOperator,
-    EventAsyncOperator, ConditionAsyncOperator)
+    EventAsyncOperator, ConditionAsyncOperator,
+    ReadWriteLockOperator, ShardedLockOperator,
+    ReadWriteLockAsyncOperator, ShardedLockAsyncOperator,
+    QueueOperator, QueueAsyncOperator)
+from multirunnable.framework.runnable.queue import QueueBatch
+from multirunnable.parallel.queue import Queue as Process_Queue, SimpleQueue as Process_SimpleQueue
+from multirunnable.concurrent.queue import Thread_Queue, Thread_SimpleQueue, Thread_LifoQueue
+from multirunnable.coroutine.queue import Greenlet_Queue, Async_Queue
+from multirunnable.api.manage import Globalize
+from multirunnable.exceptions import QueuePutTimeoutError
 from multirunnable.mode import RunningMode, FeatureMode
 
 from ...test_config import Under_Test_RunningModes, Semaphore_Value
@@ -421,3 +438,360 @@ class TestConditionAdapterOperator(ConditionTestSpec):
         ConditionTestSpec._async_feature_testing_by_pykeyword_with(_lock=_condition_opt, running_function=MapByStrategy.CoroutineWithAsynchronous, factory=ConditionFactory())
 
 
+
+_Hold_Time: float = 0.05
+
+
+class _Occupancy:
+    """
+    Record how many workers are in the critical section at most. The counters are in
+    the shared memory so that it also works with processes.
+    """
+
+    def __init__(self):
+        self.inside = Value("i", 0)
+        self.max_inside = Value("i", 0)
+        self.writer_with_others = Value("i", 0)
+
+
+    def enter(self, writer: bool = False) -> None:
+        with self.inside.get_lock():
+            self.inside.value += 1
+            self.max_inside.value = max(self.max_inside.value, self.inside.value)
+            if writer and self.inside.value > 1:
+                self.writer_with_others.value += 1
+
+
+    def exit(self) -> None:
+        with self.inside.get_lock():
+            self.inside.value -= 1
+
+
+
+def _read_with_occupancy(occupancy: _Occupancy) -> None:
+    with ReadWriteLockOperator().reading():
+        occupancy.enter()
+        time.sleep(_Hold_Time)
+        occupancy.exit()
+
+
+def _write_with_occupancy(occupancy: _Occupancy) -> None:
+    with ReadWriteLockOperator().writing():
+        occupancy.enter(writer=True)
+        time.sleep(_Hold_Time)
+        occupancy.exit()
+
+
+def _lock_shard_with_occupancy(occupancy: _Occupancy, key: int) -> None:
+    with ShardedLockOperator().locking(key):
+        occupancy.enter()
+        time.sleep(_Hold_Time)
+        occupancy.exit()
+
+
+def _run_workers(mode: FeatureMode, targets: list) -> None:
+    if mode is FeatureMode.GreenThread:
+        # time.sleep blocks green threads, so run them one by one with a yield at the start.
+        gevent.joinall([gevent.spawn(_target, *_args) for _target, _args in targets])
+        return
+    _worker_cls = Process if mode is FeatureMode.Parallel else threading.Thread
+    _workers = [_worker_cls(target=_target, args=_args) for _target, _args in targets]
+    for _worker in _workers:
+        _worker.start()
+    for _worker in _workers:
+        _worker.join()
+
+
+
+class TestReadWriteLockOperator:
+
+    @pytest.mark.parametrize("mode", [FeatureMode.Parallel, FeatureMode.Concurrent])
+    def test_readers_at_the_same_time(self, mode):
+        _factory = ReadWriteLockFactory()
+        _factory.feature_mode = mode
+        _factory.globalize_instance(_factory.get_instance())
+
+        _occupancy = _Occupancy()
+        _run_workers(mode, [(_read_with_occupancy, (_occupancy,)) for _ in range(4)])
+        assert _occupancy.max_inside.value > 1, "The readers should hold the lock at the same time."
+
+
+    @pytest.mark.parametrize("mode", [FeatureMode.Parallel, FeatureMode.Concurrent])
+    def test_writer_exclusively(self, mode):
+        _factory = ReadWriteLockFactory()
+        _factory.feature_mode = mode
+        _factory.globalize_instance(_factory.get_instance())
+
+        _occupancy = _Occupancy()
+        _targets = [(_read_with_occupancy, (_occupancy,)), (_write_with_occupancy, (_occupancy,))] * 3
+        _run_workers(mode, _targets)
+        assert _occupancy.writer_with_others.value == 0, "No one should hold the lock with the writer."
+
+
+    def test_writer_is_not_starved(self):
+        _factory = ReadWriteLockFactory()
+        _factory.feature_mode = FeatureMode.GreenThread
+        _factory.globalize_instance(_factory.get_instance())
+
+        _order = []
+        _rwlock = ReadWriteLockOperator()
+
+        def _read(index: int):
+            with _rwlock.reading():
+                _order.append(f"read-{index}")
+                gevent.sleep(_Hold_Time)
+
+        def _write():
+            with _rwlock.writing():
+                _order.append("write")
+                gevent.sleep(_Hold_Time)
+
+        gevent.joinall([gevent.spawn(_read, 0), gevent.spawn(_write), gevent.spawn(_read, 1)])
+        assert _order == ["read-0", "write", "read-1"], "The reader which comes after the waiting writer should wait for it."
+
+
+    def test_contention(self):
+        _factory = ReadWriteLockFactory()
+        _factory.feature_mode = FeatureMode.Concurrent
+        _factory.globalize_instance(_factory.get_instance())
+
+        ContentionMonitor.reset()
+        ContentionMonitor.enable(sample_rate=1)
+        try:
+            _rwlock = ReadWriteLockOperator(name="cache")
+            with _rwlock.reading():
+                pass
+            with _rwlock:
+                pass
+            _names = {_contention["name"]: _contention["acquisitions"] for _contention in ContentionMonitor.report()}
+        finally:
+            ContentionMonitor.disable()
+            ContentionMonitor.reset()
+        assert _names == {"ReadLock:cache": 1, "WriteLock:cache": 1}, "It should record the readers and writers separately."
+
+
+    def test_feature_in_asynchronous_tasks(self):
+        _factory = ReadWriteLockFactory()
+        _factory.feature_mode = FeatureMode.Asynchronous
+
+        async def _run():
+            _factory.globalize_instance(_factory.get_instance())
+            _rwlock = ReadWriteLockAsyncOperator()
+            _readers = []
+
+            async def _read():
+                async with _rwlock.reading():
+                    _readers.append(_rwlock._feature_instance.readers)
+                    await asyncio.sleep(_Hold_Time)
+
+            async def _write():
+                async with _rwlock:
+                    _readers.append(_rwlock._feature_instance.readers)
+                    await asyncio.sleep(_Hold_Time)
+
+            await asyncio.gather(_read(), _read(), _write())
+            return _readers
+
+        assert asyncio.run(_run()) == [1, 2, 0], "The readers should hold it at the same time but the writer holds it alone."
+
+
+
+class TestShardedLockOperator:
+
+    def test_same_key_same_lock(self):
+        _factory = ShardedLockFactory(shards=8)
+        _factory.feature_mode = FeatureMode.Concurrent
+        _sharded_lock = _factory.get_instance()
+
+        assert _sharded_lock.shard("key") is _sharded_lock.shard("key") and _sharded_lock.index(10) == 2
+        assert {_sharded_lock.index(f"key-{_i}") for _i in range(100)} == set(range(8)), "The keys should be spread over all the locks."
+
+
+    @pytest.mark.parametrize("mode", [FeatureMode.Parallel, FeatureMode.Concurrent])
+    def test_different_keys_at_the_same_time(self, mode):
+        _factory = ShardedLockFactory(shards=8)
+        _factory.feature_mode = mode
+        _factory.globalize_instance(_factory.get_instance())
+
+        _occupancy = _Occupancy()
+        _run_workers(mode, [(_lock_shard_with_occupancy, (_occupancy, _key)) for _key in range(4)])
+        assert _occupancy.max_inside.value > 1, "The workers with the different keys should run at the same time."
+
+        _occupancy = _Occupancy()
+        _run_workers(mode, [(_lock_shard_with_occupancy, (_occupancy, 3)) for _ in range(4)])
+        assert _occupancy.max_inside.value == 1, "The workers with the same key should run one by one."
+
+
+    def test_contention_by_shard(self):
+        _factory = ShardedLockFactory(shards=8)
+        _factory.feature_mode = FeatureMode.Concurrent
+        _factory.globalize_instance(_factory.get_instance())
+
+        ContentionMonitor.reset()
+        ContentionMonitor.enable(sample_rate=1)
+        try:
+            _sharded_lock = ShardedLockOperator()
+            for _key in (1, 1, 2):
+                with _sharded_lock.locking(_key):
+                    pass
+            _names = {_contention["name"]: _contention["acquisitions"] for _contention in ContentionMonitor.report()}
+        finally:
+            ContentionMonitor.disable()
+            ContentionMonitor.reset()
+        assert _names == {"ShardedLock[1]": 2, "ShardedLock[2]": 1}, "It should record each shard as a lock."
+
+
+    def test_feature_in_asynchronous_tasks(self):
+        _factory = ShardedLockFactory(shards=8)
+        _factory.feature_mode = FeatureMode.Asynchronous
+
+        async def _run(keys: list) -> float:
+            _factory.globalize_instance(_factory.get_instance())
+            _sharded_lock = ShardedLockAsyncOperator()
+
+            async def _lock(key: int):
+                async with _sharded_lock.locking(key):
+                    await asyncio.sleep(_Hold_Time)
+
+            _start = time.time()
+            await asyncio.gather(*[_lock(_key) for _key in keys])
+            return time.time() - _start
+
+        assert asyncio.run(_run([0, 1, 2, 3])) < _Hold_Time * 2, "The tasks with the different keys should run at the same time."
+        assert asyncio.run(_run([1, 1, 1, 1])) >= _Hold_Time * 4, "The tasks with the same key should run one by one."
+
+
+
+_Queue_Types = [Process_Queue, Process_SimpleQueue, Thread_Queue, Thread_SimpleQueue, Greenlet_Queue]
+
+
+def _put_many_in_process(queue, values: list, chunk_size: int) -> None:
+    QueueOperator.put_many(queue, values, chunk_size=chunk_size)
+
+
+
+class TestQueueOperator:
+
+    @pytest.mark.parametrize("queue_type", _Queue_Types)
+    @pytest.mark.parametrize("chunk_size", [None, 3])
+    def test_put_many_and_get_many(self, queue_type, chunk_size):
+        _queue = queue_type()
+        assert QueueOperator.put_many(_queue, (_value for _value in range(10)), chunk_size=chunk_size) == 10
+
+        _values = []
+        while len(_values) < 10:
+            _batch = QueueOperator.get_many(_queue, max_items=4, timeout=1)
+            assert 0 < len(_batch) <= 4, "It should get the values at most the max amount."
+            _values.extend(_batch)
+        assert sorted(_values) == list(range(10)), "It should get all the values without losing or duplicating."
+        assert QueueOperator.get_many(_queue, max_items=4, timeout=0.1) == [], "It should be an empty list if it's timeout."
+
+
+    def test_put_many_one_by_one(self):
+        _queue = Thread_LifoQueue()
+        QueueOperator.put_many(_queue, range(5))
+        assert _queue.qsize() == 5 and _queue.get() == 4, "Each value should be one item of the queue."
+
+        _bounded_queue = Thread_Queue(maxsize=3)
+        _thread = threading.Thread(target=QueueOperator.put_many, args=(_bounded_queue, range(5)))
+        _thread.start()
+        assert [_bounded_queue.get(timeout=1) for _ in range(5)] == list(range(5)), "It should wait if the queue is full."
+        _thread.join()
+
+
+    def test_put_many_timeout(self):
+        _queue = Thread_Queue(maxsize=3)
+        with pytest.raises(QueuePutTimeoutError) as _error:
+            QueueOperator.put_many(_queue, range(5), timeout=0.05)
+        assert isinstance(_error.value, Full) and _error.value.amount == 3, "It should report the amount of values which have been put."
+
+        async def _run():
+            _async_queue = Async_Queue(maxsize=2)
+            with pytest.raises(QueuePutTimeoutError) as _async_error:
+                await QueueAsyncOperator.put_many(_async_queue, range(5), timeout=0.05)
+            return _async_error.value.amount
+
+        assert asyncio.run(_run()) == 2
+
+
+    def test_put_many_by_chunks(self):
+        _queue = Thread_Queue()
+        QueueOperator.put_many(_queue, range(7), chunk_size=3)
+        assert _queue.qsize() == 3
+        _item = _queue.get()
+        assert isinstance(_item, QueueBatch) and _item == [0, 1, 2]
+
+
+    def test_get_many_puts_back_the_rest(self):
+        _queue = Thread_Queue()
+        QueueOperator.put_many(_queue, range(5), chunk_size=5)
+        QueueOperator.put_many(_queue, [5])
+        assert QueueOperator.get_many(_queue, max_items=2) == [0, 1]
+        assert QueueOperator.get_many(_queue, max_items=10) == [2, 3, 4, 5], "The rest values of the chunk should be kept in the front of queue."
+
+        QueueOperator.put_many(_queue, range(6), chunk_size=2)
+        assert QueueOperator.get_many(_queue, max_items=3) == [0, 1, 2]
+        assert QueueOperator.get_many(_queue, max_items=10) == [3, 4, 5], "It should only split the last chunk it gets."
+
+
+    def test_get_many_with_full_queue(self):
+
+        class _RefilledQueue(Thread_Queue):
+            # Another producer fills the free slot as soon as a value is got.
+            def get(self, block=True, timeout=None):
+                _item = super().get(block=block, timeout=timeout)
+                self.put_nowait("next")
+                return _item
+
+        _queue = _RefilledQueue(maxsize=1)
+        QueueOperator.put_many(_queue, range(5), chunk_size=5)
+        _getting = threading.Thread(target=lambda: _values.extend(QueueOperator.get_many(_queue, max_items=2)), daemon=True)
+        _values = []
+        _getting.start()
+        _getting.join(timeout=1)
+
+        assert _getting.is_alive() is False, "It should not block at putting the rest values back to the full queue."
+        assert _values == [0, 1, 2, 3, 4], "It should return the rest values instead of losing them if the queue is full."
+        assert _queue.get_nowait() == "next"
+
+
+    def test_get_many_with_name(self):
+        Globalize.queue(name="test_get_many", queue=Thread_Queue())
+        QueueOperator.put_many("test_get_many", ["a", "b"])
+        assert QueueOperator.get_many("test_get_many", max_items=5) == ["a", "b"]
+
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            QueueOperator.put_many(Thread_Queue(), range(3), chunk_size=0)
+        with pytest.raises(ValueError):
+            QueueOperator.get_many(Thread_Queue(), max_items=0)
+
+
+    def test_put_many_in_process(self):
+        _queue = Process_Queue()
+        _process = Process(target=_put_many_in_process, args=(_queue, list(range(100)), 10))
+        _process.start()
+
+        _values = []
+        while len(_values) < 100:
+            _values.extend(QueueOperator.get_many(_queue, max_items=30, timeout=5))
+        _process.join()
+        assert sorted(_values) == list(range(100))
+
+
+    def test_async_put_many_and_get_many(self):
+
+        async def _run():
+            _queue = Async_Queue(maxsize=2)
+            _producer = asyncio.create_task(QueueAsyncOperator.put_many(_queue, range(10), chunk_size=3))
+            _values = []
+            while len(_values) < 10:
+                _values.extend(await QueueAsyncOperator.get_many(_queue, max_items=4, timeout=1))
+            assert await _producer == 10
+            _timeout_values = await QueueAsyncOperator.get_many(_queue, max_items=4, timeout=0.1)
+            return _values, _timeout_values
+
+        _values, _timeout_values = asyncio.run(_run())
+        assert sorted(_values) == list(range(10)), "It should get all the values without losing or duplicating."
+        assert _timeout_values == []
@@ -0,0 +1,185 @@
+from itertools import islice
+import multiprocessing
+import asyncio
+import gevent
+import pytest
+import time
+
+from multirunnable.api.decorator import retry, async_retry
+from multirunnable.api.retry_policy import (
+    RetryPolicy, RetryBudget, ConstantBackoff, ExponentialBackoff, DecorrelatedJitterBackoff
+)
+from multirunnable import set_mode, RunningMode
+
+
+_Retry_Time: int = 4
+
+
+def _acquire_budget(budget: RetryBudget, times: int, acquired) -> None:
+    acquired.put(sum(budget.acquire() for _ in range(times)))
+
+
+def _generate_retry_target(policy: RetryPolicy, exception: Exception, errors: list):
+
+    @retry.function(timeout=_Retry_Time, policy=policy)
+    def _target():
+        raise exception
+
+    @_target.error_handling
+    def _error_handling(e: Exception):
+        errors.append(e)
+
+    return _target
+
+
+
+class TestBackoff:
+
+    def test_constant_backoff(self):
+        assert list(islice(ConstantBackoff(base_delay=0.5).delays(), 3)) == [0.5, 0.5, 0.5], "It should always wait the same delay."
+
+
+    def test_exponential_backoff(self):
+        _backoff = ExponentialBackoff(base_delay=0.1, max_delay=0.5, multiplier=2, jitter=False)
+        assert list(islice(_backoff.delays(), 5)) == pytest.approx([0.1, 0.2, 0.4, 0.5, 0.5]), "The delay should grow exponentially up to the max delay."
+
+        _backoff = ExponentialBackoff(base_delay=0.1, max_delay=0.5, multiplier=2, jitter=True)
+        for _delay, _upper in zip(_backoff.delays(), [0.1, 0.2, 0.4, 0.5, 0.5]):
+            assert 0 <= _delay <= _upper, "The delay with full jitter should be between 0 and the exponential delay."
+
+
+    def test_decorrelated_jitter_backoff(self):
+        _backoff = DecorrelatedJitterBackoff(base_delay=0.1, max_delay=1)
+        for _delay in islice(_backoff.delays(), 20):
+            assert 0.1 <= _delay <= 1, "The delay should be between the base delay and the max delay."
+
+
+    def test_invalid_option(self):
+        with pytest.raises(ValueError):
+            ConstantBackoff(base_delay=-1)
+        with pytest.raises(ValueError):
+            ExponentialBackoff(base_delay=1, max_delay=0.5)
+        with pytest.raises(ValueError):
+            ExponentialBackoff(multiplier=0.5)
+
+
+
+class TestRetryBudget:
+
+    def test_acquire(self):
+        _budget = RetryBudget(max_retries=2)
+        assert [_budget.acquire() for _ in range(3)] == [True, True, False], "It should give up after using all the tokens."
+
+
+    def test_refill(self):
+        _budget = RetryBudget(max_retries=1, refill_per_second=50)
+        assert _budget.acquire() is True and _budget.acquire() is False, "It should use the only token."
+        time.sleep(0.05)
+        assert _budget.acquire() is True, "It should refill the token over time."
+
+
+    def test_shared_between_processes(self):
+        _budget = RetryBudget(max_retries=4, shared=True)
+        _acquired = multiprocessing.Queue()
+        _processes = [multiprocessing.Process(target=_acquire_budget, args=(_budget, 3, _acquired)) for _ in range(2)]
+        for _process in _processes:
+            _process.start()
+        for _process in _processes:
+            _process.join()
+
+        assert _acquired.get() + _acquired.get() == 4, "The processes should share the tokens of budget."
+        assert _budget.available == 0, "It should use all the tokens in the parent process too."
+
+
+    def test_shared_by_running_mode(self):
+        set_mode(RunningMode.Parallel)
+        assert RetryBudget(max_retries=1).shared is True, "It should be shared between processes in Parallel mode."
+        set_mode(RunningMode.Concurrent)
+        assert RetryBudget(max_retries=1).shared is False, "It should be per-process in Concurrent mode."
+
+
+
+class TestRetryPolicy:
+
+    def test_retry_with_backoff(self):
+        _errors = []
+        _target = _generate_retry_target(RetryPolicy(backoff=ConstantBackoff(base_delay=0.05)), ValueError("retry"), _errors)
+
+        _start = time.monotonic()
+        assert isinstance(_target(), TimeoutError), "It should return a TimeoutError after retrying the target function."
+        assert time.monotonic() - _start >= 0.05 * (_Retry_Time - 1), "It should wait before each retry."
+        assert len(_errors) == _Retry_Time, f"It should run the target function '{_Retry_Time}' times."
+
+
+    def test_giveup_on_exception(self):
+        _errors = []
+        _exception = KeyError("give up")
+        _target = _generate_retry_target(RetryPolicy(retry_on=Exception, giveup_on=KeyError), _exception, _errors)
+        assert _target() is _exception, "It should return the exception directly if it gives up."
+        assert len(_errors) == 1, "It should not retry for the exception which gives up."
+
+        _errors.clear()
+        _target = _generate_retry_target(RetryPolicy(retry_on=ValueError), _exception, _errors)
+        assert _target() is _exception and len(_errors) == 1, "It should only retry for the exception in option *retry_on*."
+
+
+    def test_max_elapsed_time(self):
+        _errors = []
+        _policy = RetryPolicy(backoff=ConstantBackoff(base_delay=0.2), max_elapsed_time=0.3)
+        _target = _generate_retry_target(_policy, ValueError("retry"), _errors)
+        assert isinstance(_target(), ValueError), "It should give up if the next retry is over the max elapsed time."
+        assert len(_errors) == 2, "It should only retry until the max elapsed time."
+
+
+    def test_shared_budget(self):
+        _errors = []
+        _policy = RetryPolicy(budget=RetryBudget(max_retries=2))
+        _targets = [_generate_retry_target(_policy, ValueError("retry"), _errors) for _ in range(2)]
+        for _target in _targets:
+            _target()
+        assert len(_errors) == 2 + 2, "All the targets should share the retry budget."
+
+
+    def test_invalid_policy(self):
+        with pytest.raises(TypeError):
+            retry.function(lambda: None, policy=1)
+        with pytest.raises(ValueError):
+            RetryPolicy(max_elapsed_time=0)
+
+
+    def test_retry_in_green_thread(self):
+        _errors = []
+        _target = _generate_retry_target(RetryPolicy(backoff=ConstantBackoff(base_delay=0.1)), ValueError("retry"), _errors)
+        _ticks = []
+
+        def _tick():
+            for _ in range(5):
+                _ticks.append(len(_errors))
+                gevent.sleep(0.02)
+
+        gevent.joinall([gevent.spawn(_target), gevent.spawn(_tick)])
+        assert len(_ticks) == 5 and _ticks[-1] < _Retry_Time, "The waiting of retry should not block other green threads."
+
+
+    def test_async_retry_with_backoff(self):
+        _errors, _ticks = [], []
+
+        @async_retry.function(timeout=_Retry_Time, policy=RetryPolicy(backoff=ConstantBackoff(base_delay=0.05)))
+        async def _target():
+            raise ValueError("retry")
+
+        @_target.error_handling
+        async def _error_handling(e: Exception):
+            _errors.append(e)
+
+        async def _tick():
+            for _ in range(5):
+                _ticks.append(len(_errors))
+                await asyncio.sleep(0.01)
+
+        async def _run():
+            return await asyncio.gather(_target(), _tick())
+
+        _result, _ = asyncio.run(_run())
+        assert isinstance(_result, TimeoutError) and len(_errors) == _Retry_Time, "It should retry the coroutine."
+        assert len(_ticks) == 5 and _ticks[-1] < _Retry_Time, "The waiting of retry should not block the event loop."
@@ -45,6 +45,10 @@ _Generate_Worker_Error_Msg = \
     "The instances which be created by method 'generate_worker' should be an instance of 'threading.Thread'."
 
 
+def _target_echo_function(value):
+    return value
+
+
 class TestThread(GeneralRunningTestSpec):
 
     def test_start_new_worker_with_function_with_no_argument(self, strategy: ThreadStrategy):
@@ -532,6 +536,30 @@ class TestThread(GeneralRunningTestSpec):
             assert isinstance(_r.exception, Exception) and "Testing result raising an exception" in str(_r.exception), "It should have an exception and error message is 'Testing result raising an exception'."
 
 
+    def test_get_result_with_max_size(self):
+        _strategy = ThreadStrategy(executors=Thread_Size)
+        _strategy.initialization()
+        _strategy.result_max_size = 2
+        for _index in range(Thread_Size + 2):
+            _strategy.close(_strategy.start_new_worker(target=_target_echo_function, args=(_index,)))
+
+        assert [_r.data for _r in _strategy.get_result()] == [Thread_Size, Thread_Size + 1], "It should only keep the last running results."
+        assert _strategy.get_result() == [], "It should drop the running results after getting them."
+        with pytest.raises(ValueError):
+            _strategy.result_max_size = -1
+
+
+    def test_get_result_of_each_strategy(self, strategy: ThreadStrategy):
+        strategy.reset_result()
+        _other_strategy = ThreadStrategy(executors=Thread_Size)
+        _other_strategy.initialization()
+        _other_strategy.close(_other_strategy.start_new_worker(target=_target_echo_function, args=(1,)))
+
+        assert strategy.get_result() == [], "It should not save the running results of other strategy instances."
+        assert [_r.data for _r in _other_strategy.get_result()] == [1], "It should save the running result in its own strategy instance."
+
+
+
     def _initial(self):
         reset_running_flags()
         initial_lock()
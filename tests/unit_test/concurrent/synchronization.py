@@ -1,7 +1,7 @@
 from threading import Lock, RLock, Semaphore, BoundedSemaphore, Event, Condition
 import pytest
 
-from multirunnable.framework.runnable.synchronization import PosixThreadLock, PosixThreadCommunication
+from multirunnable.framework.runnable.synchronization import PosixThreadLock, PosixThreadCommunication, ReadWriteLock, ShardedLock
 from multirunnable.concurrent.synchronization import ThreadLock, ThreadCommunication
 
 from ...test_config import Semaphore_Value
@@ -45,6 +45,22 @@ class TestThreadLock:
         assert isinstance(_bounded_semaphore, BoundedSemaphore) is True, "This type of instance should be 'threading.BoundedSemaphore'."
 
 
+    def test_get_read_write_lock(self, mr_lock: PosixThreadLock):
+        _rwlock = mr_lock.get_read_write_lock()
+        assert isinstance(_rwlock, ReadWriteLock) is True, "This type of instance should be 'ReadWriteLock'."
+        with _rwlock.reading():
+            assert _rwlock.readers == 1
+            assert _rwlock._resource.acquire(blocking=False) is False, "The writer should not get it when a reader holds it."
+        with _rwlock.writing():
+            assert _rwlock.readers == 0
+
+
+    def test_get_sharded_lock(self, mr_lock: PosixThreadLock):
+        _sharded_lock = mr_lock.get_sharded_lock(shards=4)
+        assert isinstance(_sharded_lock, ShardedLock) is True and len(_sharded_lock) == 4, "This type of instance should be 'ShardedLock' with 4 locks."
+        assert isinstance(_sharded_lock.shard("key"), type(Lock())) is True, "Each lock should be 'threading.Lock'."
+
+
 
 class TestThreadCommunication:
 
@@ -0,0 +1,144 @@
+from threading import Thread, current_thread
+import asyncio
+import pytest
+import time
+
+from multirunnable.coroutine.runtime import AsyncRuntime
+from multirunnable.coroutine.strategy import AsynchronousStrategy
+
+
+async def _get_running_loop() -> asyncio.AbstractEventLoop:
+    await asyncio.sleep(0)
+    return asyncio.get_event_loop()
+
+
+async def _raise_error() -> None:
+    raise ValueError("Testing runtime raising an exception")
+
+
+@pytest.fixture(scope="function")
+def async_runtime() -> AsyncRuntime:
+    _runtime = AsyncRuntime()
+    yield _runtime
+    _runtime.shutdown()
+
+
+
+class TestAsyncRuntime:
+
+    def test_start_lazily(self, async_runtime: AsyncRuntime):
+        assert async_runtime.is_running is False, "It should not start the event loop before it be needed."
+        _event_loop = async_runtime.run(_get_running_loop)
+        assert async_runtime.is_running is True, "The event loop should be running."
+        assert _event_loop is async_runtime.event_loop, "It should run the coroutine in its event loop."
+
+
+    def test_reuse_event_loop(self, async_runtime: AsyncRuntime):
+        _event_loops = [async_runtime.run(_get_running_loop) for _ in range(3)]
+        assert len(set(_event_loops)) == 1, "It should reuse the same event loop across calls."
+
+
+    def test_raise_exception(self, async_runtime: AsyncRuntime):
+        with pytest.raises(ValueError):
+            async_runtime.run(_raise_error)
+        assert async_runtime.run(_get_running_loop) is async_runtime.event_loop, "It should still work after an exception."
+
+
+    def test_shutdown(self, async_runtime: AsyncRuntime):
+        _event_loop = async_runtime.run(_get_running_loop)
+        async_runtime.shutdown()
+        assert async_runtime.is_running is False, "It should stop the event loop."
+        assert _event_loop.is_closed() is True, "It should close the dedicated event loop."
+        assert _event_loop.is_running() is False, "It should stop the thread of event loop."
+        assert async_runtime.run(_get_running_loop) is not _event_loop, "It should start a new event loop if it runs again."
+
+
+    def test_reuse_caller_event_loop_in_current_thread(self):
+        _event_loop = asyncio.new_event_loop()
+        try:
+            _runtime = AsyncRuntime(event_loop=_event_loop)
+            assert _runtime.run(_get_running_loop) is _event_loop, "It should run the coroutine in the event loop of caller."
+            _runtime.shutdown()
+            assert _event_loop.is_closed() is False, "It should not close the event loop of caller."
+        finally:
+            _event_loop.close()
+
+
+    def test_reuse_caller_event_loop_in_other_thread(self):
+        _event_loop = asyncio.new_event_loop()
+        _loop_thread = Thread(target=_event_loop.run_forever, daemon=True)
+        _loop_thread.start()
+        try:
+            _runtime = AsyncRuntime(event_loop=_event_loop)
+            assert _runtime.run(_get_running_loop) is _event_loop, "It should submit the coroutine to the event loop of caller."
+        finally:
+            _event_loop.call_soon_threadsafe(_event_loop.stop)
+            _loop_thread.join()
+            _event_loop.close()
+
+
+
+class TestAsynchronousStrategyRuntime:
+
+    def test_keep_event_loop_across_calls(self):
+        _event_loops, _event_loops_thread = set(), set()
+
+        async def _record_event_loop(*args):
+            _event_loops.add(id(asyncio.get_event_loop()))
+            _event_loops_thread.add(current_thread().name)
+
+        _strategy = AsynchronousStrategy(executors=2)
+        try:
+            _strategy.run(function=_record_event_loop)
+            _strategy.map(function=_record_event_loop, args_iter=[(1,), (2,)])
+            _strategy.map_with_function(functions=[_record_event_loop, _record_event_loop])
+            assert len(_event_loops) == 1, "It should run all the calls in the same event loop."
+            assert _event_loops_thread == {"multirunnable-async-runtime"}, "It should run the event loop in the dedicated thread."
+        finally:
+            _strategy.shutdown()
+        assert _strategy.runtime.is_running is True, "It should not stop the shared event loop by method 'shutdown'."
+
+
+    def test_share_runtime(self):
+        _strategy = AsynchronousStrategy(executors=2)
+        _other_strategy = AsynchronousStrategy(executors=2)
+        try:
+            assert _strategy.runtime is AsyncRuntime.shared(), "It should use the runtime which is shared in the process by default."
+            assert _other_strategy.runtime is _strategy.runtime, "It should not create a new runtime for each strategy."
+
+            _event_loop = _strategy.runtime.run(_get_running_loop)
+            assert _other_strategy.runtime.run(_get_running_loop) is _event_loop, "It should run the coroutines in the same event loop."
+        finally:
+            _strategy.shutdown()
+
+
+    def test_shutdown_with_shared_runtime(self):
+        _results = []
+
+        async def _sleep(*args):
+            await asyncio.sleep(0.5)
+            _results.append(args)
+
+        _strategy = AsynchronousStrategy(executors=2)
+        _other_strategy = AsynchronousStrategy(executors=2)
+        _running_thread = Thread(target=_strategy.map, kwargs={"function": _sleep, "args_iter": [(1,), (2,)]})
+        _running_thread.start()
+        try:
+            time.sleep(0.1)
+            _other_strategy.shutdown()
+        finally:
+            _running_thread.join()
+
+        assert sorted(_results) == [(1,), (2,)], "It should not cancel the coroutines of the other strategy."
+        assert [_r.exception for _r in _strategy.get_result()] == [None, None], "The coroutines of the other strategy should be done successfully."
+        assert _strategy.runtime.is_running is True, "It should keep the shared runtime running."
+
+
+    def test_own_event_loop(self):
+        _event_loop = asyncio.new_event_loop()
+        try:
+            _strategy = AsynchronousStrategy(executors=2, event_loop=_event_loop)
+            assert _strategy.runtime is not AsyncRuntime.shared(), "It should not use the shared runtime if event loop is supplied."
+            assert _strategy.runtime.run(_get_running_loop) is _event_loop, "It should run the coroutines in the supplied event loop."
+        finally:
+            _event_loop.close()
@@ -56,6 +56,14 @@ _Generate_Worker_Error_Msg = "" \
                              "The instances which be created by method 'generate_worker' should be an instance of 'multiprocessing.Process'."
 
 
+def _target_echo_function(value):
+    return value
+
+
+async def _target_async_echo_function(value):
+    return value
+
+
 class TestGreenThread(GeneralRunningTestSpec):
 
     def test_start_new_worker_with_function_with_no_argument(self, strategy: GreenThreadStrategy):
@@ -547,6 +555,30 @@ class TestGreenThread(GeneralRunningTestSpec):
             assert isinstance(_r.exception, Exception) and "Testing result raising an exception" in str(_r.exception), "It should have an exception and error message is 'Testing result raising an exception'."
 
 
+    def test_get_result_with_max_size(self):
+        _strategy = GreenThreadStrategy(executors=Green_Thread_Size)
+        _strategy.initialization()
+        _strategy.result_max_size = 2
+        for _index in range(Green_Thread_Size + 2):
+            _strategy.close(_strategy.start_new_worker(target=_target_echo_function, args=(_index,)))
+
+        assert [_r.data for _r in _strategy.get_result()] == [Green_Thread_Size, Green_Thread_Size + 1], "It should only keep the last running results."
+        assert _strategy.get_result() == [], "It should drop the running results after getting them."
+
+
+    def test_get_result_of_each_strategy(self, strategy: GreenThreadStrategy):
+        strategy.reset_result()
+        _other_strategy = GreenThreadStrategy(executors=Green_Thread_Size)
+        _other_strategy.initialization()
+        _worker = _other_strategy.start_new_worker(target=_target_echo_function, args=(1,))
+        _other_strategy.close(_worker)
+
+        assert _worker.value["result"] == 1, "The running result should be the return value of green thread."
+        assert strategy.get_result() == [], "It should not save the running results of other strategy instances."
+        assert [_r.data for _r in _other_strategy.get_result()] == [1], "It should save the running result in its own strategy instance."
+
+
+
     def _initial(self):
         # Test for parameters with '**kwargs'
         # reset_running_flag()
@@ -1725,3 +1757,53 @@ class TestAsynchronous(GeneralRunningTestSpec):
             assert _r.exception is None, "It should have nothing exception."
 
 
+
+
+    def test_map_as_completed(self, async_strategy: AsynchronousStrategy):
+        async_strategy.reset_result()
+        _in_flight, _in_flight_peak = set(), []
+
+        async def __target(_index: int):
+            _in_flight.add(_index)
+            _in_flight_peak.append(len(_in_flight))
+            await asyncio.sleep(0.01 * (_index % 3))
+            _in_flight.discard(_index)
+            return _index
+
+        _result = list(async_strategy.map_as_completed(__target, range(Task_Size * 2), limit=2))
+        assert sorted([_r.data for _r in _result]) == list(range(Task_Size * 2)), "It should yield all the running results."
+        assert max(_in_flight_peak) <= 2, "The amount of in-flight coroutines should not be over the limit."
+        for _r in _result:
+            assert _r.state == "successful", "Its state should be 'successful'."
+            assert _r.worker_name, "It should have task name."
+        assert async_strategy.get_result() == [], "The running results which be yielded should not be saved."
+
+
+    def test_map_as_completed_with_timeout(self, async_strategy: AsynchronousStrategy):
+
+        async def __target(_sleep: float):
+            await asyncio.sleep(_sleep)
+            return _sleep
+
+        _result = list(async_strategy.map_as_completed(__target, [(0.01,), (5,)], timeout=0.5))
+        assert _result[0].data == 0.01 and _result[0].state == "successful", "It should yield the done one first."
+        assert _result[1].state == "fail" and isinstance(_result[1].exception, asyncio.TimeoutError), \
+            "The coroutine which runs over the timeout should be failed with 'asyncio.TimeoutError'."
+
+
+    def test_map_as_completed_with_invalid_option(self, async_strategy: AsynchronousStrategy):
+        with pytest.raises(ValueError):
+            list(async_strategy.map_as_completed(target_async_function, [()], limit=0))
+        with pytest.raises(ValueError):
+            list(async_strategy.map_as_completed(target_async_function, [()], timeout=0))
+
+
+    def test_get_result_with_max_size(self):
+        _strategy = AsynchronousStrategy(executors=Green_Thread_Size)
+        _strategy.result_max_size = 2
+        try:
+            _strategy.map(function=_target_async_echo_function, args_iter=[(_index,) for _index in range(Green_Thread_Size + 2)])
+            assert [_r.data for _r in _strategy.get_result()] == [Green_Thread_Size, Green_Thread_Size + 1], "It should only keep the last running results."
+            assert _strategy.get_result() == [], "It should drop the running results after getting them."
+        finally:
+            _strategy.shutdown()
@@ -13,7 +13,7 @@ from asyncio import (
 from asyncio import new_event_loop
 import pytest
 
-from multirunnable.framework.runnable.synchronization import PosixThreadLock, PosixThreadCommunication
+from multirunnable.framework.runnable.synchronization import PosixThreadLock, PosixThreadCommunication, ReadWriteLock, AsyncReadWriteLock, ShardedLock
 from multirunnable.coroutine.synchronization import (
     GreenThreadLock, GreenThreadCommunication,
     AsynchronousLock, AsynchronousCommunication
@@ -68,6 +68,18 @@ class TestGreenThreadLock:
         assert isinstance(_bounded_semaphore, gevent_BoundedSemaphore) is True, "This type of instance should be 'gevent.lock.BoundedSemaphore'."
 
 
+    def test_get_read_write_lock(self, mr_gevent_lock: PosixThreadLock):
+        _rwlock = mr_gevent_lock.get_read_write_lock()
+        assert isinstance(_rwlock, ReadWriteLock) is True, "This type of instance should be 'ReadWriteLock'."
+        assert isinstance(_rwlock._resource, gevent_Semaphore) is True, "The resource should be 'gevent.lock.Semaphore'."
+
+
+    def test_get_sharded_lock(self, mr_gevent_lock: PosixThreadLock):
+        _sharded_lock = mr_gevent_lock.get_sharded_lock(shards=4)
+        assert isinstance(_sharded_lock, ShardedLock) is True and len(_sharded_lock) == 4, "This type of instance should be 'ShardedLock' with 4 locks."
+        assert isinstance(_sharded_lock.shard("key"), gevent_Lock) is True, "Each lock should be 'gevent.threading.Lock'."
+
+
 
 class TestGreenThreadCommunication:
 
@@ -130,6 +142,28 @@ class TestAsynchronousLock:
         assert isinstance(_bounded_semaphore, async_BoundedSemaphore) is True, "This type of instance should be 'asyncio.lock.BoundedSemaphore'."
 
 
+    def test_get_read_write_lock(self, mr_async_lock: PosixThreadLock):
+        _event_loop = new_event_loop()
+        _rwlock = mr_async_lock.get_read_write_lock(loop=_event_loop)
+        assert isinstance(_rwlock, AsyncReadWriteLock) is True, "This type of instance should be 'AsyncReadWriteLock'."
+
+        async def __read():
+            async with _rwlock.reading():
+                async with _rwlock.reading():
+                    return _rwlock.readers
+
+        assert _event_loop.run_until_complete(__read()) == 2, "The readers should hold it at the same time."
+        _event_loop.close()
+
+
+    def test_get_sharded_lock(self, mr_async_lock: PosixThreadLock):
+        _event_loop = new_event_loop()
+        _sharded_lock = mr_async_lock.get_sharded_lock(shards=4, loop=_event_loop)
+        _event_loop.close()
+        assert isinstance(_sharded_lock, ShardedLock) is True and len(_sharded_lock) == 4, "This type of instance should be 'ShardedLock' with 4 locks."
+        assert isinstance(_sharded_lock.shard("key"), async_Lock) is True, "Each lock should be 'asyncio.Lock'."
+
+
 
 class TestAsynchronousCommunication:
 
@@ -0,0 +1,80 @@
+from multirunnable._dispatch import MethodDispatcher, method_dispatch
+
+from collections.abc import Iterable
+from functools import partial
+from types import FunctionType, MethodType
+import pytest
+
+
+
+class _Worker:
+    pass
+
+
+
+class _SubWorker(_Worker):
+    pass
+
+
+
+class DispatchTarget:
+
+    @method_dispatch(_Worker)
+    def close(self, workers: _Worker) -> str:
+        return "worker"
+
+
+    @method_dispatch(_SubWorker)
+    def close(self, workers: _SubWorker) -> str:
+        return "sub-worker"
+
+
+    @method_dispatch(Iterable)
+    def close(self, workers: list) -> str:
+        return "workers"
+
+
+    @method_dispatch((FunctionType, MethodType, partial), type(None))
+    def generate(self, function, args) -> str:
+        return "none"
+
+
+    @method_dispatch((FunctionType, MethodType, partial), tuple)
+    def generate(self, function, args) -> str:
+        return "tuple"
+
+
+    @method_dispatch(Iterable, args=tuple, kwargs=dict)
+    def start(self, target, args: tuple = (), kwargs: dict = {}) -> tuple:
+        return args, kwargs
+
+
+
+class TestMethodDispatch:
+
+    def test_dispatch_by_type(self):
+        _target = DispatchTarget()
+        assert isinstance(DispatchTarget.close, MethodDispatcher), "The methods with the same name should be one dispatcher."
+        assert _target.close(_Worker()) == "worker", "It should dispatch to the implementation of the class."
+        assert _target.close(_SubWorker()) == "sub-worker", "It should dispatch to the most specific implementation."
+        assert _target.close([_Worker()]) == "workers", "It should dispatch by virtual subclass of abstract class."
+
+
+    def test_dispatch_by_multiple_arguments(self):
+        _target = DispatchTarget()
+        assert _target.generate(lambda: None, None) == "none", "It should dispatch by all the positional arguments."
+        assert _target.generate(partial(print), ()) == "tuple", "It should dispatch by all the positional arguments."
+        assert _target.start([], args=(1,), kwargs={"a": 1}) == ((1,), {"a": 1}), "It should pass the keyword arguments."
+
+
+    def test_dispatch_table(self):
+        _target = DispatchTarget()
+        _target.close(_Worker())
+        _target.close(_Worker())
+        _table = DispatchTarget.close._Dispatch_Table
+        assert list(_table.keys()).count((_Worker,)) == 1, "It should resolve each type only once."
+
+
+    def test_dispatch_with_unknown_type(self):
+        with pytest.raises(NotImplementedError):
+            DispatchTarget().close(1)
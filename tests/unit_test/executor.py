@@ -1,4 +1,5 @@
 import threading
+import os
 import pytest
 import time
 
@@ -78,6 +79,17 @@ class TestSimpleExecutor:
             raise ValueError("The RunningMode has the unexpected mode.")
 
 
+    @pytest.mark.parametrize(
+        argnames="instantiate_executor",
+        argvalues=[RunningMode.Parallel],
+        indirect=True
+    )
+    def test_map_with_max_workers_stopped(self, instantiate_executor: SimpleExecutor):
+        # It should not be blocked forever by the full feeder if all the feeding workers have stopped.
+        with pytest.raises(RuntimeError):
+            instantiate_executor.map(function=_exit_process, args_iter=[(_i,) for _i in range(10)], max_workers=2)
+
+
     @pytest.mark.parametrize(
         argnames="instantiate_executor",
         argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread],
@@ -124,6 +136,41 @@ class TestSimpleExecutor:
         TestSimpleExecutor._chk_run_record(expected_size=len(Test_Function_Args), de_duplicate=False)
 
 
+    @pytest.mark.parametrize(
+        argnames="instantiate_executor",
+        argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread, RunningMode.Asynchronous],
+        indirect=True
+    )
+    def test_map_with_max_workers(self, instantiate_executor: SimpleExecutor):
+
+        _Max_Workers = 2
+        _Arguments = [(_i,) for _i in range(10)]
+
+        def _target(*args):
+            return args[0] * 2
+
+        async def _async_target(*args):
+            return args[0] * 2
+
+        if get_current_mode(force=True) is RunningMode.Asynchronous:
+            _function = _async_target
+        else:
+            _function = _target
+
+        instantiate_executor.map(function=_function, args_iter=_Arguments, max_workers=_Max_Workers)
+        _results = instantiate_executor.result()
+        assert len(_results) == len(_Arguments), "It should save one running result for each arguments."
+        assert sorted([_r.data for _r in _results]) == [_a[0] * 2 for _a in _Arguments], "It should run target function with each arguments."
+        if get_current_mode(force=True) is not RunningMode.GreenThread:
+            # # Green thread mode still runs one green thread for each arguments, but limits the amount of running ones.
+            assert len(set([_r.worker_ident for _r in _results])) <= _Max_Workers, "The amount of workers should not be more than *max_workers*."
+        else:
+            assert [_r.data for _r in _results] == [_a[0] * 2 for _a in _Arguments], "It should save the running results by the order of arguments."
+
+        with pytest.raises(ValueError):
+            instantiate_executor.map(function=_function, args_iter=_Arguments, max_workers=0)
+
+
     @pytest.mark.parametrize(
         argnames="instantiate_executor",
         argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread],
@@ -328,3 +375,103 @@ class TestAdapterExecutor:
             assert _r.pid, ""
             assert _r.exception is None, ""
 
+
+
+
+class TestMetricsSimpleExecutor:
+
+    @pytest.mark.parametrize(
+        argnames="instantiate_executor",
+        argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread],
+        indirect=True
+    )
+    def test_metrics(self, instantiate_executor: SimpleExecutor):
+        TestSimpleExecutor._initial()
+        assert instantiate_executor.metrics is None, "The metrics should be disabled by default."
+
+        _metrics = instantiate_executor.enable_metrics()
+        instantiate_executor.map(function=target_function_for_map, args_iter=Test_Function_Args)
+        _results = instantiate_executor.result()
+        assert len(_results) == len(Test_Function_Args), ""
+        for _result in _results:
+            assert _result.enqueue_time <= _result.start_time <= _result.end_time, "Each result should have its timing."
+
+        _snapshot = instantiate_executor.export_metrics()
+        assert _metrics is instantiate_executor.metrics, ""
+        assert _snapshot["tasks"] == len(Test_Function_Args) and _snapshot["errors"] == 0, ""
+        assert _snapshot["latency"]["count"] == len(Test_Function_Args), ""
+
+        instantiate_executor.disable_metrics()
+        assert instantiate_executor.metrics is None, "It should disable the metrics."
+
+
+
+def _exit_process(index: int) -> None:
+    os._exit(1)
+
+
+def _get_pid(index: int) -> tuple:
+    return index, os.getpid()
+
+
+
+class TestHybridSimpleExecutor:
+
+    def test_processes(self):
+        _executor = SimpleExecutor(mode=RunningMode.ParallelConcurrent, executors=_Worker_Size, processes=2)
+        _executor.map(function=_get_pid, args_iter=[(_i,) for _i in range(_Worker_Size)])
+        _results = _executor.result()
+
+        assert sorted(_r.data[0] for _r in _results) == list(range(_Worker_Size)), "It should run all the tasks."
+        assert 1 <= len(set(_r.pid for _r in _results)) <= 2, "It should run the tasks in at most 2 processes."
+
+
+    def test_processes_without_hybrid_mode(self):
+        with pytest.raises(ValueError):
+            SimpleExecutor(mode=RunningMode.Concurrent, executors=_Worker_Size, processes=2)
+
+
+    def test_reject_worker_operations(self):
+        _executor = SimpleExecutor(mode=RunningMode.ParallelConcurrent, executors=_Worker_Size, processes=2)
+        with pytest.raises(ValueError):
+            _executor.start_new_worker(_get_pid, args=(0,))
+        with pytest.raises(ValueError):
+            _executor.close([])
+
+
+
+class TestSharedMemorySimpleExecutor:
+
+    def test_shared_memory_threshold(self):
+        import multirunnable.executor as _executor_module
+
+        _executor = SimpleExecutor(mode=RunningMode.Parallel, executors=_Worker_Size, shared_memory_threshold=1024)
+        assert _executor_module.General_Runnable_Strategy.shared_memory_threshold == 1024, \
+            "The option *shared_memory_threshold* should be passed to the process strategy."
+        _executor.map(function=_get_pid, args_iter=[(_i,) for _i in range(_Worker_Size)])
+        _results = _executor.result()
+
+        assert sorted(_r.data[0] for _r in _results) == list(range(_Worker_Size)), "It should run all the tasks."
+
+
+    def test_shared_memory_threshold_without_parallel_mode(self):
+        with pytest.raises(ValueError):
+            SimpleExecutor(mode=RunningMode.Concurrent, executors=_Worker_Size, shared_memory_threshold=1024)
+
+
+
+class TestResultMaxSizeSimpleExecutor:
+
+    @pytest.mark.parametrize(
+        argnames="mode",
+        argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread]
+    )
+    def test_result_max_size(self, mode: RunningMode):
+        _executor = SimpleExecutor(mode=mode, executors=_Worker_Size, result_max_size=2)
+        assert _executor.result_max_size == 2, "The option *result_max_size* should be passed to the strategy."
+        _executor.map(function=_get_pid, args_iter=[(_i,) for _i in range(_Worker_Size)])
+        assert len(_executor.result()) == 2, "It should only keep the last running results."
+
+        _executor.result_max_size = 0
+        _executor.map(function=_get_pid, args_iter=[(_i,) for _i in range(_Worker_Size)])
+        assert _executor.result() == [], "It should drop every running result."
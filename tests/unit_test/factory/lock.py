@@ -2,7 +2,8 @@ import traceback
 import pytest
 import re
 
-from multirunnable.factory.lock import LockFactory, RLockFactory, SemaphoreFactory, BoundedSemaphoreFactory
+from multirunnable.factory.lock import LockFactory, RLockFactory, SemaphoreFactory, BoundedSemaphoreFactory, ReadWriteLockFactory, ShardedLockFactory
+from multirunnable.framework.runnable.synchronization import ReadWriteLock, AsyncReadWriteLock, ShardedLock
 from multirunnable.mode import FeatureMode
 
 from ...test_config import Semaphore_Value
@@ -31,6 +32,16 @@ def mr_bounded_semaphore() -> BoundedSemaphoreFactory:
     return BoundedSemaphoreFactory(value=_Semaphore_Value)
 
 
+@pytest.fixture(scope="function")
+def mr_rwlock() -> ReadWriteLockFactory:
+    return ReadWriteLockFactory()
+
+
+@pytest.fixture(scope="function")
+def mr_sharded_lock() -> ShardedLockFactory:
+    return ShardedLockFactory(shards=4)
+
+
 
 class TestLockFactory:
 
@@ -423,3 +434,66 @@ class TestBoundedSemaphoreFactory:
         assert Running_Bounded_Semaphore is _bounded_semaphore, "It should be the instance we instantiated."
 
 
+
+class TestReadWriteLockFactory:
+
+    def test__str__(self, mr_rwlock: ReadWriteLockFactory):
+        mr_rwlock.feature_mode = FeatureMode.Parallel
+        _chksum = re.search(r"<Read-Write Lock object with FeatureMode\.[a-zA-Z]{4,32} mode at \w{10,30}>", str(mr_rwlock))
+        assert _chksum is not None, f"The '__str__' format is incorrect. But it got *{str(mr_rwlock)}*."
+
+
+    @pytest.mark.parametrize("mode", [FeatureMode.Parallel, FeatureMode.Concurrent, FeatureMode.GreenThread])
+    def test_get_instance(self, mr_rwlock: ReadWriteLockFactory, mode):
+        with pytest.raises(ValueError):
+            mr_rwlock.get_instance()
+
+        mr_rwlock.feature_mode = mode
+        _rwlock = mr_rwlock.get_instance()
+        assert isinstance(_rwlock, ReadWriteLock) is True and isinstance(_rwlock, AsyncReadWriteLock) is False, \
+            "This type of instance should be 'ReadWriteLock'."
+
+
+    def test_get_instance_with_asynchronous_mode(self, mr_rwlock: ReadWriteLockFactory):
+        mr_rwlock.feature_mode = FeatureMode.Asynchronous
+        _rwlock = mr_rwlock.get_instance()
+        assert isinstance(_rwlock, AsyncReadWriteLock) is True, "This type of instance should be 'AsyncReadWriteLock'."
+
+
+    def test_globalize_instance(self, mr_rwlock: ReadWriteLockFactory):
+        mr_rwlock.feature_mode = FeatureMode.Concurrent
+        _rwlock = mr_rwlock.get_instance()
+        mr_rwlock.globalize_instance(_rwlock)
+
+        from multirunnable.api.manage import Running_Read_Write_Lock
+        assert Running_Read_Write_Lock is _rwlock, "It should be the instance we instantiated."
+
+
+
+class TestShardedLockFactory:
+
+    def test__repr__(self, mr_sharded_lock: ShardedLockFactory):
+        mr_sharded_lock.feature_mode = FeatureMode.Parallel
+        _chksum = re.search(r"<ShardedLock\(shards=4\) object with FeatureMode\.[a-zA-Z]{4,32} mode at \w{10,30}>", repr(mr_sharded_lock))
+        assert _chksum is not None, f"The '__repr__' format is incorrect. But it got *{repr(mr_sharded_lock)}*."
+
+
+    def test_invalid_shards(self):
+        with pytest.raises(ValueError):
+            ShardedLockFactory(shards=0)
+
+
+    @pytest.mark.parametrize("mode", [FeatureMode.Parallel, FeatureMode.Concurrent, FeatureMode.GreenThread, FeatureMode.Asynchronous])
+    def test_get_instance(self, mr_sharded_lock: ShardedLockFactory, mode):
+        mr_sharded_lock.feature_mode = mode
+        _sharded_lock = mr_sharded_lock.get_instance()
+        assert isinstance(_sharded_lock, ShardedLock) is True and len(_sharded_lock) == 4, "This type of instance should be 'ShardedLock' with 4 locks."
+
+
+    def test_globalize_instance(self, mr_sharded_lock: ShardedLockFactory):
+        mr_sharded_lock.feature_mode = FeatureMode.Concurrent
+        _sharded_lock = mr_sharded_lock.get_instance()
+        mr_sharded_lock.globalize_instance(_sharded_lock)
+
+        from multirunnable.api.manage import Running_Sharded_Lock
+        assert Running_Sharded_Lock is _sharded_lock, "It should be the instance we instantiated."
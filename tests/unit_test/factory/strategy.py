@@ -1,9 +1,16 @@
 from multirunnable.concurrent.strategy import ThreadStrategy, ThreadPoolStrategy
 from multirunnable.coroutine.strategy import GreenThreadStrategy, GreenThreadPoolStrategy, AsynchronousStrategy
 from multirunnable.parallel.strategy import ProcessStrategy, ProcessPoolStrategy
+from multirunnable.hybrid.strategy import (
+    ProcessThreadStrategy, ProcessThreadPoolStrategy,
+    ProcessGreenThreadStrategy, ProcessGreenThreadPoolStrategy,
+    ProcessAsynchronousStrategy, ProcessAsynchronousPoolStrategy)
 from multirunnable.factory.strategy import ExecutorStrategyAdapter, PoolStrategyAdapter
+from multirunnable.framework.runnable.autoscale import ScalingPolicy
 from multirunnable.mode import RunningMode
 
+import pytest
+
 from ...test_config import Worker_Size, Worker_Pool_Size, Task_Size
 
 
@@ -59,3 +66,47 @@ class TestAdapterPoolStrategy:
         _strategy = _strategy_adapter.get_simple()
         assert isinstance(_strategy, GreenThreadPoolStrategy) is True, "The type of strategy instance should be 'GreenThreadPoolStrategy'."
 
+
+
+_Hybrid_Strategies = [
+    (RunningMode.ParallelConcurrent, ProcessThreadStrategy, ProcessThreadPoolStrategy),
+    (RunningMode.ParallelGreenThread, ProcessGreenThreadStrategy, ProcessGreenThreadPoolStrategy),
+    (RunningMode.ParallelAsynchronous, ProcessAsynchronousStrategy, ProcessAsynchronousPoolStrategy)
+]
+
+
+class TestAdapterHybridStrategy:
+
+    @pytest.mark.parametrize("mode, executor_strategy_cls, pool_strategy_cls", _Hybrid_Strategies)
+    def test_get_simple_with_hybrid(self, mode, executor_strategy_cls, pool_strategy_cls):
+        _strategy = ExecutorStrategyAdapter(mode=mode, executors=_Worker_Size, processes=2).get_simple()
+        assert isinstance(_strategy, executor_strategy_cls) is True, f"The type of strategy instance should be '{executor_strategy_cls.__name__}'."
+        assert _strategy.processes == 2 and _strategy.executors_number == _Worker_Size, "It should pass the amount of processes and executors."
+
+        _strategy = PoolStrategyAdapter(mode=mode, pool_size=_Worker_Pool_Size, processes=2).get_simple()
+        assert isinstance(_strategy, pool_strategy_cls) is True, f"The type of strategy instance should be '{pool_strategy_cls.__name__}'."
+        assert _strategy.processes == 2 and _strategy.pool_size == _Worker_Pool_Size, "It should pass the amount of processes and pool size."
+
+
+    def test_processes_with_not_hybrid_mode(self):
+        with pytest.raises(ValueError):
+            ExecutorStrategyAdapter(mode=RunningMode.Parallel, executors=_Worker_Size, processes=2)
+        with pytest.raises(ValueError):
+            PoolStrategyAdapter(mode=RunningMode.Concurrent, pool_size=_Worker_Pool_Size, processes=2)
+
+
+
+class TestAdapterAutoscalePoolStrategy:
+
+    @pytest.mark.parametrize("mode", [RunningMode.Concurrent, RunningMode.GreenThread])
+    def test_get_simple_with_autoscale(self, mode):
+        _policy = ScalingPolicy(min_size=1, max_size=_Worker_Pool_Size)
+        _strategy = PoolStrategyAdapter(mode=mode, pool_size=1, autoscale=_policy).get_simple()
+        assert _strategy.auto_scaler is not None and _strategy.auto_scaler.policy is _policy, "It should pass the scaling policy."
+        assert _strategy.auto_scaler.size == 1, "The pool size should be the initial size."
+
+
+    @pytest.mark.parametrize("mode", [RunningMode.Parallel, RunningMode.ParallelConcurrent])
+    def test_autoscale_with_not_supported_mode(self, mode):
+        with pytest.raises(ValueError):
+            PoolStrategyAdapter(mode=mode, pool_size=_Worker_Pool_Size, autoscale=ScalingPolicy(min_size=1, max_size=2))
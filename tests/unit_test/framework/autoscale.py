@@ -0,0 +1,102 @@
+from threading import Thread
+import time
+import pytest
+
+from multirunnable.framework.runnable.autoscale import ScalingPolicy, ScalingEvent, AutoScaler
+
+
+
+class TestScalingPolicy:
+
+    @pytest.mark.parametrize(
+        argnames="options",
+        argvalues=[
+            {"min_size": 0, "max_size": 1},
+            {"min_size": 2, "max_size": 1},
+            {"min_size": 1, "max_size": 2, "scale_up_backlog": 0},
+            {"min_size": 1, "max_size": 2, "step": 0},
+            {"min_size": 1, "max_size": 2, "interval": 0},
+        ]
+    )
+    def test_invalid_options(self, options: dict):
+        with pytest.raises(ValueError):
+            ScalingPolicy(**options)
+
+
+    def test_clamp(self):
+        _policy = ScalingPolicy(min_size=2, max_size=4)
+        assert _policy.clamp(1) == 2 and _policy.clamp(3) == 3 and _policy.clamp(5) == 4, "It should keep the size in bounds."
+
+
+
+class TestAutoScaler:
+
+    def test_scale_up_on_backlog(self):
+        _scaler = AutoScaler(policy=ScalingPolicy(min_size=1, max_size=3, scale_up_backlog=1))
+        _events = []
+        _scaler.add_listener(_events.append)
+
+        _scaler.track(lambda: None, tasks=4)
+        _event = _scaler.evaluate()
+        assert isinstance(_event, ScalingEvent), "It should scale up if there are too many waiting tasks."
+        assert (_event.action, _event.from_size, _event.to_size, _event.reason) == ("scale_up", 1, 2, "backlog")
+        assert _events == [_event] and _scaler.events == [_event], "It should save the event and pass it to listeners."
+
+        _scaler.evaluate()
+        _scaler.evaluate()
+        assert _scaler.size == 3, "It should never be bigger than the max size."
+
+
+    def test_scale_up_on_latency(self):
+        _scaler = AutoScaler(policy=ScalingPolicy(min_size=1, max_size=2, scale_up_backlog=100, scale_up_latency=0.01))
+        _function = _scaler.track(lambda: None, tasks=2)
+        time.sleep(0.02)
+        _function()
+        assert _scaler.size == 2, "It should scale up if the tasks wait too long."
+        assert _scaler.events[0].reason == "latency"
+
+
+    def test_scale_down_on_idle(self):
+        _scaler = AutoScaler(policy=ScalingPolicy(min_size=1, max_size=4, scale_down_idle_time=0.05), size=3)
+        assert _scaler.evaluate() is None, "It should not scale down before idling long enough."
+        time.sleep(0.1)
+        _event = _scaler.evaluate()
+        assert (_event.action, _event.to_size, _event.reason) == ("scale_down", 2, "idle")
+        assert _scaler.evaluate() is None, "It should wait for the idle time again before the next scaling down."
+
+
+    def test_limit_running_tasks(self):
+        _scaler = AutoScaler(policy=ScalingPolicy(min_size=2, max_size=2))
+        _running = []
+        _max_running = []
+
+        def _target():
+            _running.append(1)
+            _max_running.append(len(_running))
+            time.sleep(0.02)
+            _running.pop()
+
+        _function = _scaler.track(_target, tasks=6)
+        _threads = [Thread(target=_function) for _ in range(6)]
+        for _thread in _threads:
+            _thread.start()
+        for _thread in _threads:
+            _thread.join()
+
+        assert max(_max_running) <= 2, "It should not run more tasks than the size at the same time."
+        assert _scaler.backlog == 0 and _scaler.busy == 0, "All the tasks should be done."
+
+
+    def test_shrink_with_busy_slots(self):
+        _scaler = AutoScaler(policy=ScalingPolicy(min_size=1, max_size=2, scale_down_idle_time=0), size=2)
+        _function = _scaler.track(lambda: _scaler.evaluate(), tasks=1)
+        _function()
+        assert _scaler.size == 1, "It should scale down when it's idle."
+
+        _function = _scaler.track(lambda: None, tasks=2)
+        _threads = [Thread(target=_function) for _ in range(2)]
+        for _thread in _threads:
+            _thread.start()
+        for _thread in _threads:
+            _thread.join()
+        assert _scaler.busy == 0, "It should run all the tasks with the slots which are left."
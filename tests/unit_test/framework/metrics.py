@@ -0,0 +1,181 @@
+import logging
+import pickle
+import time
+import pytest
+
+from multirunnable.framework.runnable.metrics import (
+    Histogram, Metrics, MetricsExporter, LoggingExporter, InMemoryExporter,
+    TimedTarget, TimedValue, untime_result, untime_callback
+)
+from multirunnable.framework.runnable.result import ResultStore, PoolResult
+
+
+
+def _timing_record(enqueue_time: float, start_time: float, end_time: float, successful: bool = True, worker: str = "w") -> dict:
+    return {"successful": successful, "enqueue_time": enqueue_time, "start_time": start_time,
+            "end_time": end_time, "cpu_time": end_time - start_time, "worker": worker}
+
+
+def _double(value: int) -> int:
+    return value * 2
+
+
+
+class _BrokenExporter(MetricsExporter):
+
+    def export(self, name: str, metrics: dict) -> None:
+        raise RuntimeError("The exporter is broken.")
+
+
+
+class TestHistogram:
+
+    def test_empty(self):
+        _histogram = Histogram()
+        assert _histogram.percentile(50) is None, "It should be None if there isn't any value."
+        assert _histogram.summary()["count"] == 0 and _histogram.summary()["p99"] is None
+
+
+    def test_percentile(self):
+        _histogram = Histogram()
+        for _value in range(1, 101):
+            _histogram.add(float(_value))
+
+        assert _histogram.percentile(50) == 50.0 and _histogram.percentile(95) == 95.0 and _histogram.percentile(100) == 100.0, \
+            "It should be the value at the nearest rank."
+        _summary = _histogram.summary()
+        assert (_summary["count"], _summary["mean"], _summary["p99"], _summary["max"]) == (100, 50.5, 99.0, 100.0)
+
+
+    def test_max_samples(self):
+        _histogram = Histogram(max_samples=10)
+        for _value in range(100):
+            _histogram.add(float(_value))
+
+        assert len(_histogram) == 100, "It should count all the values."
+        assert _histogram.percentile(0) == 90.0, "It should only keep the last values for percentiles."
+
+
+
+class TestMetrics:
+
+    def test_record_and_snapshot(self):
+        _metrics = Metrics(name="test")
+        _metrics.record(_timing_record(enqueue_time=10.0, start_time=10.5, end_time=11.0, worker="a"))
+        _metrics.record(_timing_record(enqueue_time=10.0, start_time=11.0, end_time=13.0, worker="b"))
+        _metrics.record(_timing_record(enqueue_time=11.0, start_time=11.0, end_time=12.0, successful=False, worker="a"))
+
+        _snapshot = _metrics.snapshot()
+        assert (_snapshot["tasks"], _snapshot["errors"]) == (3, 1), "It should count the tasks and the failed ones."
+        assert _snapshot["error_rate"] == pytest.approx(1 / 3)
+        assert _snapshot["throughput"] == pytest.approx(1.0), "It should be the amount of tasks per second from the first enqueue to the last end."
+        assert _snapshot["queue_wait"]["max"] == pytest.approx(1.0) and _snapshot["run_time"]["max"] == pytest.approx(2.0)
+        assert _snapshot["latency"]["max"] == pytest.approx(3.0)
+        assert _snapshot["stragglers"][0] == {"worker": "b", "max_run_time": 2.0, "tasks": 1}, "The slowest worker should be the first one."
+        assert _snapshot["stragglers"][1]["tasks"] == 2
+
+
+    def test_record_without_timing(self):
+        _metrics = Metrics(name="test")
+        _metrics.record({"successful": True, "result": 1})
+
+        _snapshot = _metrics.snapshot()
+        assert _snapshot["tasks"] == 1 and _snapshot["errors"] == 0, "It should still count the task."
+        assert _snapshot["run_time"]["count"] == 0 and _snapshot["throughput"] is None
+
+
+    def test_reset(self):
+        _metrics = Metrics(name="test")
+        _metrics.record(_timing_record(enqueue_time=1.0, start_time=1.0, end_time=2.0))
+        _metrics.reset()
+        assert _metrics.snapshot()["tasks"] == 0, "It should clear all the metrics."
+
+
+    def test_export(self):
+        _exporter = InMemoryExporter()
+        _metrics = Metrics(name="test", exporter=_exporter)
+        _metrics.record(_timing_record(enqueue_time=1.0, start_time=1.0, end_time=2.0))
+
+        _snapshot = _metrics.export()
+        assert _exporter.metrics["test"] == _snapshot, "It should send the snapshot to the exporter."
+
+
+    def test_export_with_broken_exporter(self):
+        _metrics = Metrics(name="test", exporter=_BrokenExporter())
+        assert _metrics.export()["tasks"] == 0, "The failure of exporter should not break the caller."
+
+
+    def test_logging_exporter(self, caplog):
+        _metrics = Metrics(name="test", exporter=LoggingExporter())
+        with caplog.at_level(logging.INFO, logger="multirunnable.metrics"):
+            _metrics.export()
+        assert "Metrics of test" in caplog.text, "It should log the snapshot."
+
+
+
+class TestTiming:
+
+    def test_timed_target(self):
+        _target = TimedTarget(_double)
+        _target = pickle.loads(pickle.dumps(_target))
+        _timed_value = _target(2)
+
+        assert isinstance(_timed_value, TimedValue) and _timed_value.value == 4, "It should return the value with its timing."
+        _timing = _timed_value.timing
+        assert _timing["enqueue_time"] <= _timing["start_time"] <= _timing["end_time"], "The timing should be in order."
+        assert _timing["cpu_time"] >= 0 and _timing["worker"], ""
+
+
+    def test_timed_target_failed(self):
+        _target = TimedTarget(_double)
+        with pytest.raises(TypeError) as _error:
+            _target(None)
+
+        _exception = pickle.loads(pickle.dumps(_error.value))
+        _, _timing = untime_result(None, exception=_exception)
+        assert _timing is not None and _timing["start_time"] <= _timing["end_time"], \
+            "The exception should keep the timing of failed task even if it's pickled."
+
+
+    def test_timed_target_without_cpu_time(self):
+        _timed_value = TimedTarget(_double, cpu_time=False)(2)
+        assert "cpu_time" not in _timed_value.timing, "It should not measure the CPU time."
+
+
+    def test_untime_result(self):
+        assert untime_result(TimedValue(value=1, timing={"start_time": 0.0})) == (1, {"start_time": 0.0})
+        assert untime_result(1) == (1, None), "It should return the value as it is if it isn't measured."
+
+
+    def test_untime_callback(self):
+        _values = []
+        _callback = untime_callback(_values.append)
+        _callback(TimedValue(value=1, timing={}))
+        _callback([TimedValue(value=2, timing={}), 3])
+        assert _values == [1, [2, 3]], "The callback should get the values instead of 'TimedValue'."
+        assert untime_callback(None) is None
+
+
+
+class TestResultStoreMetrics:
+
+    def test_record_when_saving(self):
+        _store = ResultStore()
+        _store.append({"successful": True})
+        _store.metrics = Metrics(name="test")
+        _store.append({"successful": True})
+        _store.extend(iter([{"successful": False}, {"successful": True}]))
+
+        assert len(_store) == 4, "It should still save all the records."
+        assert _store.metrics.snapshot()["tasks"] == 3 and _store.metrics.snapshot()["errors"] == 1, \
+            "It should only aggregate the records which are saved after the metrics is set."
+
+
+    def test_timing_result(self):
+        _result = PoolResult()
+        assert _result.start_time is None, "The timing should be None if the metrics isn't enabled."
+
+        _now = time.time()
+        _result._save_timing(_timing_record(enqueue_time=_now, start_time=_now + 1, end_time=_now + 2))
+        assert (_result.enqueue_time, _result.start_time, _result.end_time) == (_now, _now + 1, _now + 2)
+        assert _result.cpu_time == 1
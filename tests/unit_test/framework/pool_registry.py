@@ -0,0 +1,116 @@
+import time
+import pytest
+
+from multirunnable.framework.runnable.pool_registry import PoolLifecycle, PoolRegistry
+
+
+
+class _Pool:
+
+    def __init__(self):
+        self.closed = False
+
+
+    def close(self):
+        self.closed = True
+
+
+
+def _close(pool: _Pool) -> None:
+    pool.close()
+
+
+
+class TestPoolLifecycle:
+
+    @pytest.mark.parametrize(
+        argnames="options",
+        argvalues=[{"max_idle_time": -1}, {"max_tasks_per_child": 0}, {"max_memory": 0}]
+    )
+    def test_invalid_options(self, options: dict):
+        with pytest.raises(ValueError):
+            PoolLifecycle(**options)
+
+
+
+class TestPoolRegistry:
+
+    def test_acquire_warm_pool(self):
+        _registry = PoolRegistry()
+        _pool, _is_warm = _registry.acquire(name="test", mode="Mode", pool_size=2, factory=_Pool, closer=_close)
+        assert _is_warm is False, "It should build a new pool at the first time."
+        _registry.release(name="test", mode="Mode", pool_size=2)
+
+        _warm_pool, _is_warm = _registry.acquire(name="test", mode="Mode", pool_size=2, factory=_Pool, closer=_close)
+        assert _is_warm is True and _warm_pool is _pool, "It should attach to the running pool."
+        assert "test" in _registry and len(_registry) == 1, "It should keep only one pool with the same key."
+
+        _other_pool, _is_warm = _registry.acquire(name="test", mode="Mode", pool_size=3, factory=_Pool, closer=_close)
+        assert _is_warm is False and _other_pool is not _pool, "It should build a new pool for different pool size."
+        _registry.close()
+
+
+    def test_idle_timeout(self):
+        _registry = PoolRegistry()
+        _pool, _ = _registry.acquire(name="test", mode="Mode", pool_size=2, factory=_Pool, closer=_close,
+                                     lifecycle=PoolLifecycle(max_idle_time=0.05))
+        time.sleep(0.1)
+        assert _registry.prune() == 0, "It should not close the pool which is still used."
+
+        _registry.release(name="test", mode="Mode", pool_size=2)
+        time.sleep(0.2)
+        assert _pool.closed is True, "It should close the pool which idles too long by the timer."
+        assert len(_registry) == 0, "It should remove the closed pool from registry."
+
+
+    def test_cancel_idle_timer(self):
+        _registry = PoolRegistry()
+        _lifecycle = PoolLifecycle(max_idle_time=0.1)
+        _pool, _ = _registry.acquire(name="test", mode="Mode", pool_size=2, factory=_Pool, closer=_close, lifecycle=_lifecycle)
+        _registry.release(name="test", mode="Mode", pool_size=2)
+        _registry.acquire(name="test", mode="Mode", pool_size=2, factory=_Pool, closer=_close, lifecycle=_lifecycle)
+        time.sleep(0.2)
+        assert _pool.closed is False and "test" in _registry, "It should not close the pool which is used again."
+        _registry.close(force=True)
+
+
+    def test_recycle_on_memory(self):
+        _registry = PoolRegistry()
+        _pool, _ = _registry.acquire(name="test", mode="Mode", pool_size=2, factory=_Pool, closer=_close,
+                                     lifecycle=PoolLifecycle(max_memory=1024), memory_usage=lambda pool: 2048)
+        _registry.release(name="test", mode="Mode", pool_size=2)
+        assert _pool.closed is True and "test" not in _registry, "It should recycle the pool which uses too much memory."
+
+
+    def test_close_and_discard(self):
+        _registry = PoolRegistry()
+        _pool_a, _ = _registry.acquire(name="a", mode="Mode", pool_size=2, factory=_Pool, closer=_close)
+        _pool_b, _ = _registry.acquire(name="b", mode="Mode", pool_size=2, factory=_Pool, closer=_close)
+        _registry.discard(name="b", mode="Mode", pool_size=2)
+        assert _registry.names() == ["a"] and _pool_b.closed is False, "It should remove the pool without closing it."
+
+        _registry.close(name="a")
+        assert _pool_a.closed is False and "a" in _registry, "It should not close the pool which is still used."
+        _registry.release(name="a", mode="Mode", pool_size=2)
+        assert _pool_a.closed is True and len(_registry) == 0, "It should close the pool when its last user releases it."
+
+
+    def test_force_close(self):
+        _registry = PoolRegistry()
+        _pool, _ = _registry.acquire(name="test", mode="Mode", pool_size=2, factory=_Pool, closer=_close)
+        _registry.close(force=True)
+        assert _pool.closed is True and len(_registry) == 0, "It should close the pool which is still used if it's forced."
+
+
+    @pytest.mark.parametrize(
+        argnames="options",
+        argvalues=[{"lifecycle": PoolLifecycle(max_idle_time=10)}, {"config": (print, (1,))}]
+    )
+    def test_mismatch_pool(self, options: dict):
+        _registry = PoolRegistry()
+        _registry.acquire(name="test", mode="Mode", pool_size=2, factory=_Pool, closer=_close)
+        with pytest.raises(ValueError):
+            _registry.acquire(name="test", mode="Mode", pool_size=2, factory=_Pool, closer=_close, **options)
+
+        _registry.acquire(name="test", mode="Mode", pool_size=2, factory=_Pool, closer=_close, lifecycle=PoolLifecycle())
+        _registry.close(force=True)
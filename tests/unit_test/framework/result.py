@@ -0,0 +1,37 @@
+import pytest
+
+from multirunnable.framework.runnable.result import ResultStore
+
+
+
+class TestResultStore:
+
+    def test_keep_all_records(self):
+        _store = ResultStore()
+        _store.extend([{"result": _i} for _i in range(3)])
+        assert _store.max_size is None, "It should keep all the records by default."
+        assert [_r["result"] for _r in _store] == [0, 1, 2], "It should keep the records in order."
+        _store.clear()
+        assert len(_store) == 0, "It should drop all the records."
+
+
+    def test_keep_last_records(self):
+        _store = ResultStore(max_size=2)
+        for _i in range(5):
+            _store.append({"result": _i})
+        assert [_r["result"] for _r in _store] == [3, 4], "It should only keep the last records."
+
+        _store.max_size = 1
+        assert [_r["result"] for _r in _store] == [4], "It should drop the older records if the max size is decreased."
+
+
+    def test_drop_all_records(self):
+        _store = ResultStore(max_size=0)
+        _store.append({"result": 1})
+        assert len(_store) == 0, "It should not keep any record."
+
+
+    @pytest.mark.parametrize("max_size", [-1, 1.5, True, "1"])
+    def test_invalid_max_size(self, max_size):
+        with pytest.raises(ValueError):
+            ResultStore(max_size=max_size)
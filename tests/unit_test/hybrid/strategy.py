@@ -0,0 +1,176 @@
+import asyncio
+import pytest
+import os
+
+from multirunnable.hybrid.strategy import (
+    ProcessThreadStrategy, ProcessThreadPoolStrategy,
+    ProcessGreenThreadStrategy, ProcessGreenThreadPoolStrategy,
+    ProcessAsynchronousStrategy, ProcessAsynchronousPoolStrategy)
+from multirunnable.hybrid.result import HybridResult, HybridPoolResult
+from multirunnable.framework.runnable import ResultState
+from multirunnable import set_mode, RunningMode
+
+
+_Processes: int = 2
+_Workers: int = 3
+_Task_Size: int = 8
+_Error_Index: int = 3
+
+
+def _target_function(index: int) -> tuple:
+    if index == _Error_Index:
+        raise ValueError(f"Test error at {index}.")
+    return index, os.getpid()
+
+
+async def _target_async_function(index: int) -> tuple:
+    await asyncio.sleep(0.01)
+    if index == _Error_Index:
+        raise ValueError(f"Test error at {index}.")
+    return index, os.getpid()
+
+
+_General_Strategies = [
+    (RunningMode.ParallelConcurrent, ProcessThreadStrategy, _target_function),
+    (RunningMode.ParallelGreenThread, ProcessGreenThreadStrategy, _target_function),
+    (RunningMode.ParallelAsynchronous, ProcessAsynchronousStrategy, _target_async_function)
+]
+
+_Pool_Strategies = [
+    (RunningMode.ParallelConcurrent, ProcessThreadPoolStrategy, _target_function),
+    (RunningMode.ParallelGreenThread, ProcessGreenThreadPoolStrategy, _target_function),
+    (RunningMode.ParallelAsynchronous, ProcessAsynchronousPoolStrategy, _target_async_function)
+]
+
+
+def _chk_merged_result(results: list, task_size: int) -> None:
+    assert len(results) == task_size, f"It should merge the running results of all processes into '{task_size}' records."
+    # A worker process may take more than one chunk if the others start slowly, so it only checks the upper bound.
+    assert 1 <= len(set(_r.pid for _r in results)) <= _Processes, f"The tasks should be run in at most '{_Processes}' processes."
+    assert os.getpid() not in [_r.pid for _r in results], "The tasks should not be run in the main process."
+
+
+
+class TestHybridGeneralStrategy:
+
+    @pytest.mark.parametrize("mode, strategy_cls, function", _General_Strategies)
+    def test_map(self, mode, strategy_cls, function):
+        set_mode(mode=mode)
+        _strategy = strategy_cls(executors=_Workers, processes=_Processes)
+        _strategy.map(function=function, args_iter=[(_i,) for _i in range(_Task_Size)])
+
+        _results = _strategy.get_result()
+        _chk_merged_result(_results, _Task_Size)
+        assert all(isinstance(_r, HybridResult) for _r in _results), "The running result should be 'HybridResult'."
+        for _index, _result in enumerate(_results):
+            if _index == _Error_Index:
+                assert _result.state == ResultState.FAIL.value and isinstance(_result.exception, ValueError), "It should save the exception of the task."
+            else:
+                assert _result.state == ResultState.SUCCESS.value and _result.data == (_index, _result.pid), "It should save the return value of the task."
+        assert _strategy.get_result() == [], "It should reset the running results after getting them."
+
+
+    @pytest.mark.parametrize("mode, strategy_cls, function", _General_Strategies)
+    def test_run(self, mode, strategy_cls, function):
+        set_mode(mode=mode)
+        _strategy = strategy_cls(executors=_Workers, processes=_Processes)
+        _strategy.run(function=function, args=(0,))
+        _chk_merged_result(_strategy.get_result(), _Processes * _Workers)
+
+
+    def test_map_with_function(self):
+        set_mode(mode=RunningMode.ParallelConcurrent)
+        _strategy = ProcessThreadStrategy(executors=_Workers, processes=_Processes)
+        _strategy.map_with_function(functions=[_target_function for _ in range(3)], args_iter=[(_i,) for _i in range(3)])
+        _results = _strategy.get_result()
+        assert [_r.data[0] for _r in _results] == [0, 1, 2], "It should run each function with its arguments."
+
+
+    def test_start_new_worker(self):
+        _strategy = ProcessThreadStrategy(executors=_Workers, processes=_Processes)
+        with pytest.raises(NotImplementedError):
+            _strategy.start_new_worker(_target_function, args=(0,))
+
+
+    def test_invalid_processes(self):
+        with pytest.raises(ValueError):
+            ProcessThreadStrategy(executors=_Workers, processes=0)
+
+
+
+class TestHybridPoolStrategy:
+
+    @pytest.mark.parametrize("mode, strategy_cls, function", _Pool_Strategies)
+    def test_map(self, mode, strategy_cls, function):
+        set_mode(mode=mode)
+        _strategy = strategy_cls(pool_size=_Workers, processes=_Processes)
+        _strategy.initialization()
+        try:
+            _strategy.map(function=function, args_iter=range(_Task_Size))
+            _results = _strategy.get_result()
+            _chk_merged_result(_results, _Task_Size)
+            assert all(isinstance(_r, HybridPoolResult) for _r in _results), "The running result should be 'HybridPoolResult'."
+            assert [_r.is_successful for _r in _results] == [_i != _Error_Index for _i in range(_Task_Size)], "It should save the state of each task."
+            assert isinstance(_results[_Error_Index].exception, ValueError), "It should save the exception of the task."
+
+            # The processes pool keeps alive until it's closed.
+            _strategy.map_by_args(function=function, args_iter=[(_i,) for _i in range(_Task_Size)])
+            _chk_merged_result(_strategy.get_result(), _Task_Size)
+        finally:
+            _strategy.close()
+
+
+    def test_async_apply_with_callback(self):
+        set_mode(mode=RunningMode.ParallelConcurrent)
+        _strategy = ProcessThreadPoolStrategy(pool_size=_Workers, processes=_Processes)
+        _strategy.initialization()
+        _values, _errors = [], []
+        try:
+            _strategy.async_apply_with_iter(
+                functions_iter=[_target_function for _ in range(_Task_Size)],
+                args_iter=[(_i,) for _i in range(_Task_Size)],
+                callback_iter=[_values.append for _ in range(_Task_Size)],
+                error_callback_iter=[_errors.append for _ in range(_Task_Size)])
+        finally:
+            _strategy.close()
+
+        assert len(_values) == _Task_Size - 1 and len(_errors) == 1, "It should call the callback or error callback of each task."
+        _chk_merged_result(_strategy.get_result(), _Task_Size)
+
+
+    def test_imap_with_chunksize(self):
+        set_mode(mode=RunningMode.ParallelConcurrent)
+        _strategy = ProcessThreadPoolStrategy(pool_size=_Workers, processes=_Processes)
+        _strategy.initialization()
+        try:
+            _strategy.imap(function=_target_function, args_iter=range(_Task_Size), chunksize=_Task_Size)
+            _results = _strategy.get_result()
+        finally:
+            _strategy.close()
+
+        assert len(_results) == _Task_Size, "It should run all the tasks."
+        assert len(set(_r.pid for _r in _results)) == 1, "It should run the tasks of one chunk in the same process."
+
+
+    @pytest.mark.parametrize("imap_name", ["imap", "imap_unordered"])
+    def test_imap_split_by_processes(self, imap_name):
+        set_mode(mode=RunningMode.ParallelConcurrent)
+        _strategy = ProcessThreadPoolStrategy(pool_size=_Workers, processes=_Processes)
+        _strategy.initialization()
+        _chunks = []
+        _async_apply_with_iter = _strategy._Process_Pool_Strategy.async_apply_with_iter
+
+        def _record_chunks(functions_iter, args_iter, *args, **kwargs):
+            _chunks.extend(len(_args[2]) for _args in args_iter)
+            return _async_apply_with_iter(functions_iter, args_iter, *args, **kwargs)
+
+        _strategy._Process_Pool_Strategy.async_apply_with_iter = _record_chunks
+        try:
+            # The default chunksize of imap is 1.
+            getattr(_strategy, imap_name)(function=_target_function, args_iter=range(_Task_Size))
+            _results = _strategy.get_result()
+        finally:
+            _strategy.close()
+
+        assert len(_results) == _Task_Size, "It should run all the tasks."
+        assert _chunks == [_Task_Size // _Processes] * _Processes, "It should split the tasks evenly by the amount of processes."
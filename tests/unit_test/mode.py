@@ -56,6 +56,11 @@ class FinalProveResult:
         return "strategy_module", "class_key", "executor_strategy", "pool_strategy", "feature", "context"
 
 
+    @staticmethod
+    def hybrid_running_mode_key():
+        return "strategy_module", "class_key", "executor_strategy", "pool_strategy", "inner_mode", "feature", "context"
+
+
     @staticmethod
     def feature_mode_key():
         return "module", "queue", "lock", "communication"
@@ -86,6 +91,20 @@ class TestRunningMode(ModeTestSpec):
 
 
 
+class TestHybridRunningMode(ModeTestSpec):
+
+    @pytest.mark.parametrize("mode", [RunningMode.ParallelConcurrent, RunningMode.ParallelGreenThread, RunningMode.ParallelAsynchronous])
+    def test_mode(self, mode):
+        self._check_mechanism(mode=mode)
+        assert mode.value["feature"] is FeatureMode.Parallel, "The features of hybrid mode should work between processes."
+        assert RunningMode[mode.value["inner_mode"]] is not None, "The inner mode should be one of RunningMode."
+
+
+    def mode_keys(self):
+        return FinalProveResult.hybrid_running_mode_key()
+
+
+
 class TestFeatureMode(ModeTestSpec):
 
     @pytest.mark.parametrize("mode", [FeatureMode.Parallel, FeatureMode.Concurrent, FeatureMode.GreenThread, FeatureMode.Asynchronous])
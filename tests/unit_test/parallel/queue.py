@@ -1,6 +1,14 @@
 # from multirunnable.parallel.queue import ProcessQueueType
 
 from multiprocessing.queues import Queue, SimpleQueue, JoinableQueue
+from multiprocessing import Process
+from queue import Empty, Full
+import pytest
+import pickle
+
+from multirunnable.parallel.queue import SharedMemoryQueue
+from multirunnable.api.operator import QueueOperator
+from multirunnable.tasks import QueueTask
 
 from ...test_config import Semaphore_Value
 
@@ -33,3 +41,110 @@ class TestProcessQueue:
         _queue = Process_JoinableQueue()
         assert isinstance(_queue, JoinableQueue) is True, "This type of instance should be 'multiprocessing.JoinableQueue'."
 
+
+
+def _produce(queue: SharedMemoryQueue, start: int, amount: int) -> None:
+    for _value in range(start, start + amount):
+        queue.put(_value)
+
+
+def _consume(queue: SharedMemoryQueue, amount: int, result: SharedMemoryQueue) -> None:
+    _values = []
+    while len(_values) < amount:
+        _values.extend(queue.get_many(max_items=amount - len(_values), timeout=5))
+    result.put((len(_values), sum(_values)))
+
+
+def _consume_globalized_queue(name: str, result: SharedMemoryQueue) -> None:
+    _values = QueueOperator.get_many(name, max_items=100, timeout=5)
+    result.put((len(_values), sum(_values)))
+
+
+@pytest.fixture(scope="function")
+def shared_memory_queue():
+    _queue = SharedMemoryQueue(maxsize=8)
+    yield _queue
+    _queue.unlink()
+
+
+
+class TestSharedMemoryQueue:
+
+    def test_put_and_get(self, shared_memory_queue: SharedMemoryQueue):
+        for _value in range(8):
+            shared_memory_queue.put(_value)
+        assert shared_memory_queue.qsize() == 8 and shared_memory_queue.full() is True
+        with pytest.raises(Full):
+            shared_memory_queue.put(8, timeout=0.05)
+
+        assert [shared_memory_queue.get() for _ in range(3)] == [0, 1, 2], "It should be FIFO."
+        for _value in range(8, 11):
+            shared_memory_queue.put_nowait(_value)
+        assert shared_memory_queue.get_many(max_items=10) == list(range(3, 11)), "It should keep the order after wrapping around."
+        assert shared_memory_queue.empty() is True
+        with pytest.raises(Empty):
+            shared_memory_queue.get_nowait()
+
+
+    def test_records(self):
+        _queue = SharedMemoryQueue(maxsize=2, fmt="qd")
+        try:
+            _queue.put((7, 0.5))
+            assert _queue.get() == (7, 0.5), "The record with many fields should be a tuple."
+        finally:
+            _queue.unlink()
+
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            SharedMemoryQueue(maxsize=0)
+
+
+    def test_cannot_pickle(self, shared_memory_queue: SharedMemoryQueue):
+        with pytest.raises(RuntimeError):
+            pickle.dumps(shared_memory_queue)
+
+
+    def test_put_many_timeout(self, shared_memory_queue: SharedMemoryQueue):
+        with pytest.raises(Full) as _error:
+            QueueOperator.put_many(shared_memory_queue, range(10), timeout=0.05)
+        assert _error.value.amount == 8, "It should report the amount of values which have been put."
+        assert shared_memory_queue.get_many(max_items=10) == list(range(8))
+
+        with pytest.raises(ValueError):
+            QueueOperator.put_many(shared_memory_queue, range(3), chunk_size=2)
+
+
+    def test_many_producers_and_consumers(self, shared_memory_queue: SharedMemoryQueue):
+        _result = SharedMemoryQueue(maxsize=3, fmt="qq")
+        try:
+            _producers = [Process(target=_produce, args=(shared_memory_queue, _index * 1000, 1000)) for _index in range(3)]
+            _consumers = [Process(target=_consume, args=(shared_memory_queue, 1000, _result)) for _ in range(3)]
+            for _process in _producers + _consumers:
+                _process.start()
+            for _process in _producers + _consumers:
+                _process.join()
+
+            _results = [_result.get(timeout=5) for _ in range(3)]
+            assert sum(_amount for _amount, _ in _results) == 3000
+            assert sum(_total for _, _total in _results) == sum(range(3000)), "Every value should be got once."
+        finally:
+            _result.unlink()
+
+
+    def test_queue_task(self):
+        _queue_task = QueueTask()
+        _queue_task.name = "test_shared_memory_queue"
+        _queue_task.queue_instance = SharedMemoryQueue(maxsize=100)
+        _queue_task.value = range(100)
+        _queue_task.init_queue_with_values()
+
+        _result = SharedMemoryQueue(maxsize=1, fmt="qq")
+        try:
+            _process = Process(target=_consume_globalized_queue, args=(_queue_task.name, _result))
+            _process.start()
+            _process.join()
+            assert _result.get(timeout=5) == (100, sum(range(100))), "The children process should get the values of globalized queue."
+        finally:
+            _result.unlink()
+            _queue_task.queue_instance.unlink()
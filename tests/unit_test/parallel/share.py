@@ -0,0 +1,65 @@
+from multiprocessing.managers import SyncManager
+import multiprocessing as mp
+import subprocess
+import pytest
+import sys
+
+from multirunnable.parallel.share import _ManagerServer, _LazyManager
+
+
+@pytest.fixture(scope="function")
+def manager_server() -> _ManagerServer:
+    _server = _ManagerServer(factory=mp.Manager)
+    yield _server
+    _server.shutdown()
+
+
+
+class TestManagerServer:
+
+    def test_import_package_without_forking(self):
+        _script = "import multirunnable, multirunnable.parallel.strategy, multirunnable.persistence.file.saver\n" \
+                  "import multiprocessing\n" \
+                  "print(len(multiprocessing.active_children()))"
+        _output = subprocess.check_output([sys.executable, "-c", _script])
+        assert _output.decode("utf-8").strip().splitlines()[-1] == "0", \
+            "It should not start any children process when importing the package."
+
+
+    def test_start_lazily(self, manager_server: _ManagerServer):
+        assert manager_server.is_running is False, "It should not start the server process before it be needed."
+        _manager = manager_server.get()
+        assert isinstance(_manager, SyncManager) is True, "It should start the server process when it be needed."
+        assert manager_server.is_running is True, "The server process should be running."
+        assert manager_server.get() is _manager, "It should reuse the running server process."
+
+
+    def test_acquire_and_release(self, manager_server: _ManagerServer):
+        _manager = manager_server.acquire()
+        assert manager_server.acquire() is _manager, "It should reuse the running server process."
+        assert manager_server.references == 2, "It should count the references."
+
+        manager_server.release()
+        assert manager_server.is_running is True, "It should keep the server process alive if any references exist."
+
+        manager_server.release()
+        assert manager_server.is_running is False, "It should shutdown the server process when all references be released."
+        assert manager_server.references == 0, "It should clear the references."
+
+
+    def test_pin(self, manager_server: _ManagerServer):
+        manager_server.acquire()
+        manager_server.pin()
+        manager_server.release()
+        assert manager_server.is_running is True, "It should keep the pinned server process alive."
+        assert manager_server.pinned is True, "The server process should be pinned."
+
+
+    def test_lazy_manager(self, manager_server: _ManagerServer):
+        _lazy_manager = _LazyManager(server=manager_server)
+        assert manager_server.is_running is False, "It should not start the server process before it be used."
+
+        _shared_list = _lazy_manager.list()
+        _shared_list.append(1)
+        assert list(_shared_list) == [1], "The shared object should work finely."
+        assert manager_server.pinned is True, "It should pin the server process when it generates any shared objects."
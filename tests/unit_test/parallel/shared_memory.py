@@ -0,0 +1,145 @@
+from multiprocessing.shared_memory import SharedMemory
+import pickle
+import pytest
+
+from multirunnable.parallel.strategy import ProcessStrategy, ProcessPoolStrategy
+from multirunnable.parallel.shared_memory import (
+    SharedMemoryHandle, SharedMemoryTarget,
+    chk_shared_memory_threshold, share_object, attach_object, detach_segments, restore_object, release_segments
+)
+
+
+_Threshold: int = 1024
+_Large_Bytes: bytes = b"m" * (_Threshold * 4)
+
+
+def _target_echo_function(value):
+    return value
+
+
+def _target_type_function(value):
+    return type(value).__name__
+
+
+def _target_concat_function(value_a, value_b):
+    return bytes(value_a) + bytes(value_b)
+
+
+
+class TestSharedMemoryTransport:
+
+    def test_chk_threshold(self):
+        chk_shared_memory_threshold(None)
+        chk_shared_memory_threshold(_Threshold)
+        with pytest.raises(ValueError):
+            chk_shared_memory_threshold(0)
+        with pytest.raises(ValueError):
+            chk_shared_memory_threshold("1024")
+
+
+    def test_share_small_object(self):
+        _segments = []
+        assert share_object(b"small", threshold=_Threshold, segments=_segments) == b"small", \
+            "It should return the object directly if it's smaller than threshold."
+        assert share_object([_Large_Bytes], threshold=_Threshold, segments=_segments) == [_Large_Bytes], \
+            "It should return the object directly if it isn't a buffer object."
+        assert _segments == [], "It should not create any segment."
+
+
+    @pytest.mark.parametrize(
+        argnames="large_object",
+        argvalues=[_Large_Bytes, bytearray(_Large_Bytes), memoryview(_Large_Bytes)]
+    )
+    def test_share_and_restore_object(self, large_object):
+        _handle = share_object(large_object, threshold=_Threshold)
+        assert isinstance(_handle, SharedMemoryHandle), "It should return a handle of the shared memory segment."
+        assert len(pickle.dumps(_handle)) < 256, "The pickled handle should be small."
+
+        _value = restore_object(pickle.loads(pickle.dumps(_handle)))
+        assert type(_value) is type(large_object), "It should restore the object as the same type."
+        assert bytes(_value) == _Large_Bytes, "It should restore the entire content."
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=_handle.name)
+
+
+    def test_attach_and_release_object(self):
+        _segments, _attached_segments = [], []
+        _handle = share_object(memoryview(_Large_Bytes), threshold=_Threshold, segments=_segments)
+        assert len(_segments) == 1, "It should keep the segment for releasing it later."
+
+        _view = attach_object(_handle, segments=_attached_segments)
+        assert isinstance(_view, memoryview) and _view.readonly is True, "It should attach a read-only view of the segment."
+        assert _view.tobytes() == _Large_Bytes, "The view should have the entire content."
+        _view.release()
+        detach_segments(_attached_segments)
+
+        release_segments(_segments)
+        assert _segments == [], "It should clear the released segments."
+        with pytest.raises(FileNotFoundError):
+            SharedMemory(name=_handle.name)
+
+
+    def test_shared_memory_target(self):
+        _segments = []
+        _target = SharedMemoryTarget(function=_target_echo_function, threshold=_Threshold)
+        _handle = share_object(_Large_Bytes, threshold=_Threshold, segments=_segments)
+
+        _result = pickle.loads(pickle.dumps(_target))(_handle)
+        assert isinstance(_result, SharedMemoryHandle), "The large return value should be shared."
+        assert restore_object(_result) == _Large_Bytes, "It should restore the return value."
+        release_segments(_segments)
+
+
+
+class TestSharedMemoryStrategy:
+
+    def test_process_strategy(self):
+        _strategy = ProcessStrategy(executors=1, shared_memory_threshold=_Threshold)
+        _strategy.initialization()
+        _workers = [_strategy.generate_worker(_target_echo_function, _Large_Bytes),
+                    _strategy.generate_worker(_target_type_function, memoryview(_Large_Bytes))]
+        _strategy.activate_workers(_workers)
+        _strategy.close(_workers)
+
+        _data = sorted([_r.data for _r in _strategy.get_result()], key=len)
+        assert _data == ["memoryview", _Large_Bytes], "It should pass the arguments and return value through shared memory."
+
+
+    def test_process_pool_strategy(self):
+        _strategy = ProcessPoolStrategy(pool_size=2)
+        _strategy.initialization(shared_memory_threshold=_Threshold)
+        assert _strategy.shared_memory_threshold == _Threshold, "It should enable the shared memory transport by the option."
+
+        _strategy.map(function=_target_echo_function, args_iter=[_Large_Bytes, b"small"])
+        assert [_r.data for _r in _strategy.get_result()] == [_Large_Bytes, b"small"], "It should restore the results of 'map'."
+
+        _strategy.map_by_args(function=_target_concat_function, args_iter=[(_Large_Bytes, _Large_Bytes)])
+        assert [_r.data for _r in _strategy.get_result()] == [_Large_Bytes * 2], "It should restore the results of 'map_by_args'."
+
+        _callback_values = []
+        _strategy.async_apply(tasks_size=2, function=_target_echo_function, args=(_Large_Bytes,), callback=_callback_values.append)
+        assert [_r.data for _r in _strategy.get_result()] == [_Large_Bytes] * 2, "It should restore the results of 'async_apply'."
+        assert _callback_values == [_Large_Bytes] * 2, "The callback should receive the restored results."
+
+        _segments = list(_strategy._Shared_Memory_Segments)
+        assert _segments, "It should keep the segments of arguments until closing."
+        _strategy.close()
+        for _segment in _segments:
+            with pytest.raises(FileNotFoundError):
+                SharedMemory(name=_segment.name)
+
+
+    def test_process_pool_strategy_streaming(self):
+        _strategy = ProcessPoolStrategy(pool_size=2, shared_memory_threshold=_Threshold)
+        _strategy.initialization()
+        _released_segments = []
+        try:
+            _results = []
+            for _result in _strategy.imap(function=_target_type_function, args_iter=[_Large_Bytes] * 6, stream=True, window=2):
+                _results.append(_result.data)
+                _released_segments.append(len(_strategy._Shared_Memory_Segments))
+        finally:
+            _strategy.close()
+
+        assert _results == ["bytes"] * 6, "It should pass the arguments through shared memory in streaming mode."
+        assert set(_released_segments) == {0}, "It should not keep the segments of streaming tasks until closing."
@@ -4,6 +4,7 @@ import os
 
 from multirunnable.parallel.strategy import ProcessStrategy, ProcessPoolStrategy
 from multirunnable.parallel.result import ParallelResult
+from multirunnable.framework.runnable.result import ResultStore
 from multirunnable import set_mode, RunningMode
 
 from ...test_config import (
@@ -42,6 +43,17 @@ def process_pool_strategy():
     return _strategy
 
 
+_Large_Result: bytes = b"0" * (1024 * 1024)
+
+
+def _target_large_result_function() -> bytes:
+    return _Large_Result
+
+
+def _target_echo_function(value: int) -> int:
+    return value
+
+
 _Generate_Worker_Error_Msg = \
     "The instances which be created by method 'generate_worker' should be an instance of 'multiprocessing.Process'."
 
@@ -533,6 +545,68 @@ class TestProcess(GeneralRunningTestSpec):
             assert isinstance(_r.exception, Exception) and "Testing result raising an exception" in str(_r.exception), "It should have an exception and error message is 'Testing result raising an exception'."
 
 
+    def test_get_large_result(self, process_strategy: ProcessStrategy):
+        process_strategy.reset_result()
+        _workers = [process_strategy.generate_worker(_target_large_result_function) for _ in range(Process_Size)]
+        process_strategy.activate_workers(_workers)
+        process_strategy.close(_workers)
+
+        _result = process_strategy.get_result()
+        assert isinstance(process_strategy._Processors_Running_Result, ResultStore), \
+            "The running result should be saved in a store of main process instead of any proxy object."
+        assert len(_result) == Process_Size, f"The amount of running result should be {Process_Size}."
+        for _r in _result:
+            assert _r.state == "successful", "Its state should be 'successful'."
+            assert _r.data == _Large_Result, "It should receive the entire large running result."
+
+
+    def test_get_result_with_max_size(self):
+        _strategy = ProcessStrategy(executors=Process_Size)
+        _strategy.initialization()
+        _strategy.result_max_size = 2
+        for _index in range(Process_Size + 2):
+            _worker = _strategy.generate_worker(_target_echo_function, _index)
+            _strategy.activate_workers([_worker])
+            _strategy.close([_worker])
+
+        assert [_r.data for _r in _strategy.get_result()] == [Process_Size, Process_Size + 1], "It should only keep the last running results."
+        assert _strategy.get_result() == [], "It should drop the running results after getting them."
+        with pytest.raises(ValueError):
+            _strategy.result_max_size = -1
+
+
+    def test_get_result_of_each_strategy(self, process_strategy: ProcessStrategy):
+        process_strategy.reset_result()
+        _other_strategy = ProcessStrategy(executors=Process_Size)
+        _other_strategy.initialization()
+        _worker = _other_strategy.generate_worker(_target_echo_function, 1)
+        _other_strategy.activate_workers([_worker])
+        _other_strategy.close([_worker])
+
+        assert process_strategy.get_result() == [], "It should not save the running results of other strategy instances."
+        assert [_r.data for _r in _other_strategy.get_result()] == [1], "It should save the running result in its own strategy instance."
+
+
+    def test_release_manager_server(self, monkeypatch):
+        _references = []
+        monkeypatch.setattr("multirunnable.parallel.strategy.activate_manager_server", lambda: _references.append(1) or object())
+        monkeypatch.setattr("multirunnable.parallel.strategy.deactivate_manager_server", lambda: _references.pop())
+
+        _strategy = ProcessStrategy(executors=Process_Size)
+        _strategy.initialization()
+        _strategy.initialization()
+        assert len(_references) == 1, "It should only take one reference of the manager server."
+
+        _workers = [_strategy.start_new_worker(_target_large_result_function) for _ in range(2)]
+        _strategy.close(_workers[0])
+        assert len(_references) == 1, "It should keep the manager server if any worker is still running."
+        _strategy.close(_workers[1])
+        assert len(_references) == 0, "It should release the manager server after all the workers are closed."
+
+        _strategy.run(function=_target_large_result_function)
+        assert len(_references) == 0, "It should release the manager server after each running."
+
+
     def _initial(self):
         reset_running_flags()
         # set_lock(lock=Global_Manager.Lock())
@@ -1,7 +1,7 @@
 from multiprocessing.synchronize import Lock, RLock, Semaphore, BoundedSemaphore, Event, Condition
 import pytest
 
-from multirunnable.framework.runnable.synchronization import PosixThreadLock, PosixThreadCommunication
+from multirunnable.framework.runnable.synchronization import PosixThreadLock, PosixThreadCommunication, ReadWriteLock, ShardedLock
 from multirunnable.parallel.synchronization import ProcessLock, ProcessCommunication
 
 from ...test_config import Semaphore_Value
@@ -43,6 +43,23 @@ class TestProcessLock:
         assert isinstance(_bounded_semaphore, BoundedSemaphore) is True, "This type of instance should be 'multiprocessing.synchronize.BoundedSemaphore'."
 
 
+    def test_get_read_write_lock(self, mr_lock: PosixThreadLock):
+        _rwlock = mr_lock.get_read_write_lock()
+        assert isinstance(_rwlock, ReadWriteLock) is True, "This type of instance should be 'ReadWriteLock'."
+        assert isinstance(_rwlock._resource, Semaphore) is True, "The resource should be 'multiprocessing.synchronize.Semaphore' so that it works between processes."
+        _rwlock.acquire_read()
+        _rwlock.acquire_read()
+        assert _rwlock.readers == 2, "The readers should hold it at the same time."
+        _rwlock.release_read()
+        _rwlock.release_read()
+
+
+    def test_get_sharded_lock(self, mr_lock: PosixThreadLock):
+        _sharded_lock = mr_lock.get_sharded_lock(shards=4)
+        assert isinstance(_sharded_lock, ShardedLock) is True and len(_sharded_lock) == 4, "This type of instance should be 'ShardedLock' with 4 locks."
+        assert isinstance(_sharded_lock.shard("key"), Lock) is True, "Each lock should be 'multiprocessing.synchronize.Lock'."
+
+
 
 class TestProcessCommunication:
 
@@ -0,0 +1,214 @@
+from multirunnable.persistence.database.strategy import (
+    BaseDatabaseConnection, BaseSingleConnection, BaseManagedConnectionPool, AsyncBaseSingleConnection, AsyncBaseConnectionPool)
+from multirunnable.persistence.database.operator import DatabaseOperator, AsyncDatabaseOperator, OffloadDatabaseOperator
+from multirunnable.persistence.database.layer import BaseDao, AsyncBaseDao
+from multirunnable.persistence.database.offload import ExecutorOffload
+from multirunnable._singletons import NamedSingletonABCMeta
+
+from typing import Any, Tuple, Dict
+import sqlite3
+
+
+
+def reset_sqlite_connection() -> None:
+    """
+    Description:
+        The connection strategy is a singleton by its class name, close and remove
+        it so that the next Dao connects to its own database file.
+    :return:
+    """
+
+    _strategy = NamedSingletonABCMeta._NamedInstances.pop("SQLiteSingleConnection", None)
+    if _strategy is not None and _strategy.current_connection is not None:
+        _strategy.close_connection()
+
+
+
+class SQLiteSingleConnection(BaseSingleConnection):
+
+    def _connect_database(self, **kwargs) -> sqlite3.Connection:
+        return sqlite3.connect(kwargs["database"], timeout=30, check_same_thread=False)
+
+
+    def commit(self) -> None:
+        self.current_connection.commit()
+
+
+    def _close_connection(self) -> None:
+        if self.current_connection is not None:
+            self.current_connection.close()
+
+
+
+class SQLiteConnectionPool(BaseManagedConnectionPool):
+
+    def _connect_database(self, **kwargs) -> sqlite3.Connection:
+        return sqlite3.connect(kwargs["database"], timeout=30, check_same_thread=False)
+
+
+    def _ping_connection(self, conn: sqlite3.Connection) -> bool:
+        conn.execute("SELECT 1").fetchall()
+        return True
+
+
+
+class SQLiteOperator(DatabaseOperator):
+
+    def __init__(self, conn_strategy: BaseDatabaseConnection, db_config: Dict = {}):
+        super().__init__(conn_strategy=conn_strategy, db_config=db_config)
+
+
+    def initial_cursor(self, connection: sqlite3.Connection) -> sqlite3.Cursor:
+        return connection.cursor()
+
+
+    def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> sqlite3.Cursor:
+        return self._statement(operator).execute(operator, params or ())
+
+
+    def execute_many(self, operator: Any, seq_params=None) -> sqlite3.Cursor:
+        return self._statement(operator).executemany(operator, seq_params)
+
+
+    def fetch_one(self) -> list:
+        return self._result_cursor.fetchone()
+
+
+    def fetch_many(self, size: int = None) -> list:
+        return self._result_cursor.fetchmany(size or 1)
+
+
+    def fetch_all(self) -> list:
+        return self._result_cursor.fetchall()
+
+
+    def close_cursor(self) -> None:
+        self._cursor.close()
+
+
+
+class SQLiteDao(BaseDao):
+
+    # The path of database file, the subclass (or test) sets it.
+    _Database_Path: str = ":memory:"
+
+    def _instantiate_strategy(self) -> SQLiteSingleConnection:
+        return SQLiteSingleConnection(database=self._Database_Path)
+
+
+    def _instantiate_database_opts(self, strategy: SQLiteSingleConnection) -> SQLiteOperator:
+        return SQLiteOperator(conn_strategy=strategy, db_config={"database": self._Database_Path})
+
+
+
+# The blocking calls of sqlite3 in the async implementations run in these threads.
+_SQLite_Offload = ExecutorOffload(max_workers=4)
+
+
+class AsyncSQLiteSingleConnection(AsyncBaseSingleConnection):
+
+    async def _connect_database(self, **kwargs) -> sqlite3.Connection:
+        return await _SQLite_Offload.run(sqlite3.connect, kwargs["database"], timeout=30, check_same_thread=False)
+
+
+    async def commit(self) -> None:
+        await _SQLite_Offload.run(self.current_connection.commit)
+
+
+    async def _close_connection(self) -> None:
+        if self.current_connection is not None:
+            await _SQLite_Offload.run(self.current_connection.close)
+
+
+
+class AsyncSQLiteConnectionPool(AsyncBaseConnectionPool):
+
+    async def _connect_database(self, **kwargs) -> sqlite3.Connection:
+        return await _SQLite_Offload.run(sqlite3.connect, kwargs["database"], timeout=30, check_same_thread=False)
+
+
+    async def _ping_connection(self, conn: sqlite3.Connection) -> bool:
+        await _SQLite_Offload.run(lambda: conn.execute("SELECT 1").fetchall())
+        return True
+
+
+    async def _commit(self, conn: sqlite3.Connection) -> None:
+        await _SQLite_Offload.run(conn.commit)
+
+
+    async def _disconnect(self, conn: sqlite3.Connection) -> None:
+        await _SQLite_Offload.run(conn.close)
+
+
+
+class AsyncSQLiteOperator(AsyncDatabaseOperator):
+
+    async def initial_cursor(self, connection: sqlite3.Connection) -> sqlite3.Cursor:
+        return await _SQLite_Offload.run(connection.cursor)
+
+
+    async def execute(self, operator: Any, params: Tuple = None, multi: bool = False) -> sqlite3.Cursor:
+        return await _SQLite_Offload.run((await self._get_cursor()).execute, operator, params or ())
+
+
+    async def execute_many(self, operator: Any, seq_params=None) -> sqlite3.Cursor:
+        return await _SQLite_Offload.run((await self._get_cursor()).executemany, operator, seq_params)
+
+
+    async def fetch_one(self) -> list:
+        return await _SQLite_Offload.run((await self._get_cursor()).fetchone)
+
+
+    async def fetch_many(self, size: int = None) -> list:
+        return await _SQLite_Offload.run((await self._get_cursor()).fetchmany, size or 1)
+
+
+    async def fetch_all(self) -> list:
+        return await _SQLite_Offload.run((await self._get_cursor()).fetchall)
+
+
+    async def close_cursor(self) -> None:
+        await _SQLite_Offload.run((await self._get_cursor()).close)
+
+
+
+class AsyncSQLiteDao(AsyncBaseDao):
+
+    _Database_Path: str = ":memory:"
+
+    def _instantiate_strategy(self) -> AsyncSQLiteSingleConnection:
+        return AsyncSQLiteSingleConnection(database=self._Database_Path)
+
+
+    def _instantiate_database_opts(self, strategy: AsyncSQLiteSingleConnection) -> AsyncSQLiteOperator:
+        return AsyncSQLiteOperator(conn_strategy=strategy, db_config={"database": self._Database_Path})
+
+
+
+class AsyncSQLitePoolDao(AsyncBaseDao):
+
+    _Database_Path: str = ":memory:"
+    _Pool_Name: str = "async_sqlite_pool"
+    _Pool_Size: int = 2
+
+    def _instantiate_strategy(self) -> AsyncSQLiteConnectionPool:
+        return AsyncSQLiteConnectionPool(pool_name=self._Pool_Name, pool_size=self._Pool_Size, database=self._Database_Path)
+
+
+    def _instantiate_database_opts(self, strategy: AsyncSQLiteConnectionPool) -> AsyncSQLiteOperator:
+        return AsyncSQLiteOperator(conn_strategy=strategy, db_config={"pool_name": self._Pool_Name, "database": self._Database_Path})
+
+
+
+class OffloadSQLiteDao(AsyncBaseDao):
+
+    _Database_Path: str = ":memory:"
+
+    def _instantiate_strategy(self) -> None:
+        return None
+
+
+    def _instantiate_database_opts(self, strategy: None) -> OffloadDatabaseOperator:
+        return OffloadDatabaseOperator(operator=lambda: SQLiteOperator(
+            conn_strategy=SQLiteSingleConnection(database=self._Database_Path),
+            db_config={"database": self._Database_Path}))
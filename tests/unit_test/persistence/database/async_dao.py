@@ -0,0 +1,230 @@
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import tempfile
+import sqlite3
+import asyncio
+import pytest
+import os
+
+from multirunnable.persistence.database.strategy import database_connection_pools
+from multirunnable.persistence.database.offload import ExecutorOffload
+from multirunnable.exceptions import ConnectionPoolTimeoutError
+from multirunnable._singletons import NamedSingletonABCMeta
+
+from ._sqlite_implement import (
+    AsyncSQLiteDao, AsyncSQLitePoolDao, OffloadSQLiteDao, AsyncSQLiteConnectionPool, reset_sqlite_connection
+)
+
+
+_Tasks: int = 8
+_Rows: int = 20
+_Create_Table_SQL: str = "CREATE TABLE crawled_data (task INTEGER, page INTEGER)"
+_Insert_SQL: str = "INSERT INTO crawled_data (task, page) VALUES (?, ?)"
+_Count_SQL: str = "SELECT count(*) FROM crawled_data"
+# It takes a while (hundreds of milliseconds) in sqlite.
+_Slow_SQL: str = "WITH RECURSIVE c(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM c WHERE x < 2000000) SELECT count(*) FROM c"
+
+
+@pytest.fixture(scope="function")
+def database_path() -> str:
+    _database_path = os.path.join(tempfile.mkdtemp(), "async_dao.db")
+    with sqlite3.connect(_database_path) as _connection:
+        _connection.execute(_Create_Table_SQL)
+    for _dao_cls in (AsyncSQLiteDao, AsyncSQLitePoolDao, OffloadSQLiteDao):
+        _dao_cls._Database_Path = _database_path
+
+    yield _database_path
+
+    for _strategy_cls in ("AsyncSQLiteSingleConnection", "AsyncSQLiteConnectionPool"):
+        NamedSingletonABCMeta._NamedInstances.pop(_strategy_cls, None)
+    database_connection_pools().pop(AsyncSQLitePoolDao._Pool_Name, None)
+    reset_sqlite_connection()
+
+
+def _count_rows(database_path: str) -> int:
+    with sqlite3.connect(database_path) as _connection:
+        return _connection.execute(_Count_SQL).fetchone()[0]
+
+
+async def _heartbeat(stop: asyncio.Event) -> int:
+    _beats = 0
+    while stop.is_set() is False:
+        await asyncio.sleep(0.01)
+        _beats += 1
+    return _beats
+
+
+async def _run_without_blocking(dao) -> int:
+    """
+    Description:
+        Run the slow statement by the Dao, and return how many times the other task
+        runs at the same time.
+    :return:
+    """
+    _stop = asyncio.Event()
+    _heartbeat_task = asyncio.create_task(_heartbeat(_stop))
+    await asyncio.sleep(0)
+    await dao.execute(_Slow_SQL)
+    assert await dao.fetch_one() == (2000000,)
+    _stop.set()
+    return await _heartbeat_task
+
+
+
+class TestExecutorOffload:
+
+    def test_run_in_thread(self):
+        _offload = ExecutorOffload()
+        _thread_ident = asyncio.run(_offload.run(threading.get_ident))
+        assert _thread_ident != threading.get_ident(), "It should run the function in the other thread."
+        assert asyncio.run(_offload.run(threading.get_ident)) == _thread_ident, "It should run in the same thread by default."
+        _offload.shutdown()
+
+
+    def test_executor(self):
+        with pytest.raises(ValueError):
+            ExecutorOffload(max_workers=0)
+
+        _executor = ThreadPoolExecutor(max_workers=2)
+        _offload = ExecutorOffload(executor=_executor)
+        assert asyncio.run(_offload.run(sum, [1, 2, 3])) == 6
+        _offload.shutdown()
+        assert _executor.submit(sum, [1]).result() == 1, "It shouldn't shut down the executor which isn't created by itself."
+        _executor.shutdown()
+
+
+
+class TestAsyncBaseDao:
+
+    def test_single_connection(self, database_path: str):
+        async def _operate():
+            _dao = AsyncSQLiteDao()
+            await _dao.execute_many(_Insert_SQL, [(0, _page) for _page in range(_Rows)])
+            await _dao.execute(_Insert_SQL, (0, _Rows))
+            await _dao.commit()
+            await _dao.execute("SELECT page FROM crawled_data WHERE task = ? ORDER BY page", (0,))
+            _pages = await _dao.fetch_all()
+            await _dao.close_connection()
+            return _pages
+
+        assert asyncio.run(_operate()) == [(_page,) for _page in range(_Rows + 1)]
+        assert _count_rows(database_path) == _Rows + 1
+
+
+    def test_not_block_event_loop(self, database_path: str):
+        async def _operate():
+            _dao = AsyncSQLiteDao()
+            _beats = await _run_without_blocking(_dao)
+            await _dao.close_connection()
+            return _beats
+
+        assert asyncio.run(_operate()) > 0, "The other tasks should keep running when it's executing."
+
+
+    def test_connection_pool(self, database_path: str):
+        async def _crawl(task: int):
+            _dao = AsyncSQLitePoolDao()
+            for _page in range(_Rows):
+                await _dao.execute(_Insert_SQL, (task, _page))
+                await asyncio.sleep(0)
+            await _dao.commit()
+            await _dao.close_connection()
+
+        async def _operate():
+            await asyncio.gather(*[_crawl(_task) for _task in range(_Tasks)])
+            return AsyncSQLitePoolDao().database_opts._conn_strategy.pool_metrics()
+
+        _metrics = asyncio.run(_operate())
+        assert _count_rows(database_path) == _Tasks * _Rows
+        assert _metrics["checkouts"] == _Tasks and _metrics["created"] <= AsyncSQLitePoolDao._Pool_Size, \
+            "The tasks should share the connections of pool."
+        assert _metrics["waits"] > 0 and _metrics["in_use"] == 0
+
+
+    def test_connection_by_task(self, database_path: str):
+        async def _check_out(strategy: AsyncSQLiteConnectionPool):
+            _connection = await strategy.get_one_connection(pool_name=AsyncSQLitePoolDao._Pool_Name)
+            await asyncio.sleep(0)
+            assert strategy.current_connection is _connection
+            return _connection
+
+        async def _operate():
+            _strategy = AsyncSQLitePoolDao().database_opts._conn_strategy
+            await _strategy.initial(**_strategy.database_config)
+            _connections = await asyncio.gather(_check_out(_strategy), _check_out(_strategy))
+            assert _strategy.current_connection is None, "The task shouldn't get the connections of the other tasks."
+
+            with pytest.raises(ConnectionPoolTimeoutError):
+                await _strategy.get_one_connection(pool_name=AsyncSQLitePoolDao._Pool_Name, timeout=0.1)
+            for _connection in _connections:
+                await _strategy.close_connection(conn=_connection)
+            return _strategy.pool_metrics()
+
+        _metrics = asyncio.run(_operate())
+        assert (_metrics["timeouts"], _metrics["idle"], _metrics["in_use"]) == (1, 2, 0)
+
+
+    def test_reuse_pool(self, database_path: str):
+        async def _operate():
+            _strategy = AsyncSQLitePoolDao().database_opts._conn_strategy
+            await _strategy.initial(**_strategy.database_config)
+            _pool = database_connection_pools()[AsyncSQLitePoolDao._Pool_Name]
+            await _strategy.initial(**_strategy.database_config)
+            assert database_connection_pools()[AsyncSQLitePoolDao._Pool_Name] is _pool, "It shouldn't rebuild the pool which is open."
+            with pytest.raises(ValueError):
+                await _strategy.initial(**{**_strategy.database_config, "database": ":memory:"})
+            await _pool.close()
+
+        asyncio.run(_operate())
+
+
+    def test_reconnect(self, database_path: str):
+        async def _operate():
+            _dao = AsyncSQLitePoolDao()
+            _strategy = _dao.database_opts._conn_strategy
+            await _dao.execute(_Count_SQL)
+            _connection = _strategy.current_connection
+            await _dao.reconnect(force=True)
+            assert _strategy.current_connection is not _connection, "It should check out another connection."
+            await _dao.execute(_Count_SQL)
+            assert await _dao.fetch_one() == (0,)
+            await _dao.close_connection()
+            return _strategy.pool_metrics()
+
+        assert asyncio.run(_operate())["discarded"] == 1
+
+
+    def test_offload_sync_operator(self, database_path: str):
+        async def _operate():
+            _dao = OffloadSQLiteDao()
+            await _dao.execute(_Insert_SQL, (0, 0))
+            await _dao.commit()
+            await _dao.execute(_Count_SQL)
+            _count = await _dao.fetch_one()
+            _beats = await _run_without_blocking(_dao)
+            await _dao.close_connection()
+            assert _dao.database_opts.offload._executor is None, "It should shut down the executor when closing the connection."
+            return _count, _beats
+
+        _count, _beats = asyncio.run(_operate())
+        assert _count == (1,) and _beats > 0, "The sync operator should run in the executor without blocking the event loop."
+
+
+    def test_offload_instantiate_operator_once(self, database_path: str):
+        _instantiated = []
+
+        class _CountingOffloadSQLiteDao(OffloadSQLiteDao):
+
+            def _instantiate_database_opts(self, strategy: None):
+                _operator = super()._instantiate_database_opts(strategy=strategy)
+                _factory = _operator._operator_factory
+                _operator._operator_factory = lambda: _instantiated.append(1) or _factory()
+                return _operator
+
+        async def _operate():
+            _dao = _CountingOffloadSQLiteDao()
+            await asyncio.gather(*[_dao.execute(_Count_SQL) for _ in range(_Tasks)])
+            await _dao.close_connection()
+
+        asyncio.run(_operate())
+        assert len(_instantiated) == 1, "It should instantiate the sync operator only once even if the tasks run at the same time."
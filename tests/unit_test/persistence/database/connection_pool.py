@@ -0,0 +1,439 @@
+from multiprocessing import Process, Queue as ProcessQueue
+import threading
+import asyncio
+import tempfile
+import sqlite3
+import pytest
+import time
+import os
+
+import gevent
+
+from multirunnable.persistence.database.strategy import ManagedConnectionPool, database_connection_pools, _WorkerLocal
+from multirunnable.exceptions import ConnectionPoolTimeoutError, ConnectionPoolExhaustedError
+from multirunnable._singletons import NamedSingletonABCMeta
+from multirunnable import set_mode, RunningMode
+
+from ._sqlite_implement import SQLiteConnectionPool, SQLiteOperator
+
+
+_Workers: int = 8
+_Checkouts: int = 50
+_Pool_Name: str = "sqlite_testing_pool"
+
+
+class CountingConnector:
+
+    def __init__(self):
+        self.database = os.path.join(tempfile.mkdtemp(), "connection_pool.db")
+        self.connections = 0
+        self.pings = 0
+
+
+    def connect(self) -> sqlite3.Connection:
+        self.connections += 1
+        return sqlite3.connect(self.database, check_same_thread=False)
+
+
+    def ping(self, connection: sqlite3.Connection) -> bool:
+        self.pings += 1
+        connection.execute("SELECT 1").fetchall()
+        return True
+
+
+    def close(self, connection: sqlite3.Connection) -> None:
+        connection.close()
+
+
+    def pool(self, **kwargs) -> ManagedConnectionPool:
+        return ManagedConnectionPool(name=_Pool_Name, connect=self.connect, ping=self.ping, close=self.close, **kwargs)
+
+
+
+class KeyedSQLiteConnectionPool(SQLiteConnectionPool):
+
+    def _get_connections_key(self) -> str:
+        return "all_workers"
+
+
+
+@pytest.fixture(scope="function")
+def connector() -> CountingConnector:
+    return CountingConnector()
+
+
+@pytest.fixture(scope="function")
+def pool_strategy() -> SQLiteConnectionPool:
+    set_mode(RunningMode.Concurrent)
+    NamedSingletonABCMeta._NamedInstances.pop("SQLiteConnectionPool", None)
+    database_connection_pools().pop(_Pool_Name, None)
+    _database = os.path.join(tempfile.mkdtemp(), "connection_pool.db")
+    _strategy = SQLiteConnectionPool(pool_name=_Pool_Name, pool_size=2, database=_database, min_idle=1)
+    yield _strategy
+    _strategy.close_pool(pool_name=_Pool_Name)
+    NamedSingletonABCMeta._NamedInstances.pop("SQLiteConnectionPool", None)
+    database_connection_pools().pop(_Pool_Name, None)
+    set_mode(None)
+
+
+def _checkout_in_child(pool: ManagedConnectionPool, queue: ProcessQueue) -> None:
+    _connection = pool.get_connection()
+    _connection.execute("SELECT 1").fetchall()
+    pool.release(_connection)
+    queue.put(pool.metrics()["created"])
+
+
+def _binding_in_child(worker_local: _WorkerLocal, queue: ProcessQueue) -> None:
+    queue.put(worker_local.get().connection)
+
+
+def _use_connections(pool: ManagedConnectionPool, sleep) -> None:
+    for _ in range(_Checkouts):
+        _connection = pool.get_connection()
+        sleep(0)
+        pool.release(_connection)
+
+
+
+class TestManagedConnectionPool:
+
+    def test_lazy_growth(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=3)
+        assert _pool.size == 0 and connector.connections == 0, "It shouldn't connect to database before it's needed."
+
+        _connections = [_pool.get_connection() for _ in range(2)]
+        assert _pool.size == 2 and connector.connections == 2
+        for _connection in _connections:
+            _pool.release(_connection)
+
+        _pool.release(_pool.get_connection())
+        assert connector.connections == 2, "It should reuse the idle connection."
+        _metrics = _pool.metrics()
+        assert (_metrics["checkouts"], _metrics["created"], _metrics["idle"], _metrics["in_use"]) == (3, 2, 2, 0)
+
+
+    def test_min_idle(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=3, min_idle=2)
+        assert _pool.metrics()["idle"] == 2, "It should create the min idle connections at the beginning."
+
+        _connection = _pool.get_connection()
+        _pool.release(_connection, discard=True)
+        _deadline = time.monotonic() + 5
+        while _pool.metrics()["idle"] < 2 and time.monotonic() < _deadline:
+            time.sleep(0.01)
+        _metrics = _pool.metrics()
+        assert _metrics["idle"] == 2 and _metrics["discarded"] == 1, "It should create the new one in background to keep the min idle connections."
+
+
+    def test_release_without_connecting(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=2, min_idle=1)
+        _connect = connector.connect
+        connector.connect = lambda: time.sleep(0.3) or _connect()
+
+        _connection = _pool.get_connection()
+        _start = time.monotonic()
+        _pool.release(_connection, discard=True)
+        assert time.monotonic() - _start < 0.3, "It should not wait for creating the min idle connection when releasing."
+
+
+    def test_checkout_timeout(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=1, checkout_timeout=0.1)
+        _connection = _pool.get_connection()
+
+        _start = time.monotonic()
+        with pytest.raises(ConnectionPoolTimeoutError):
+            _pool.get_connection()
+        assert time.monotonic() - _start >= 0.1
+        _metrics = _pool.metrics()
+        assert (_metrics["waits"], _metrics["timeouts"], _metrics["size"]) == (1, 1, 1), "It shouldn't grow over the max size."
+        _pool.release(_connection)
+
+
+    def test_max_waiters(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=1, max_waiters=0)
+        _connection = _pool.get_connection()
+        with pytest.raises(ConnectionPoolExhaustedError):
+            _pool.get_connection(timeout=10)
+        assert _pool.metrics()["rejections"] == 1
+        _pool.release(_connection)
+
+
+    def test_wait_for_release(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=1)
+        _connection = _pool.get_connection()
+        _got = []
+        _waiter = threading.Thread(target=lambda: _got.append(_pool.get_connection(timeout=5)))
+        _waiter.start()
+        time.sleep(0.1)
+        _pool.release(_connection)
+        _waiter.join()
+
+        assert _got == [_connection], "The waiting worker should get the released connection."
+        _metrics = _pool.metrics()
+        assert _metrics["waits"] == 1 and _metrics["wait_time"]["max"] >= 0.05
+        _pool.release(_got[0])
+
+
+    def test_pre_ping(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=1, validation_interval=60)
+        _pool.release(_pool.get_connection())
+        _pool.release(_pool.get_connection())
+        assert connector.pings == 0, "It shouldn't ping the connection which is checked in the validation interval."
+
+        _pool = connector.pool(max_size=1, validation_interval=0)
+        _connection = _pool.get_connection()
+        _pool.release(_connection)
+        _connection.close()
+        _new_connection = _pool.get_connection()
+        assert _new_connection is not _connection, "It should replace the connection which fails to ping."
+        assert _pool.metrics()["invalid"] == 1
+        _pool.release(_new_connection)
+
+
+    def test_max_lifetime(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=1, max_lifetime=0.1)
+        _connection = _pool.get_connection()
+        _pool.release(_connection)
+        time.sleep(0.1)
+
+        _new_connection = _pool.get_connection()
+        assert _new_connection is not _connection and _pool.metrics()["expired"] == 1, "It shouldn't reuse the too old connection."
+        _pool.release(_new_connection)
+
+
+    def test_release_and_close(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=2)
+        with pytest.raises(ValueError):
+            _pool.release(sqlite3.connect(connector.database))
+
+        _connection = _pool.get_connection()
+        _pool.release(_pool.get_connection())
+        _pool.close()
+        assert _pool.closed is True and _pool.metrics()["idle"] == 0
+        with pytest.raises(ConnectionError):
+            _pool.get_connection()
+
+        _pool.release(_connection)
+        with pytest.raises(sqlite3.ProgrammingError):
+            _connection.execute("SELECT 1")
+
+
+    def test_invalid_options(self, connector: CountingConnector):
+        with pytest.raises(ValueError):
+            connector.pool(max_size=0)
+        with pytest.raises(ValueError):
+            connector.pool(max_size=1, min_idle=2)
+
+
+    def test_concurrent(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=3)
+        _threads = [threading.Thread(target=_use_connections, args=(_pool, time.sleep)) for _ in range(_Workers)]
+        for _thread in _threads:
+            _thread.start()
+        for _thread in _threads:
+            _thread.join()
+
+        _metrics = _pool.metrics()
+        assert _metrics["checkouts"] == _Workers * _Checkouts and _metrics["in_use"] == 0
+        assert _metrics["created"] <= 3, "It shouldn't grow over the max size."
+
+
+    def test_green_thread(self, connector: CountingConnector):
+        set_mode(RunningMode.GreenThread)
+        try:
+            _pool = connector.pool(max_size=3)
+            gevent.joinall([gevent.spawn(_use_connections, _pool, gevent.sleep) for _ in range(_Workers)])
+        finally:
+            set_mode(None)
+
+        _metrics = _pool.metrics()
+        assert _metrics["checkouts"] == _Workers * _Checkouts and _metrics["created"] <= 3
+        assert _metrics["waits"] > 0, "The green threads should wait for each other."
+
+
+    def test_parallel(self, connector: CountingConnector):
+        _pool = connector.pool(max_size=1)
+        _pool.release(_pool.get_connection())
+
+        _queue = ProcessQueue()
+        _process = Process(target=_checkout_in_child, args=(_pool, _queue))
+        _process.start()
+        _process.join()
+        assert _process.exitcode == 0
+        assert _queue.get(timeout=5) == 1, "The children process should create its own connection."
+        assert _pool.metrics()["idle"] == 1, "It shouldn't change the pool of parent process."
+
+
+
+class TestManagedConnectionPoolStrategy:
+
+    def test_get_and_close_connection(self, pool_strategy: SQLiteConnectionPool):
+        assert pool_strategy.pool_metrics()["idle"] == 1, "It should create the min idle connections."
+
+        _connection = pool_strategy.get_one_connection(pool_name=_Pool_Name)
+        assert pool_strategy.is_connected() is True and pool_strategy.current_connection is _connection
+        pool_strategy.close_connection()
+        _metrics = pool_strategy.pool_metrics()
+        assert pool_strategy.is_connected() is False and (_metrics["idle"], _metrics["in_use"]) == (1, 0), \
+            "It should release the connection back to pool."
+
+
+    def test_reuse_pool(self, pool_strategy: SQLiteConnectionPool):
+        _pool = database_connection_pools()[_Pool_Name]
+        pool_strategy.initial(**pool_strategy.database_config)
+        assert database_connection_pools()[_Pool_Name] is _pool, "It shouldn't rebuild the pool which is open."
+
+        with pytest.raises(ValueError):
+            pool_strategy.initial(**{**pool_strategy.database_config, "database": ":memory:"})
+        with pytest.raises(ValueError):
+            pool_strategy.initial(**{**pool_strategy.database_config, "pool_size": 5})
+        assert database_connection_pools()[_Pool_Name] is _pool, "It shouldn't replace the pool which is open."
+
+
+    def test_reconnect(self, pool_strategy: SQLiteConnectionPool):
+        _connection = pool_strategy.get_one_connection(pool_name=_Pool_Name)
+        assert pool_strategy.reconnect() is _connection
+
+        _new_connection = pool_strategy.reconnect(force=True)
+        assert _new_connection is not _connection and pool_strategy.pool_metrics()["discarded"] == 1, \
+            "It should discard the current connection and check out another one."
+        pool_strategy.close_connection()
+
+
+    def test_connection_by_worker(self, pool_strategy: SQLiteConnectionPool):
+        _connections = []
+
+        def _check_out():
+            _connections.append(pool_strategy.get_one_connection(pool_name=_Pool_Name))
+            assert pool_strategy.current_connection is _connections[-1]
+
+        _threads = [threading.Thread(target=_check_out) for _ in range(2)]
+        for _thread in _threads:
+            _thread.start()
+        for _thread in _threads:
+            _thread.join()
+
+        assert _connections[0] is not _connections[1], "Each worker should have its own connection."
+        assert pool_strategy.current_connection is None and pool_strategy.pool_metrics()["in_use"] == 2
+        for _connection in _connections:
+            pool_strategy.close_connection(conn=_connection)
+
+
+    def test_operator(self, pool_strategy: SQLiteConnectionPool):
+        _operator = SQLiteOperator(conn_strategy=pool_strategy, db_config={"pool_name": _Pool_Name})
+        _operator.execute("CREATE TABLE crawled_data (page INTEGER)")
+        _operator.execute_many("INSERT INTO crawled_data VALUES (?)", [(_page,) for _page in range(10)])
+        _operator.commit()
+        _operator.execute("SELECT count(*) FROM crawled_data")
+        assert _operator.fetch_one() == (10,)
+        _operator.close_connection()
+        assert pool_strategy.pool_metrics()["in_use"] == 0
+
+
+    def test_deprecated_connections_key(self, pool_strategy: SQLiteConnectionPool):
+        _pool_name = "sqlite_testing_keyed_pool"
+        with pytest.warns(DeprecationWarning):
+            _strategy = KeyedSQLiteConnectionPool(pool_name=_pool_name, pool_size=2, database=pool_strategy.database_config["database"])
+        try:
+            _connection = _strategy.get_one_connection(pool_name=_pool_name)
+            _connections = []
+            _thread = threading.Thread(target=lambda: _connections.append(_strategy.current_connection))
+            _thread.start()
+            _thread.join()
+            assert _connections == [_connection], "It should still keep the connections by the overridden key."
+            _strategy.close_connection()
+        finally:
+            _strategy.close_pool(pool_name=_pool_name)
+            NamedSingletonABCMeta._NamedInstances.pop("KeyedSQLiteConnectionPool", None)
+            database_connection_pools().pop(_pool_name, None)
+
+
+
+class TestWorkerLocal:
+
+    @pytest.mark.parametrize("mode", [RunningMode.Concurrent, RunningMode.ParallelConcurrent, None])
+    def test_thread_local(self, mode: RunningMode):
+        set_mode(mode)
+        try:
+            _worker_local = _WorkerLocal()
+            _bindings = []
+            _threads = [threading.Thread(target=lambda: _bindings.append(_worker_local.get())) for _ in range(_Workers)]
+            for _thread in _threads:
+                _thread.start()
+            for _thread in _threads:
+                _thread.join()
+        finally:
+            set_mode(None)
+
+        assert len(set(map(id, _bindings))) == _Workers, "Each thread should have its own binding."
+        assert _worker_local.get() is _worker_local.get()
+
+
+    def test_greenlet_local(self):
+        set_mode(RunningMode.GreenThread)
+        try:
+            _worker_local = _WorkerLocal()
+            _main_binding = _worker_local.get()
+            _greenlets = [gevent.spawn(_worker_local.get) for _ in range(_Workers)]
+            gevent.joinall(_greenlets)
+        finally:
+            set_mode(None)
+
+        _bindings = [_greenlet.value for _greenlet in _greenlets]
+        assert len(set(map(id, _bindings))) == _Workers and _main_binding not in _bindings, "Each green thread should have its own binding."
+
+
+    def test_task_local(self):
+        set_mode(RunningMode.Asynchronous)
+        _worker_local = _WorkerLocal()
+
+        async def _get_twice():
+            _binding = _worker_local.get()
+            await asyncio.sleep(0)
+            assert _worker_local.get() is _binding
+            return _binding
+
+        async def _main():
+            _main_binding = _worker_local.get()
+            _bindings = await asyncio.gather(*[_get_twice() for _ in range(_Workers)])
+            return _main_binding, _bindings
+
+        try:
+            _main_binding, _bindings = asyncio.run(_main())
+        finally:
+            set_mode(None)
+
+        assert len(set(map(id, _bindings))) == _Workers and _main_binding not in _bindings, \
+            "Each task should have its own binding but not inherit the one of its parent."
+
+
+    def test_process_global(self):
+        set_mode(RunningMode.Parallel)
+        try:
+            _worker_local = _WorkerLocal()
+            _binding = _worker_local.get()
+            _binding.connection = "parent connection"
+            _thread_bindings = []
+            _thread = threading.Thread(target=lambda: _thread_bindings.append(_worker_local.get()))
+            _thread.start()
+            _thread.join()
+            assert _thread_bindings == [_binding], "The workers in the same process should share the binding."
+
+            _queue = ProcessQueue()
+            _process = Process(target=_binding_in_child, args=(_worker_local, _queue))
+            _process.start()
+            _process.join()
+            assert _queue.get(timeout=5) is None, "The children process shouldn't inherit the binding of parent process."
+        finally:
+            set_mode(None)
+
+
+    def test_mode_changes(self):
+        set_mode(RunningMode.Concurrent)
+        try:
+            _worker_local = _WorkerLocal()
+            _binding = _worker_local.get()
+            set_mode(RunningMode.GreenThread)
+            assert _worker_local.get() is not _binding, "The bindings should be dropped if the running mode changes."
+        finally:
+            set_mode(None)
@@ -0,0 +1,190 @@
+import tempfile
+import sqlite3
+import pytest
+import os
+
+from multirunnable.persistence.database.statement_cache import PreparedStatementCache
+
+from ._sqlite_implement import SQLiteDao, SQLiteOperator, reset_sqlite_connection
+
+
+_Rows: int = 20
+_Insert_SQL: str = "INSERT INTO crawled_data (task, page) VALUES (?, ?)"
+_Select_SQL: str = "SELECT page FROM crawled_data WHERE task = ? ORDER BY page"
+_Count_SQL: str = "SELECT count(*) FROM crawled_data"
+
+
+class ReleaseRecorder:
+
+    def __init__(self):
+        self.released = []
+
+
+    def __call__(self, statement) -> None:
+        self.released.append(statement)
+
+
+
+class SmallCacheSQLiteOperator(SQLiteOperator):
+
+    _Statement_Cache_Size = 2
+
+
+
+class NoCacheSQLiteOperator(SQLiteOperator):
+
+    _Statement_Cache_Size = 0
+
+
+
+class SmallCacheSQLiteDao(SQLiteDao):
+
+    def _instantiate_database_opts(self, strategy) -> SmallCacheSQLiteOperator:
+        return SmallCacheSQLiteOperator(conn_strategy=strategy, db_config={"database": self._Database_Path})
+
+
+
+class NoCacheSQLiteDao(SQLiteDao):
+
+    def _instantiate_database_opts(self, strategy) -> NoCacheSQLiteOperator:
+        return NoCacheSQLiteOperator(conn_strategy=strategy, db_config={"database": self._Database_Path})
+
+
+
+class WriteBehindSQLiteDao(SQLiteDao):
+
+    _Write_Behind = True
+    _Write_Behind_Max_Size = 5
+    _Write_Behind_Max_Delay = 60
+
+
+
+@pytest.fixture(scope="function")
+def database_path() -> str:
+    reset_sqlite_connection()
+    _database_path = os.path.join(tempfile.mkdtemp(), "statement_cache.db")
+    with sqlite3.connect(_database_path) as _connection:
+        _connection.execute("CREATE TABLE crawled_data (task INTEGER, page INTEGER)")
+    SQLiteDao._Database_Path = _database_path
+    yield _database_path
+    SQLiteDao._Database_Path = ":memory:"
+    reset_sqlite_connection()
+
+
+
+class TestPreparedStatementCache:
+
+    def test_hits_and_misses(self):
+        _cache = PreparedStatementCache(max_size=4)
+        assert _cache.stats()["hit_ratio"] is None
+
+        assert _cache.get(_Insert_SQL) is None
+        _cache.put(_Insert_SQL, "insert")
+        assert _cache.get(_Insert_SQL) == "insert"
+        assert _cache.get(_Insert_SQL) == "insert"
+        assert _cache.stats() == {"hits": 2, "misses": 1, "evictions": 0, "hit_ratio": 2 / 3, "size": 1, "max_size": 4}
+
+
+    def test_evict_least_recently_used(self):
+        _recorder = ReleaseRecorder()
+        _cache = PreparedStatementCache(max_size=2, release=_recorder)
+        _cache.put(_Insert_SQL, "insert")
+        _cache.put(_Select_SQL, "select")
+        _cache.get(_Insert_SQL)
+        _cache.put(_Count_SQL, "count")
+
+        assert _recorder.released == ["select"], "It should release the least recently used statement."
+        assert _Select_SQL not in _cache and _Insert_SQL in _cache and _Count_SQL in _cache
+        assert _cache.stats()["evictions"] == 1
+
+
+    def test_clear(self):
+        def _release(statement):
+            raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+
+        _cache = PreparedStatementCache(max_size=2, release=_release)
+        _cache.put(_Insert_SQL, "insert")
+        _cache.get(_Insert_SQL)
+        _cache.clear()
+        assert len(_cache) == 0, "It should remove all the statements even if it fails to release them."
+        assert _cache.stats()["hits"] == 1, "It should keep the statistics."
+
+        with pytest.raises(ValueError):
+            PreparedStatementCache(max_size=0)
+
+
+
+class TestStatementCacheOperator:
+
+    def test_reuse_statement(self, database_path: str):
+        _dao = SQLiteDao()
+        _cursors = set()
+        for _page in range(_Rows):
+            _cursors.add(id(_dao.execute(_Insert_SQL, (0, _page))))
+        _dao.commit()
+
+        assert len(_cursors) == 1, "It should reuse the prepared statement of the same SQL."
+        _stats = _dao.statement_cache_stats()
+        assert (_stats["hits"], _stats["misses"], _stats["size"]) == (_Rows - 1, 1, 1)
+
+
+    def test_interleaved_statements(self, database_path: str):
+        _dao = SQLiteDao()
+        _dao.execute_many(_Insert_SQL, [(0, _page) for _page in range(_Rows)])
+        _dao.execute(_Select_SQL, (0,))
+        assert _dao.fetch_one() == (0,)
+        _dao.execute(_Count_SQL)
+        assert _dao.fetch_one() == (_Rows,), "It should fetch from the last executed statement."
+        _dao.execute(_Select_SQL, (0,))
+        assert _dao.fetch_many(size=2) == [(0,), (1,)]
+        assert _dao.fetch_all() == [(_page,) for _page in range(2, _Rows)]
+        assert _dao.statement_cache_stats()["size"] == 3
+
+
+    def test_evicted_statement_is_closed(self, database_path: str):
+        _dao = SmallCacheSQLiteDao()
+        _insert_cursor = _dao.execute(_Insert_SQL, (0, 0))
+        _dao.execute(_Select_SQL, (0,))
+        _dao.execute(_Count_SQL)
+        assert _dao.fetch_one() == (1,)
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            _insert_cursor.execute(_Count_SQL)
+        assert _dao.statement_cache_stats()["evictions"] == 1
+
+
+    def test_disabled(self, database_path: str):
+        _dao = NoCacheSQLiteDao()
+        assert _dao.database_opts.statement_cache is None
+        _insert_cursor = _dao.execute(_Insert_SQL, (0, 0))
+        assert _dao.execute(_Count_SQL) is _insert_cursor, "It should use the common cursor."
+        assert _dao.fetch_one() == (1,)
+        assert _dao.statement_cache_stats() == {}
+
+
+    def test_clear_when_reconnect(self, database_path: str):
+        _dao = SQLiteDao()
+        _dao.execute(_Count_SQL)
+        _opts = _dao.database_opts
+        assert len(_opts.statement_cache) == 1
+
+        _dao.reconnect(force=True)
+        assert len(_opts.statement_cache) == 0, "The prepared statements belong to the previous connection."
+        _dao.execute(_Count_SQL)
+        assert _dao.fetch_one() == (0,)
+        assert _dao.statement_cache_stats()["misses"] == 2
+
+
+    def test_write_behind(self, database_path: str):
+        _dao = WriteBehindSQLiteDao()
+        _dao.write_behind_buffer.drain()
+        for _page in range(_Rows):
+            _dao.execute(_Insert_SQL, (0, _page))
+        _dao.flush()
+
+        _dao.execute(_Count_SQL)
+        assert _dao.fetch_one() == (_Rows,)
+        _stats = _dao.statement_cache_stats()
+        assert (_stats["misses"], _stats["hits"]) == (2, _Rows // WriteBehindSQLiteDao._Write_Behind_Max_Size - 1), \
+            "The batches of write-behind should reuse the prepared statement."
+        _dao.close_connection()
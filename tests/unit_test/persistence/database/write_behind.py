@@ -0,0 +1,286 @@
+from multiprocessing import Process
+import threading
+import tempfile
+import sqlite3
+import pytest
+import time
+import os
+
+import gevent
+
+from multirunnable.persistence.database.write_behind import WriteBehindBuffer, get_write_behind_buffer, is_write_statement, is_transient_error
+
+from ._sqlite_implement import SQLiteDao, SQLiteOperator, reset_sqlite_connection
+
+
+_Workers: int = 4
+_Rows: int = 50
+_Insert_SQL: str = "INSERT INTO crawled_data (worker, page) VALUES (?, ?)"
+_Insert_Page_SQL: str = "INSERT INTO crawled_page (id, content) VALUES (?, ?)"
+
+
+class CountingSQLiteOperator(SQLiteOperator):
+
+    Executions = []
+
+    def execute_many(self, operator, seq_params=None):
+        self.Executions.append(len(seq_params))
+        return super().execute_many(operator=operator, seq_params=seq_params)
+
+
+
+class WriteBehindDao(SQLiteDao):
+
+    _Write_Behind = True
+    _Write_Behind_Max_Size = 20
+    _Write_Behind_Max_Delay = 60
+
+    def _instantiate_database_opts(self, strategy) -> CountingSQLiteOperator:
+        return CountingSQLiteOperator(conn_strategy=strategy, db_config={"database": self._Database_Path})
+
+
+    @property
+    def Executions(self) -> list:
+        return CountingSQLiteOperator.Executions
+
+
+
+class DelayedWriteBehindDao(WriteBehindDao):
+
+    _Write_Behind_Max_Delay = 0.1
+
+
+
+@pytest.fixture(scope="function")
+def dao() -> WriteBehindDao:
+    reset_sqlite_connection()
+    _database_path = os.path.join(tempfile.mkdtemp(), "write_behind.db")
+    WriteBehindDao._Database_Path = _database_path
+    CountingSQLiteOperator.Executions = []
+
+    _dao = WriteBehindDao()
+    _dao.execute("CREATE TABLE crawled_data (worker INTEGER, page INTEGER)")
+    _dao.commit()
+    _dao.write_behind_buffer.drain()
+    yield _dao
+    _dao.write_behind_buffer.drain()
+    reset_sqlite_connection()
+
+
+def _count_rows() -> int:
+    with sqlite3.connect(WriteBehindDao._Database_Path) as _connection:
+        return _connection.execute("SELECT count(*) FROM crawled_data").fetchone()[0]
+
+
+def _create_unique_table(dao: WriteBehindDao) -> None:
+    dao.execute("CREATE TABLE crawled_page (id INTEGER PRIMARY KEY, content TEXT)")
+    dao.commit()
+
+
+def _pages() -> list:
+    with sqlite3.connect(WriteBehindDao._Database_Path) as _connection:
+        return _connection.execute("SELECT id, content FROM crawled_page ORDER BY id").fetchall()
+
+
+def _crawl(worker: int, reconnect: bool = False) -> None:
+    _dao = WriteBehindDao()
+    if reconnect is True:
+        _dao.reconnect(force=True)
+    for _page in range(_Rows):
+        _dao.execute(_Insert_SQL, (worker, _page))
+        _dao.commit()
+        gevent.sleep(0)
+    if reconnect is True:
+        _dao.close_connection()
+
+
+
+class TestWriteBehindBuffer:
+
+    def test_due_by_size_and_delay(self):
+        _buffer = WriteBehindBuffer(max_size=3, max_delay=0.1)
+        assert _buffer.add("INSERT 1", (1,)) is False
+        assert _buffer.add("INSERT 2", (2,)) is False
+        assert _buffer.add("INSERT 2", (3,)) is True, "It should be due if the amount of rows reaches the max size."
+        assert _buffer.drain() == [("INSERT 1", [(1,)]), ("INSERT 2", [(2,), (3,)])], "The consecutive rows should be coalesced by statement."
+        assert len(_buffer) == 0 and _buffer.is_due() is False
+
+        _buffer.add("INSERT 1", (4,))
+        time.sleep(0.1)
+        assert _buffer.is_due() is True, "It should be due if the oldest row waits longer than the max delay."
+
+
+    def test_keep_order(self):
+        _buffer = WriteBehindBuffer()
+        for _operator, _params in (("INSERT 1", (1,)), ("DELETE 1", (1,)), ("INSERT 1", (1,)), ("INSERT 1", (2,))):
+            _buffer.add(_operator, _params)
+        assert _buffer.drain() == [("INSERT 1", [(1,)]), ("DELETE 1", [(1,)]), ("INSERT 1", [(1,), (2,)])], \
+            "The interleaved statements should keep their order."
+
+
+    def test_restore(self):
+        _buffer = WriteBehindBuffer()
+        _buffer.add("INSERT 1", (1,))
+        _batches = _buffer.drain()
+        _buffer.add("INSERT 1", (2,))
+        _buffer.restore(_batches)
+        assert len(_buffer) == 2 and _buffer.drain() == [("INSERT 1", [(1,), (2,)])], "The restored rows should be in front."
+        assert _buffer.failures == 1
+        _buffer.reset_failures()
+        assert _buffer.failures == 0
+
+
+    def test_invalid_options(self):
+        with pytest.raises(ValueError):
+            WriteBehindBuffer(max_size=0)
+        with pytest.raises(ValueError):
+            WriteBehindBuffer(max_delay=-1)
+        with pytest.raises(ValueError):
+            WriteBehindBuffer(max_retries=-1)
+
+
+    def test_write_statement(self):
+        assert is_write_statement("  insert into t values (?)") is True
+        assert is_write_statement("REPLACE INTO t VALUES (?)") is True
+        assert is_write_statement("SELECT * FROM t WHERE a = ?") is False
+
+
+    def test_transient_error(self):
+        assert is_transient_error(sqlite3.OperationalError("database is locked")) is True
+        assert is_transient_error(ConnectionResetError()) is True
+        assert is_transient_error(sqlite3.IntegrityError("UNIQUE constraint failed")) is False
+        assert is_transient_error(sqlite3.ProgrammingError("Incorrect number of bindings")) is False
+        assert is_transient_error(TypeError()) is False
+
+
+    def test_buffer_by_process(self):
+        _buffer = get_write_behind_buffer(name="test_buffer_by_process")
+        assert get_write_behind_buffer(name="test_buffer_by_process") is _buffer, "It should be the same buffer in the same process."
+
+
+
+class TestWriteBehindDao:
+
+    def test_flush_by_size(self, dao: WriteBehindDao):
+        for _page in range(dao._Write_Behind_Max_Size - 1):
+            assert dao.execute(_Insert_SQL, (0, _page)) is None
+            dao.commit()
+        assert _count_rows() == 0, "The rows should be kept in the buffer."
+
+        dao.execute(_Insert_SQL, (0, dao._Write_Behind_Max_Size))
+        assert _count_rows() == dao._Write_Behind_Max_Size and dao.Executions == [dao._Write_Behind_Max_Size], \
+            "The rows should be written by one batch."
+
+
+    def test_buffer_by_dao_class(self, dao: WriteBehindDao):
+        # The same class name in another module shouldn't share the buffer.
+        _same_name_dao_cls = type(WriteBehindDao.__name__, (WriteBehindDao,), {"__module__": "other.module"})
+        _same_name_dao = _same_name_dao_cls()
+        assert _same_name_dao.write_behind_buffer is not dao.write_behind_buffer, "Each Dao class should have its own buffer."
+        assert WriteBehindDao().write_behind_buffer is dao.write_behind_buffer, "The instances of the same Dao class should share the buffer."
+
+
+    def test_flush_by_delay(self, dao: WriteBehindDao):
+        _delayed_dao = DelayedWriteBehindDao()
+        _delayed_dao.execute(_Insert_SQL, (0, 0))
+        _delayed_dao.commit()
+        assert _count_rows() == 0
+
+        time.sleep(0.1)
+        _delayed_dao.commit()
+        assert _count_rows() == 1, "The rows should be written if the oldest one waits too long."
+
+
+    def test_flush_and_close(self, dao: WriteBehindDao):
+        dao.execute(_Insert_SQL, (0, 0))
+        dao.execute("UPDATE crawled_data SET page = ? WHERE worker = ?", (1, 0))
+        assert dao.flush() == 2 and dao.flush() == 0
+        assert _count_rows() == 1
+
+        dao.execute(_Insert_SQL, (0, 1))
+        dao.close_connection()
+        assert _count_rows() == 2, "It should flush before closing the connection."
+
+
+    def test_read_directly(self, dao: WriteBehindDao):
+        dao.execute(_Insert_SQL, (0, 0))
+        dao.execute("SELECT count(*) FROM crawled_data WHERE worker = ?", (0,))
+        assert dao.fetch_one() == (0,), "The statement which isn't writing should be executed directly."
+
+
+    def test_restore_if_fail(self, dao: WriteBehindDao):
+        dao.execute("INSERT INTO not_exist_table VALUES (?)", (0,))
+        with pytest.raises(sqlite3.OperationalError):
+            dao.flush()
+        assert len(dao.write_behind_buffer) == 1, "The rows should be put back if it fails to write them."
+
+
+    def test_interleaved_statements(self, dao: WriteBehindDao):
+        _create_unique_table(dao)
+        dao.execute(_Insert_Page_SQL, (1, "a"))
+        dao.execute("DELETE FROM crawled_page WHERE id = ?", (1,))
+        dao.execute(_Insert_Page_SQL, (1, "b"))
+        assert dao.flush() == 3
+        assert _pages() == [(1, "b")], "The statements should be written by the order they're executed."
+
+
+    def test_partial_failure(self, dao: WriteBehindDao):
+        _create_unique_table(dao)
+        dao.execute(_Insert_SQL, (0, 0))
+        dao.execute(_Insert_Page_SQL, (1, "a"))
+        dao.execute(_Insert_Page_SQL, (1, "b"))
+        dao.execute(_Insert_SQL, (0, 1))
+        with pytest.raises(sqlite3.IntegrityError):
+            dao.flush()
+
+        dao.execute("SELECT count(*) FROM crawled_data")
+        dao.commit()
+        assert _count_rows() == 0 and _pages() == [], "The batches which have been written should be rolled back."
+        assert len(dao.write_behind_buffer) == 2, "It should drop the failing batch but keep the others."
+        assert dao.flush() == 2 and _count_rows() == 2 and _pages() == []
+        assert dao.write_behind_buffer.failures == 0
+
+
+    def test_max_retries(self, dao: WriteBehindDao):
+        dao.execute("INSERT INTO not_exist_table VALUES (?)", (0,))
+        dao.execute(_Insert_SQL, (0, 0))
+        for _ in range(dao._Write_Behind_Max_Retries + 1):
+            with pytest.raises(sqlite3.OperationalError):
+                dao.flush()
+
+        assert len(dao.write_behind_buffer) == 1, "It should drop the failing batch after retrying too many times."
+        assert dao.flush() == 1 and _count_rows() == 1
+
+
+    def test_concurrent(self, dao: WriteBehindDao):
+        _threads = [threading.Thread(target=_crawl, args=(_worker,)) for _worker in range(_Workers)]
+        for _thread in _threads:
+            _thread.start()
+        for _thread in _threads:
+            _thread.join()
+        dao.flush()
+
+        assert _count_rows() == _Workers * _Rows, "All the rows of all the threads should be written."
+        assert len(dao.Executions) < _Workers * _Rows / 2, "The rows of different threads should be coalesced."
+
+
+    def test_green_thread(self, dao: WriteBehindDao):
+        gevent.joinall([gevent.spawn(_crawl, _worker) for _worker in range(_Workers)])
+        dao.flush()
+
+        assert _count_rows() == _Workers * _Rows
+        assert dao.Executions == [dao._Write_Behind_Max_Size] * (_Workers * _Rows // dao._Write_Behind_Max_Size)
+
+
+    def test_parallel(self, dao: WriteBehindDao):
+        dao.execute(_Insert_SQL, (-1, 0))
+        _processes = [Process(target=_crawl, args=(_worker, True)) for _worker in range(_Workers)]
+        for _process in _processes:
+            _process.start()
+        for _process in _processes:
+            _process.join()
+
+        assert all(_process.exitcode == 0 for _process in _processes)
+        assert _count_rows() == _Workers * _Rows, "Each process should write its own rows but not the rows of parent process."
+        dao.flush()
+        assert _count_rows() == _Workers * _Rows + 1
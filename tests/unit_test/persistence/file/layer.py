@@ -20,6 +20,13 @@ Thread_Counter = 0
 Thread_Lock = threading.Lock()
 
 
+@pytest.fixture(scope="function", autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    # The files are saved with the relative paths, so save them in a temporary directory.
+    monkeypatch.chdir(tmp_path)
+
+
+
 class _ExampleTestingFao(BaseFao):
     pass
 
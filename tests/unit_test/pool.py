@@ -1,11 +1,13 @@
+from typing import Iterator
 import traceback
 import pytest
 
 from multirunnable.concurrent.strategy import ThreadPoolStrategy
 from multirunnable.coroutine.strategy import GreenThreadPoolStrategy
 from multirunnable.parallel.strategy import ProcessPoolStrategy
+from multirunnable.framework.runnable.result import PoolResult
 from multirunnable.pool import AdapterPool
-from multirunnable import get_current_mode, set_mode, RunningMode, SimplePool
+from multirunnable import get_current_mode, set_mode, RunningMode, SimplePool, PoolLifecycle, Pool_Registry, ScalingPolicy, InMemoryExporter
 
 from ..test_config import Worker_Pool_Size, Task_Size, Test_Function_Args, Test_Function_Multiple_Args
 from .._examples import (
@@ -23,6 +25,12 @@ _Worker_Pool_Size = Worker_Pool_Size
 _Task_Size = Task_Size
 
 
+def _fail_on_odd(value: int) -> int:
+    if value % 2 == 1:
+        raise ValueError(f"The value {value} is odd.")
+    return value
+
+
 @pytest.fixture(scope="function")
 def simple_pool(request) -> SimplePool:
     return SimplePool(mode=request.param, pool_size=_Worker_Pool_Size)
@@ -371,6 +379,47 @@ class TestSimplePool:
         TestSimplePool.chk_results(results=_results, expected_size=len(Test_Function_Args))
 
 
+    @pytest.mark.parametrize(
+        argnames="simple_pool",
+        argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread],
+        indirect=True
+    )
+    def test_imap_with_stream(self, simple_pool: SimplePool):
+        TestSimplePool._initial()
+        with simple_pool as _pool:
+            _results = _pool.imap(function=target_function_for_map, args_iter=Test_Function_Args, stream=True)
+            assert isinstance(_results, Iterator), "It should return an iterator in streaming mode."
+            _results = list(_results)
+        TestSimplePool._chk_map_record()
+        TestSimplePool.chk_results(results=_results, expected_size=len(Test_Function_Args))
+        for _r in _results:
+            assert isinstance(_r, PoolResult), "Each element of the streaming result should be a PoolResult object."
+
+
+    @pytest.mark.parametrize(
+        argnames="simple_pool",
+        argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread],
+        indirect=True
+    )
+    def test_imap_unordered_with_stream(self, simple_pool: SimplePool):
+        TestSimplePool._initial()
+        with simple_pool as _pool:
+            _results = list(_pool.imap_unordered(function=target_function_for_map, args_iter=Test_Function_Args, stream=True))
+        TestSimplePool._chk_map_record()
+        TestSimplePool.chk_results(results=_results, expected_size=len(Test_Function_Args))
+
+
+    @pytest.mark.parametrize(
+        argnames="simple_pool",
+        argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread],
+        indirect=True
+    )
+    def test_imap_with_invalid_window(self, simple_pool: SimplePool):
+        with simple_pool as _pool:
+            with pytest.raises(ValueError):
+                _pool.imap(function=target_function_for_map, args_iter=Test_Function_Args, stream=True, window=0)
+
+
     @pytest.mark.parametrize(
         argnames="simple_pool",
         argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread],
@@ -680,3 +729,181 @@ class TestAdapterPool:
         else:
             assert True, "It work finely without any issue."
 
+
+
+
+class TestWarmSimplePool:
+
+    @pytest.mark.parametrize(
+        argnames="mode",
+        argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread]
+    )
+    def test_attach_to_warm_pool(self, mode: RunningMode):
+        _name = f"test-warm-{mode.name}"
+        set_mode(mode)
+        TestSimplePool._initial()
+        try:
+            with SimplePool(mode=mode, pool_size=_Worker_Pool_Size, name=_name) as _pool:
+                _pool.map(function=target_function_for_map, args_iter=Test_Function_Args)
+                assert _pool.is_warm is False, "It should build a new pool at the first time."
+
+            with SimplePool(mode=mode, pool_size=_Worker_Pool_Size, name=_name) as _pool:
+                _pool.map(function=target_function_for_map, args_iter=Test_Function_Args)
+                assert _pool.is_warm is True, "It should attach to the pool which keeps running."
+
+            _results = _pool.get_result()
+            TestSimplePool.chk_results(results=_results, expected_size=len(Test_Function_Args))
+            assert _name in Pool_Registry, "The named pool should keep running after closing."
+        finally:
+            Pool_Registry.close(name=_name)
+        assert _name not in Pool_Registry, "It should close the named pool."
+
+
+    def test_lifecycle_without_name(self):
+        with pytest.raises(ValueError):
+            SimplePool(mode=RunningMode.Concurrent, pool_size=_Worker_Pool_Size, lifecycle=PoolLifecycle(max_idle_time=1))
+
+
+    def test_mismatch_initializer(self):
+        _name = "test-warm-mismatch"
+        set_mode(RunningMode.Concurrent)
+        try:
+            with SimplePool(mode=RunningMode.Concurrent, pool_size=_Worker_Pool_Size, name=_name):
+                with pytest.raises(ValueError):
+                    SimplePool(mode=RunningMode.Concurrent, pool_size=_Worker_Pool_Size, name=_name).initial(pool_initializer=print)
+        finally:
+            Pool_Registry.close(name=_name)
+        assert _name not in Pool_Registry, "It should close the named pool."
+
+
+
+class TestAutoscaleSimplePool:
+
+    @pytest.mark.parametrize(
+        argnames="mode",
+        argvalues=[RunningMode.Concurrent, RunningMode.GreenThread]
+    )
+    def test_scale_up_with_backlog(self, mode: RunningMode):
+        _events = []
+        _policy = ScalingPolicy(min_size=1, max_size=_Worker_Pool_Size, scale_up_backlog=1)
+        with SimplePool(mode=mode, pool_size=1, autoscale=_policy) as _pool:
+            _pool.auto_scaler.add_listener(_events.append)
+            _pool.map(function=lambda a: a * 2, args_iter=range(_Task_Size))
+            _results = _pool.get_result()
+
+        assert sorted(_r.data for _r in _results) == [_i * 2 for _i in range(_Task_Size)], "It should run all the tasks."
+        assert _events and _events[0].action == "scale_up", "It should scale up because of the backlog."
+        assert _pool.auto_scaler.size <= _Worker_Pool_Size, "It should never be bigger than the max size."
+
+
+
+class TestMetricsSimplePool:
+
+    @pytest.mark.parametrize(
+        argnames="mode",
+        argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread]
+    )
+    def test_metrics(self, mode: RunningMode):
+        set_mode(mode)
+        TestSimplePool._initial()
+        _exporter = InMemoryExporter()
+        with SimplePool(mode=mode, pool_size=_Worker_Pool_Size) as _pool:
+            assert _pool.metrics is None and _pool.export_metrics() is None, "The metrics should be disabled by default."
+            _pool.enable_metrics(exporter=_exporter)
+            _pool.map(function=target_function_for_map, args_iter=Test_Function_Args)
+            _results = _pool.get_result()
+
+        TestSimplePool.chk_results(results=_results, expected_size=len(Test_Function_Args))
+        for _result in _results:
+            assert _result.enqueue_time <= _result.start_time <= _result.end_time, "Each result should have its timing."
+
+        _snapshot = _pool.export_metrics()
+        assert _snapshot["tasks"] == len(Test_Function_Args) and _snapshot["errors"] == 0, ""
+        assert _snapshot["run_time"]["count"] == len(Test_Function_Args) and _snapshot["throughput"] > 0, ""
+        assert _exporter.metrics[_pool.metrics.name] == _snapshot, "It should export the snapshot by the exporter."
+
+        _pool.disable_metrics()
+        assert _pool.metrics is None, "It should disable the metrics."
+
+
+    @pytest.mark.parametrize(
+        argnames="mode",
+        argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread]
+    )
+    def test_metrics_of_failed_tasks(self, mode: RunningMode):
+        set_mode(mode)
+        with SimplePool(mode=mode, pool_size=_Worker_Pool_Size) as _pool:
+            _pool.enable_metrics()
+            _pool.async_apply(tasks_size=2, function=_fail_on_odd, args=(1,))
+            _snapshot = _pool.metrics.snapshot()
+            assert _snapshot["errors"] == 2 and _snapshot["run_time"]["count"] == 2, "The failed tasks should be measured too."
+
+            _pool.metrics.reset()
+            _results = list(_pool.imap(function=_fail_on_odd, args_iter=range(4), stream=True))
+            _snapshot = _pool.metrics.snapshot()
+
+        assert [_r.is_successful for _r in _results] == [True, False, True, False]
+        assert (_snapshot["tasks"], _snapshot["errors"], _snapshot["run_time"]["count"]) == (4, 2, 4), \
+            "The failed tasks of streaming mode should be measured too."
+
+
+
+class TestHybridSimplePool:
+
+    def test_processes(self):
+        with SimplePool(mode=RunningMode.ParallelConcurrent, pool_size=_Worker_Pool_Size, processes=2) as _pool:
+            _pool.map(function=_fail_on_odd, args_iter=range(_Task_Size))
+            _results = _pool.get_result()
+
+        assert len(_results) == _Task_Size, "It should run all the tasks."
+        assert 1 <= len(set(_r.pid for _r in _results)) <= 2, "It should run the tasks in at most 2 processes."
+
+
+    def test_processes_without_hybrid_mode(self):
+        with pytest.raises(ValueError):
+            SimplePool(mode=RunningMode.Concurrent, pool_size=_Worker_Pool_Size, processes=2)
+
+
+    @pytest.mark.parametrize(argnames="imap", argvalues=["imap", "imap_unordered"])
+    def test_reject_streaming(self, imap: str):
+        _pool = SimplePool(mode=RunningMode.ParallelConcurrent, pool_size=_Worker_Pool_Size, processes=2)
+        with pytest.raises(ValueError):
+            getattr(_pool, imap)(function=_fail_on_odd, args_iter=range(_Task_Size), stream=True)
+
+
+
+class TestSharedMemorySimplePool:
+
+    def test_shared_memory_threshold(self):
+        import multirunnable.pool as _pool_module
+
+        with SimplePool(mode=RunningMode.Parallel, pool_size=_Worker_Pool_Size, shared_memory_threshold=1024) as _pool:
+            assert _pool_module.Pool_Runnable_Strategy.shared_memory_threshold == 1024, \
+                "The option *shared_memory_threshold* should be passed to the process pool strategy."
+            _pool.map(function=len, args_iter=[b"0" * 4096] * _Task_Size)
+            _results = _pool.get_result()
+
+        assert [_r.data for _r in _results] == [4096] * _Task_Size, "It should pass the large arguments by shared memory."
+
+
+    def test_shared_memory_threshold_without_parallel_mode(self):
+        with pytest.raises(ValueError):
+            SimplePool(mode=RunningMode.Concurrent, pool_size=_Worker_Pool_Size, shared_memory_threshold=1024)
+
+
+
+class TestResultMaxSizeSimplePool:
+
+    @pytest.mark.parametrize(
+        argnames="mode",
+        argvalues=[RunningMode.Parallel, RunningMode.Concurrent, RunningMode.GreenThread]
+    )
+    def test_result_max_size(self, mode: RunningMode):
+        with SimplePool(mode=mode, pool_size=_Worker_Pool_Size, result_max_size=2) as _pool:
+            assert _pool.result_max_size == 2, "The option *result_max_size* should be passed to the strategy."
+            _pool.map(function=abs, args_iter=range(_Task_Size + 2))
+            assert len(_pool.get_result()) == 2, "It should only keep the last running results."
+
+            _pool.result_max_size = 0
+            _pool.map(function=abs, args_iter=range(_Task_Size))
+            assert _pool.get_result() == [], "It should drop every running result."
@@ -4,6 +4,8 @@ A unittest for pyocean.task module
 
 from multirunnable.tasks import QueueTask
 from multirunnable.parallel import Queue as Process_Queue
+from multirunnable.concurrent.queue import Thread_Queue
+from multirunnable.api.operator import QueueOperator
 # from multirunnable.concurrent import Thread_Queue
 # from multirunnable.coroutine import Greenlet_Queue, Async_Queue
 
@@ -131,6 +133,22 @@ class TestQueueTask(QueueTaskTestCases):
         assert _queue_one_value is not None, "The queue value should not be empty (None value)."
 
 
+    def test_init_queue_with_chunks(self, queue_task: QueueTask):
+        queue_task.name = _Testing_Queue_Task_Name
+        queue_task.queue_instance = Thread_Queue()
+        queue_task.value = (_value for _value in range(25))
+        queue_task.chunk_size = 10
+        queue_task.init_queue_with_values()
+
+        from multirunnable.api.manage import Running_Queue
+        _under_test_queue = Running_Queue[queue_task.name]
+        assert _under_test_queue.qsize() == 3, "The values should be put as chunks."
+        assert QueueOperator.get_many(_under_test_queue, max_items=100) == list(range(25))
+
+        with pytest.raises(ValueError):
+            queue_task.chunk_size = 0
+
+
     @pytest.mark.skip("Not implement testing logic.")
     def test_async_init_queue_with_value(self, queue_task):
         pass